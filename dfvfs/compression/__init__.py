@@ -1,9 +1,11 @@
 # -*- coding: utf-8 -*-
 """Imports for the compression manager."""
 
+from dfvfs.compression import bzip2_block_index
 from dfvfs.compression import bzip2_decompressor
 
 try:
+  from dfvfs.compression import xz_block_index
   from dfvfs.compression import xz_decompressor
 except ImportError:
   pass
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+"""The compressed block index object interface."""
+
+import abc
+import bisect
+
+
+class CompressedBlock(object):
+  """Class that contains an independently decompressible block.
+
+  Attributes:
+    compressed_data_offset (int): offset of the first byte containing
+        compressed data of the block.
+    compressed_data_size (int): number of bytes containing compressed data
+        of the block.
+    uncompressed_data_offset (int): offset of the uncompressed data of
+        the block, relative to the start of the uncompressed stream or None
+        if not known.
+    uncompressed_data_size (int): size of the uncompressed data of the block
+        or None if not known.
+  """
+
+  def __init__(
+      self, compressed_data_offset, compressed_data_size,
+      uncompressed_data_size=None):
+    """Initializes the compressed block.
+
+    Args:
+      compressed_data_offset (int): offset of the first byte containing
+          compressed data of the block.
+      compressed_data_size (int): number of bytes containing compressed data
+          of the block.
+      uncompressed_data_size (Optional[int]): size of the uncompressed data
+          of the block or None if not known.
+    """
+    super(CompressedBlock, self).__init__()
+    self.compressed_data_offset = compressed_data_offset
+    self.compressed_data_size = compressed_data_size
+    self.uncompressed_data_offset = None
+    self.uncompressed_data_size = uncompressed_data_size
+
+
+class BlockIndex(object):
+  """Class that implements the compressed block index object interface.
+
+  A block index maps the uncompressed stream onto blocks of compressed data
+  that can be decompressed independently of each other. This allows for
+  random access without decompressing the preceding data and for blocks
+  to be decompressed in parallel.
+
+  Attributes:
+    blocks (list[CompressedBlock]): blocks ordered by offset.
+  """
+
+  COMPRESSION_METHOD = None
+
+  def __init__(self):
+    """Initializes the block index."""
+    super(BlockIndex, self).__init__()
+    self._uncompressed_data_offsets = []
+    self.blocks = []
+
+  @property
+  def uncompressed_data_size(self):
+    """int: size of the uncompressed stream or None if not known."""
+    if not self.blocks:
+      return 0
+
+    last_block = self.blocks[-1]
+    if (last_block.uncompressed_data_offset is None or
+        last_block.uncompressed_data_size is None):
+      return None
+
+    return (
+        last_block.uncompressed_data_offset +
+        last_block.uncompressed_data_size)
+
+  @abc.abstractmethod
+  def Build(self, file_object):
+    """Builds the block index.
+
+    Args:
+      file_object (FileIO): file-like object containing the compressed
+          stream.
+
+    Raises:
+      BackEndError: if the block index cannot be built.
+    """
+
+  @abc.abstractmethod
+  def DecompressBlock(self, block, compressed_data):
+    """Decompresses a block.
+
+    This method does not change the state of the block index, so that blocks
+    can be decompressed in parallel.
+
+    Args:
+      block (CompressedBlock): block.
+      compressed_data (bytes): compressed data of the block, as defined by
+          the compressed data offset and size of the block.
+
+    Returns:
+      bytes: uncompressed data.
+
+    Raises:
+      BackEndError: if the block cannot be decompressed.
+    """
+
+  def GetBlockNumberByOffset(self, uncompressed_data_offset):
+    """Retrieves the number of the block that contains a specific offset.
+
+    The uncompressed data offsets must be known, see UpdateOffsets().
+
+    Args:
+      uncompressed_data_offset (int): offset in the uncompressed stream.
+
+    Returns:
+      int: number of the block or None if not available.
+    """
+    uncompressed_data_size = self.uncompressed_data_size
+    if (uncompressed_data_size is None or uncompressed_data_offset < 0 or
+        uncompressed_data_offset >= uncompressed_data_size):
+      return
+
+    return bisect.bisect_right(
+        self._uncompressed_data_offsets, uncompressed_data_offset) - 1
+
+  def UpdateOffsets(self):
+    """Updates the uncompressed data offsets of the blocks.
+
+    The offsets are only determined when the uncompressed data sizes of
+    all the blocks are known.
+    """
+    uncompressed_data_offsets = []
+    uncompressed_data_offset = 0
+    for block in self.blocks:
+      if block.uncompressed_data_size is None:
+        return
+
+      uncompressed_data_offsets.append(uncompressed_data_offset)
+      uncompressed_data_offset += block.uncompressed_data_size
+
+    for block, uncompressed_data_offset in zip(
+        self.blocks, uncompressed_data_offsets):
+      block.uncompressed_data_offset = uncompressed_data_offset
+
+    self._uncompressed_data_offsets = uncompressed_data_offsets
@@ -0,0 +1,297 @@
+# -*- coding: utf-8 -*-
+"""The BZIP2 compressed block index object implementation."""
+
+import binascii
+import bz2
+import os
+
+from dfvfs.compression import block_index
+from dfvfs.compression import manager
+from dfvfs.lib import definitions
+from dfvfs.lib import errors
+
+
+class BZIP2Block(block_index.CompressedBlock):
+  """Class that contains a BZIP2 compressed block.
+
+  BZIP2 compressed blocks are not byte aligned, hence the bits of the block
+  are defined relative to the compressed data of the block.
+
+  Attributes:
+    bit_offset (int): offset of the first bit of the block, relative to
+        the first byte containing compressed data of the block.
+    bit_size (int): number of bits of the block.
+  """
+
+  def __init__(self, bit_offset, bit_size):
+    """Initializes the BZIP2 compressed block.
+
+    Args:
+      bit_offset (int): offset of the first bit of the block, relative to
+          the start of the compressed stream.
+      bit_size (int): number of bits of the block.
+    """
+    compressed_data_offset = bit_offset // 8
+    compressed_data_size = ((bit_offset + bit_size + 7) // 8) - (
+        compressed_data_offset)
+
+    super(BZIP2Block, self).__init__(
+        compressed_data_offset, compressed_data_size)
+    self.bit_offset = bit_offset % 8
+    self.bit_size = bit_size
+
+
+class BZIP2BlockIndex(block_index.BlockIndex):
+  """Class that implements a BZIP2 compressed block index.
+
+  A BZIP2 compressed stream consists of blocks that each start with a bit
+  aligned block signature. Every block can be decompressed independently
+  by wrapping it into a stream of its own. The uncompressed data sizes of
+  the blocks are only known after the blocks have been decompressed.
+  """
+
+  COMPRESSION_METHOD = definitions.COMPRESSION_METHOD_BZIP2
+
+  _BLOCK_SIGNATURE = 0x314159265359
+
+  _END_OF_STREAM_SIGNATURE = 0x177245385090
+
+  _SIGNATURE_SIZE = 48
+
+  _STREAM_SIGNATURE = b'BZh'
+
+  # The block signature is followed by a 32-bit checksum.
+  _BLOCK_HEADER_SIZE = 80
+
+  # The maximum number of bytes of a signature that is not byte aligned.
+  _SIGNATURE_WINDOW_SIZE = 7
+
+  # The size of the compressed data buffer used to scan for signatures.
+  _COMPRESSED_DATA_BUFFER_SIZE = 16 * 1024 * 1024
+
+  def __init__(self):
+    """Initializes the block index."""
+    super(BZIP2BlockIndex, self).__init__()
+    self._signature_patterns = []
+
+    for signature in (self._BLOCK_SIGNATURE, self._END_OF_STREAM_SIGNATURE):
+      for bit_shift in range(0, 8):
+        self._signature_patterns.append(
+            self._GetSignaturePattern(signature, bit_shift))
+
+  def _BytesToInteger(self, byte_string):
+    """Converts a byte string into a big-endian integer.
+
+    Args:
+      byte_string (bytes): byte string.
+
+    Returns:
+      int: integer value.
+    """
+    if not byte_string:
+      return 0
+
+    return int(binascii.hexlify(byte_string), 16)
+
+  def _GetSignaturePattern(self, signature, bit_shift):
+    """Retrieves the pattern to scan for a signature that is not byte aligned.
+
+    Args:
+      signature (int): signature.
+      bit_shift (int): offset of the first bit of the signature in the first
+          byte.
+
+    Returns:
+      tuple[int, int, bytes, int, bytearray, bytearray]: signature,
+          bit shift, bytes of the signature that are fully defined, offset of
+          these bytes, bytes of the signature and mask of the bytes of
+          the signature.
+    """
+    value_shift = (self._SIGNATURE_WINDOW_SIZE * 8) - (
+        self._SIGNATURE_SIZE + bit_shift)
+    value = signature << value_shift
+    mask = ((1 << self._SIGNATURE_SIZE) - 1) << value_shift
+
+    signature_bytes = bytearray(self._IntegerToBytes(
+        value, self._SIGNATURE_WINDOW_SIZE))
+    mask_bytes = bytearray(self._IntegerToBytes(
+        mask, self._SIGNATURE_WINDOW_SIZE))
+
+    # The last byte of the window is only partially defined or not defined
+    # at all. The first byte is only partially defined if the signature is
+    # not byte aligned.
+    if bit_shift == 0:
+      pattern_offset = 0
+    else:
+      pattern_offset = 1
+
+    pattern = bytes(signature_bytes[pattern_offset:6])
+
+    return (
+        signature, bit_shift, pattern, pattern_offset, signature_bytes,
+        mask_bytes)
+
+  def _IntegerToBytes(self, integer, size):
+    """Converts a big-endian integer into a byte string.
+
+    Args:
+      integer (int): integer value.
+      size (int): size of the byte string.
+
+    Returns:
+      bytes: byte string.
+    """
+    hexadecimal_string = u'{0:0{1:d}x}'.format(integer, size * 2)
+    return binascii.unhexlify(hexadecimal_string)
+
+  def _ScanForSignatures(self, buffer_data, buffer_offset):
+    """Scans a buffer for bit aligned signatures.
+
+    Only signatures of which the entire window is contained in the buffer
+    are returned. Signatures that start in the last part of the buffer
+    are expected to be scanned for in the next buffer.
+
+    Args:
+      buffer_data (bytearray): buffer data.
+      buffer_offset (int): offset of the buffer in the compressed stream.
+
+    Returns:
+      list[tuple[int, int]]: bit offset in the compressed stream and value
+          of the signatures found.
+    """
+    last_data_offset = len(buffer_data) - self._SIGNATURE_WINDOW_SIZE
+
+    signatures = []
+    for (signature, bit_shift, pattern, pattern_offset, signature_bytes,
+         mask_bytes) in self._signature_patterns:
+      pattern_index = buffer_data.find(pattern, pattern_offset)
+      while pattern_index != -1:
+        data_offset = pattern_index - pattern_offset
+        if data_offset > last_data_offset:
+          break
+
+        for byte_index in range(0, self._SIGNATURE_WINDOW_SIZE):
+          byte_value = buffer_data[data_offset + byte_index]
+          if byte_value & mask_bytes[byte_index] != signature_bytes[
+              byte_index]:
+            break
+        else:
+          bit_offset = ((buffer_offset + data_offset) * 8) + bit_shift
+          signatures.append((bit_offset, signature))
+
+        pattern_index = buffer_data.find(pattern, pattern_index + 1)
+
+    return signatures
+
+  def Build(self, file_object):
+    """Builds the block index.
+
+    Args:
+      file_object (FileIO): file-like object containing the compressed
+          stream.
+
+    Raises:
+      BackEndError: if the block index cannot be built.
+    """
+    file_object.seek(0, os.SEEK_SET)
+    file_size = file_object.get_size()
+
+    stream_signature = file_object.read(len(self._STREAM_SIGNATURE))
+    if stream_signature != self._STREAM_SIGNATURE:
+      raise errors.BackEndError(u'Unsupported BZIP2 stream signature.')
+
+    file_object.seek(0, os.SEEK_SET)
+
+    signatures = []
+    buffer_data = bytearray()
+    buffer_offset = 0
+    overlap_size = self._SIGNATURE_WINDOW_SIZE - 1
+
+    compressed_data_offset = 0
+    while compressed_data_offset < file_size:
+      compressed_data = file_object.read(self._COMPRESSED_DATA_BUFFER_SIZE)
+      if not compressed_data:
+        break
+
+      compressed_data_offset += len(compressed_data)
+
+      buffer_data.extend(compressed_data)
+      signatures.extend(self._ScanForSignatures(buffer_data, buffer_offset))
+
+      if len(buffer_data) > overlap_size:
+        buffer_offset += len(buffer_data) - overlap_size
+        buffer_data = buffer_data[-overlap_size:]
+
+    signatures = sorted(signatures)
+    file_size_in_bits = compressed_data_offset * 8
+
+    self.blocks = []
+    for index, (bit_offset, signature) in enumerate(signatures):
+      if signature != self._BLOCK_SIGNATURE:
+        continue
+
+      if index + 1 < len(signatures):
+        next_bit_offset, _ = signatures[index + 1]
+      else:
+        next_bit_offset = file_size_in_bits
+
+      bit_size = next_bit_offset - bit_offset
+      if bit_size <= self._BLOCK_HEADER_SIZE:
+        raise errors.BackEndError(
+            u'Invalid BZIP2 block at bit offset: {0:d}.'.format(bit_offset))
+
+      self.blocks.append(BZIP2Block(bit_offset, bit_size))
+
+    self.UpdateOffsets()
+
+  def DecompressBlock(self, block, compressed_data):
+    """Decompresses a block.
+
+    The block is decompressed by wrapping it in a stream of its own, where
+    the stream checksum is the checksum of the block.
+
+    Args:
+      block (BZIP2Block): block.
+      compressed_data (bytes): compressed data of the block, as defined by
+          the compressed data offset and size of the block.
+
+    Returns:
+      bytes: uncompressed data.
+
+    Raises:
+      BackEndError: if the block cannot be decompressed.
+    """
+    trailing_number_of_bits = (
+        (len(compressed_data) * 8) - block.bit_offset - block.bit_size)
+    if trailing_number_of_bits < 0:
+      raise errors.BackEndError(u'Missing BZIP2 block data.')
+
+    block_value = self._BytesToInteger(compressed_data)
+    block_value >>= trailing_number_of_bits
+    block_value &= (1 << block.bit_size) - 1
+
+    block_checksum = block_value >> (
+        block.bit_size - self._BLOCK_HEADER_SIZE)
+    block_checksum &= 0xffffffff
+
+    stream_value = (block_value << 80) | (
+        self._END_OF_STREAM_SIGNATURE << 32) | block_checksum
+
+    number_of_bits = block.bit_size + 80
+    number_of_padding_bits = (8 - (number_of_bits % 8)) % 8
+    stream_value <<= number_of_padding_bits
+
+    stream_data = b''.join([
+        self._STREAM_SIGNATURE, b'9', self._IntegerToBytes(
+            stream_value, (number_of_bits + number_of_padding_bits) // 8)])
+
+    try:
+      return bz2.decompress(stream_data)
+
+    except (EOFError, IOError, ValueError) as exception:
+      raise errors.BackEndError((
+          u'Unable to decompress BZIP2 compressed block with error: '
+          u'{0!s}.').format(exception))
+
+
+manager.CompressionManager.RegisterBlockIndex(BZIP2BlockIndex)
@@ -2,6 +2,7 @@
 """The BZIP2 decompressor object implementation."""
 
 import bz2
+import sys
 
 from dfvfs.compression import decompressor
 from dfvfs.compression import manager
@@ -19,11 +20,14 @@ class BZIP2Decompressor(decompressor.Decompressor):
     super(BZIP2Decompressor, self).__init__()
     self._bz2_decompressor = bz2.BZ2Decompressor()
 
-  def Decompress(self, compressed_data):
+  def Decompress(self, compressed_data, maximum_size=None):
     """Decompresses the compressed data.
 
     Args:
       compressed_data (bytes): compressed data.
+      maximum_size (Optional[int]): maximum size of the uncompressed data
+          to return, where None represents no maximum. Note that the maximum
+          size is not supported by bz2 of Python 2.
 
     Returns:
       tuple(bytes, bytes): uncompressed data and remaining compressed data.
@@ -31,8 +35,17 @@ class BZIP2Decompressor(decompressor.Decompressor):
     Raises:
       BackEndError: if the BZIP2 compressed stream cannot be decompressed.
     """
+    if not compressed_data and getattr(self._bz2_decompressor, u'eof', False):
+      # Continuing a bounded decompression that reached the end of stream.
+      return b'', b''
+
     try:
-      uncompressed_data = self._bz2_decompressor.decompress(compressed_data)
+      if maximum_size is None or sys.version_info[0] < 3:
+        uncompressed_data = self._bz2_decompressor.decompress(compressed_data)
+      else:
+        uncompressed_data = self._bz2_decompressor.decompress(
+            compressed_data, max_length=maximum_size)
+
       remaining_compressed_data = getattr(
           self._bz2_decompressor, u'unused_data', b'')
 
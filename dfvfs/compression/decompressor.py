@@ -8,11 +8,22 @@ class Decompressor(object):
   """Class that implements the decompressor object interface."""
 
   @abc.abstractmethod
-  def Decompress(self, compressed_data):
+  def Decompress(self, compressed_data, maximum_size=None):
     """Decompresses the compressed data.
 
+    When the size of the uncompressed data is bounded, the compressed data
+    that is needed to produce the rest of the uncompressed data is either
+    retained by the decompressor or returned as remaining compressed data.
+    Hence Decompress should be called again with the remaining compressed
+    data, even if empty, until less uncompressed data than the maximum size
+    is returned.
+
     Args:
       compressed_data (bytes): compressed data.
+      maximum_size (Optional[int]): maximum size of the uncompressed data
+          to return, where None represents no maximum. Note that not every
+          implementation of the underlying decompression library supports
+          a maximum size.
 
     Returns:
       tuple(bytes, bytes): uncompressed data and remaining compressed data.
@@ -5,8 +5,27 @@
 class CompressionManager(object):
   """Class that implements the compression manager."""
 
+  _block_indexes = {}
   _decompressors = {}
 
+  @classmethod
+  def DeregisterBlockIndex(cls, block_index):
+    """Deregisters a block index for a specific compression method.
+
+    Args:
+      block_index (type): block index class.
+
+    Raises:
+      KeyError: if the corresponding block index is not set.
+    """
+    compression_method = block_index.COMPRESSION_METHOD.lower()
+    if compression_method not in cls._block_indexes:
+      raise KeyError(
+          u'Block index for compression method: {0:s} not set.'.format(
+              block_index.COMPRESSION_METHOD))
+
+    del cls._block_indexes[compression_method]
+
   @classmethod
   def DeregisterDecompressor(cls, decompressor):
     """Deregisters a decompressor for a specific compression method.
@@ -25,6 +44,24 @@ class CompressionManager(object):
 
     del cls._decompressors[compression_method]
 
+  @classmethod
+  def GetBlockIndex(cls, compression_method):
+    """Retrieves the block index object for a specific compression method.
+
+    Args:
+      compression_method (str): compression method identifier.
+
+    Returns:
+      BlockIndex: block index or None if the compression method does not
+          support independently decompressible blocks.
+    """
+    compression_method = compression_method.lower()
+    block_index = cls._block_indexes.get(compression_method, None)
+    if not block_index:
+      return
+
+    return block_index()
+
   @classmethod
   def GetDecompressor(cls, compression_method):
     """Retrieves the decompressor object for a specific compression method.
@@ -43,6 +80,24 @@ class CompressionManager(object):
 
     return decompressor()
 
+  @classmethod
+  def RegisterBlockIndex(cls, block_index):
+    """Registers a block index for a specific compression method.
+
+    Args:
+      block_index (type): block index class.
+
+    Raises:
+      KeyError: if the corresponding block index is already set.
+    """
+    compression_method = block_index.COMPRESSION_METHOD.lower()
+    if compression_method in cls._block_indexes:
+      raise KeyError(
+          u'Block index for compression method: {0:s} already set.'.format(
+              block_index.COMPRESSION_METHOD))
+
+    cls._block_indexes[compression_method] = block_index
+
   @classmethod
   def RegisterDecompressor(cls, decompressor):
     """Registers a decompressor for a specific compression method.
@@ -0,0 +1,303 @@
+# -*- coding: utf-8 -*-
+"""The XZ compressed block index object implementation."""
+
+import os
+import struct
+import zlib
+
+from dfvfs.compression import block_index
+from dfvfs.compression import manager
+from dfvfs.compression import xz_decompressor
+from dfvfs.lib import definitions
+from dfvfs.lib import errors
+
+
+class XZBlock(block_index.CompressedBlock):
+  """Class that contains a XZ compressed block.
+
+  Attributes:
+    stream_flags (bytes): flags of the stream that contains the block.
+    unpadded_size (int): size of the block without block padding.
+  """
+
+  def __init__(
+      self, compressed_data_offset, unpadded_size, uncompressed_data_size,
+      stream_flags):
+    """Initializes the XZ compressed block.
+
+    Args:
+      compressed_data_offset (int): offset of the block header.
+      unpadded_size (int): size of the block without block padding.
+      uncompressed_data_size (int): size of the uncompressed data of
+          the block.
+      stream_flags (bytes): flags of the stream that contains the block.
+    """
+    compressed_data_size = (unpadded_size + 3) & ~3
+
+    super(XZBlock, self).__init__(
+        compressed_data_offset, compressed_data_size,
+        uncompressed_data_size=uncompressed_data_size)
+    self.stream_flags = stream_flags
+    self.unpadded_size = unpadded_size
+
+
+class XZBlockIndex(block_index.BlockIndex):
+  """Class that implements a XZ compressed block index.
+
+  A XZ compressed stream stores an index with the unpadded size and
+  the uncompressed data size of each block at the end of the stream.
+  The blocks can be decompressed independently by wrapping them into
+  a stream of their own.
+  """
+
+  COMPRESSION_METHOD = definitions.COMPRESSION_METHOD_XZ
+
+  _STREAM_HEADER_SIGNATURE = b'\xfd7zXZ\x00'
+
+  _STREAM_FOOTER_SIGNATURE = b'YZ'
+
+  _STREAM_HEADER_SIZE = 12
+
+  _STREAM_FOOTER_SIZE = 12
+
+  # The maximum size of the index that is supported.
+  _MAXIMUM_INDEX_SIZE = 64 * 1024 * 1024
+
+  def _CalculateChecksum(self, data):
+    """Calculates a CRC-32 checksum.
+
+    Args:
+      data (bytes): data.
+
+    Returns:
+      bytes: little-endian CRC-32 of the data.
+    """
+    return struct.pack(u'<I', zlib.crc32(data) & 0xffffffff)
+
+  def _EncodeMultiByteInteger(self, integer):
+    """Encodes a multi-byte integer.
+
+    Args:
+      integer (int): integer value.
+
+    Returns:
+      bytes: encoded integer.
+    """
+    encoded_integer = bytearray()
+    while integer >= 0x80:
+      encoded_integer.append((integer & 0x7f) | 0x80)
+      integer >>= 7
+
+    encoded_integer.append(integer)
+    return bytes(encoded_integer)
+
+  def _DecodeMultiByteInteger(self, data, data_offset):
+    """Decodes a multi-byte integer.
+
+    Args:
+      data (bytearray): data.
+      data_offset (int): offset of the multi-byte integer in the data.
+
+    Returns:
+      tuple[int, int]: integer value and offset of the data that follows
+          the multi-byte integer.
+
+    Raises:
+      BackEndError: if the multi-byte integer is invalid.
+    """
+    integer = 0
+    for byte_index in range(0, 9):
+      if data_offset >= len(data):
+        break
+
+      byte_value = data[data_offset]
+      data_offset += 1
+
+      integer |= (byte_value & 0x7f) << (byte_index * 7)
+      if not byte_value & 0x80:
+        return integer, data_offset
+
+    raise errors.BackEndError(u'Invalid XZ multi-byte integer.')
+
+  def _ReadIndex(self, index_data):
+    """Reads the records of a XZ index.
+
+    Args:
+      index_data (bytes): index data.
+
+    Returns:
+      list[tuple[int, int]]: unpadded size and uncompressed data size of
+          the blocks.
+
+    Raises:
+      BackEndError: if the index is invalid.
+    """
+    if index_data[-4:] != self._CalculateChecksum(index_data[:-4]):
+      raise errors.BackEndError(u'Invalid XZ index checksum.')
+
+    index_data = bytearray(index_data)
+    if index_data[0] != 0:
+      raise errors.BackEndError(u'Invalid XZ index indicator.')
+
+    number_of_records, data_offset = self._DecodeMultiByteInteger(
+        index_data, 1)
+
+    records = []
+    for _ in range(0, number_of_records):
+      unpadded_size, data_offset = self._DecodeMultiByteInteger(
+          index_data, data_offset)
+      uncompressed_data_size, data_offset = self._DecodeMultiByteInteger(
+          index_data, data_offset)
+      records.append((unpadded_size, uncompressed_data_size))
+
+    return records
+
+  def _ReadStream(self, file_object, stream_end_offset):
+    """Reads the blocks of a XZ stream using its index.
+
+    Args:
+      file_object (FileIO): file-like object containing the compressed
+          stream.
+      stream_end_offset (int): offset of the end of the stream.
+
+    Returns:
+      tuple[int, list[XZBlock]]: offset of the start of the stream and
+          blocks of the stream.
+
+    Raises:
+      BackEndError: if the stream is invalid.
+    """
+    footer_offset = stream_end_offset - self._STREAM_FOOTER_SIZE
+    if footer_offset < self._STREAM_HEADER_SIZE:
+      raise errors.BackEndError(u'Missing XZ stream footer.')
+
+    file_object.seek(footer_offset, os.SEEK_SET)
+    stream_footer = file_object.read(self._STREAM_FOOTER_SIZE)
+    if (len(stream_footer) != self._STREAM_FOOTER_SIZE or
+        stream_footer[10:] != self._STREAM_FOOTER_SIGNATURE):
+      raise errors.BackEndError(u'Unsupported XZ stream footer signature.')
+
+    if stream_footer[:4] != self._CalculateChecksum(stream_footer[4:10]):
+      raise errors.BackEndError(u'Invalid XZ stream footer checksum.')
+
+    backward_size = struct.unpack(u'<I', stream_footer[4:8])[0]
+    index_size = (backward_size + 1) * 4
+    index_offset = footer_offset - index_size
+    if index_size > self._MAXIMUM_INDEX_SIZE or index_offset < 0:
+      raise errors.BackEndError(u'Unsupported XZ index size.')
+
+    stream_flags = stream_footer[8:10]
+
+    file_object.seek(index_offset, os.SEEK_SET)
+    index_data = file_object.read(index_size)
+    records = self._ReadIndex(index_data)
+
+    blocks_size = sum([
+        (unpadded_size + 3) & ~3 for unpadded_size, _ in records])
+    stream_start_offset = index_offset - blocks_size - self._STREAM_HEADER_SIZE
+    if stream_start_offset < 0:
+      raise errors.BackEndError(u'Invalid XZ index block sizes.')
+
+    file_object.seek(stream_start_offset, os.SEEK_SET)
+    stream_header = file_object.read(self._STREAM_HEADER_SIZE)
+    if (stream_header[:6] != self._STREAM_HEADER_SIGNATURE or
+        stream_header[6:8] != stream_flags):
+      raise errors.BackEndError(u'Unsupported XZ stream header.')
+
+    blocks = []
+    compressed_data_offset = stream_start_offset + self._STREAM_HEADER_SIZE
+    for unpadded_size, uncompressed_data_size in records:
+      block = XZBlock(
+          compressed_data_offset, unpadded_size, uncompressed_data_size,
+          stream_flags)
+      blocks.append(block)
+
+      compressed_data_offset += block.compressed_data_size
+
+    return stream_start_offset, blocks
+
+  def Build(self, file_object):
+    """Builds the block index.
+
+    The streams are read from the end of the compressed stream, since
+    the index of a stream is stored at its end.
+
+    Args:
+      file_object (FileIO): file-like object containing the compressed
+          stream.
+
+    Raises:
+      BackEndError: if the block index cannot be built.
+    """
+    file_object.seek(0, os.SEEK_SET)
+    stream_header = file_object.read(self._STREAM_HEADER_SIZE)
+    if stream_header[:6] != self._STREAM_HEADER_SIGNATURE:
+      raise errors.BackEndError(u'Unsupported XZ stream header signature.')
+
+    self.blocks = []
+
+    stream_end_offset = file_object.get_size()
+    while stream_end_offset > 0:
+      # Skip stream padding that follows the stream, which consists of
+      # a multitude of 4 bytes with a value of 0.
+      file_object.seek(stream_end_offset - 4, os.SEEK_SET)
+      if file_object.read(4) == b'\x00\x00\x00\x00':
+        stream_end_offset -= 4
+        continue
+
+      stream_end_offset, blocks = self._ReadStream(
+          file_object, stream_end_offset)
+      self.blocks = blocks + self.blocks
+
+    self.UpdateOffsets()
+
+  def DecompressBlock(self, block, compressed_data):
+    """Decompresses a block.
+
+    The block is decompressed by wrapping it in a stream of its own, with
+    an index that only contains the block.
+
+    Args:
+      block (XZBlock): block.
+      compressed_data (bytes): compressed data of the block, as defined by
+          the compressed data offset and size of the block.
+
+    Returns:
+      bytes: uncompressed data.
+
+    Raises:
+      BackEndError: if the block cannot be decompressed.
+    """
+    stream_header = b''.join([
+        self._STREAM_HEADER_SIGNATURE, block.stream_flags,
+        self._CalculateChecksum(block.stream_flags)])
+
+    index_data = b''.join([
+        b'\x00', self._EncodeMultiByteInteger(1),
+        self._EncodeMultiByteInteger(block.unpadded_size),
+        self._EncodeMultiByteInteger(block.uncompressed_data_size)])
+
+    index_data = b''.join([
+        index_data, b'\x00' * ((4 - (len(index_data) % 4)) % 4)])
+    index_data = b''.join([index_data, self._CalculateChecksum(index_data)])
+
+    backward_size = struct.pack(u'<I', (len(index_data) // 4) - 1)
+    stream_footer_data = b''.join([backward_size, block.stream_flags])
+    stream_footer = b''.join([
+        self._CalculateChecksum(stream_footer_data), stream_footer_data,
+        self._STREAM_FOOTER_SIGNATURE])
+
+    stream_data = b''.join([
+        stream_header, compressed_data, index_data, stream_footer])
+
+    decompressor = xz_decompressor.XZDecompressor()
+    uncompressed_data, _ = decompressor.Decompress(stream_data)
+
+    if len(uncompressed_data) != block.uncompressed_data_size:
+      raise errors.BackEndError(
+          u'Uncompressed XZ block size does not match index.')
+
+    return uncompressed_data
+
+
+manager.CompressionManager.RegisterBlockIndex(XZBlockIndex)
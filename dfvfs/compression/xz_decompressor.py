@@ -29,11 +29,14 @@ class XZDecompressor(decompressor.Decompressor):
     # Note that lzma.FORMAT_XZ does not work for every implementation of lzma.
     self._lzma_decompressor = lzma.LZMADecompressor(1)
 
-  def Decompress(self, compressed_data):
+  def Decompress(self, compressed_data, maximum_size=None):
     """Decompresses the compressed data.
 
     Args:
       compressed_data (bytes): compressed data.
+      maximum_size (Optional[int]): maximum size of the uncompressed data
+          to return, where None represents no maximum. Note that the maximum
+          size is not supported by lzma of Python 2.
 
     Returns:
       tuple(bytes, bytes): uncompressed data and remaining compressed data.
@@ -41,14 +44,21 @@ class XZDecompressor(decompressor.Decompressor):
     Raises:
       BackEndError: if the XZ compressed stream cannot be decompressed.
     """
+    if not compressed_data and getattr(self._lzma_decompressor, u'eof', False):
+      # Continuing a bounded decompression that reached the end of stream.
+      return b'', b''
+
     try:
       if sys.version_info[0] < 3:
         # Note that we cannot use max_length=0 here due to different
         # versions of the lzma code.
         uncompressed_data = self._lzma_decompressor.decompress(
             compressed_data, 0)
-      else:
+      elif maximum_size is None:
         uncompressed_data = self._lzma_decompressor.decompress(compressed_data)
+      else:
+        uncompressed_data = self._lzma_decompressor.decompress(
+            compressed_data, max_length=maximum_size)
 
       remaining_compressed_data = getattr(
           self._lzma_decompressor, u'unused_data', b'')
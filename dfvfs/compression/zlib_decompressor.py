@@ -25,11 +25,13 @@ class ZlibDecompressor(decompressor.Decompressor):
     super(ZlibDecompressor, self).__init__()
     self._zlib_decompressor = zlib.decompressobj(window_size)
 
-  def Decompress(self, compressed_data):
+  def Decompress(self, compressed_data, maximum_size=None):
     """Decompresses the compressed data.
 
     Args:
       compressed_data (bytes): compressed data.
+      maximum_size (Optional[int]): maximum size of the uncompressed data
+          to return, where None represents no maximum.
 
     Returns:
       tuple(bytes, bytes): uncompressed data and remaining compressed data.
@@ -38,9 +40,17 @@ class ZlibDecompressor(decompressor.Decompressor):
       BackEndError: if the zlib compressed stream cannot be decompressed.
     """
     try:
-      uncompressed_data = self._zlib_decompressor.decompress(compressed_data)
-      remaining_compressed_data = getattr(
-          self._zlib_decompressor, u'unused_data', b'')
+      if maximum_size is None:
+        uncompressed_data = self._zlib_decompressor.decompress(compressed_data)
+      else:
+        uncompressed_data = self._zlib_decompressor.decompress(
+            compressed_data, maximum_size)
+
+      # The unconsumed tail contains the compressed data that was not
+      # decompressed due to the maximum size.
+      remaining_compressed_data = (
+          self._zlib_decompressor.unconsumed_tail or
+          getattr(self._zlib_decompressor, u'unused_data', b''))
 
     except zlib.error as exception:
       raise errors.BackEndError((
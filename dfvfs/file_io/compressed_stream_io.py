@@ -1,7 +1,14 @@
 # -*- coding: utf-8 -*-
 """The compressed stream file-like object implementation."""
 
+from multiprocessing import pool
 import os
+import threading
+
+try:
+  import queue
+except ImportError:
+  import Queue as queue  # pylint: disable=import-error
 
 from dfvfs.compression import manager as compression_manager
 from dfvfs.file_io import file_io
@@ -9,23 +16,201 @@ from dfvfs.lib import errors
 from dfvfs.resolver import resolver
 
 
+class DecompressionPipeline(object):
+  """Class that decompresses chunks of compressed data on a worker thread.
+
+  The chunks are decompressed in the order they were added by a single
+  worker thread, since the decompressor maintains state between chunks.
+  The uncompressed data is passed back in parts of a maximum size through
+  a bounded queue, hence the amount of uncompressed data that is kept in
+  memory does not depend on the compression ratio.
+  """
+
+  # The interval in seconds at which a blocked worker thread checks if
+  # the pipeline was stopped and at which a blocked reader checks if
+  # the worker thread is still running.
+  _STOP_CHECK_INTERVAL = 0.1
+
+  def __init__(self, decompressor, maximum_size, maximum_number_of_parts):
+    """Initializes the decompression pipeline.
+
+    Args:
+      decompressor (Decompressor): decompressor.
+      maximum_size (int): maximum size of a part of uncompressed data.
+      maximum_number_of_parts (int): maximum number of parts of uncompressed
+          data that are decompressed ahead.
+    """
+    super(DecompressionPipeline, self).__init__()
+    self._compressed_data_queue = queue.Queue()
+    self._decompressor = decompressor
+    self._maximum_size = maximum_size
+    self._stop_event = threading.Event()
+    self._uncompressed_data_queue = queue.Queue(
+        maxsize=maximum_number_of_parts)
+    self.number_of_pending_chunks = 0
+
+    self._thread = threading.Thread(target=self._DecompressChunks)
+    self._thread.daemon = True
+    self._thread.start()
+
+  def _DecompressChunks(self):
+    """Decompresses chunks of compressed data on the worker thread.
+
+    Every chunk results in zero or more parts of uncompressed data followed
+    by a marker that the chunk was consumed.
+    """
+    compressed_data = b''
+    while not self._stop_event.is_set():
+      compressed_chunk = self._compressed_data_queue.get()
+      if compressed_chunk is None:
+        break
+
+      compressed_data = b''.join([compressed_data, compressed_chunk])
+
+      try:
+        while True:
+          uncompressed_data, compressed_data = self._decompressor.Decompress(
+              compressed_data, maximum_size=self._maximum_size)
+
+          if uncompressed_data and not self._PutResult(uncompressed_data, None):
+            return
+
+          if len(uncompressed_data) != self._maximum_size:
+            break
+
+      # Any exception raised by the decompressor is passed to the thread that
+      # retrieves the uncompressed data, which otherwise would wait forever.
+      except Exception as exception:  # pylint: disable=broad-except
+        self._PutResult(None, exception)
+        return
+
+      if not self._PutResult(None, None):
+        return
+
+  def _PutResult(self, uncompressed_data, exception):
+    """Puts a result on the uncompressed data queue.
+
+    Args:
+      uncompressed_data (bytes): part of uncompressed data or None to mark
+          that a chunk of compressed data was consumed.
+      exception (Exception): exception raised by the decompressor or None.
+
+    Returns:
+      bool: True if the result was put on the queue, False if the pipeline
+          was stopped.
+    """
+    while not self._stop_event.is_set():
+      try:
+        self._uncompressed_data_queue.put(
+            (uncompressed_data, exception), timeout=self._STOP_CHECK_INTERVAL)
+        return True
+
+      except queue.Full:
+        pass
+
+    return False
+
+  def AddCompressedData(self, compressed_data):
+    """Adds a chunk of compressed data to be decompressed.
+
+    Args:
+      compressed_data (bytes): compressed data.
+    """
+    self._compressed_data_queue.put(compressed_data)
+    self.number_of_pending_chunks += 1
+
+  def GetUncompressedData(self):
+    """Retrieves the next part of uncompressed data.
+
+    Waits for the worker thread if the part was not yet decompressed.
+
+    Returns:
+      bytes: part of uncompressed data or None if a chunk of compressed data
+          was consumed.
+
+    Raises:
+      BackEndError: if the compressed data cannot be decompressed or
+          the worker thread stopped unexpectedly.
+    """
+    while True:
+      try:
+        uncompressed_data, exception = self._uncompressed_data_queue.get(
+            timeout=self._STOP_CHECK_INTERVAL)
+        break
+
+      except queue.Empty:
+        if self._thread.is_alive():
+          continue
+
+        # The worker thread can put a result just before it stops.
+        try:
+          uncompressed_data, exception = (
+              self._uncompressed_data_queue.get_nowait())
+          break
+
+        except queue.Empty:
+          self.number_of_pending_chunks = 0
+          raise errors.BackEndError(
+              u'Decompression worker thread stopped unexpectedly.')
+
+    if exception:
+      self.number_of_pending_chunks = 0
+      raise exception
+
+    if uncompressed_data is None:
+      self.number_of_pending_chunks -= 1
+
+    return uncompressed_data
+
+  def Stop(self):
+    """Stops the worker thread."""
+    self._stop_event.set()
+    self._compressed_data_queue.put(None)
+    self._thread.join()
+
+
 class CompressedStream(file_io.FileIO):
   """Class that implements a file-like object of a compressed stream."""
 
   # The size of the compressed data buffer.
   _COMPRESSED_DATA_BUFFER_SIZE = 8 * 1024 * 1024
 
+  # The maximum size of the uncompressed data that is decompressed at once,
+  # which bounds the memory used independent of the compression ratio.
+  _UNCOMPRESSED_DATA_BUFFER_SIZE = 8 * 1024 * 1024
+
+  # The maximum number of compressed data buffers that are read ahead and
+  # the maximum number of uncompressed data buffers that are decompressed
+  # ahead on a worker thread.
+  _MAXIMUM_NUMBER_OF_PENDING_CHUNKS = 4
+
+  # The maximum size of the uncompressed data of a block, for which the
+  # compressed stream is read by block. Since a block is decompressed as
+  # a whole, larger blocks are read as part of the compressed stream.
+  _MAXIMUM_BLOCK_SIZE = 64 * 1024 * 1024
+
   def __init__(
-      self, resolver_context, compression_method=None, file_object=None):
+      self, resolver_context, compression_method=None, file_object=None,
+      number_of_threads=1):
     """Initializes the file-like object.
 
     If the file-like object is chained do not separately use the parent
     file-like object.
 
+    If the compression method supports independently decompressible blocks,
+    such as BZIP2, the compressed stream is read by block, which allows
+    blocks to be decompressed in parallel by multiple threads. Otherwise
+    multiple threads cause the compressed stream to be decompressed ahead
+    on a worker thread, which overlaps decompression with the processing
+    of the uncompressed data by the caller.
+
     Args:
       resolver_context (Context): resolver context.
       compression_method (Optional[str]): method used to the compress the data.
       file_object (Optional[file]): parent file-like object.
+      number_of_threads (Optional[int]): number of threads used to decompress
+          data, where 1 represents decompressing data on the thread that
+          reads the data.
 
     Raises:
       ValueError: if file_object provided but compression_method is not.
@@ -36,11 +221,19 @@ class CompressedStream(file_io.FileIO):
           u'method.')
 
     super(CompressedStream, self).__init__(resolver_context)
+    self._block_data = b''
+    self._block_index = None
+    self._block_number = None
     self._compression_method = compression_method
     self._file_object = file_object
+    self._number_of_threads = number_of_threads
+    self._pending_blocks = {}
+    self._thread_pool = None
     self._compressed_data = b''
     self._current_offset = 0
+    self._decompression_pipeline = None
     self._decompressor = None
+    self._decompressor_needs_input = True
     self._realign_offset = True
     self._uncompressed_data = b''
     self._uncompressed_data_offset = 0
@@ -63,10 +256,161 @@ class CompressedStream(file_io.FileIO):
       self._file_object.close()
       self._file_object = None
 
+    self._StopDecompressionPipeline()
+    self._TerminateThreadPool()
+
+    self._block_data = b''
+    self._block_index = None
+    self._block_number = None
+    self._pending_blocks = {}
+
     self._compressed_data = b''
     self._uncompressed_data = b''
     self._decompressor = None
 
+  def _BuildBlockIndex(self):
+    """Builds the block index.
+
+    Building the block index determines the uncompressed data sizes of
+    the blocks, which requires the blocks to be decompressed if their
+    sizes are not stored in the compressed stream.
+
+    Returns:
+      BlockIndex: block index or None if the compression method does not
+          support independently decompressible blocks or if the block index
+          could not be built.
+    """
+    block_index = compression_manager.CompressionManager.GetBlockIndex(
+        self._compression_method)
+    if not block_index:
+      return
+
+    if self._number_of_threads > 1 and not self._thread_pool:
+      self._thread_pool = pool.ThreadPool(processes=self._number_of_threads)
+
+    try:
+      block_index.Build(self._file_object)
+      if block_index.uncompressed_data_size is None:
+        self._DetermineBlockSizes(block_index)
+
+    except errors.BackEndError:
+      block_index = None
+
+    if block_index:
+      for block in block_index.blocks:
+        if block.uncompressed_data_size > self._MAXIMUM_BLOCK_SIZE:
+          block_index = None
+          break
+
+    if not block_index:
+      # Fall back to decompressing the compressed stream as a whole, which
+      # uses a decompression pipeline instead of the thread pool.
+      self._TerminateThreadPool()
+
+    return block_index
+
+  def _DetermineBlockSizes(self, block_index):
+    """Determines the uncompressed data sizes of the blocks.
+
+    Args:
+      block_index (BlockIndex): block index.
+
+    Raises:
+      BackEndError: if a block cannot be decompressed.
+    """
+    blocks = [
+        block for block in block_index.blocks
+        if block.uncompressed_data_size is None]
+
+    if not self._thread_pool:
+      for block in blocks:
+        compressed_data = self._ReadBlockCompressedData(block)
+        uncompressed_data = block_index.DecompressBlock(
+            block, compressed_data)
+        block.uncompressed_data_size = len(uncompressed_data)
+
+    else:
+      # Decompress a limited number of blocks at a time to bound the amount
+      # of memory used.
+      batch_size = self._number_of_threads * 2
+      for batch_index in range(0, len(blocks), batch_size):
+        results = []
+        for block in blocks[batch_index:batch_index + batch_size]:
+          compressed_data = self._ReadBlockCompressedData(block)
+          result = self._thread_pool.apply_async(
+              block_index.DecompressBlock, (block, compressed_data))
+          results.append((block, result))
+
+        for block, result in results:
+          block.uncompressed_data_size = len(result.get())
+
+    block_index.UpdateOffsets()
+
+  def _GetBlockData(self, block_number):
+    """Retrieves the uncompressed data of a block.
+
+    If multiple threads are used the blocks that follow the block are
+    decompressed ahead in parallel.
+
+    Args:
+      block_number (int): number of the block.
+
+    Returns:
+      bytes: uncompressed data of the block.
+
+    Raises:
+      BackEndError: if the block cannot be decompressed.
+    """
+    if block_number == self._block_number:
+      return self._block_data
+
+    block = self._block_index.blocks[block_number]
+
+    if not self._thread_pool:
+      compressed_data = self._ReadBlockCompressedData(block)
+      block_data = self._block_index.DecompressBlock(block, compressed_data)
+
+    else:
+      last_block_number = min(
+          block_number + self._number_of_threads,
+          len(self._block_index.blocks))
+
+      for pending_block_number in list(self._pending_blocks.keys()):
+        if (pending_block_number < block_number or
+            pending_block_number >= last_block_number):
+          del self._pending_blocks[pending_block_number]
+
+      for pending_block_number in range(block_number, last_block_number):
+        if pending_block_number not in self._pending_blocks:
+          pending_block = self._block_index.blocks[pending_block_number]
+          compressed_data = self._ReadBlockCompressedData(pending_block)
+          self._pending_blocks[pending_block_number] = (
+              self._thread_pool.apply_async(
+                  self._block_index.DecompressBlock,
+                  (pending_block, compressed_data)))
+
+      result = self._pending_blocks.pop(block_number)
+      block_data = result.get()
+
+    self._block_data = block_data
+    self._block_number = block_number
+
+    return block_data
+
+  def _GetDecompressionPipeline(self):
+    """Retrieves a decompression pipeline for the current decompressor.
+
+    Returns:
+      DecompressionPipeline: decompression pipeline or None if the compressed
+          stream is decompressed on the thread that reads the data.
+    """
+    if self._number_of_threads <= 1:
+      return
+
+    return DecompressionPipeline(
+        self._decompressor, self._UNCOMPRESSED_DATA_BUFFER_SIZE,
+        self._MAXIMUM_NUMBER_OF_PENDING_CHUNKS)
+
   def _GetDecompressor(self):
     """Retrieves the decompressor.
 
@@ -82,22 +426,19 @@ class CompressedStream(file_io.FileIO):
     Returns:
       int: uncompressed stream size.
     """
-    self._file_object.seek(0, os.SEEK_SET)
+    self._block_index = self._BuildBlockIndex()
+    if self._block_index:
+      return self._block_index.uncompressed_data_size
 
-    self._decompressor = self._GetDecompressor()
-    self._uncompressed_data = b''
+    self._ResetDecompressor()
 
-    compressed_data_offset = 0
-    compressed_data_size = self._file_object.get_size()
     uncompressed_stream_size = 0
-
-    while compressed_data_offset < compressed_data_size:
-      read_count = self._ReadCompressedData(self._COMPRESSED_DATA_BUFFER_SIZE)
-      if read_count == 0:
+    while True:
+      uncompressed_data_size = self._ReadUncompressedData()
+      if not uncompressed_data_size:
         break
 
-      compressed_data_offset += read_count
-      uncompressed_stream_size += self._uncompressed_data_size
+      uncompressed_stream_size += uncompressed_data_size
 
     return uncompressed_stream_size
 
@@ -137,48 +478,173 @@ class CompressedStream(file_io.FileIO):
     Args:
       uncompressed_data_offset (int): uncompressed data offset.
     """
-    self._file_object.seek(0, os.SEEK_SET)
+    self._ResetDecompressor()
 
-    self._decompressor = self._GetDecompressor()
-    self._uncompressed_data = b''
+    while True:
+      uncompressed_data_size = self._ReadUncompressedData()
+      if not uncompressed_data_size:
+        break
+
+      if uncompressed_data_offset < uncompressed_data_size:
+        self._uncompressed_data_offset = uncompressed_data_offset
+        break
 
-    compressed_data_offset = 0
-    compressed_data_size = self._file_object.get_size()
+      uncompressed_data_offset -= uncompressed_data_size
+
+  def _ReadBlockCompressedData(self, block):
+    """Reads the compressed data of a block from the file-like object.
+
+    Args:
+      block (CompressedBlock): block.
+
+    Returns:
+      bytes: compressed data of the block.
+    """
+    self._file_object.seek(block.compressed_data_offset, os.SEEK_SET)
+    return self._file_object.read(block.compressed_data_size)
+
+  def _ReadBlocks(self, size):
+    """Reads uncompressed data from the blocks at the current offset.
+
+    Args:
+      size (int): number of bytes to read.
 
-    while compressed_data_offset < compressed_data_size:
-      read_count = self._ReadCompressedData(self._COMPRESSED_DATA_BUFFER_SIZE)
-      if read_count == 0:
+    Returns:
+      bytes: data read.
+
+    Raises:
+      BackEndError: if a block cannot be decompressed.
+    """
+    uncompressed_data = []
+    while size > 0:
+      block_number = self._block_index.GetBlockNumberByOffset(
+          self._current_offset)
+      if block_number is None:
         break
 
-      compressed_data_offset += read_count
+      block = self._block_index.blocks[block_number]
+      block_data = self._GetBlockData(block_number)
 
-      if uncompressed_data_offset < self._uncompressed_data_size:
-        self._uncompressed_data_offset = uncompressed_data_offset
+      block_data_offset = self._current_offset - block.uncompressed_data_offset
+      read_size = min(size, len(block_data) - block_data_offset)
+      if read_size <= 0:
         break
 
-      uncompressed_data_offset -= self._uncompressed_data_size
+      uncompressed_data.append(
+          block_data[block_data_offset:block_data_offset + read_size])
 
-  def _ReadCompressedData(self, read_size):
-    """Reads compressed data from the file-like object.
+      self._current_offset += read_size
+      size -= read_size
 
-    Args:
-      read_size (int): number of bytes of compressed data to read.
+    return b''.join(uncompressed_data)
+
+  def _ReadUncompressedData(self):
+    """Reads the next part of the uncompressed data.
+
+    Compressed data is only read from the file-like object when the
+    decompressor has no more uncompressed data to return for the compressed
+    data read so far. The size of the part is bounded by the uncompressed
+    data buffer size.
+
+    Returns:
+      int: number of bytes of uncompressed data read or 0 if no more
+          uncompressed data is available.
+
+    Raises:
+      BackEndError: if the compressed data cannot be decompressed.
+    """
+    if self._decompression_pipeline:
+      uncompressed_data = self._ReadUncompressedDataPipelined()
+
+    else:
+      uncompressed_data = b''
+      while not uncompressed_data:
+        if self._decompressor_needs_input:
+          compressed_data = self._file_object.read(
+              self._COMPRESSED_DATA_BUFFER_SIZE)
+          if not compressed_data:
+            break
+
+          self._compressed_data = b''.join([
+              self._compressed_data, compressed_data])
+
+        uncompressed_data, self._compressed_data = (
+            self._decompressor.Decompress(
+                self._compressed_data,
+                maximum_size=self._UNCOMPRESSED_DATA_BUFFER_SIZE))
+
+        self._decompressor_needs_input = (
+            len(uncompressed_data) != self._UNCOMPRESSED_DATA_BUFFER_SIZE)
+
+    self._uncompressed_data = uncompressed_data
+    self._uncompressed_data_offset = 0
+    self._uncompressed_data_size = len(uncompressed_data)
+
+    return self._uncompressed_data_size
+
+  def _ReadUncompressedDataPipelined(self):
+    """Reads the next part of the uncompressed data using the pipeline.
+
+    The compressed data is read ahead on the thread that reads the data,
+    so that the parent file-like object is not accessed concurrently, and
+    decompressed ahead on the worker thread.
 
     Returns:
-      int: number of bytes of compressed data read.
+      bytes: part of uncompressed data or an empty byte string if no more
+          uncompressed data is available.
+
+    Raises:
+      BackEndError: if the compressed data cannot be decompressed.
     """
-    compressed_data = self._file_object.read(read_size)
+    decompression_pipeline = self._decompression_pipeline
+
+    while True:
+      while (self._decompressor_needs_input and
+             decompression_pipeline.number_of_pending_chunks <
+             self._MAXIMUM_NUMBER_OF_PENDING_CHUNKS):
+        compressed_data = self._file_object.read(
+            self._COMPRESSED_DATA_BUFFER_SIZE)
+        if not compressed_data:
+          # All compressed data was added to the pipeline.
+          self._decompressor_needs_input = False
+          break
+
+        decompression_pipeline.AddCompressedData(compressed_data)
 
-    read_count = len(compressed_data)
+      if not decompression_pipeline.number_of_pending_chunks:
+        return b''
 
-    self._compressed_data = b''.join([self._compressed_data, compressed_data])
+      uncompressed_data = decompression_pipeline.GetUncompressedData()
+      if uncompressed_data:
+        return uncompressed_data
 
-    self._uncompressed_data, self._compressed_data = (
-        self._decompressor.Decompress(self._compressed_data))
+  def _ResetDecompressor(self):
+    """Resets the decompressor to the start of the compressed stream."""
+    self._StopDecompressionPipeline()
 
-    self._uncompressed_data_size = len(self._uncompressed_data)
+    self._file_object.seek(0, os.SEEK_SET)
 
-    return read_count
+    self._compressed_data = b''
+    self._decompressor = self._GetDecompressor()
+    self._decompressor_needs_input = True
+    self._decompression_pipeline = self._GetDecompressionPipeline()
+
+    self._uncompressed_data = b''
+    self._uncompressed_data_offset = 0
+    self._uncompressed_data_size = 0
+
+  def _StopDecompressionPipeline(self):
+    """Stops the decompression pipeline if present."""
+    if self._decompression_pipeline:
+      self._decompression_pipeline.Stop()
+      self._decompression_pipeline = None
+
+  def _TerminateThreadPool(self):
+    """Terminates the thread pool if present."""
+    if self._thread_pool:
+      self._thread_pool.terminate()
+      self._thread_pool.join()
+      self._thread_pool = None
 
   # Note: that the following functions do not follow the style guide
   # because they are part of the file-like object interface.
@@ -216,6 +682,11 @@ class CompressedStream(file_io.FileIO):
     if self._current_offset >= self._uncompressed_stream_size:
       return b''
 
+    if self._block_index:
+      if size is None:
+        size = self._uncompressed_stream_size
+      return self._ReadBlocks(size)
+
     if self._realign_offset:
       self._AlignUncompressedDataOffset(self._current_offset)
       self._realign_offset = False
@@ -225,15 +696,17 @@ class CompressedStream(file_io.FileIO):
     if self._current_offset + size > self._uncompressed_stream_size:
       size = self._uncompressed_stream_size - self._current_offset
 
-    uncompressed_data = b''
-
     if size == 0:
-      return uncompressed_data
+      return b''
 
-    while size > self._uncompressed_data_size:
-      uncompressed_data = b''.join([
-          uncompressed_data,
-          self._uncompressed_data[self._uncompressed_data_offset:]])
+    # The parts of uncompressed data are joined once, to prevent copying
+    # the uncompressed data read so far for every part.
+    uncompressed_data = []
+
+    while size > (
+        self._uncompressed_data_size - self._uncompressed_data_offset):
+      uncompressed_data.append(
+          self._uncompressed_data[self._uncompressed_data_offset:])
 
       remaining_uncompressed_data_size = (
           self._uncompressed_data_size - self._uncompressed_data_offset)
@@ -244,23 +717,20 @@ class CompressedStream(file_io.FileIO):
       if self._current_offset >= self._uncompressed_stream_size:
         break
 
-      read_count = self._ReadCompressedData(self._COMPRESSED_DATA_BUFFER_SIZE)
-      self._uncompressed_data_offset = 0
-      if read_count == 0:
+      if not self._ReadUncompressedData():
         break
 
     if size > 0:
       slice_start_offset = self._uncompressed_data_offset
       slice_end_offset = slice_start_offset + size
 
-      uncompressed_data = b''.join([
-          uncompressed_data,
-          self._uncompressed_data[slice_start_offset:slice_end_offset]])
+      uncompressed_data.append(
+          self._uncompressed_data[slice_start_offset:slice_end_offset])
 
       self._uncompressed_data_offset += size
       self._current_offset += size
 
-    return uncompressed_data
+    return b''.join(uncompressed_data)
 
   def seek(self, offset, whence=os.SEEK_SET):
     """Seeks to an offset within the file-like object.
@@ -15,6 +15,10 @@ class DataRange(file_io.FileIO):
   a full disk image as a separate file-like object by mapping
   the data range (offset and size) fo the volume on top of the full disk
   image.
+
+  If the parent file-like object maps a data range itself, for example
+  a data range within a data range, the data range is flattened and read
+  directly from the bottom-most file-like object.
   """
 
   def __init__(self, resolver_context, file_object=None):
@@ -30,6 +34,9 @@ class DataRange(file_io.FileIO):
     super(DataRange, self).__init__(resolver_context)
     self._current_offset = 0
     self._file_object = file_object
+    self._flattened_file_object = None
+    self._flattened_range_offset = -1
+    self._flattened_range_size = -1
 
     if file_object:
       self._file_object_set_in_init = True
@@ -47,6 +54,10 @@ class DataRange(file_io.FileIO):
     the data range file-like object does not control the file-like object
     and should not actually close it.
     """
+    self._flattened_file_object = None
+    self._flattened_range_offset = -1
+    self._flattened_range_size = -1
+
     if not self._file_object_set_in_init:
       self._file_object.close()
       self._file_object = None
@@ -85,6 +96,42 @@ class DataRange(file_io.FileIO):
       self._file_object = resolver.Resolver.OpenFileObject(
           path_spec.parent, resolver_context=self._resolver_context)
 
+    self._FlattenDataRange()
+
+  def _FlattenDataRange(self):
+    """Maps the data range onto the bottom-most file-like object."""
+    if hasattr(self._file_object, u'GetFlattenedDataRange'):
+      file_object, range_offset, range_size = (
+          self._file_object.GetFlattenedDataRange())
+    else:
+      file_object = self._file_object
+      range_offset = 0
+      range_size = self._file_object.get_size()
+
+    self._flattened_file_object = file_object
+    self._flattened_range_offset = range_offset + self._range_offset
+
+    # Data beyond the end of the parent file-like object is not mapped.
+    self._flattened_range_size = max(
+        0, min(self._range_size, range_size - self._range_offset))
+
+  def GetFlattenedDataRange(self):
+    """Retrieves the data range within the bottom-most file-like object.
+
+    Returns:
+      tuple[FileIO, int, int]: bottom-most file-like object and the offset
+          and size of the data within it.
+
+    Raises:
+      IOError: if the file-like object has not been opened.
+    """
+    if not self._is_open:
+      raise IOError(u'Not opened.')
+
+    return (
+        self._flattened_file_object, self._flattened_range_offset,
+        self._flattened_range_size)
+
   def SetRange(self, range_offset, range_size):
     """Sets the data range (offset and size).
 
@@ -146,18 +193,18 @@ class DataRange(file_io.FileIO):
           u'Invalid current offset: {0:d} value less than zero.'.format(
               self._current_offset))
 
-    if self._current_offset >= self._range_size:
+    if self._current_offset >= self._flattened_range_size:
       return b''
 
     if size is None:
-      size = self._range_size
-    if self._current_offset + size > self._range_size:
-      size = self._range_size - self._current_offset
+      size = self._flattened_range_size
+    if self._current_offset + size > self._flattened_range_size:
+      size = self._flattened_range_size - self._current_offset
 
-    self._file_object.seek(
-        self._range_offset + self._current_offset, os.SEEK_SET)
+    self._flattened_file_object.seek(
+        self._flattened_range_offset + self._current_offset, os.SEEK_SET)
 
-    data = self._file_object.read(size)
+    data = self._flattened_file_object.read(size)
 
     self._current_offset += len(data)
 
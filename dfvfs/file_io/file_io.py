@@ -27,6 +27,35 @@ class FileIO(object):
       IOError: if the close failed.
     """
 
+  def _MergeExtents(self, extents):
+    """Merges overlapping and adjacent extents.
+
+    Args:
+      extents (list[tuple[int, int]]): offset and size of the extents.
+
+    Returns:
+      list[tuple[int, int]]: offset and size of the merged extents, sorted
+          by offset.
+    """
+    merged_extents = []
+    for extent_offset, extent_size in sorted(extents):
+      if extent_size <= 0:
+        continue
+
+      if merged_extents:
+        last_extent_offset, last_extent_size = merged_extents[-1]
+        last_extent_end_offset = last_extent_offset + last_extent_size
+        if extent_offset <= last_extent_end_offset:
+          extent_end_offset = max(
+              last_extent_end_offset, extent_offset + extent_size)
+          merged_extents[-1] = (
+              last_extent_offset, extent_end_offset - last_extent_offset)
+          continue
+
+      merged_extents.append((extent_offset, extent_size))
+
+    return merged_extents
+
   @abc.abstractmethod
   def _Open(self, path_spec=None, mode='rb'):
     """Opens the file-like object defined by path specification.
@@ -42,6 +71,50 @@ class FileIO(object):
       ValueError: if the path specification is invalid.
     """
 
+  def GetAllocatedExtents(self):
+    """Retrieves the allocated extents of the data.
+
+    File-like objects that support sparse storage, such as storage media
+    images, only return the extents that are backed by stored data. Data
+    outside these extents reads as zero bytes. By default all the data is
+    considered allocated.
+
+    Returns:
+      list[tuple[int, int]]: offset and size of the allocated extents,
+          sorted by offset.
+
+    Raises:
+      IOError: if the file-like object has not been opened.
+    """
+    if not self._is_open:
+      raise IOError(u'Not opened.')
+
+    size = self.get_size()
+    if not size:
+      return []
+
+    return [(0, size)]
+
+  def GetFlattenedDataRange(self):
+    """Retrieves the data range within the bottom-most file-like object.
+
+    File-like objects that only map a data range of their parent file-like
+    object, such as a data range, return the corresponding data range within
+    the bottom-most file-like object. This allows intermediate file-like
+    objects to be skipped when reading.
+
+    Returns:
+      tuple[FileIO, int, int]: bottom-most file-like object and the offset
+          and size of the data within it.
+
+    Raises:
+      IOError: if the file-like object has not been opened.
+    """
+    if not self._is_open:
+      raise IOError(u'Not opened.')
+
+    return self, 0, self.get_size()
+
   # Note: that the following functions do not follow the style guide
   # because they are part of the file-like object interface.
 
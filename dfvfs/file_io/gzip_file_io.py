@@ -1,46 +1,32 @@
 # -*- coding: utf-8 -*-
 """The gzip file-like object."""
 
+import bisect
 import os
 
-import construct
-
-from dfvfs.file_io import file_object_io
-from dfvfs.lib import definitions
+from dfvfs.file_io import file_io
 from dfvfs.lib import errors
-from dfvfs.path import compressed_stream_path_spec
-from dfvfs.path import data_range_path_spec
+from dfvfs.lib import gzipfile
 from dfvfs.resolver import resolver
 
 
-class GzipFile(file_object_io.FileObjectIO):
+class GzipFile(file_io.FileIO):
   """Class that implements a file-like object of a gzip file.
 
-     The gzip file is a zlib compressed data stream with additional metadata.
+  The gzip file is a zlib compressed data stream with additional metadata.
+  It consists of one or more members, where the uncompressed data of
+  the gzip file is the concatenation of the uncompressed data of
+  the members.
+
+  Attributes:
+    comment (str): comment stored in the first member.
+    modification_time (int): modification POSIX timestamp stored in
+        the first member.
+    operating_system (int): operating system stored in the first member.
+    original_filename (str): original filename stored in the first member.
+    uncompressed_data_size (int): total size of the uncompressed data of
+        all members.
   """
-  _FILE_HEADER_STRUCT = construct.Struct(
-      u'file_header',
-      construct.ULInt16(u'signature'),
-      construct.UBInt8(u'compression_method'),
-      construct.UBInt8(u'flags'),
-      construct.SLInt32(u'modification_time'),
-      construct.UBInt8(u'extra_flags'),
-      construct.UBInt8(u'operating_system'))
-
-  _FILE_FOOTER_STRUCT = construct.Struct(
-      u'file_footer',
-      construct.ULInt32(u'checksum'),
-      construct.ULInt32(u'uncompressed_data_size'))
-
-  _FILE_SIGNATURE = 0x8b1f
-
-  _COMPRESSION_METHOD_DEFLATE = 8
-
-  _FLAG_FTEXT = 0x01
-  _FLAG_FHCRC = 0x02
-  _FLAG_FEXTRA = 0x04
-  _FLAG_FNAME = 0x08
-  _FLAG_FCOMMENT = 0x10
 
   def __init__(self, resolver_context, file_object=None):
     """Initializes the file-like object.
@@ -56,71 +42,62 @@ class GzipFile(file_object_io.FileObjectIO):
       raise ValueError(u'File object value set.')
 
     super(GzipFile, self).__init__(resolver_context)
-    self._compressed_data_offset = -1
-    self._compressed_data_size = -1
+    self._current_offset = 0
+    self._file_object = None
+    self._members = []
+    self._members_uncompressed_data_offsets = []
     self.comment = None
     self.modification_time = None
     self.operating_system = None
     self.original_filename = None
     self.uncompressed_data_size = 0
 
-  def _ReadFileHeader(self, file_object):
-    """Reads the file header.
+  def _Close(self):
+    """Closes the file-like object."""
+    self._file_object.close()
+    self._file_object = None
+
+    self._members = []
+    self._members_uncompressed_data_offsets = []
+
+  def _Open(self, path_spec=None, mode='rb'):
+    """Opens the file-like object defined by path specification.
 
     Args:
-      file_object (FileIO): file-like object to read from.
+      path_spec (Optional[PathSpec]): path specification.
+      mode (Optional[str]): file access mode.
 
     Raises:
-      FileFormatError: if file format related errors are detected.
+      AccessError: if the access to open the file was denied.
+      IOError: if the file-like object could not be opened.
+      PathSpecError: if the path specification is incorrect.
+      ValueError: if the path specification is invalid.
     """
-    file_object.seek(0, os.SEEK_SET)
-    file_header = self._FILE_HEADER_STRUCT.parse_stream(file_object)
-    self._compressed_data_offset = file_object.get_offset()
-
-    if file_header.signature != self._FILE_SIGNATURE:
-      raise errors.FileFormatError(
-          u'Unsuppored file signature: 0x{0:04x}.'.format(
-              file_header.signature))
-
-    if file_header.compression_method != self._COMPRESSION_METHOD_DEFLATE:
-      raise errors.FileFormatError(
-          u'Unsuppored compression method: {0:d}.'.format(
-              file_header.compression_method))
-
-    self.modification_time = file_header.modification_time
-    self.operating_system = file_header.operating_system
-
-    if file_header.flags & self._FLAG_FEXTRA:
-      extra_field_data_size = construct.ULInt16(
-          u'extra_field_data_size').parse_stream(file_object)
-      file_object.seek(extra_field_data_size, os.SEEK_CUR)
-      self._compressed_data_offset += 2 + extra_field_data_size
-
-    if file_header.flags & self._FLAG_FNAME:
-      # Since encoding is set construct will convert the C string to Unicode.
-      # Note that construct 2 does not support the encoding to be a Unicode
-      # string.
-      self.original_filename = construct.CString(
-          u'original_filename', encoding='iso-8859-1').parse_stream(
-              file_object)
-      self._compressed_data_offset = file_object.get_offset()
-
-    if file_header.flags & self._FLAG_FCOMMENT:
-      # Since encoding is set construct will convert the C string to Unicode.
-      # Note that construct 2 does not support the encoding to be a Unicode
-      # string.
-      self.comment = construct.CString(
-          u'comment', encoding='iso-8859-1').parse_stream(file_object)
-      self._compressed_data_offset = file_object.get_offset()
-
-    if file_header.flags & self._FLAG_FHCRC:
-      self._compressed_data_offset += 2
-
-    self._compressed_data_size = (
-        file_object.get_size() - (self._compressed_data_offset + 8))
-
-  def _ReadFileFooter(self, file_object):
-    """Reads the file footer.
+    if not path_spec:
+      raise ValueError(u'Missing path specification.')
+
+    if not path_spec.HasParent():
+      raise errors.PathSpecError(
+          u'Unsupported path specification without parent.')
+
+    file_object = resolver.Resolver.OpenFileObject(
+        path_spec.parent, resolver_context=self._resolver_context)
+
+    try:
+      self._ReadMembers(file_object)
+
+    except (IOError, errors.FileFormatError) as exception:
+      file_object.close()
+      raise IOError(
+          u'Unable to open gzip file with error: {0!s}.'.format(exception))
+
+    self._file_object = file_object
+
+  def _ReadMembers(self, file_object):
+    """Reads the members.
+
+    Data that follows the last member and that is not a valid member,
+    such as padding, is ignored.
 
     Args:
       file_object (FileIO): file-like object to read from.
@@ -128,37 +105,161 @@ class GzipFile(file_object_io.FileObjectIO):
     Raises:
       FileFormatError: if file format related errors are detected.
     """
-    file_object.seek(-8, os.SEEK_END)
-    file_footer = self._FILE_FOOTER_STRUCT.parse_stream(file_object)
+    file_size = file_object.get_size()
 
-    self.uncompressed_data_size = file_footer.uncompressed_data_size
+    self._members = []
+    self._members_uncompressed_data_offsets = []
 
-  def _OpenFileObject(self, path_spec):
-    """Opens the file-like object defined by path specification.
+    member_start_offset = 0
+    uncompressed_data_offset = 0
+
+    while member_start_offset < file_size:
+      try:
+        member = gzipfile.GzipMember(
+            file_object, member_start_offset, uncompressed_data_offset)
+      except errors.FileFormatError:
+        if not self._members:
+          raise
+        break
+
+      self._members.append(member)
+      self._members_uncompressed_data_offsets.append(uncompressed_data_offset)
+
+      member_start_offset = member.member_end_offset
+      uncompressed_data_offset += member.uncompressed_data_size
+
+    first_member = self._members[0]
+    self.comment = first_member.comment
+    self.modification_time = first_member.modification_time
+    self.operating_system = first_member.operating_system
+    self.original_filename = first_member.original_filename
+    self.uncompressed_data_size = uncompressed_data_offset
+
+  def GetNumberOfMembers(self):
+    """Retrieves the number of members.
+
+    Returns:
+      int: number of members.
+
+    Raises:
+      IOError: if the file-like object has not been opened.
+    """
+    if not self._is_open:
+      raise IOError(u'Not opened.')
+
+    return len(self._members)
+
+  # Note: that the following functions do not follow the style guide
+  # because they are part of the file-like object interface.
+
+  def read(self, size=None):
+    """Reads a byte string from the gzip file at the current offset.
+
+    The function will read a byte string up to the specified size or
+    all of the remaining data if no size was specified.
 
     Args:
-      path_spec (Optional[PathSpec]): path specification.
+      size (Optional[int]): number of bytes to read, where None is all
+          remaining data.
+
+    Returns:
+      bytes: data read.
+
+    Raises:
+      IOError: if the read failed.
+    """
+    if not self._is_open:
+      raise IOError(u'Not opened.')
+
+    if self._current_offset < 0:
+      raise IOError(
+          u'Invalid current offset: {0:d} value less than zero.'.format(
+              self._current_offset))
+
+    if self._current_offset >= self.uncompressed_data_size:
+      return b''
+
+    if size is None or (
+        self._current_offset + size > self.uncompressed_data_size):
+      size = self.uncompressed_data_size - self._current_offset
+
+    member_index = bisect.bisect_right(
+        self._members_uncompressed_data_offsets, self._current_offset) - 1
+
+    data = []
+    while size > 0 and member_index < len(self._members):
+      member = self._members[member_index]
+      member_offset = self._current_offset - member.uncompressed_data_offset
+
+      try:
+        member_data = member.ReadAtOffset(member_offset, size)
+      except errors.FileFormatError as exception:
+        raise IOError(
+            u'Unable to read gzip member with error: {0!s}.'.format(
+                exception))
+
+      if member_offset + len(member_data) >= member.uncompressed_data_size:
+        member_index += 1
+
+      elif not member_data:
+        break
+
+      data.append(member_data)
+      self._current_offset += len(member_data)
+      size -= len(member_data)
+
+    return b''.join(data)
+
+  def seek(self, offset, whence=os.SEEK_SET):
+    """Seeks to an offset within the file-like object.
+
+    Args:
+      offset (int): offset to seek to.
+      whence (Optional(int)): value that indicates whether offset is an absolute
+          or relative position within the file.
+
+    Raises:
+      IOError: if the seek failed.
+    """
+    if not self._is_open:
+      raise IOError(u'Not opened.')
+
+    if whence == os.SEEK_CUR:
+      offset += self._current_offset
+    elif whence == os.SEEK_END:
+      offset += self.uncompressed_data_size
+    elif whence != os.SEEK_SET:
+      raise IOError(u'Unsupported whence.')
+
+    if offset < 0:
+      raise IOError(u'Invalid offset value less than zero.')
+
+    self._current_offset = offset
+
+  def get_offset(self):
+    """Retrieves the current offset into the file-like object.
 
     Returns:
-      FileIO: a file-like object.
+      int: current offset into the file-like object.
+
+    Raises:
+      IOError: if the file-like object has not been opened.
     """
-    gzip_file_object = resolver.Resolver.OpenFileObject(
-        path_spec.parent, resolver_context=self._resolver_context)
+    if not self._is_open:
+      raise IOError(u'Not opened.')
 
-    try:
-      self._ReadFileHeader(gzip_file_object)
-      self._ReadFileFooter(gzip_file_object)
-
-    finally:
-      gzip_file_object.close()
-
-    path_spec_data_range = data_range_path_spec.DataRangePathSpec(
-        range_offset=self._compressed_data_offset,
-        range_size=self._compressed_data_size, parent=path_spec.parent)
-    path_spec_compressed_stream = (
-        compressed_stream_path_spec.CompressedStreamPathSpec(
-            compression_method=definitions.COMPRESSION_METHOD_DEFLATE,
-            parent=path_spec_data_range))
-
-    return resolver.Resolver.OpenFileObject(
-        path_spec_compressed_stream, resolver_context=self._resolver_context)
+    return self._current_offset
+
+  def get_size(self):
+    """Retrieves the size of the file-like object.
+
+    Returns:
+      int: size of the file-like object data.
+
+    Raises:
+      IOError: if the file-like object has not been opened.
+    """
+    if not self._is_open:
+      raise IOError(u'Not opened.')
+
+    return self.uncompressed_data_size
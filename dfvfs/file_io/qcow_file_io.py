@@ -1,6 +1,10 @@
 # -*- coding: utf-8 -*-
 """The QCOW image file-like object."""
 
+import os
+import struct
+
+import construct
 import pyqcow
 
 from dfvfs.file_io import file_object_io
@@ -11,6 +15,64 @@ from dfvfs.resolver import resolver
 class QCOWFile(file_object_io.FileObjectIO):
   """Class that implements a file-like object using pyqcow."""
 
+  _FILE_HEADER_VERSION1_STRUCT = construct.Struct(
+      u'file_header_version1',
+      construct.Bytes(u'signature', 4),
+      construct.UBInt32(u'format_version'),
+      construct.UBInt64(u'backing_filename_offset'),
+      construct.UBInt32(u'backing_filename_size'),
+      construct.UBInt32(u'modification_time'),
+      construct.UBInt64(u'media_size'),
+      construct.UBInt8(u'number_of_cluster_block_bits'),
+      construct.UBInt8(u'number_of_level2_table_bits'),
+      construct.UBInt16(u'unknown1'),
+      construct.UBInt32(u'encryption_method'),
+      construct.UBInt64(u'level1_table_offset'))
+
+  _FILE_HEADER_VERSION2_STRUCT = construct.Struct(
+      u'file_header_version2',
+      construct.Bytes(u'signature', 4),
+      construct.UBInt32(u'format_version'),
+      construct.UBInt64(u'backing_filename_offset'),
+      construct.UBInt32(u'backing_filename_size'),
+      construct.UBInt32(u'number_of_cluster_block_bits'),
+      construct.UBInt64(u'media_size'),
+      construct.UBInt32(u'encryption_method'),
+      construct.UBInt32(u'number_of_level1_table_references'),
+      construct.UBInt64(u'level1_table_offset'))
+
+  _FILE_SIGNATURE = b'QFI\xfb'
+
+  # Level 1 and 2 table references in format version 1 store the offset
+  # in the lower 63 bits, format version 2 and 3 use bits 9 to 55.
+  _OFFSET_MASK_VERSION1 = 0x7fffffffffffffff
+  _OFFSET_MASK_VERSION2 = 0x00fffffffffffe00
+
+  _COMPRESSED_FLAG_VERSION1 = 0x8000000000000000
+  _COMPRESSED_FLAG_VERSION2 = 0x4000000000000000
+
+  # Format version 3 level 2 table references can mark a cluster as
+  # reading as zero bytes.
+  _ZERO_FLAG_VERSION3 = 0x0000000000000001
+
+  def __init__(self, resolver_context, file_object=None):
+    """Initializes the file-like object.
+
+    Args:
+      resolver_context (Context): resolver context.
+      file_object (Optional[FileIO]): file-like object.
+    """
+    super(QCOWFile, self).__init__(resolver_context, file_object=file_object)
+    self._allocated_extents = None
+    self._parent_file_object = None
+
+  def _Close(self):
+    """Closes the file-like object."""
+    super(QCOWFile, self)._Close()
+
+    self._allocated_extents = None
+    self._parent_file_object = None
+
   def _OpenFileObject(self, path_spec):
     """Opens the file-like object defined by path specification.
 
@@ -31,8 +93,150 @@ class QCOWFile(file_object_io.FileObjectIO):
         path_spec.parent, resolver_context=self._resolver_context)
     qcow_file = pyqcow.file()
     qcow_file.open_file_object(file_object)
+
+    self._parent_file_object = file_object
     return qcow_file
 
+  def _ReadAllocatedExtents(self, file_object):
+    """Reads the allocated extents from the level 1 and 2 tables.
+
+    Args:
+      file_object (FileIO): file-like object of the QCOW image file.
+
+    Returns:
+      list[tuple[int, int]]: offset and size of the allocated extents.
+
+    Raises:
+      FileFormatError: if file format related errors are detected.
+    """
+    file_object.seek(0, os.SEEK_SET)
+    file_header_data = file_object.read(
+        self._FILE_HEADER_VERSION2_STRUCT.sizeof())
+
+    try:
+      file_header = self._FILE_HEADER_VERSION2_STRUCT.parse(file_header_data)
+    except construct.FieldError as exception:
+      raise errors.FileFormatError(
+          u'Unable to parse file header with error: {0!s}'.format(exception))
+
+    if file_header.signature != self._FILE_SIGNATURE:
+      raise errors.FileFormatError(u'Unsupported file signature.')
+
+    format_version = file_header.format_version
+    if format_version == 1:
+      file_header = self._FILE_HEADER_VERSION1_STRUCT.parse(file_header_data)
+
+      cluster_block_size = 1 << file_header.number_of_cluster_block_bits
+      number_of_level2_table_references = (
+          1 << file_header.number_of_level2_table_bits)
+      level2_table_data_size = number_of_level2_table_references * 8
+
+      level1_table_data_size = (
+          cluster_block_size * number_of_level2_table_references)
+      number_of_level1_table_references, remainder = divmod(
+          file_header.media_size, level1_table_data_size)
+      if remainder:
+        number_of_level1_table_references += 1
+
+      offset_mask = self._OFFSET_MASK_VERSION1
+      compressed_flag = self._COMPRESSED_FLAG_VERSION1
+      zero_flag = 0
+
+    elif format_version in (2, 3):
+      cluster_block_size = 1 << file_header.number_of_cluster_block_bits
+      number_of_level2_table_references = cluster_block_size // 8
+      level2_table_data_size = cluster_block_size
+
+      number_of_level1_table_references = (
+          file_header.number_of_level1_table_references)
+
+      offset_mask = self._OFFSET_MASK_VERSION2
+      compressed_flag = self._COMPRESSED_FLAG_VERSION2
+      if format_version == 3:
+        zero_flag = self._ZERO_FLAG_VERSION3
+      else:
+        zero_flag = 0
+
+    else:
+      raise errors.FileFormatError(
+          u'Unsupported format version: {0:d}.'.format(format_version))
+
+    media_size = file_header.media_size
+    level2_table_media_size = (
+        cluster_block_size * number_of_level2_table_references)
+
+    file_object.seek(file_header.level1_table_offset, os.SEEK_SET)
+    level1_table_data = file_object.read(
+        number_of_level1_table_references * 8)
+    level1_table = struct.unpack(
+        u'>{0:d}Q'.format(len(level1_table_data) // 8), level1_table_data)
+
+    allocated_extents = []
+    for level1_index, level1_table_reference in enumerate(level1_table):
+      level2_table_offset = level1_table_reference & offset_mask
+      if not level2_table_offset:
+        continue
+
+      file_object.seek(level2_table_offset, os.SEEK_SET)
+      level2_table_data = file_object.read(level2_table_data_size)
+      level2_table = struct.unpack(
+          u'>{0:d}Q'.format(len(level2_table_data) // 8), level2_table_data)
+
+      media_offset = level1_index * level2_table_media_size
+      for level2_table_reference in level2_table:
+        if media_offset >= media_size:
+          break
+
+        if level2_table_reference & compressed_flag:
+          is_allocated = True
+        elif level2_table_reference & zero_flag:
+          is_allocated = False
+        else:
+          is_allocated = bool(level2_table_reference & offset_mask)
+
+        if is_allocated:
+          allocated_extents.append((media_offset, min(
+              cluster_block_size, media_size - media_offset)))
+
+        media_offset += cluster_block_size
+
+    return allocated_extents
+
+  def GetAllocatedExtents(self):
+    """Retrieves the allocated extents of the data.
+
+    Clusters that are not allocated in the QCOW image read as zero bytes.
+
+    Returns:
+      list[tuple[int, int]]: offset and size of the allocated extents,
+          sorted by offset.
+
+    Raises:
+      IOError: if the file-like object has not been opened or the allocated
+          extents cannot be determined.
+    """
+    if not self._is_open:
+      raise IOError(u'Not opened.')
+
+    if self._allocated_extents is None:
+      if not self._parent_file_object:
+        return super(QCOWFile, self).GetAllocatedExtents()
+
+      current_offset = self._parent_file_object.get_offset()
+      try:
+        allocated_extents = self._ReadAllocatedExtents(
+            self._parent_file_object)
+      except errors.FileFormatError as exception:
+        raise IOError(
+            u'Unable to read allocated extents with error: {0!s}'.format(
+                exception))
+      finally:
+        self._parent_file_object.seek(current_offset, os.SEEK_SET)
+
+      self._allocated_extents = self._MergeExtents(allocated_extents)
+
+    return list(self._allocated_extents)
+
   def get_size(self):
     """Retrieves the size of the file-like object.
 
@@ -78,8 +78,33 @@ class RawFile(file_object_io.FileObjectIO):
 
     raw_handle = pysmraw.handle()
     raw_handle.open_file_objects(file_objects)
+
+    self._file_objects = file_objects
     return raw_handle
 
+  def GetFlattenedDataRange(self):
+    """Retrieves the data range within the bottom-most file-like object.
+
+    A RAW storage media image that consists of a single segment file maps
+    directly onto the segment file.
+
+    Returns:
+      tuple[FileIO, int, int]: bottom-most file-like object and the offset
+          and size of the data within it.
+
+    Raises:
+      IOError: if the file-like object has not been opened.
+    """
+    if not self._is_open:
+      raise IOError(u'Not opened.')
+
+    if len(self._file_objects) != 1:
+      return super(RawFile, self).GetFlattenedDataRange()
+
+    file_object, range_offset, range_size = (
+        self._file_objects[0].GetFlattenedDataRange())
+    return file_object, range_offset, min(range_size, self.get_size())
+
   def get_size(self):
     """Retrieves the size of the file-like object.
 
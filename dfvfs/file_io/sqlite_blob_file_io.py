@@ -11,7 +11,11 @@ from dfvfs.resolver import resolver
 
 
 class SQLiteBlobFile(file_io.FileIO):
-  """Class that implements a file-like object using sqlite."""
+  """Class that implements a file-like object using sqlite.
+
+  If supported by the sqlite3 module the blob is read incrementally,
+  otherwise the entire blob is read into memory when opened.
+  """
 
   _OPERATORS = frozenset([u'==', u'=', u'IS'])
 
@@ -23,22 +27,85 @@ class SQLiteBlobFile(file_io.FileIO):
     """
     super(SQLiteBlobFile, self).__init__(resolver_context)
     self._blob = None
+    self._blob_handle = None
     self._current_offset = 0
     self._database_object = None
+    self._database_object_is_cached = False
     self._number_of_rows = None
     self._size = 0
     self._table_name = None
 
   def _Close(self):
     """Closes the file-like object."""
+    if self._blob_handle:
+      self._blob_handle.close()
+      self._blob_handle = None
+
     if self._database_object:
-      self._database_object.Close()
+      self._ReleaseDatabase(self._database_object)
+      self._database_object = None
 
     self._blob = None
     self._current_offset = 0
     self._size = 0
     self._table_name = None
 
+  def _OpenDatabase(self, path_spec):
+    """Opens the database.
+
+    The database is shared by the SQLite blob file-like objects of
+    the resolver context, such that the database is only copied to
+    a temporary file once.
+
+    Args:
+      path_spec (PathSpec): path specification of the file that contains
+          the database.
+
+    Returns:
+      SQLiteDatabaseFile: database object.
+
+    Raises:
+      IOError: if the database could not be opened.
+    """
+    database_object = self._resolver_context.GetDatabase(path_spec)
+    if not database_object:
+      file_object = resolver.Resolver.OpenFileObject(
+          path_spec, resolver_context=self._resolver_context)
+
+      try:
+        database_object = sqlite_database.SQLiteDatabaseFile()
+        database_object.Open(file_object)
+      finally:
+        file_object.close()
+
+      try:
+        self._resolver_context.CacheDatabase(path_spec, database_object)
+      except errors.CacheFullError:
+        self._database_object_is_cached = False
+        return database_object
+
+    self._resolver_context.GrabDatabase(path_spec)
+    self._database_object_is_cached = True
+
+    return database_object
+
+  def _ReleaseDatabase(self, database_object):
+    """Releases the database.
+
+    The database is closed, which removes its temporary copy, when it is
+    no longer used by any SQLite blob file-like object.
+
+    Args:
+      database_object (SQLiteDatabaseFile): database object.
+    """
+    if not self._database_object_is_cached:
+      database_object.Close()
+
+    elif self._resolver_context.ReleaseDatabase(database_object):
+      database_object.Close()
+
+    self._database_object_is_cached = False
+
   def _Open(self, path_spec=None, mode='rb'):
     """Opens the file-like object defined by path specification.
 
@@ -87,14 +154,7 @@ class SQLiteBlobFile(file_io.FileIO):
     if self._database_object:
       raise IOError(u'Database file already set.')
 
-    file_object = resolver.Resolver.OpenFileObject(
-        path_spec.parent, resolver_context=self._resolver_context)
-
-    try:
-      database_object = sqlite_database.SQLiteDatabaseFile()
-      database_object.Open(file_object)
-    finally:
-      file_object.close()
+    database_object = self._OpenDatabase(path_spec.parent)
 
     # Sanity check the table and column names.
     error_string = u''
@@ -106,9 +166,9 @@ class SQLiteBlobFile(file_io.FileIO):
           column_name, table_name)
 
     elif not row_condition:
-      query = u'SELECT {0:s} FROM {1:s} LIMIT 1 OFFSET {2:d}'.format(
-          column_name, table_name, row_index)
-      rows = database_object.Query(query)
+      query = u'SELECT {{0:s}} FROM {0:s} LIMIT 1 OFFSET {1:d}'.format(
+          table_name, row_index)
+      query_parameters = None
 
     elif not database_object.HasColumn(table_name, row_condition[0]):
       error_string = (
@@ -121,9 +181,28 @@ class SQLiteBlobFile(file_io.FileIO):
               row_condition[1]))
 
     else:
-      query = u'SELECT {0:s} FROM {1:s} WHERE {2:s} {3:s} ?'.format(
-          column_name, table_name, row_condition[0], row_condition[1])
-      rows = database_object.Query(query, parameters=(row_condition[2], ))
+      query = u'SELECT {{0:s}} FROM {0:s} WHERE {1:s} {2:s} ?'.format(
+          table_name, row_condition[0], row_condition[1])
+      query_parameters = (row_condition[2], )
+
+    # If supported, the row identifier is queried instead of the value, so
+    # that the value can be read incrementally, instead of entirely. Note
+    # that this is only done for a row condition, since the order of the rows
+    # without condition can differ between a row identifier query and a value
+    # query, for example when SQLite uses an index for the former.
+    use_incremental_blob_io = False
+    if not error_string:
+      use_incremental_blob_io = (
+          bool(row_condition) and
+          database_object.SupportsIncrementalBlobIO() and
+          database_object.HasRowIdentifier(table_name))
+
+      if use_incremental_blob_io:
+        rows = database_object.Query(
+            query.format(u'_ROWID_'), parameters=query_parameters)
+      else:
+        rows = database_object.Query(
+            query.format(column_name), parameters=query_parameters)
 
     # Make sure the query returns a single row, using cursor.rowcount
     # is not reliable for this purpose.
@@ -142,13 +221,29 @@ class SQLiteBlobFile(file_io.FileIO):
                 table_name, column_name, row_condition_string)
 
     if error_string:
-      database_object.Close()
+      self._ReleaseDatabase(database_object)
       raise IOError(error_string)
 
-    self._blob = rows[0][0]
+    blob = None
+    if use_incremental_blob_io:
+      blob = database_object.OpenBlob(table_name, column_name, rows[0][0])
+      if blob is None:
+        # Fall back to reading the entire value, for example if the value
+        # is not a blob or text.
+        rows = database_object.Query(
+            query.format(column_name), parameters=query_parameters)
+
+    if blob is not None:
+      self._blob = None
+      self._blob_handle = blob
+      self._size = len(blob)
+    else:
+      self._blob = rows[0][0]
+      self._blob_handle = None
+      self._size = len(self._blob)
+
     self._current_offset = 0
     self._database_object = database_object
-    self._size = len(self._blob)
     self._table_name = table_name
 
   # TODO: remove this when there is a move this to a central temp file
@@ -206,6 +301,11 @@ class SQLiteBlobFile(file_io.FileIO):
 
     start_offset = self._current_offset
     self._current_offset += size
+
+    if self._blob_handle:
+      self._blob_handle.seek(start_offset)
+      return self._blob_handle.read(size)
+
     return self._blob[start_offset:self._current_offset]
 
   def seek(self, offset, whence=os.SEEK_SET):
@@ -1,9 +1,7 @@
 # -*- coding: utf-8 -*-
 """The TAR extracted file-like object implementation."""
 
-# Note: that tarfile.ExFileObject is not POSIX compliant for seeking
-# beyond the file size, hence it is wrapped in an instance of file_io.FileIO.
-
+import bisect
 import os
 
 from dfvfs.file_io import file_io
@@ -11,7 +9,13 @@ from dfvfs.resolver import resolver
 
 
 class TARFile(file_io.FileIO):
-  """Class that implements a file-like object using tarfile."""
+  """Class that implements a file-like object using tarfile.
+
+  The data of a TAR member is stored contiguously in the TAR file, hence
+  it is read directly from the file-like object that contains the TAR file,
+  instead of through tarfile. The data of a sparse member only contains
+  the data segments, where the holes in between are read as zero bytes.
+  """
 
   def __init__(self, resolver_context):
     """Initializes the file-like object.
@@ -21,18 +25,49 @@ class TARFile(file_io.FileIO):
     """
     super(TARFile, self).__init__(resolver_context)
     self._current_offset = 0
+    self._data_segments = []
+    self._data_segments_offsets = []
+    self._file_object = None
     self._file_system = None
     self._size = 0
-    self._tar_ext_file = None
 
   def _Close(self):
     """Closes the file-like object."""
-    self._tar_ext_file.close()
-    self._tar_ext_file = None
+    self._data_segments = []
+    self._data_segments_offsets = []
+    self._file_object = None
 
     self._file_system.Close()
     self._file_system = None
 
+  def _GetDataSegments(self, tar_info, range_offset):
+    """Retrieves the data segments of a TAR member.
+
+    Args:
+      tar_info (tarfile.TarInfo): TAR info.
+      range_offset (int): offset of the TAR file within the file-like object
+          the data is read from.
+
+    Returns:
+      list[tuple[int, int, int]]: offset of the segment within the member,
+          offset of the segment data within the file-like object and size
+          of the segment, ordered by offset.
+    """
+    data_offset = range_offset + tar_info.offset_data
+
+    if not tar_info.issparse():
+      return [(0, data_offset, tar_info.size)]
+
+    data_segments = []
+    for segment_offset, segment_size in tar_info.sparse:
+      if segment_size <= 0:
+        continue
+
+      data_segments.append((segment_offset, data_offset, segment_size))
+      data_offset += segment_size
+
+    return sorted(data_segments)
+
   def _Open(self, path_spec=None, mode='rb'):
     """Opens the file-like object defined by path specification.
 
@@ -62,14 +97,93 @@ class TARFile(file_io.FileIO):
       raise IOError(u'Not a regular file.')
 
     self._file_system = file_system
-    tar_file = self._file_system.GetTARFile()
     tar_info = file_entry.GetTARInfo()
 
-    self._tar_ext_file = tar_file.extractfile(tar_info)
+    # Read from the bottom-most file-like object, which allows intermediate
+    # data ranges, such as a partition, to be skipped.
+    file_object, range_offset, _ = (
+        self._file_system.GetTARFileObject().GetFlattenedDataRange())
+
+    self._data_segments = self._GetDataSegments(tar_info, range_offset)
+    self._data_segments_offsets = [
+        segment_offset for segment_offset, _, _ in self._data_segments]
+    self._file_object = file_object
 
     self._current_offset = 0
     self._size = tar_info.size
 
+  def _ReadData(self, offset, size):
+    """Reads data of the member.
+
+    Args:
+      offset (int): offset of the data within the member.
+      size (int): number of bytes to read.
+
+    Returns:
+      bytes: data read.
+    """
+    data = []
+
+    segment_index = bisect.bisect_right(self._data_segments_offsets, offset)
+    segment_index = max(segment_index - 1, 0)
+
+    while size > 0 and segment_index < len(self._data_segments):
+      segment_offset, data_offset, segment_size = (
+          self._data_segments[segment_index])
+
+      if offset < segment_offset:
+        # The data before the segment is a hole in a sparse member.
+        read_size = min(size, segment_offset - offset)
+        data.append(b'\x00' * read_size)
+
+      elif offset < segment_offset + segment_size:
+        read_size = min(size, segment_offset + segment_size - offset)
+
+        self._file_object.seek(
+            data_offset + offset - segment_offset, os.SEEK_SET)
+        segment_data = self._file_object.read(read_size)
+        data.append(segment_data)
+
+        if len(segment_data) < read_size:
+          # The TAR file is truncated.
+          return b''.join(data)
+
+      else:
+        segment_index += 1
+        continue
+
+      offset += read_size
+      size -= read_size
+
+    if size > 0 and offset < self._size:
+      # The data after the last segment is a hole in a sparse member.
+      data.append(b'\x00' * min(size, self._size - offset))
+
+    return b''.join(data)
+
+  def GetFlattenedDataRange(self):
+    """Retrieves the data range within the bottom-most file-like object.
+
+    The data of a TAR member that is not sparse maps directly onto the
+    file-like object that contains the TAR file.
+
+    Returns:
+      tuple[FileIO, int, int]: bottom-most file-like object and the offset
+          and size of the data within it.
+
+    Raises:
+      IOError: if the file-like object has not been opened.
+    """
+    if not self._is_open:
+      raise IOError(u'Not opened.')
+
+    if self._data_segments_offsets != [0] or (
+        self._data_segments[0][2] != self._size):
+      return super(TARFile, self).GetFlattenedDataRange()
+
+    _, data_offset, _ = self._data_segments[0]
+    return self._file_object, data_offset, self._size
+
   # Note: that the following functions do not follow the style guide
   # because they are part of the file-like object interface.
 
@@ -101,9 +215,7 @@ class TARFile(file_io.FileIO):
     if size is None or self._current_offset + size > self._size:
       size = self._size - self._current_offset
 
-    self._tar_ext_file.seek(self._current_offset, os.SEEK_SET)
-
-    data = self._tar_ext_file.read(size)
+    data = self._ReadData(self._current_offset, size)
 
     # It is possible the that returned data size is not the same as the
     # requested data size. At this layer we don't care and this discrepancy
@@ -1,6 +1,10 @@
 # -*- coding: utf-8 -*-
 """The VHD image file-like object."""
 
+import os
+import struct
+
+import construct
 import pyvhdi
 
 from dfvfs.file_io import file_object_io
@@ -12,6 +16,37 @@ from dfvfs.resolver import resolver
 class VHDIFile(file_object_io.FileObjectIO):
   """Class that implements a file-like object using pyvhdi."""
 
+  _FILE_FOOTER_STRUCT = construct.Struct(
+      u'file_footer',
+      construct.Bytes(u'signature', 8),
+      construct.UBInt32(u'features'),
+      construct.UBInt32(u'format_version'),
+      construct.UBInt64(u'next_offset'),
+      construct.UBInt32(u'modification_time'),
+      construct.Bytes(u'creator_application', 4),
+      construct.UBInt32(u'creator_version'),
+      construct.Bytes(u'creator_operating_system', 4),
+      construct.UBInt64(u'initial_disk_size'),
+      construct.UBInt64(u'disk_size'),
+      construct.UBInt32(u'disk_geometry'),
+      construct.UBInt32(u'disk_type'))
+
+  _DYNAMIC_DISK_HEADER_STRUCT = construct.Struct(
+      u'dynamic_disk_header',
+      construct.Bytes(u'signature', 8),
+      construct.UBInt64(u'next_offset'),
+      construct.UBInt64(u'block_allocation_table_offset'),
+      construct.UBInt32(u'format_version'),
+      construct.UBInt32(u'number_of_blocks'),
+      construct.UBInt32(u'block_size'))
+
+  _FILE_FOOTER_SIGNATURE = b'conectix'
+  _DYNAMIC_DISK_HEADER_SIGNATURE = b'cxsparse'
+
+  _DISK_TYPE_FIXED = 2
+
+  _UNALLOCATED_BLOCK_NUMBER = 0xffffffff
+
   def __init__(self, resolver_context, file_object=None):
     """Initializes the file-like object.
 
@@ -20,6 +55,7 @@ class VHDIFile(file_object_io.FileObjectIO):
       file_object (Optional[FileIO]): file-like object.
     """
     super(VHDIFile, self).__init__(resolver_context, file_object=file_object)
+    self._allocated_extents = None
     self._parent_vhdi_files = []
     self._sub_file_objects = []
 
@@ -33,6 +69,7 @@ class VHDIFile(file_object_io.FileObjectIO):
     for file_object in self._sub_file_objects:
       file_object.close()
 
+    self._allocated_extents = None
     self._parent_vhdi_files = []
     self._sub_file_objects = []
 
@@ -129,6 +166,112 @@ class VHDIFile(file_object_io.FileObjectIO):
     self._parent_vhdi_files.append(vhdi_parent_file)
     self._sub_file_objects.append(file_object)
 
+  def _ReadAllocatedExtents(self, file_object):
+    """Reads the allocated extents from the block allocation table.
+
+    Args:
+      file_object (FileIO): file-like object of the VHD image file.
+
+    Returns:
+      list[tuple[int, int]]: offset and size of the allocated extents.
+
+    Raises:
+      FileFormatError: if file format related errors are detected.
+    """
+    file_object.seek(-512, os.SEEK_END)
+    file_footer_data = file_object.read(self._FILE_FOOTER_STRUCT.sizeof())
+
+    try:
+      file_footer = self._FILE_FOOTER_STRUCT.parse(file_footer_data)
+    except construct.FieldError as exception:
+      raise errors.FileFormatError(
+          u'Unable to parse file footer with error: {0!s}'.format(exception))
+
+    if file_footer.signature != self._FILE_FOOTER_SIGNATURE:
+      raise errors.FileFormatError(u'Unsupported file footer signature.')
+
+    disk_size = file_footer.disk_size
+    if file_footer.disk_type == self._DISK_TYPE_FIXED:
+      return [(0, disk_size)]
+
+    file_object.seek(file_footer.next_offset, os.SEEK_SET)
+    dynamic_disk_header_data = file_object.read(
+        self._DYNAMIC_DISK_HEADER_STRUCT.sizeof())
+
+    try:
+      dynamic_disk_header = self._DYNAMIC_DISK_HEADER_STRUCT.parse(
+          dynamic_disk_header_data)
+    except construct.FieldError as exception:
+      raise errors.FileFormatError((
+          u'Unable to parse dynamic disk header with error: '
+          u'{0!s}').format(exception))
+
+    if dynamic_disk_header.signature != self._DYNAMIC_DISK_HEADER_SIGNATURE:
+      raise errors.FileFormatError(
+          u'Unsupported dynamic disk header signature.')
+
+    block_size = dynamic_disk_header.block_size
+
+    file_object.seek(
+        dynamic_disk_header.block_allocation_table_offset, os.SEEK_SET)
+    block_allocation_table_data = file_object.read(
+        dynamic_disk_header.number_of_blocks * 4)
+    block_allocation_table = struct.unpack(
+        u'>{0:d}I'.format(len(block_allocation_table_data) // 4),
+        block_allocation_table_data)
+
+    allocated_extents = []
+    for block_index, block_number in enumerate(block_allocation_table):
+      if block_number == self._UNALLOCATED_BLOCK_NUMBER:
+        continue
+
+      media_offset = block_index * block_size
+      if media_offset >= disk_size:
+        break
+
+      allocated_extents.append((
+          media_offset, min(block_size, disk_size - media_offset)))
+
+    return allocated_extents
+
+  def GetAllocatedExtents(self):
+    """Retrieves the allocated extents of the data.
+
+    Blocks that are not allocated in a dynamic VHD image read as zero bytes.
+    For a differential VHD image the blocks allocated in the parent images
+    are included as well.
+
+    Returns:
+      list[tuple[int, int]]: offset and size of the allocated extents,
+          sorted by offset.
+
+    Raises:
+      IOError: if the file-like object has not been opened or the allocated
+          extents cannot be determined.
+    """
+    if not self._is_open:
+      raise IOError(u'Not opened.')
+
+    if self._allocated_extents is None:
+      if not self._sub_file_objects:
+        return super(VHDIFile, self).GetAllocatedExtents()
+
+      allocated_extents = []
+      for file_object in self._sub_file_objects:
+        current_offset = file_object.get_offset()
+        try:
+          allocated_extents.extend(self._ReadAllocatedExtents(file_object))
+        except errors.FileFormatError as exception:
+          raise IOError(
+              u'Unable to read allocated extents with error: {0!s}'.format(
+                  exception))
+        finally:
+          file_object.seek(current_offset, os.SEEK_SET)
+
+      self._allocated_extents = self._MergeExtents(allocated_extents)
+
+    return list(self._allocated_extents)
+
   def get_size(self):
     """Retrieves the size of the file-like object.
 
@@ -1,6 +1,10 @@
 # -*- coding: utf-8 -*-
 """The VMDK image file-like object."""
 
+import os
+import struct
+
+import construct
 import pyvmdk
 
 from dfvfs.file_io import file_object_io
@@ -12,6 +16,56 @@ from dfvfs.resolver import resolver
 class VMDKFile(file_object_io.FileObjectIO):
   """Class that implements a file-like object using pyvmdk."""
 
+  _SPARSE_EXTENT_FILE_HEADER_STRUCT = construct.Struct(
+      u'sparse_extent_file_header',
+      construct.Bytes(u'signature', 4),
+      construct.ULInt32(u'format_version'),
+      construct.ULInt32(u'flags'),
+      construct.ULInt64(u'maximum_data_number_of_sectors'),
+      construct.ULInt64(u'grain_number_of_sectors'),
+      construct.ULInt64(u'descriptor_sector_number'),
+      construct.ULInt64(u'descriptor_number_of_sectors'),
+      construct.ULInt32(u'number_of_grain_table_entries'),
+      construct.ULInt64(u'secondary_grain_directory_sector_number'),
+      construct.ULInt64(u'primary_grain_directory_sector_number'))
+
+  _SPARSE_EXTENT_FILE_SIGNATURE = b'KDMV'
+
+  _BYTES_PER_SECTOR = 512
+
+  # The grain directory of a stream-optimized sparse extent file is stored
+  # at the end of the file and its location is stored in the file footer.
+  _GRAIN_DIRECTORY_AT_END = 0xffffffffffffffff
+
+  # Grain table entries with sector number 1 mark a grain that reads as
+  # zero bytes.
+  _SPARSE_GRAIN_SECTOR_NUMBER = 1
+
+  _ALLOCATED_EXTENT_TYPES = frozenset([
+      pyvmdk.extent_types.FLAT,
+      pyvmdk.extent_types.VMFS_FLAT,
+      pyvmdk.extent_types.VMFS_RAW,
+      pyvmdk.extent_types.VMFS_RDM,
+      pyvmdk.extent_types.VMFS_SPARSE])
+
+  def __init__(self, resolver_context, file_object=None):
+    """Initializes the file-like object.
+
+    Args:
+      resolver_context (Context): resolver context.
+      file_object (Optional[FileIO]): file-like object.
+    """
+    super(VMDKFile, self).__init__(resolver_context, file_object=file_object)
+    self._allocated_extents = None
+    self._extent_data_file_objects = []
+
+  def _Close(self):
+    """Closes the file-like object."""
+    super(VMDKFile, self)._Close()
+
+    self._allocated_extents = None
+    self._extent_data_file_objects = []
+
   def _OpenFileObject(self, path_spec):
     """Opens the file-like object defined by path specification.
 
@@ -100,8 +154,157 @@ class VMDKFile(file_object_io.FileObjectIO):
     # TODO: add parent image support.
     vmdk_handle.open_extent_data_files_file_objects(file_objects)
 
+    self._extent_data_file_objects = file_objects
     return vmdk_handle
 
+  def _ReadSparseExtentAllocatedExtents(
+      self, file_object, media_offset, extent_size):
+    """Reads the allocated extents from the grain directory and tables.
+
+    Args:
+      file_object (FileIO): file-like object of the sparse extent data file.
+      media_offset (int): offset of the extent relative to the start of
+          the media data.
+      extent_size (int): size of the extent.
+
+    Returns:
+      list[tuple[int, int]]: offset and size of the allocated extents.
+
+    Raises:
+      FileFormatError: if file format related errors are detected.
+    """
+    file_header_size = self._SPARSE_EXTENT_FILE_HEADER_STRUCT.sizeof()
+
+    file_object.seek(0, os.SEEK_SET)
+    file_header_data = file_object.read(file_header_size)
+
+    try:
+      file_header = self._SPARSE_EXTENT_FILE_HEADER_STRUCT.parse(
+          file_header_data)
+    except construct.FieldError as exception:
+      raise errors.FileFormatError(
+          u'Unable to parse file header with error: {0!s}'.format(exception))
+
+    if file_header.signature != self._SPARSE_EXTENT_FILE_SIGNATURE:
+      raise errors.FileFormatError(u'Unsupported file signature.')
+
+    if (file_header.primary_grain_directory_sector_number ==
+        self._GRAIN_DIRECTORY_AT_END):
+      file_object.seek(-1024, os.SEEK_END)
+      file_header_data = file_object.read(file_header_size)
+
+      try:
+        file_header = self._SPARSE_EXTENT_FILE_HEADER_STRUCT.parse(
+            file_header_data)
+      except construct.FieldError as exception:
+        raise errors.FileFormatError(
+            u'Unable to parse file footer with error: {0!s}'.format(
+                exception))
+
+      if file_header.signature != self._SPARSE_EXTENT_FILE_SIGNATURE:
+        raise errors.FileFormatError(u'Unsupported file footer signature.')
+
+    grain_size = file_header.grain_number_of_sectors * self._BYTES_PER_SECTOR
+    number_of_grain_table_entries = file_header.number_of_grain_table_entries
+    if not grain_size or not number_of_grain_table_entries:
+      raise errors.FileFormatError(u'Unsupported grain or grain table size.')
+
+    extent_size = min(
+        extent_size,
+        file_header.maximum_data_number_of_sectors * self._BYTES_PER_SECTOR)
+
+    grain_table_media_size = grain_size * number_of_grain_table_entries
+    number_of_grain_directory_entries, remainder = divmod(
+        extent_size, grain_table_media_size)
+    if remainder:
+      number_of_grain_directory_entries += 1
+
+    file_object.seek(
+        file_header.primary_grain_directory_sector_number *
+        self._BYTES_PER_SECTOR, os.SEEK_SET)
+    grain_directory_data = file_object.read(
+        number_of_grain_directory_entries * 4)
+    grain_directory = struct.unpack(
+        u'<{0:d}I'.format(len(grain_directory_data) // 4),
+        grain_directory_data)
+
+    allocated_extents = []
+    for grain_directory_index, grain_table_sector_number in enumerate(
+        grain_directory):
+      if not grain_table_sector_number:
+        continue
+
+      file_object.seek(
+          grain_table_sector_number * self._BYTES_PER_SECTOR, os.SEEK_SET)
+      grain_table_data = file_object.read(number_of_grain_table_entries * 4)
+      grain_table = struct.unpack(
+          u'<{0:d}I'.format(len(grain_table_data) // 4), grain_table_data)
+
+      grain_offset = grain_directory_index * grain_table_media_size
+      for grain_sector_number in grain_table:
+        if grain_offset >= extent_size:
+          break
+
+        if grain_sector_number > self._SPARSE_GRAIN_SECTOR_NUMBER:
+          allocated_extents.append((
+              media_offset + grain_offset,
+              min(grain_size, extent_size - grain_offset)))
+
+        grain_offset += grain_size
+
+    return allocated_extents
+
+  def GetAllocatedExtents(self):
+    """Retrieves the allocated extents of the data.
+
+    Grains that are not allocated in a sparse extent and zero extents read
+    as zero bytes. Note that VMFS sparse extents are considered allocated.
+
+    Returns:
+      list[tuple[int, int]]: offset and size of the allocated extents,
+          sorted by offset.
+
+    Raises:
+      IOError: if the file-like object has not been opened or the allocated
+          extents cannot be determined.
+    """
+    if not self._is_open:
+      raise IOError(u'Not opened.')
+
+    if self._allocated_extents is None:
+      if not self._extent_data_file_objects:
+        return super(VMDKFile, self).GetAllocatedExtents()
+
+      extent_descriptors = iter(self._file_object.extent_descriptors)
+
+      allocated_extents = []
+      media_offset = 0
+      for extent_descriptor, file_object in zip(
+          extent_descriptors, self._extent_data_file_objects):
+        extent_type = extent_descriptor.type
+        extent_size = extent_descriptor.size
+
+        if extent_type in self._ALLOCATED_EXTENT_TYPES:
+          allocated_extents.append((media_offset, extent_size))
+
+        elif extent_type == pyvmdk.extent_types.SPARSE:
+          current_offset = file_object.get_offset()
+          try:
+            allocated_extents.extend(self._ReadSparseExtentAllocatedExtents(
+                file_object, media_offset, extent_size))
+          except errors.FileFormatError as exception:
+            raise IOError(
+                u'Unable to read allocated extents with error: {0!s}'.format(
+                    exception))
+          finally:
+            file_object.seek(current_offset, os.SEEK_SET)
+
+        media_offset += extent_size
+
+      self._allocated_extents = self._MergeExtents(allocated_extents)
+
+    return list(self._allocated_extents)
+
   def get_size(self):
     """Retrieves the size of the file-like object.
 
@@ -110,7 +110,8 @@ class ZipFile(file_io.FileIO):
     self._uncompressed_data_offset = 0
 
     while uncompressed_data_offset > 0:
-      self._ReadCompressedData(self._UNCOMPRESSED_DATA_BUFFER_SIZE)
+      if not self._ReadUncompressedData():
+        break
 
       if uncompressed_data_offset < self._uncompressed_data_size:
         self._uncompressed_data_offset = uncompressed_data_offset
@@ -118,14 +119,23 @@ class ZipFile(file_io.FileIO):
 
       uncompressed_data_offset -= self._uncompressed_data_size
 
-  def _ReadCompressedData(self, read_size):
-    """Reads compressed data from the file-like object.
+  def _ReadUncompressedData(self):
+    """Reads the next part of the uncompressed data.
 
-    Args:
-      read_size (int): number of bytes of compressed data to read.
+    The size of the part is bounded by the uncompressed data buffer size,
+    since the ZIP extracted file-like object decompresses no more data than
+    requested, independent of the compression ratio.
+
+    Returns:
+      int: number of bytes of uncompressed data read or 0 if no more
+          uncompressed data is available.
     """
-    self._uncompressed_data = self._zip_ext_file.read(read_size)
+    self._uncompressed_data = self._zip_ext_file.read(
+        self._UNCOMPRESSED_DATA_BUFFER_SIZE)
     self._uncompressed_data_size = len(self._uncompressed_data)
+    self._uncompressed_data_offset = 0
+
+    return self._uncompressed_data_size
 
   # Note: that the following functions do not follow the style guide
   # because they are part of the file-like object interface.
@@ -163,13 +173,14 @@ class ZipFile(file_io.FileIO):
       self._AlignUncompressedDataOffset(self._current_offset)
       self._realign_offset = False
 
-    uncompressed_data = b''
+    # The parts of uncompressed data are joined once, to prevent copying
+    # the uncompressed data read so far for every part.
+    uncompressed_data = []
 
     # Read in full blocks of uncompressed data.
     while self._uncompressed_data_offset + size > self._uncompressed_data_size:
-      uncompressed_data = b''.join([
-          uncompressed_data,
-          self._uncompressed_data[self._uncompressed_data_offset:]])
+      uncompressed_data.append(
+          self._uncompressed_data[self._uncompressed_data_offset:])
 
       remaining_uncompressed_data_size = (
           self._uncompressed_data_size - self._uncompressed_data_offset)
@@ -177,9 +188,8 @@ class ZipFile(file_io.FileIO):
       self._current_offset += remaining_uncompressed_data_size
       size -= remaining_uncompressed_data_size
 
-      self._ReadCompressedData(self._UNCOMPRESSED_DATA_BUFFER_SIZE)
-
-      self._uncompressed_data_offset = 0
+      if not self._ReadUncompressedData():
+        break
 
     # Read in partial block of uncompressed data.
     if (size > 0 and
@@ -187,14 +197,13 @@ class ZipFile(file_io.FileIO):
       slice_start_offset = self._uncompressed_data_offset
       slice_end_offset = slice_start_offset + size
 
-      uncompressed_data = b''.join([
-          uncompressed_data,
-          self._uncompressed_data[slice_start_offset:slice_end_offset]])
+      uncompressed_data.append(
+          self._uncompressed_data[slice_start_offset:slice_end_offset])
 
       self._uncompressed_data_offset += size
       self._current_offset += size
 
-    return uncompressed_data
+    return b''.join(uncompressed_data)
 
   def seek(self, offset, whence=os.SEEK_SET):
     """Seeks to an offset within the file-like object.
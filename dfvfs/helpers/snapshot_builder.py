@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+"""A builder of snapshots of file system metadata."""
+
+from dfvfs.lib import definitions
+from dfvfs.lib import errors
+from dfvfs.lib import snapshot_index
+from dfvfs.resolver import resolver
+
+
+class SnapshotBuilder(object):
+  """Class that implements a builder of file system snapshots.
+
+  The builder walks the directory tree of a file system once and writes
+  the location, inode, parent, type, size, ownership and timestamps of
+  every file entry to the snapshot index. A snapshot file system can then
+  find and list file entries without reading the file system.
+
+  A file entry of which the metadata cannot be read, for example due to
+  corruption, is left out of the snapshot together with its sub file entries,
+  so that such a file entry does not prevent building the snapshot.
+  """
+
+  # The names of the path specification attributes that contain the inode
+  # per type indicator.
+  _INODE_PATH_SPEC_ATTRIBUTES = {
+      definitions.TYPE_INDICATOR_NTFS: u'mft_entry',
+      definitions.TYPE_INDICATOR_TSK: u'inode'}
+
+  def __init__(self, index, resolver_context=None):
+    """Initializes a snapshot builder.
+
+    Args:
+      index (SnapshotIndex): snapshot index to write the snapshots to.
+      resolver_context (Optional[Context]): resolver context, where None
+          represents the built in context which is not multi process safe.
+    """
+    super(SnapshotBuilder, self).__init__()
+    self._resolver_context = resolver_context
+    self._snapshot_index = index
+
+  def _GetSnapshotRecord(self, file_entry, parent_identifier):
+    """Retrieves the snapshot record of a file entry.
+
+    Args:
+      file_entry (FileEntry): file entry.
+      parent_identifier (int): identifier of the record of the parent
+          directory or None for the root directory.
+
+    Returns:
+      tuple[SnapshotRecord, str]: snapshot record and the format of its
+          timestamps, where the format is None if the file entry has no
+          timestamps.
+    """
+    stat_object = file_entry.GetStat()
+
+    inode = getattr(stat_object, u'ino', None)
+    if inode is None:
+      path_spec_attribute = self._INODE_PATH_SPEC_ATTRIBUTES.get(
+          file_entry.type_indicator, None)
+      if path_spec_attribute:
+        inode = getattr(file_entry.path_spec, path_spec_attribute, None)
+
+    record = snapshot_index.SnapshotRecord(
+        getattr(file_entry.path_spec, u'location', None), file_entry.name,
+        file_entry_type=getattr(stat_object, u'type', None),
+        gid=getattr(stat_object, u'gid', None), inode=inode,
+        is_allocated=getattr(stat_object, u'is_allocated', True),
+        mode=getattr(stat_object, u'mode', None),
+        parent_identifier=parent_identifier,
+        size=getattr(stat_object, u'size', None),
+        uid=getattr(stat_object, u'uid', None))
+
+    timestamps = file_entry.GetTimestamps()
+    if not timestamps:
+      return record, None
+
+    record.access_time = timestamps.access_time
+    record.change_time = timestamps.change_time
+    record.creation_time = timestamps.creation_time
+    record.modification_time = timestamps.modification_time
+
+    return record, timestamps.timestamp_format
+
+  def _WriteFileEntries(self, snapshot_writer, file_system):
+    """Writes the file entries of a file system to a snapshot.
+
+    Args:
+      snapshot_writer (SnapshotWriter): snapshot writer.
+      file_system (FileSystem): file system.
+
+    Raises:
+      BackEndError: if the root file entry cannot be retrieved or its
+          metadata cannot be read.
+      IOError: if the metadata of the root file entry cannot be read.
+    """
+    root_file_entry = file_system.GetRootFileEntry()
+    if not root_file_entry:
+      raise errors.BackEndError(u'Unable to retrieve root file entry.')
+
+    record, timestamp_format = self._GetSnapshotRecord(root_file_entry, None)
+    snapshot_writer.WriteRecord(record, timestamp_format=timestamp_format)
+
+    # The inodes of the directories that were walked, which prevents walking
+    # a directory more than once, for example when hard linked.
+    directory_inodes = set([record.inode])
+    directories = [(root_file_entry, record.identifier)]
+
+    while directories:
+      file_entry, parent_identifier = directories.pop()
+
+      for sub_file_entry in file_entry.sub_file_entries:
+        try:
+          record, timestamp_format = self._GetSnapshotRecord(
+              sub_file_entry, parent_identifier)
+        except (IOError, errors.BackEndError):
+          continue
+
+        snapshot_writer.WriteRecord(record, timestamp_format=timestamp_format)
+
+        if record.file_entry_type != definitions.FILE_ENTRY_TYPE_DIRECTORY:
+          continue
+
+        if record.inode is not None:
+          if record.inode in directory_inodes:
+            continue
+          directory_inodes.add(record.inode)
+
+        directories.append((sub_file_entry, record.identifier))
+
+  def Build(self, path_spec):
+    """Builds the snapshot of a file system.
+
+    Args:
+      path_spec (PathSpec): path specification of the file system, for
+          example of its root directory.
+
+    Returns:
+      str: identifier of the file system in the snapshot index.
+
+    Raises:
+      BackEndError: if the file system cannot be opened.
+      IOError: if the snapshot cannot be written.
+      PathSpecError: if the path specification has no parent.
+    """
+    identifier = self.GetIdentifier(path_spec)
+
+    file_system = resolver.Resolver.OpenFileSystem(
+        path_spec, resolver_context=self._resolver_context)
+    if not file_system:
+      raise errors.BackEndError(u'Unable to open file system.')
+
+    try:
+      snapshot_writer = self._snapshot_index.CreateSnapshot(
+          identifier, file_system.type_indicator, file_system.PATH_SEPARATOR)
+
+      try:
+        self._WriteFileEntries(snapshot_writer, file_system)
+      except:
+        snapshot_writer.Abort()
+        raise
+
+      snapshot_writer.Close()
+
+    finally:
+      file_system.Close()
+
+    return identifier
+
+  def GetIdentifier(self, path_spec):
+    """Determines the identifier of a file system in the snapshot index.
+
+    Args:
+      path_spec (PathSpec): path specification of the file system.
+
+    Returns:
+      str: identifier of the file system.
+
+    Raises:
+      BackEndError: if the image that contains the file system cannot
+          be opened.
+      PathSpecError: if the path specification has no parent.
+    """
+    if not path_spec.HasParent():
+      raise errors.PathSpecError(
+          u'Unsupported path specification without parent.')
+
+    file_object = resolver.Resolver.OpenFileObject(
+        path_spec.parent, resolver_context=self._resolver_context)
+    if not file_object:
+      raise errors.BackEndError(u'Unable to open image of file system.')
+
+    try:
+      return self._snapshot_index.GetIdentifier(
+          path_spec.type_indicator, path_spec.parent, file_object)
+    finally:
+      file_object.close()
@@ -286,11 +286,14 @@ class CPIOArchiveFile(object):
 
     return self._file_entries.get(path, None)
 
-  def Open(self, file_object):
+  def Open(self, file_object, file_entries=None):
     """Opens the CPIO archive file.
 
     Args:
       file_object: the file-like object.
+      file_entries: optional list of CPIO archive file entries (instances of
+                    CPIOArchiveFileEntry), such as read from a member index.
+                    If set the file entries are not read from the archive.
 
     Raises:
       IOError: if the file format signature is not supported.
@@ -318,7 +321,11 @@ class CPIOArchiveFile(object):
     self._file_object = file_object
     self._file_size = file_object.get_size()
 
-    self._ReadFileEntries()
+    if file_entries is None:
+      self._ReadFileEntries()
+    else:
+      for file_entry in file_entries:
+        self._file_entries[file_entry.path] = file_entry
 
   def ReadDataAtOffset(self, file_offset, size):
     """Reads a byte string from the file-like object at a specific offset.
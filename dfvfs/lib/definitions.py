@@ -81,6 +81,12 @@ ATTRIBUTE_TYPE_NTFS_OBJECT_ID = u'NTFS:$OBJECT_ID'
 ATTRIBUTE_TYPE_NTFS_SECURITY_DESCRIPTOR = u'NTFS:$SECURITY_DESCRIPTOR'
 ATTRIBUTE_TYPE_NTFS_STANDARD_INFORMATION = u'NTFS:$STANDARD_INFORMATION'
 
+# The extent types.
+EXTENT_TYPE_COMPRESSED = u'compressed'
+EXTENT_TYPE_DATA = u'data'
+EXTENT_TYPE_RESIDENT = u'resident'
+EXTENT_TYPE_SPARSE = u'sparse'
+
 # The file entry types.
 FILE_ENTRY_TYPE_DEVICE = 1
 FILE_ENTRY_TYPE_DIRECTORY = 2
@@ -98,6 +104,12 @@ FORMAT_CATEGORY_FILE_SYSTEM = 4
 FORMAT_CATEGORY_STORAGE_MEDIA_IMAGE = 5
 FORMAT_CATEGORY_VOLUME_SYSTEM = 6
 
+# The timestamp format definitions, where the format defines the epoch and
+# the precision of a raw timestamp.
+TIMESTAMP_FORMAT_FILETIME = u'filetime'
+TIMESTAMP_FORMAT_POSIX_TIME = u'posix_time'
+TIMESTAMP_FORMAT_POSIX_TIME_IN_NANOSECONDS = u'posix_time_in_nanoseconds'
+
 # The source type defintions.
 SOURCE_TYPE_DIRECTORY = u'directory'
 SOURCE_TYPE_FILE = u'file'
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""Helper for finding file entries using directory listings."""
+
+from dfvfs.lib import errors
+from dfvfs.path import factory as path_spec_factory
+
+
+class DirectoryListingCache(object):
+  """Class that implements a cache of directory listings.
+
+  The cache is intended to be used for a single search, such as globbing
+  the segment files of a storage media image, after which it is discarded.
+  Hence the directory listings cannot become stale between searches.
+  """
+
+  def __init__(self, file_system, path_spec):
+    """Initializes the directory listing cache.
+
+    Args:
+      file_system (FileSystem): file system.
+      path_spec (PathSpec): path specification of a file entry in the file
+          system, which is used as template for the path specifications of
+          the file entries that are found.
+    """
+    super(DirectoryListingCache, self).__init__()
+    self._directory_entry_names_per_location = {}
+    self._file_system = file_system
+    self._path_spec = path_spec
+
+  def _GetDirectoryEntryNames(self, location):
+    """Retrieves the names of the entries of a directory.
+
+    The directory is listed once and its entry names are cached by location.
+
+    Args:
+      location (str): location of the directory.
+
+    Returns:
+      frozenset[str]: names of the directory entries or None if the directory
+          cannot be listed.
+    """
+    if location in self._directory_entry_names_per_location:
+      return self._directory_entry_names_per_location[location]
+
+    directory_path_spec = self._NewPathSpec(location)
+
+    directory_entry_names = None
+    try:
+      file_entry = self._file_system.GetFileEntryByPathSpec(
+          directory_path_spec)
+      if file_entry and file_entry.IsDirectory():
+        directory_entry_names = frozenset([
+            sub_file_entry.name
+            for sub_file_entry in file_entry.sub_file_entries])
+
+    except (errors.AccessError, errors.BackEndError):
+      pass
+
+    self._directory_entry_names_per_location[location] = directory_entry_names
+    return directory_entry_names
+
+  def _NewPathSpec(self, location):
+    """Creates a path specification with a different location.
+
+    Args:
+      location (str): location.
+
+    Returns:
+      PathSpec: path specification.
+    """
+    # Note that we don't want to set the keyword arguments when not used
+    # because the path specification base class will check for unused
+    # keyword arguments and raise.
+    kwargs = path_spec_factory.Factory.GetProperties(self._path_spec)
+
+    kwargs[u'location'] = location
+    if self._path_spec.parent is not None:
+      kwargs[u'parent'] = self._path_spec.parent
+
+    return path_spec_factory.Factory.NewPathSpec(
+        self._path_spec.type_indicator, **kwargs)
+
+  def FindPathSpecByLocation(self, location):
+    """Finds the path specification of a file entry by location.
+
+    The name of the file entry is matched against the cached listing of its
+    parent directory, which is much cheaper than checking if a file entry
+    exists, for example on network shares. The file system is only asked
+    if the file entry exists when the name is not found in the listing, so
+    that a file system with case insensitive names does not cause a file
+    entry to be missed.
+
+    Args:
+      location (str): location of the file entry.
+
+    Returns:
+      PathSpec: path specification of the file entry or None if no such file
+          entry exists.
+    """
+    name = self._file_system.BasenamePath(location)
+    if name:
+      directory_location = location[:-len(name)]
+      if len(directory_location) > 1:
+        directory_location = directory_location[:-1]
+
+      if directory_location:
+        directory_entry_names = self._GetDirectoryEntryNames(
+            directory_location)
+        if directory_entry_names and name in directory_entry_names:
+          return self._NewPathSpec(location)
+
+    file_entry_path_spec = self._NewPathSpec(location)
+    if not self._file_system.FileEntryExistsByPathSpec(file_entry_path_spec):
+      return
+
+    return file_entry_path_spec
@@ -1,8 +1,8 @@
 # -*- coding: utf-8 -*-
 """Helper functions for EWF image support."""
 
+from dfvfs.lib import directory_listing
 from dfvfs.lib import errors
-from dfvfs.path import factory as path_spec_factory
 
 
 def EWFGlobPathSpec(file_system, path_spec):
@@ -45,24 +45,17 @@ def EWFGlobPathSpec(file_system, path_spec):
         u'Unsupported parent path specification invalid segment file '
         u'extension: {0:s}').format(segment_extension))
 
+  directory_listing_cache = directory_listing.DirectoryListingCache(
+      file_system, parent_path_spec)
+
   segment_number = 1
   segment_files = []
   while True:
     segment_location = u'{0:s}.{1:s}'.format(parent_location, segment_extension)
 
-    # Note that we don't want to set the keyword arguments when not used
-    # because the path specification base class will check for unused
-    # keyword arguments and raise.
-    kwargs = path_spec_factory.Factory.GetProperties(parent_path_spec)
-
-    kwargs[u'location'] = segment_location
-    if parent_path_spec.parent is not None:
-      kwargs[u'parent'] = parent_path_spec.parent
-
-    segment_path_spec = path_spec_factory.Factory.NewPathSpec(
-        parent_path_spec.type_indicator, **kwargs)
-
-    if not file_system.FileEntryExistsByPathSpec(segment_path_spec):
+    segment_path_spec = directory_listing_cache.FindPathSpecByLocation(
+        segment_location)
+    if not segment_path_spec:
       break
 
     segment_files.append(segment_path_spec)
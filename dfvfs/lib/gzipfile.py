@@ -0,0 +1,358 @@
+# -*- coding: utf-8 -*-
+"""Helper functions for gzip file support.
+
+A gzip file consists of one or more members, where every member contains
+a header, deflate compressed data and a footer. Concatenated gzip files,
+such as produced by logrotate, contain multiple members.
+
+To be able to seek in the uncompressed data without having to decompress
+it from the start, an index of access points is built when a member is
+scanned. An access point contains a copy of the state of the decompressor
+at a specific offset in the uncompressed data, similar to zran.c of zlib.
+"""
+
+import bisect
+import os
+import zlib
+
+import construct
+
+from dfvfs.lib import errors
+
+
+class GzipMember(object):
+  """Class that contains a gzip member.
+
+  Attributes:
+    comment (str): comment stored in the member header.
+    member_end_offset (int): offset of the end of the member in the parent
+        file-like object.
+    member_start_offset (int): offset of the start of the member in the
+        parent file-like object.
+    modification_time (int): modification POSIX timestamp stored in
+        the member header.
+    operating_system (int): operating system stored in the member header.
+    original_filename (str): original filename stored in the member header.
+    uncompressed_data_offset (int): offset of the uncompressed data of
+        the member, relative to the start of the uncompressed data of
+        the gzip file.
+    uncompressed_data_size (int): size of the uncompressed data of
+        the member.
+  """
+
+  _MEMBER_HEADER_STRUCT = construct.Struct(
+      u'member_header',
+      construct.ULInt16(u'signature'),
+      construct.UBInt8(u'compression_method'),
+      construct.UBInt8(u'flags'),
+      construct.SLInt32(u'modification_time'),
+      construct.UBInt8(u'extra_flags'),
+      construct.UBInt8(u'operating_system'))
+
+  # The member footer consists of a 32-bit checksum and a 32-bit
+  # uncompressed data size.
+  _MEMBER_FOOTER_SIZE = 8
+
+  _SIGNATURE = 0x8b1f
+
+  _COMPRESSION_METHOD_DEFLATE = 8
+
+  _FLAG_FTEXT = 0x01
+  _FLAG_FHCRC = 0x02
+  _FLAG_FEXTRA = 0x04
+  _FLAG_FNAME = 0x08
+  _FLAG_FCOMMENT = 0x10
+
+  # The distance, in bytes of uncompressed data, between access points.
+  ACCESS_POINT_SPAN = 4 * 1024 * 1024
+
+  # The maximum size of compressed data read at once.
+  _COMPRESSED_DATA_BUFFER_SIZE = 64 * 1024
+
+  # The maximum size of uncompressed data produced at once.
+  _UNCOMPRESSED_DATA_BUFFER_SIZE = 1024 * 1024
+
+  def __init__(
+      self, file_object, member_start_offset, uncompressed_data_offset,
+      access_point_span=None):
+    """Initializes and reads the gzip member.
+
+    Reading the member decompresses all of its data to determine the end
+    of the member and to build the access point index.
+
+    Args:
+      file_object (FileIO): file-like object containing the member.
+      member_start_offset (int): offset of the start of the member in
+          the file-like object.
+      uncompressed_data_offset (int): offset of the uncompressed data of
+          the member, relative to the start of the uncompressed data of
+          the gzip file.
+      access_point_span (Optional[int]): distance, in bytes of uncompressed
+          data, between access points, where None represents the default.
+
+    Raises:
+      FileFormatError: if file format related errors are detected.
+    """
+    super(GzipMember, self).__init__()
+    self._access_point_offsets = []
+    self._access_points = []
+    self._access_point_span = access_point_span or self.ACCESS_POINT_SPAN
+    self._compressed_data_offset = None
+    self._file_object = file_object
+
+    # The state of the most recent read, which allows sequential reads
+    # to continue without having to start from an access point.
+    self._cache = b''
+    self._cache_offset = 0
+    self._decompressor = None
+    self._decompressor_compressed_offset = 0
+    self._decompressor_uncompressed_offset = 0
+    self._unconsumed_data = b''
+
+    self.comment = None
+    self.member_end_offset = None
+    self.member_start_offset = member_start_offset
+    self.modification_time = None
+    self.operating_system = None
+    self.original_filename = None
+    self.uncompressed_data_offset = uncompressed_data_offset
+    self.uncompressed_data_size = 0
+
+    self._ReadMemberHeader()
+    self._ReadCompressedData()
+    self._ReadMemberFooter()
+
+  def _Decompress(self, decompressor, compressed_offset, unconsumed_data):
+    """Decompresses the next part of the compressed data.
+
+    Args:
+      decompressor (zlib.Decompress): decompressor.
+      compressed_offset (int): offset of the next compressed data to read
+          from the file-like object.
+      unconsumed_data (bytes): compressed data that was read but not yet
+          consumed by the decompressor.
+
+    Returns:
+      tuple[bytes, int, bytes, bool]: uncompressed data, offset of the next
+          compressed data to read from the file-like object, compressed data
+          not yet consumed by the decompressor and a value to indicate the
+          end of the compressed data was reached.
+
+    Raises:
+      FileFormatError: if the compressed data cannot be decompressed.
+    """
+    if not unconsumed_data:
+      self._file_object.seek(compressed_offset, os.SEEK_SET)
+      unconsumed_data = self._file_object.read(
+          self._COMPRESSED_DATA_BUFFER_SIZE)
+      compressed_offset += len(unconsumed_data)
+
+      if not unconsumed_data:
+        # The member is truncated, flush the remaining uncompressed data.
+        return decompressor.flush(), compressed_offset, b'', True
+
+    try:
+      uncompressed_data = decompressor.decompress(
+          unconsumed_data, self._UNCOMPRESSED_DATA_BUFFER_SIZE)
+    except zlib.error as exception:
+      raise errors.FileFormatError(
+          u'Unable to decompress gzip member with error: {0!s}.'.format(
+              exception))
+
+    if decompressor.unused_data or getattr(decompressor, u'eof', False):
+      compressed_offset -= len(decompressor.unused_data)
+      return uncompressed_data, compressed_offset, b'', True
+
+    return (
+        uncompressed_data, compressed_offset, decompressor.unconsumed_tail,
+        False)
+
+  def _ReadCompressedData(self):
+    """Reads the compressed data and builds the access point index.
+
+    Raises:
+      FileFormatError: if the compressed data cannot be decompressed.
+    """
+    decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+    compressed_offset = self._compressed_data_offset
+    uncompressed_offset = 0
+    unconsumed_data = b''
+
+    self._access_point_offsets = [0]
+    self._access_points = [(compressed_offset, decompressor.copy())]
+
+    end_of_data = False
+    while not end_of_data:
+      uncompressed_data, compressed_offset, unconsumed_data, end_of_data = (
+          self._Decompress(decompressor, compressed_offset, unconsumed_data))
+
+      uncompressed_offset += len(uncompressed_data)
+
+      if end_of_data:
+        break
+
+      if (uncompressed_offset - self._access_point_offsets[-1] >=
+          self._access_point_span):
+        # Note that the compressed offset of the access point needs to account
+        # for compressed data that was read but not yet consumed.
+        access_point_compressed_offset = (
+            compressed_offset - len(unconsumed_data))
+        self._access_point_offsets.append(uncompressed_offset)
+        self._access_points.append(
+            (access_point_compressed_offset, decompressor.copy()))
+
+    self.member_end_offset = compressed_offset
+    self.uncompressed_data_size = uncompressed_offset
+
+  def _ReadMemberFooter(self):
+    """Reads the member footer.
+
+    A truncated member has no footer, in which case the member ends at
+    the end of the compressed data.
+    """
+    self._file_object.seek(self.member_end_offset, os.SEEK_SET)
+    footer_data = self._file_object.read(self._MEMBER_FOOTER_SIZE)
+    if len(footer_data) < self._MEMBER_FOOTER_SIZE:
+      self.member_end_offset += len(footer_data)
+      return
+
+    # The uncompressed data size in the footer is stored modulo 2^32,
+    # hence the size determined by decompressing the data is used instead.
+    self.member_end_offset += self._MEMBER_FOOTER_SIZE
+
+  def _ReadMemberHeader(self):
+    """Reads the member header.
+
+    Raises:
+      FileFormatError: if file format related errors are detected.
+    """
+    file_object = self._file_object
+    file_object.seek(self.member_start_offset, os.SEEK_SET)
+
+    try:
+      member_header = self._MEMBER_HEADER_STRUCT.parse_stream(file_object)
+    except construct.FieldError as exception:
+      raise errors.FileFormatError(
+          u'Unable to parse gzip member header with error: {0!s}.'.format(
+              exception))
+
+    if member_header.signature != self._SIGNATURE:
+      raise errors.FileFormatError(
+          u'Unsuppored file signature: 0x{0:04x}.'.format(
+              member_header.signature))
+
+    if member_header.compression_method != self._COMPRESSION_METHOD_DEFLATE:
+      raise errors.FileFormatError(
+          u'Unsuppored compression method: {0:d}.'.format(
+              member_header.compression_method))
+
+    self.modification_time = member_header.modification_time
+    self.operating_system = member_header.operating_system
+
+    if member_header.flags & self._FLAG_FEXTRA:
+      extra_field_data_size = construct.ULInt16(
+          u'extra_field_data_size').parse_stream(file_object)
+      file_object.seek(extra_field_data_size, os.SEEK_CUR)
+
+    if member_header.flags & self._FLAG_FNAME:
+      # Since encoding is set construct will convert the C string to Unicode.
+      # Note that construct 2 does not support the encoding to be a Unicode
+      # string.
+      self.original_filename = construct.CString(
+          u'original_filename', encoding='iso-8859-1').parse_stream(
+              file_object)
+
+    if member_header.flags & self._FLAG_FCOMMENT:
+      # Since encoding is set construct will convert the C string to Unicode.
+      # Note that construct 2 does not support the encoding to be a Unicode
+      # string.
+      self.comment = construct.CString(
+          u'comment', encoding='iso-8859-1').parse_stream(file_object)
+
+    if member_header.flags & self._FLAG_FHCRC:
+      file_object.seek(2, os.SEEK_CUR)
+
+    self._compressed_data_offset = file_object.get_offset()
+
+  def FlushCache(self):
+    """Empties the cache of the most recent read."""
+    self._cache = b''
+    self._cache_offset = 0
+    self._decompressor = None
+    self._decompressor_compressed_offset = 0
+    self._decompressor_uncompressed_offset = 0
+    self._unconsumed_data = b''
+
+  def GetNumberOfAccessPoints(self):
+    """Retrieves the number of access points.
+
+    Returns:
+      int: number of access points.
+    """
+    return len(self._access_points)
+
+  def ReadAtOffset(self, offset, size):
+    """Reads uncompressed data at an offset within the member.
+
+    Reading continues from the state of the previous read when the offset
+    is within or not too far beyond the data of the previous read, otherwise
+    it starts from the nearest preceding access point.
+
+    Args:
+      offset (int): offset within the uncompressed data of the member.
+      size (int): number of bytes to read.
+
+    Returns:
+      bytes: uncompressed data read.
+
+    Raises:
+      FileFormatError: if the compressed data cannot be decompressed.
+    """
+    if offset < 0 or size <= 0 or offset >= self.uncompressed_data_size:
+      return b''
+
+    end_offset = min(offset + size, self.uncompressed_data_size)
+
+    if (not self._decompressor or offset < self._cache_offset or
+        offset > self._decompressor_uncompressed_offset + (
+            self._access_point_span)):
+      index = bisect.bisect_right(self._access_point_offsets, offset) - 1
+      compressed_offset, decompressor = self._access_points[index]
+
+      self._cache = b''
+      self._cache_offset = self._access_point_offsets[index]
+      self._decompressor = decompressor.copy()
+      self._decompressor_compressed_offset = compressed_offset
+      self._decompressor_uncompressed_offset = self._cache_offset
+      self._unconsumed_data = b''
+
+    cache_data = [self._cache]
+    while self._decompressor_uncompressed_offset < end_offset:
+      (uncompressed_data, self._decompressor_compressed_offset,
+       self._unconsumed_data, end_of_data) = self._Decompress(
+           self._decompressor, self._decompressor_compressed_offset,
+           self._unconsumed_data)
+
+      self._decompressor_uncompressed_offset += len(uncompressed_data)
+
+      if self._decompressor_uncompressed_offset <= offset:
+        # Skip uncompressed data that precedes the offset.
+        cache_data = []
+        self._cache_offset = self._decompressor_uncompressed_offset
+      else:
+        cache_data.append(uncompressed_data)
+
+      if end_of_data:
+        break
+
+    cache = b''.join(cache_data)
+
+    data_offset = offset - self._cache_offset
+    data = cache[data_offset:data_offset + (end_offset - offset)]
+
+    # Only retain the uncompressed data that follows the data read.
+    data_end_offset = end_offset - self._cache_offset
+    self._cache = cache[data_end_offset:]
+    self._cache_offset = end_offset
+
+    return data
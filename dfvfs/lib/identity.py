@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""Helper functions for determining the identity of stored data."""
+
+import hashlib
+import os
+
+from dfvfs.lib import definitions
+
+
+# The size of the data at the start of the file-like object that is part of
+# its identity.
+_IDENTITY_DATA_SIZE = 64 * 1024
+
+
+def GetIdentifier(type_indicator, path_spec, file_object):
+  """Determines the identifier of the data in a file-like object.
+
+  The identity of the data consists of the size of the file-like object and
+  the data at its start. If the file-like object is stored in an operating
+  system file, the size and modification time of this file are part of
+  the identity as well. Hence changed data does not match an identifier
+  that was determined before the change.
+
+  Args:
+    type_indicator (str): type indicator of the file system that is stored
+        in the file-like object, such as an archive or a file system image.
+    path_spec (PathSpec): path specification of the file-like object.
+    file_object (FileIO): file-like object.
+
+  Returns:
+    str: identifier of the data.
+  """
+  hash_context = hashlib.sha256()
+  hash_context.update(type_indicator.encode(u'utf-8'))
+  hash_context.update(path_spec.comparable.encode(u'utf-8'))
+
+  file_size = file_object.get_size()
+  hash_context.update(u'size: {0:d}\n'.format(file_size).encode(u'utf-8'))
+
+  file_object.seek(0, os.SEEK_SET)
+  hash_context.update(file_object.read(_IDENTITY_DATA_SIZE))
+
+  os_path_spec = path_spec
+  while os_path_spec.HasParent():
+    os_path_spec = os_path_spec.parent
+
+  location = getattr(os_path_spec, u'location', None)
+  if (location and
+      os_path_spec.type_indicator == definitions.TYPE_INDICATOR_OS):
+    try:
+      stat_object = os.stat(location)
+      hash_context.update(u'os: {0:d} {1!r}\n'.format(
+          stat_object.st_size, stat_object.st_mtime).encode(u'utf-8'))
+    except OSError:
+      pass
+
+  return hash_context.hexdigest()
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+"""The on-disk member index of archive files."""
+
+import json
+import os
+import tempfile
+
+from dfvfs.lib import identity
+
+
+class MemberIndex(object):
+  """Class that implements an on-disk member index of archive files.
+
+  The member index stores the members of an archive file, such as a TAR or
+  CPIO archive, so that reopening the archive does not require reading all
+  the member headers. The members of an archive are stored in a file of
+  their own, named after the identifier of the archive. The identifier is
+  derived from the path specification of the archive and its identity,
+  so that a changed archive is not matched with an outdated index file.
+
+  Note that the index only contains the members of the archive itself.
+  If the archive is stored in compressed data, such as a gzip compressed TAR
+  file, opening the compressed data still decompresses all of it to determine
+  its size and the gzip member boundaries. Hence for such an archive the index
+  prevents reading the member headers but not the decompression. The access
+  points of the compressed data are not stored in the index since these
+  contain the state of a decompressor, which cannot be serialized.
+  """
+
+  _FORMAT_VERSION = 1
+
+  def __init__(self, path):
+    """Initializes the member index.
+
+    Args:
+      path (str): path of the directory that contains the index files.
+    """
+    super(MemberIndex, self).__init__()
+    self._path = path
+
+  def _GetIndexFilePath(self, identifier):
+    """Retrieves the path of an index file.
+
+    Args:
+      identifier (str): identifier of the archive.
+
+    Returns:
+      str: path of the index file.
+    """
+    return os.path.join(self._path, u'{0:s}.json'.format(identifier))
+
+  def GetIdentifier(self, type_indicator, path_spec, file_object):
+    """Determines the identifier of an archive.
+
+    The identity of the archive consists of the size of the archive and
+    the data at the start of the archive. If the archive is stored in
+    an operating system file, the size and modification time of this file
+    are part of the identity as well.
+
+    Args:
+      type_indicator (str): type indicator of the archive file system.
+      path_spec (PathSpec): path specification of the archive file.
+      file_object (FileIO): file-like object of the archive file.
+
+    Returns:
+      str: identifier of the archive.
+    """
+    return identity.GetIdentifier(type_indicator, path_spec, file_object)
+
+  def ReadMembers(self, identifier):
+    """Reads the members of an archive from the index.
+
+    Args:
+      identifier (str): identifier of the archive.
+
+    Returns:
+      list[dict[str, object]]: members of the archive or None if the archive
+          is not in the index or its index file cannot be read.
+    """
+    index_file_path = self._GetIndexFilePath(identifier)
+    if not os.path.exists(index_file_path):
+      return
+
+    try:
+      with open(index_file_path, 'rb') as file_object:
+        index_data = json.loads(file_object.read().decode(u'utf-8'))
+
+    except (IOError, OSError, UnicodeDecodeError, ValueError):
+      return
+
+    if (not isinstance(index_data, dict) or
+        index_data.get(u'version', None) != self._FORMAT_VERSION or
+        index_data.get(u'identifier', None) != identifier):
+      return
+
+    members = index_data.get(u'members', None)
+    if not isinstance(members, list):
+      return
+
+    return members
+
+  def WriteMembers(self, identifier, members):
+    """Writes the members of an archive to the index.
+
+    The index file is written to a temporary file first that is renamed
+    afterwards, so that concurrent readers never see a partial index file.
+    Failures to write are ignored since the index is only an optimization.
+
+    Args:
+      identifier (str): identifier of the archive.
+      members (list[dict[str, object]]): members of the archive.
+    """
+    index_data = {
+        u'identifier': identifier,
+        u'members': members,
+        u'version': self._FORMAT_VERSION}
+
+    index_file_path = self._GetIndexFilePath(identifier)
+    temp_file_path = None
+    try:
+      if not os.path.isdir(self._path):
+        os.makedirs(self._path)
+
+      file_descriptor, temp_file_path = tempfile.mkstemp(
+          dir=self._path, suffix=u'.tmp')
+      with os.fdopen(file_descriptor, 'wb') as file_object:
+        file_object.write(json.dumps(index_data).encode(u'utf-8'))
+
+      os.rename(temp_file_path, index_file_path)
+      temp_file_path = None
+
+    except (IOError, OSError):
+      pass
+
+    finally:
+      if temp_file_path:
+        try:
+          os.remove(temp_file_path)
+        except OSError:
+          pass
@@ -1,18 +1,18 @@
 # -*- coding: utf-8 -*-
 """Helper functions for RAW storage media image support."""
 
+from dfvfs.lib import directory_listing
 from dfvfs.lib import errors
-from dfvfs.path import factory as path_spec_factory
 
 
 def _RawGlobPathSpecWithAlphabeticalSchema(
-    file_system, parent_path_spec, segment_format, location, segment_length,
+    directory_listing_cache, segment_format, location, segment_length,
     upper_case=False):
   """Globs for path specifications according to an alphabetical naming schema.
 
   Args:
-    file_system: the file system object (instance of FileSystem).
-    parent_path_spec: the parent path specification (instance of PathSpec).
+    directory_listing_cache: the directory listing cache (instance of
+                             DirectoryListingCache).
     segment_format: the format string of the segment file location.
     location: the base segment file location string.
     segment_length: the length (number of characters) of the segment indicator.
@@ -38,19 +38,9 @@ def _RawGlobPathSpecWithAlphabeticalSchema(
     segment_letters = u''.join(segment_letters[::-1])
     segment_location = segment_format.format(location, segment_letters)
 
-    # Note that we don't want to set the keyword arguments when not used
-    # because the path specification base class will check for unused
-    # keyword arguments and raise.
-    kwargs = path_spec_factory.Factory.GetProperties(parent_path_spec)
-
-    kwargs[u'location'] = segment_location
-    if parent_path_spec.parent is not None:
-      kwargs[u'parent'] = parent_path_spec.parent
-
-    segment_path_spec = path_spec_factory.Factory.NewPathSpec(
-        parent_path_spec.type_indicator, **kwargs)
-
-    if not file_system.FileEntryExistsByPathSpec(segment_path_spec):
+    segment_path_spec = directory_listing_cache.FindPathSpecByLocation(
+        segment_location)
+    if not segment_path_spec:
       break
 
     segment_files.append(segment_path_spec)
@@ -61,12 +51,12 @@ def _RawGlobPathSpecWithAlphabeticalSchema(
 
 
 def _RawGlobPathSpecWithNumericSchema(
-    file_system, parent_path_spec, segment_format, location, segment_number):
+    directory_listing_cache, segment_format, location, segment_number):
   """Globs for path specifications according to a numeric naming schema.
 
   Args:
-    file_system: the file system object (instance of FileSystem).
-    parent_path_spec: the parent path specification (instance of PathSpec).
+    directory_listing_cache: the directory listing cache (instance of
+                             DirectoryListingCache).
     segment_format: the format string of the segment file location.
     location: the base segment file location string.
     segment_number: the first segment number.
@@ -79,19 +69,9 @@ def _RawGlobPathSpecWithNumericSchema(
   while True:
     segment_location = segment_format.format(location, segment_number)
 
-    # Note that we don't want to set the keyword arguments when not used
-    # because the path specification base class will check for unused
-    # keyword arguments and raise.
-    kwargs = path_spec_factory.Factory.GetProperties(parent_path_spec)
-
-    kwargs[u'location'] = segment_location
-    if parent_path_spec.parent is not None:
-      kwargs[u'parent'] = parent_path_spec.parent
-
-    segment_path_spec = path_spec_factory.Factory.NewPathSpec(
-        parent_path_spec.type_indicator, **kwargs)
-
-    if not file_system.FileEntryExistsByPathSpec(segment_path_spec):
+    segment_path_spec = directory_listing_cache.FindPathSpecByLocation(
+        segment_location)
+    if not segment_path_spec:
       break
 
     segment_files.append(segment_path_spec)
@@ -127,6 +107,9 @@ def RawGlobPathSpec(file_system, path_spec):
     raise errors.PathSpecError(
         u'Unsupported parent path specification without location.')
 
+  directory_listing_cache = directory_listing.DirectoryListingCache(
+      file_system, parent_path_spec)
+
   path_segments = file_system.SplitPath(parent_location)
   last_path_segment = path_segments.pop()
   filename_prefix, dot, segment_extension = last_path_segment.rpartition(u'.')
@@ -156,7 +139,7 @@ def RawGlobPathSpec(file_system, path_spec):
 
       suffix_length = filename_prefix_length - suffix_index
       segment_files = _RawGlobPathSpecWithAlphabeticalSchema(
-          file_system, parent_path_spec, u'{0:s}{1:s}',
+          directory_listing_cache, u'{0:s}{1:s}',
           location[:-suffix_length], filename_prefix_length - suffix_index,
           upper_case=False)
 
@@ -173,7 +156,7 @@ def RawGlobPathSpec(file_system, path_spec):
 
       suffix_length = filename_prefix_length - suffix_index
       segment_files = _RawGlobPathSpecWithAlphabeticalSchema(
-          file_system, parent_path_spec, u'{0:s}{1:s}',
+          directory_listing_cache, u'{0:s}{1:s}',
           location[:-suffix_length], filename_prefix_length - suffix_index,
           upper_case=True)
 
@@ -212,7 +195,7 @@ def RawGlobPathSpec(file_system, path_spec):
             u'Unsupported path specification invalid segment file scheme.')
 
       segment_files = _RawGlobPathSpecWithNumericSchema(
-          file_system, parent_path_spec, segment_format,
+          directory_listing_cache, segment_format,
           location[:-suffix_length], segment_number)
     else:
       segment_files = []
@@ -230,7 +213,7 @@ def RawGlobPathSpec(file_system, path_spec):
   # e.g. PREFIX.aa or PREFIX.aaa.
   elif segment_extension == u'a' * segment_extension_length:
     segment_files = _RawGlobPathSpecWithAlphabeticalSchema(
-        file_system, parent_path_spec, u'{0:s}.{1:s}', location,
+        directory_listing_cache, u'{0:s}.{1:s}', location,
         segment_extension_length, upper_case=False)
 
   # Check if there are muliple segment files in the form: PREFIX.[A-Z]+
@@ -238,7 +221,7 @@ def RawGlobPathSpec(file_system, path_spec):
   # e.g. PREFIX.AA or PREFIX.AAA.
   elif segment_extension == u'A' * segment_extension_length:
     segment_files = _RawGlobPathSpecWithAlphabeticalSchema(
-        file_system, parent_path_spec, u'{0:s}.{1:s}', location,
+        directory_listing_cache, u'{0:s}.{1:s}', location,
         segment_extension_length, upper_case=True)
 
   # Check if there are muliple segment files in the form: PREFIX###.asb
@@ -246,7 +229,7 @@ def RawGlobPathSpec(file_system, path_spec):
   elif segment_extension == u'asb':
     if location[-3:] == u'001':
       segment_files = _RawGlobPathSpecWithNumericSchema(
-          file_system, parent_path_spec, u'{0:s}{1:03d}.asb', location[:-3], 1)
+          directory_listing_cache, u'{0:s}{1:03d}.asb', location[:-3], 1)
     else:
       segment_files = []
 
@@ -257,7 +240,7 @@ def RawGlobPathSpec(file_system, path_spec):
     location, _, segment_number = location.partition(u'-f')
     if segment_number == u'001':
       segment_files = _RawGlobPathSpecWithNumericSchema(
-          file_system, parent_path_spec, u'{0:s}-f{1:03d}.vmdk', location, 1)
+          directory_listing_cache, u'{0:s}-f{1:03d}.vmdk', location, 1)
     else:
       segment_files = []
 
@@ -291,7 +274,7 @@ def RawGlobPathSpec(file_system, path_spec):
           u'{0:s}').format(segment_extension))
 
     segment_files = _RawGlobPathSpecWithNumericSchema(
-        file_system, parent_path_spec, segment_format, location, segment_number)
+        directory_listing_cache, segment_format, location, segment_number)
 
   else:
     segment_files = []
@@ -318,19 +301,9 @@ def RawGlobPathSpec(file_system, path_spec):
         segment_location = u'{0:s}.{1:d}of{2:d}'.format(
             location, segment_number, number_of_segments)
 
-        # Note that we don't want to set the keyword arguments when not used
-        # because the path specification base class will check for unused
-        # keyword arguments and raise.
-        kwargs = path_spec_factory.Factory.GetProperties(parent_path_spec)
-
-        kwargs[u'location'] = segment_location
-        if parent_path_spec.parent is not None:
-          kwargs[u'parent'] = parent_path_spec.parent
-
-        segment_path_spec = path_spec_factory.Factory.NewPathSpec(
-            parent_path_spec.type_indicator, **kwargs)
-
-        if not file_system.FileEntryExistsByPathSpec(segment_path_spec):
+        segment_path_spec = directory_listing_cache.FindPathSpecByLocation(
+            segment_location)
+        if not segment_path_spec:
           raise errors.PathSpecError(
               u'Missing segment file: {0:d}of{1:d} for extension: {2:s}'.format(
                   segment_number, number_of_segments, segment_extension))
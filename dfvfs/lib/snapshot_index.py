@@ -0,0 +1,472 @@
+# -*- coding: utf-8 -*-
+"""The on-disk snapshot index of file system metadata."""
+
+import os
+import tempfile
+
+try:
+  from pysqlite2 import dbapi2 as sqlite3
+except ImportError:
+  import sqlite3
+
+from dfvfs.lib import identity
+
+
+class SnapshotRecord(object):
+  """Record of a file entry in a file system snapshot.
+
+  Attributes:
+    access_time (int): access time or None if not available.
+    change_time (int): change time or None if not available.
+    creation_time (int): creation time or None if not available.
+    file_entry_type (int): file entry type, such as file or directory, or None
+        if not available.
+    gid (int): group identifier or None if not available.
+    identifier (int): identifier of the record in the snapshot.
+    inode (int): inode number, or equivalent such as the MFT entry number,
+        or None if not available.
+    is_allocated (bool): True if the file entry is allocated.
+    location (str): location of the file entry.
+    mode (int): access mode or None if not available.
+    modification_time (int): modification time or None if not available.
+    name (str): name of the file entry.
+    parent_identifier (int): identifier of the record of the parent directory
+        or None for the root directory.
+    size (int): size of the data of the file entry or None if not available.
+    uid (int): user identifier or None if not available.
+  """
+
+  __slots__ = (
+      u'access_time', u'change_time', u'creation_time', u'file_entry_type',
+      u'gid', u'identifier', u'inode', u'is_allocated', u'location', u'mode',
+      u'modification_time', u'name', u'parent_identifier', u'size', u'uid')
+
+  # The order of the values in a row of the records table.
+  _VALUE_NAMES = (
+      u'identifier', u'parent_identifier', u'location', u'name', u'inode',
+      u'file_entry_type', u'size', u'is_allocated', u'mode', u'uid', u'gid',
+      u'access_time', u'change_time', u'creation_time', u'modification_time')
+
+  def __init__(
+      self, location, name, access_time=None, change_time=None,
+      creation_time=None, file_entry_type=None, gid=None, identifier=None,
+      inode=None, is_allocated=True, mode=None, modification_time=None,
+      parent_identifier=None, size=None, uid=None):
+    """Initializes a snapshot record.
+
+    Args:
+      location (str): location of the file entry.
+      name (str): name of the file entry.
+      access_time (Optional[int]): access time.
+      change_time (Optional[int]): change time.
+      creation_time (Optional[int]): creation time.
+      file_entry_type (Optional[int]): file entry type, such as file or
+          directory.
+      gid (Optional[int]): group identifier.
+      identifier (Optional[int]): identifier of the record in the snapshot,
+          where None represents the record was not written yet.
+      inode (Optional[int]): inode number, or equivalent such as the MFT
+          entry number.
+      is_allocated (Optional[bool]): True if the file entry is allocated.
+      mode (Optional[int]): access mode.
+      modification_time (Optional[int]): modification time.
+      parent_identifier (Optional[int]): identifier of the record of
+          the parent directory.
+      size (Optional[int]): size of the data of the file entry.
+      uid (Optional[int]): user identifier.
+    """
+    super(SnapshotRecord, self).__init__()
+    self.access_time = access_time
+    self.change_time = change_time
+    self.creation_time = creation_time
+    self.file_entry_type = file_entry_type
+    self.gid = gid
+    self.identifier = identifier
+    self.inode = inode
+    self.is_allocated = is_allocated
+    self.location = location
+    self.mode = mode
+    self.modification_time = modification_time
+    self.name = name
+    self.parent_identifier = parent_identifier
+    self.size = size
+    self.uid = uid
+
+  @classmethod
+  def FromRow(cls, row):
+    """Creates a snapshot record from a row of the records table.
+
+    Args:
+      row (tuple[object]): values of the row.
+
+    Returns:
+      SnapshotRecord: snapshot record.
+    """
+    values = dict(zip(cls._VALUE_NAMES, row))
+    values[u'is_allocated'] = bool(values[u'is_allocated'])
+    return cls(**values)
+
+  def GetRow(self):
+    """Retrieves the row of the records table of the snapshot record.
+
+    Returns:
+      tuple[object]: values of the row.
+    """
+    return tuple(getattr(self, name) for name in self._VALUE_NAMES)
+
+
+class Snapshot(object):
+  """Class that implements read access to a file system snapshot.
+
+  Attributes:
+    path_separator (str): path separator of the file system.
+    timestamp_format (str): format of the timestamps of the records, such as
+        "filetime" or "posix_time", or None if the records have no timestamps.
+    type_indicator (str): type indicator of the file system.
+  """
+
+  _SELECT_RECORDS_QUERY = (
+      u'SELECT identifier, parent_identifier, location, name, inode, '
+      u'file_entry_type, size, is_allocated, mode, uid, gid, access_time, '
+      u'change_time, creation_time, modification_time FROM records')
+
+  def __init__(self, connection):
+    """Initializes a snapshot.
+
+    Args:
+      connection (sqlite3.Connection): connection to the snapshot database.
+
+    Raises:
+      IOError: if the snapshot database is not supported.
+    """
+    super(Snapshot, self).__init__()
+    self._connection = connection
+
+    try:
+      cursor = connection.execute(u'SELECT name, value FROM metadata')
+      metadata = dict(cursor.fetchall())
+    except sqlite3.DatabaseError as exception:
+      raise IOError(u'Unable to read metadata with error: {0!s}'.format(
+          exception))
+
+    if metadata.get(u'format_version', None) != u'{0:d}'.format(
+        SnapshotIndex.FORMAT_VERSION):
+      raise IOError(u'Unsupported snapshot format version.')
+
+    self.path_separator = metadata.get(u'path_separator', None)
+    self.timestamp_format = metadata.get(u'timestamp_format', None)
+    self.type_indicator = metadata.get(u'type_indicator', None)
+
+  def _GetRecord(self, condition, value):
+    """Retrieves the first record that matches a condition.
+
+    Args:
+      condition (str): condition of the SQL query.
+      value (object): value of the condition.
+
+    Returns:
+      SnapshotRecord: snapshot record or None if not available.
+    """
+    query = u'{0:s} WHERE {1:s} ORDER BY identifier LIMIT 1'.format(
+        self._SELECT_RECORDS_QUERY, condition)
+    cursor = self._connection.execute(query, (value, ))
+    row = cursor.fetchone()
+    if row:
+      return SnapshotRecord.FromRow(row)
+
+  def Close(self):
+    """Closes the snapshot."""
+    if self._connection:
+      self._connection.close()
+      self._connection = None
+
+  def GetRecordByIdentifier(self, identifier):
+    """Retrieves a record by its identifier.
+
+    Args:
+      identifier (int): identifier of the record.
+
+    Returns:
+      SnapshotRecord: snapshot record or None if not available.
+    """
+    return self._GetRecord(u'identifier = ?', identifier)
+
+  def GetRecordByInode(self, inode):
+    """Retrieves a record by inode.
+
+    Args:
+      inode (int): inode number, or equivalent such as the MFT entry number.
+
+    Returns:
+      SnapshotRecord: first record of the inode, which is the record of the
+          first name found in the walk of the file system, or None if not
+          available.
+    """
+    return self._GetRecord(u'inode = ?', inode)
+
+  def GetRecordByLocation(self, location):
+    """Retrieves a record by location.
+
+    Args:
+      location (str): location of the file entry.
+
+    Returns:
+      SnapshotRecord: snapshot record or None if not available.
+    """
+    return self._GetRecord(u'location = ?', location)
+
+  def GetSubRecords(self, parent_identifier):
+    """Retrieves the records of the entries of a directory.
+
+    Args:
+      parent_identifier (int): identifier of the record of the directory.
+
+    Returns:
+      list[SnapshotRecord]: snapshot records in the order they were written.
+    """
+    query = u'{0:s} WHERE parent_identifier = ? ORDER BY identifier'.format(
+        self._SELECT_RECORDS_QUERY)
+    cursor = self._connection.execute(query, (parent_identifier, ))
+    return [SnapshotRecord.FromRow(row) for row in cursor.fetchall()]
+
+
+class SnapshotWriter(object):
+  """Class that implements writing a file system snapshot.
+
+  The snapshot is written to a temporary file that is renamed on close,
+  so that concurrent readers never see a partial snapshot.
+  """
+
+  _CREATE_TABLE_QUERIES = [
+      u'CREATE TABLE metadata (name TEXT PRIMARY KEY, value TEXT)',
+      (u'CREATE TABLE records (identifier INTEGER PRIMARY KEY, '
+       u'parent_identifier INTEGER, location TEXT, name TEXT, inode INTEGER, '
+       u'file_entry_type INTEGER, size INTEGER, is_allocated INTEGER, '
+       u'mode INTEGER, uid INTEGER, gid INTEGER, access_time INTEGER, '
+       u'change_time INTEGER, creation_time INTEGER, '
+       u'modification_time INTEGER)')]
+
+  _CREATE_INDEX_QUERIES = [
+      u'CREATE INDEX records_inode ON records (inode)',
+      u'CREATE INDEX records_location ON records (location)',
+      u'CREATE INDEX records_parent ON records (parent_identifier)']
+
+  _INSERT_RECORD_QUERY = (
+      u'INSERT INTO records VALUES '
+      u'(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)')
+
+  def __init__(self, path, temp_file_path, type_indicator, path_separator):
+    """Initializes a snapshot writer.
+
+    Args:
+      path (str): path of the snapshot database.
+      temp_file_path (str): path of the temporary snapshot database.
+      type_indicator (str): type indicator of the file system.
+      path_separator (str): path separator of the file system.
+    """
+    super(SnapshotWriter, self).__init__()
+    self._connection = sqlite3.connect(temp_file_path)
+    self._path = path
+    self._temp_file_path = temp_file_path
+    self._timestamp_format = None
+
+    for query in self._CREATE_TABLE_QUERIES:
+      self._connection.execute(query)
+
+    self._SetMetadataValue(
+        u'format_version', u'{0:d}'.format(SnapshotIndex.FORMAT_VERSION))
+    self._SetMetadataValue(u'path_separator', path_separator)
+    self._SetMetadataValue(u'type_indicator', type_indicator)
+
+  def _SetMetadataValue(self, name, value):
+    """Sets a metadata value.
+
+    Args:
+      name (str): name of the metadata value.
+      value (str): metadata value.
+    """
+    self._connection.execute(
+        u'INSERT OR REPLACE INTO metadata VALUES (?, ?)', (name, value))
+
+  def Abort(self):
+    """Aborts writing the snapshot and removes the temporary database."""
+    if self._connection:
+      self._connection.close()
+      self._connection = None
+
+    try:
+      os.remove(self._temp_file_path)
+    except OSError:
+      pass
+
+  def Close(self):
+    """Closes the snapshot writer and makes the snapshot available.
+
+    Raises:
+      IOError: if the snapshot cannot be made available.
+    """
+    for query in self._CREATE_INDEX_QUERIES:
+      self._connection.execute(query)
+
+    if self._timestamp_format:
+      self._SetMetadataValue(u'timestamp_format', self._timestamp_format)
+
+    self._connection.commit()
+    self._connection.close()
+    self._connection = None
+
+    try:
+      if os.path.exists(self._path):
+        os.remove(self._path)
+      os.rename(self._temp_file_path, self._path)
+
+    except OSError as exception:
+      self.Abort()
+      raise IOError(u'Unable to write snapshot with error: {0!s}'.format(
+          exception))
+
+  def WriteRecord(self, record, timestamp_format=None):
+    """Writes a record.
+
+    The snapshot stores timestamps of a single format, which is the format
+    of the first record written with timestamps. The timestamps of a record
+    in another format are not stored.
+
+    Args:
+      record (SnapshotRecord): snapshot record, where the identifier is set
+          to the identifier of the record in the snapshot.
+      timestamp_format (Optional[str]): format of the timestamps of
+          the record, such as "filetime" or "posix_time".
+    """
+    if timestamp_format and not self._timestamp_format:
+      self._timestamp_format = timestamp_format
+
+    if timestamp_format != self._timestamp_format:
+      record.access_time = None
+      record.change_time = None
+      record.creation_time = None
+      record.modification_time = None
+
+    cursor = self._connection.execute(
+        self._INSERT_RECORD_QUERY, record.GetRow())
+    record.identifier = cursor.lastrowid
+
+
+class SnapshotIndex(object):
+  """Class that implements an on-disk snapshot index of file systems.
+
+  The snapshot index stores the metadata of the file entries of a file system,
+  such as a NTFS or ext file system, so that finding and listing file entries
+  does not require reading the file system. The snapshot of a file system is
+  stored in a SQLite database of its own, named after the identifier of the
+  file system. The identifier is derived from the path specification of
+  the file system and the identity of the image that contains it, so that
+  a changed image is not matched with an outdated snapshot.
+  """
+
+  FORMAT_VERSION = 1
+
+  def __init__(self, path):
+    """Initializes the snapshot index.
+
+    Args:
+      path (str): path of the directory that contains the snapshot databases.
+    """
+    super(SnapshotIndex, self).__init__()
+    self._path = path
+
+  def _GetSnapshotPath(self, identifier):
+    """Retrieves the path of a snapshot database.
+
+    Args:
+      identifier (str): identifier of the file system.
+
+    Returns:
+      str: path of the snapshot database.
+    """
+    return os.path.join(self._path, u'{0:s}.sqlite'.format(identifier))
+
+  def CreateSnapshot(self, identifier, type_indicator, path_separator):
+    """Creates a snapshot of a file system.
+
+    Args:
+      identifier (str): identifier of the file system.
+      type_indicator (str): type indicator of the file system.
+      path_separator (str): path separator of the file system.
+
+    Returns:
+      SnapshotWriter: snapshot writer.
+
+    Raises:
+      IOError: if the snapshot cannot be created.
+    """
+    try:
+      if not os.path.isdir(self._path):
+        os.makedirs(self._path)
+
+      file_descriptor, temp_file_path = tempfile.mkstemp(
+          dir=self._path, suffix=u'.tmp')
+      os.close(file_descriptor)
+
+    except OSError as exception:
+      raise IOError(u'Unable to create snapshot with error: {0!s}'.format(
+          exception))
+
+    snapshot_path = self._GetSnapshotPath(identifier)
+    return SnapshotWriter(
+        snapshot_path, temp_file_path, type_indicator, path_separator)
+
+  def GetIdentifier(self, type_indicator, path_spec, file_object):
+    """Determines the identifier of a file system.
+
+    The identity of the image that contains the file system consists of
+    the size of the image and the data at the start of the image. If
+    the image is stored in an operating system file, the size and
+    modification time of this file are part of the identity as well.
+
+    Args:
+      type_indicator (str): type indicator of the file system.
+      path_spec (PathSpec): path specification of the image that contains
+          the file system.
+      file_object (FileIO): file-like object of the image.
+
+    Returns:
+      str: identifier of the file system.
+    """
+    return identity.GetIdentifier(type_indicator, path_spec, file_object)
+
+  def HasSnapshot(self, identifier):
+    """Determines if the index contains a snapshot of a file system.
+
+    Args:
+      identifier (str): identifier of the file system.
+
+    Returns:
+      bool: True if the index contains a snapshot of the file system.
+    """
+    return os.path.exists(self._GetSnapshotPath(identifier))
+
+  def OpenSnapshot(self, identifier):
+    """Opens the snapshot of a file system.
+
+    Args:
+      identifier (str): identifier of the file system.
+
+    Returns:
+      Snapshot: snapshot or None if the index does not contain a snapshot
+          of the file system or the snapshot cannot be read.
+    """
+    snapshot_path = self._GetSnapshotPath(identifier)
+    if not os.path.exists(snapshot_path):
+      return
+
+    try:
+      connection = sqlite3.connect(snapshot_path)
+    except sqlite3.Error:
+      return
+
+    try:
+      return Snapshot(connection)
+    except IOError:
+      connection.close()
+      return
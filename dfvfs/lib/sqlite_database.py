@@ -19,6 +19,8 @@ class SQLiteDatabaseFile(object):
 
   _HAS_COLUMN_QUERY = u'PRAGMA table_info("{0:s}")'
 
+  _HAS_ROW_IDENTIFIER_QUERY = u'SELECT _ROWID_ FROM {0:s} LIMIT 0'
+
   _HAS_TABLE_QUERY = (
       u'SELECT name FROM sqlite_master WHERE type = "table"')
 
@@ -32,6 +34,7 @@ class SQLiteDatabaseFile(object):
     self._column_names_per_table = {}
     self._connection = None
     self._cursor = None
+    self._row_identifier_per_table = {}
     self._table_names = None
     self._temp_file_path = u''
 
@@ -48,11 +51,15 @@ class SQLiteDatabaseFile(object):
 
     # TODO: move this to a central temp file manager and have it track errors.
     # https://github.com/log2timeline/dfvfs/issues/92
-    try:
-      os.remove(self._temp_file_path)
-    except (OSError, IOError):
-      pass
+    if self._temp_file_path:
+      try:
+        os.remove(self._temp_file_path)
+      except (OSError, IOError):
+        pass
 
+    self._column_names_per_table = {}
+    self._row_identifier_per_table = {}
+    self._table_names = None
     self._temp_file_path = u''
 
   def GetNumberOfRows(self, table_name):
@@ -128,6 +135,36 @@ class SQLiteDatabaseFile(object):
     column_name = column_name.lower()
     return column_name in column_names
 
+  def HasRowIdentifier(self, table_name):
+    """Determines if a specific table has row identifiers.
+
+    Tables that were created WITHOUT ROWID do not have row identifiers.
+
+    Args:
+      table_name (str): name of the table.
+
+    Returns:
+      bool: True if the table has row identifiers.
+
+    Raises:
+      IOError: if the database file is not opened.
+    """
+    if not self._connection:
+      raise IOError(u'Not opened.')
+
+    table_name = table_name.lower()
+    has_row_identifier = self._row_identifier_per_table.get(table_name, None)
+    if has_row_identifier is None:
+      try:
+        self._cursor.execute(self._HAS_ROW_IDENTIFIER_QUERY.format(table_name))
+        has_row_identifier = True
+      except sqlite3.Error:
+        has_row_identifier = False
+
+      self._row_identifier_per_table[table_name] = has_row_identifier
+
+    return has_row_identifier
+
   def HasTable(self, table_name):
     """Determines if a specific table exists.
 
@@ -184,18 +221,55 @@ class SQLiteDatabaseFile(object):
     data = file_object.read(len(self._HEADER_SIGNATURE))
 
     if data != self._HEADER_SIGNATURE:
-      file_object.close()
       raise IOError(u'Unsupported SQLite database signature.')
 
-    with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-      self._temp_file_path = temp_file.name
-      while data:
-        temp_file.write(data)
-        data = file_object.read(self._COPY_BUFFER_SIZE)
+    try:
+      with tempfile.NamedTemporaryFile(delete=False) as temp_file:
+        self._temp_file_path = temp_file.name
+        while data:
+          temp_file.write(data)
+          data = file_object.read(self._COPY_BUFFER_SIZE)
+
+      self._connection = sqlite3.connect(self._temp_file_path)
+      self._connection.text_factory = bytes
+      self._cursor = self._connection.cursor()
+
+    except (IOError, sqlite3.Error) as exception:
+      # Make sure the temporary copy is removed if the open failed.
+      self.Close()
+      raise IOError(
+          u'Unable to open SQLite database with error: {0!s}'.format(
+              exception))
+
+  def OpenBlob(self, table_name, column_name, row_identifier):
+    """Opens a blob for incremental I/O.
 
-    self._connection = sqlite3.connect(self._temp_file_path)
-    self._connection.text_factory = bytes
-    self._cursor = self._connection.cursor()
+    Incremental I/O allows to read parts of a blob without reading
+    the entire blob into memory.
+
+    Args:
+      table_name (str): name of the table.
+      column_name (str): name of the column.
+      row_identifier (int): row identifier.
+
+    Returns:
+      sqlite3.Blob: blob or None if incremental I/O is not supported or
+          the value is not a blob or text.
+
+    Raises:
+      IOError: if the database file is not opened.
+    """
+    if not self._connection:
+      raise IOError(u'Not opened.')
+
+    if not self.SupportsIncrementalBlobIO():
+      return
+
+    try:
+      return self._connection.blobopen(
+          table_name, column_name, row_identifier, readonly=True)
+    except sqlite3.Error:
+      return
 
   def Query(self, query, parameters=None):
     """Queries the database file.
@@ -216,3 +290,14 @@ class SQLiteDatabaseFile(object):
       self._cursor.execute(query)
 
     return self._cursor.fetchall()
+
+  def SupportsIncrementalBlobIO(self):
+    """Determines if incremental blob I/O is supported.
+
+    Incremental blob I/O requires Connection.blobopen, which was added
+    to the sqlite3 module in Python 3.11.
+
+    Returns:
+      bool: True if incremental blob I/O is supported.
+    """
+    return hasattr(sqlite3.Connection, u'blobopen')
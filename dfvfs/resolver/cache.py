@@ -146,6 +146,16 @@ class ObjectsCache(object):
 
     return cache_value.vfs_object
 
+  def GetObjects(self):
+    """Retrieves the cached objects.
+
+    This method ignores the cache value reference count.
+
+    Returns:
+      A list of the cached VFS objects.
+    """
+    return [cache_value.vfs_object for cache_value in self._values.values()]
+
   def GrabObject(self, identifier):
     """Grabs a cached object based on the identifier.
 
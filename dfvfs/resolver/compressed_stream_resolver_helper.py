@@ -24,7 +24,9 @@ class CompressedStreamResolverHelper(resolver_helper.ResolverHelper):
     Returns:
       The file-like object (instance of file_io.FileIO).
     """
-    return dfvfs.file_io.compressed_stream_io.CompressedStream(resolver_context)
+    number_of_threads = resolver_context.GetCompressedStreamNumberOfThreads()
+    return dfvfs.file_io.compressed_stream_io.CompressedStream(
+        resolver_context, number_of_threads=number_of_threads)
 
   def NewFileSystem(self, resolver_context):
     """Creates a new file system object.
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 """The resolver context object."""
 
+from dfvfs.lib import member_index
 from dfvfs.resolver import cache
 
 
@@ -9,7 +10,8 @@ class Context(object):
 
   def __init__(
       self, maximum_number_of_file_objects=128,
-      maximum_number_of_file_systems=16):
+      maximum_number_of_file_systems=16, maximum_number_of_databases=16,
+      member_index_path=None, compressed_stream_number_of_threads=1):
     """Initializes the resolver context object.
 
     Args:
@@ -17,12 +19,27 @@ class Context(object):
           of file-like objects cached in the context.
       maximum_number_of_file_systems (Optional[int]): maximum number
           of file system objects cached in the context.
+      maximum_number_of_databases (Optional[int]): maximum number
+          of database objects cached in the context.
+      member_index_path (Optional[str]): path of the directory that contains
+          the on-disk member index of archive files, where None represents
+          the member index is not used.
+      compressed_stream_number_of_threads (Optional[int]): number of threads
+          used to decompress the data of compressed streams, where 1
+          represents decompressing data on the thread that reads the data.
     """
     super(Context, self).__init__()
+    self._compressed_stream_number_of_threads = (
+        compressed_stream_number_of_threads)
+    self._database_cache = cache.ObjectsCache(maximum_number_of_databases)
     self._file_object_cache = cache.ObjectsCache(
         maximum_number_of_file_objects)
     self._file_system_cache = cache.ObjectsCache(
         maximum_number_of_file_systems)
+    self._member_index = None
+
+    if member_index_path:
+      self._member_index = member_index.MemberIndex(member_index_path)
 
   def _GetFileSystemCacheIdentifier(self, path_spec):
     """Determines the file system cache identifier for the path specification.
@@ -40,6 +57,16 @@ class Context(object):
 
     return u''.join(string_parts)
 
+  def CacheDatabase(self, path_spec, database_object):
+    """Caches a database object based on a path specification.
+
+    Args:
+      path_spec (PathSpec): path specification of the file that contains
+          the database.
+      database_object (SQLiteDatabaseFile): database object.
+    """
+    self._database_cache.CacheObject(path_spec.comparable, database_object)
+
   def CacheFileObject(self, path_spec, file_object):
     """Caches a file-like object based on a path specification.
 
@@ -60,7 +87,15 @@ class Context(object):
     self._file_system_cache.CacheObject(identifier, file_system)
 
   def Empty(self):
-    """Empties the caches."""
+    """Empties the caches.
+
+    The cached database objects are closed, since a database object can
+    hold a temporary copy of the database file.
+    """
+    for database_object in self._database_cache.GetObjects():
+      database_object.Close()
+
+    self._database_cache.Empty()
     self._file_object_cache.Empty()
     self._file_system_cache.Empty()
 
@@ -82,6 +117,44 @@ class Context(object):
 
     return True
 
+  def GetCompressedStreamNumberOfThreads(self):
+    """Retrieves the number of threads used to decompress compressed streams.
+
+    Returns:
+      int: number of threads used to decompress data, where 1 represents
+          decompressing data on the thread that reads the data.
+    """
+    return self._compressed_stream_number_of_threads
+
+  def GetDatabase(self, path_spec):
+    """Retrieves a database object defined by path specification.
+
+    Args:
+      path_spec (PathSpec): path specification of the file that contains
+          the database.
+
+    Returns:
+      SQLiteDatabaseFile: a database object or None if not cached.
+    """
+    return self._database_cache.GetObject(path_spec.comparable)
+
+  def GetDatabaseReferenceCount(self, path_spec):
+    """Retrieves the reference count of a cached database object.
+
+    Args:
+      path_spec (PathSpec): path specification of the file that contains
+          the database.
+
+    Returns:
+      int: reference count or None if there is no database object for
+          the corresponding path specification cached.
+    """
+    cache_value = self._database_cache.GetCacheValue(path_spec.comparable)
+    if not cache_value:
+      return
+
+    return cache_value.reference_count
+
   def GetFileObject(self, path_spec):
     """Retrieves a file-like object defined by path specification.
 
@@ -138,6 +211,23 @@ class Context(object):
 
     return cache_value.reference_count
 
+  def GetMemberIndex(self):
+    """Retrieves the on-disk member index of archive files.
+
+    Returns:
+      MemberIndex: member index or None if not used.
+    """
+    return self._member_index
+
+  def GrabDatabase(self, path_spec):
+    """Grabs a cached database object defined by path specification.
+
+    Args:
+      path_spec (PathSpec): path specification of the file that contains
+          the database.
+    """
+    self._database_cache.GrabObject(path_spec.comparable)
+
   def GrabFileObject(self, path_spec):
     """Grabs a cached file-like object defined by path specification.
 
@@ -155,6 +245,36 @@ class Context(object):
     identifier = self._GetFileSystemCacheIdentifier(path_spec)
     self._file_system_cache.GrabObject(identifier)
 
+  def ReleaseDatabase(self, database_object):
+    """Releases a cached database object.
+
+    Args:
+      database_object (SQLiteDatabaseFile): database object.
+
+    Returns:
+      bool: True if the database object can be closed.
+
+    Raises:
+      RuntimeError: if the database object is not cached or an inconsistency
+          is detected in the cache.
+    """
+    identifier, cache_value = self._database_cache.GetCacheValueByObject(
+        database_object)
+
+    if not identifier:
+      raise RuntimeError(u'Object not cached.')
+
+    if not cache_value:
+      raise RuntimeError(u'Invalid cache value.')
+
+    self._database_cache.ReleaseObject(identifier)
+
+    result = cache_value.IsDereferenced()
+    if result:
+      self._database_cache.RemoveObject(identifier)
+
+    return result
+
   def ReleaseFileObject(self, file_object):
     """Releases a cached file-like object.
 
@@ -217,6 +337,16 @@ class Context(object):
 
     return result
 
+  def SetMaximumNumberOfDatabases(self, maximum_number_of_databases):
+    """Sets the maximum number of cached database objects.
+
+    Args:
+      maximum_number_of_databases (int): maximum number of database
+          objects cached in the context.
+    """
+    self._database_cache.SetMaximumNumberOfCachedValues(
+        maximum_number_of_databases)
+
   def SetMaximumNumberOfFileObjects(self, maximum_number_of_file_objects):
     """Sets the maximum number of cached filei-like objects.
 
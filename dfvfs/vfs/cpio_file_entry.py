@@ -28,20 +28,8 @@ class CPIODirectory(file_entry.Directory):
         not location.startswith(self._file_system.PATH_SEPARATOR)):
       return
 
-    cpio_archive_file = self._file_system.GetCPIOArchiveFile()
-    for cpio_archive_file_entry in cpio_archive_file.GetFileEntries(
-        path_prefix=location[1:]):
-
-      path = cpio_archive_file_entry.path
-      if not path:
-        continue
-
-      _, suffix = self._file_system.GetPathSegmentAndSuffix(location[1:], path)
-
-      # Ignore anything that is part of a sub directory or the directory itself.
-      if suffix or path == location:
-        continue
-
+    index = self._file_system.GetDirectoryIndex()
+    for path in index.GetChildren(location[1:]):
       path_spec_location = self._file_system.JoinPath([path])
       yield cpio_path_spec.CPIOPathSpec(
           location=path_spec_location, parent=self.path_spec.parent)
@@ -171,10 +159,14 @@ class CPIOFileEntry(file_entry.FileEntry):
     """The name of the file entry, which does not include the full path."""
     cpio_archive_file_entry = self.GetCPIOArchiveFileEntry()
 
-    # Note that the root file entry is virtual and has no
+    # Note that virtual file entries, such as the root file entry, have no
     # cpio_archive_file_entry.
     if cpio_archive_file_entry is None:
-      return u''
+      location = getattr(self.path_spec, u'location', None)
+      if not location or len(location) == 1:
+        return u''
+
+      return self._file_system.BasenamePath(location)
 
     return self._file_system.BasenamePath(cpio_archive_file_entry.path)
 
@@ -185,9 +177,14 @@ class CPIOFileEntry(file_entry.FileEntry):
       self._directory = self._GetDirectory()
 
     if self._directory:
+      index = self._file_system.GetDirectoryIndex()
       for path_spec in self._directory.entries:
+        location = getattr(path_spec, u'location', None)
+        is_virtual = index.IsVirtualDirectory(location[1:])
+
         yield CPIOFileEntry(
-            self._resolver_context, self._file_system, path_spec)
+            self._resolver_context, self._file_system, path_spec,
+            is_virtual=is_virtual)
 
   def GetCPIOArchiveFileEntry(self):
     """Retrieves the CPIO archive file entry object.
@@ -232,3 +229,14 @@ class CPIOFileEntry(file_entry.FileEntry):
     path_spec = cpio_path_spec.CPIOPathSpec(
         location=parent_location, parent=parent_path_spec)
     return CPIOFileEntry(self._resolver_context, self._file_system, path_spec)
+
+  def GetTimestamps(self):
+    """Retrieves the raw timestamps.
+
+    Returns:
+      Timestamps: raw timestamps, which are POSIX timestamps in seconds.
+    """
+    return file_entry.Timestamps(
+        definitions.TIMESTAMP_FORMAT_POSIX_TIME,
+        modification_time=getattr(
+            self.GetCPIOArchiveFileEntry(), u'modification_time', None))
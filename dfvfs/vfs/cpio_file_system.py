@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 """The CPIO file system implementation."""
 
+import stat
+
 # This is necessary to prevent a circular import.
 import dfvfs.vfs.cpio_file_entry
 
@@ -9,6 +11,7 @@ from dfvfs.lib import definitions
 from dfvfs.lib import errors
 from dfvfs.path import cpio_path_spec
 from dfvfs.resolver import resolver
+from dfvfs.vfs import directory_index
 from dfvfs.vfs import file_system
 
 
@@ -27,6 +30,7 @@ class CPIOFileSystem(file_system.FileSystem):
     """
     super(CPIOFileSystem, self).__init__(resolver_context)
     self._cpio_archive_file = None
+    self._directory_index = None
     self._file_object = None
     self.encoding = encoding
 
@@ -36,6 +40,8 @@ class CPIOFileSystem(file_system.FileSystem):
     Raises:
       IOError: if the close failed.
     """
+    self._directory_index = None
+
     self._cpio_archive_file.Close()
     self._cpio_archive_file = None
 
@@ -64,14 +70,124 @@ class CPIOFileSystem(file_system.FileSystem):
 
     cpio_archive_file = cpio.CPIOArchiveFile()
     try:
-      cpio_archive_file.Open(file_object)
+      self._OpenCPIOArchiveFile(
+          path_spec.parent, file_object, cpio_archive_file)
     except:
       file_object.close()
       raise
 
+    self._directory_index = self._BuildDirectoryIndex(cpio_archive_file)
     self._file_object = file_object
     self._cpio_archive_file = cpio_archive_file
 
+  def _BuildDirectoryIndex(self, cpio_archive_file):
+    """Builds the directory index.
+
+    Args:
+      cpio_archive_file (CPIOArchiveFile): CPIO archive file.
+
+    Returns:
+      DirectoryIndex: directory index.
+    """
+    index = directory_index.DirectoryIndex(path_separator=self.PATH_SEPARATOR)
+
+    for cpio_archive_file_entry in cpio_archive_file.GetFileEntries():
+      if cpio_archive_file_entry.path:
+        index.AddPath(
+            cpio_archive_file_entry.path,
+            is_directory=stat.S_ISDIR(cpio_archive_file_entry.mode))
+
+    return index
+
+  def _GetCPIOArchiveFileEntry(self, member_values):
+    """Retrieves the CPIO archive file entry of a member in the member index.
+
+    Args:
+      member_values (dict[str, object]): values of the member.
+
+    Returns:
+      CPIOArchiveFileEntry: CPIO archive file entry.
+
+    Raises:
+      KeyError: if a value is missing.
+    """
+    cpio_archive_file_entry = cpio.CPIOArchiveFileEntry()
+    cpio_archive_file_entry.data_offset = member_values[u'offset']
+    cpio_archive_file_entry.data_size = member_values[u'data_size']
+    cpio_archive_file_entry.group_identifier = member_values[u'gid']
+    cpio_archive_file_entry.inode_number = member_values[u'inode']
+    cpio_archive_file_entry.mode = member_values[u'mode']
+    cpio_archive_file_entry.modification_time = member_values[u'mtime']
+    cpio_archive_file_entry.path = member_values[u'path']
+    cpio_archive_file_entry.size = member_values[u'size']
+    cpio_archive_file_entry.user_identifier = member_values[u'uid']
+    return cpio_archive_file_entry
+
+  def _GetMemberValues(self, cpio_archive_file_entry):
+    """Retrieves the values of a member to store in the member index.
+
+    Args:
+      cpio_archive_file_entry (CPIOArchiveFileEntry): CPIO archive file entry.
+
+    Returns:
+      dict[str, object]: values of the member.
+    """
+    return {
+        u'data_size': cpio_archive_file_entry.data_size,
+        u'gid': cpio_archive_file_entry.group_identifier,
+        u'inode': cpio_archive_file_entry.inode_number,
+        u'mode': cpio_archive_file_entry.mode,
+        u'mtime': cpio_archive_file_entry.modification_time,
+        u'offset': cpio_archive_file_entry.data_offset,
+        u'path': cpio_archive_file_entry.path,
+        u'size': cpio_archive_file_entry.size,
+        u'type': stat.S_IFMT(cpio_archive_file_entry.mode),
+        u'uid': cpio_archive_file_entry.user_identifier}
+
+  def _OpenCPIOArchiveFile(self, path_spec, file_object, cpio_archive_file):
+    """Opens the CPIO archive file using the member index.
+
+    If the member index of the resolver context contains the CPIO archive
+    file its file entries are read from the index, which prevents reading
+    all the file entry headers of the CPIO archive file. Otherwise the file
+    entries are read from the CPIO archive file and written to the index.
+
+    Args:
+      path_spec (PathSpec): path specification of the CPIO archive file.
+      file_object (FileIO): file-like object of the CPIO archive file.
+      cpio_archive_file (CPIOArchiveFile): CPIO archive file.
+
+    Raises:
+      IOError: if the CPIO archive file cannot be opened.
+    """
+    member_index = self._resolver_context.GetMemberIndex()
+    if not member_index:
+      cpio_archive_file.Open(file_object)
+      return
+
+    identifier = member_index.GetIdentifier(
+        self.TYPE_INDICATOR, path_spec, file_object)
+
+    members = member_index.ReadMembers(identifier)
+    if members is not None:
+      try:
+        file_entries = [
+            self._GetCPIOArchiveFileEntry(member_values)
+            for member_values in members]
+      except (KeyError, TypeError):
+        file_entries = None
+
+      if file_entries is not None:
+        cpio_archive_file.Open(file_object, file_entries=file_entries)
+        return
+
+    cpio_archive_file.Open(file_object)
+
+    members = [
+        self._GetMemberValues(cpio_archive_file_entry)
+        for cpio_archive_file_entry in cpio_archive_file.GetFileEntries()]
+    member_index.WriteMembers(identifier, members)
+
   def FileEntryExistsByPathSpec(self, path_spec):
     """Determines if a file entry for a path specification exists.
 
@@ -90,7 +206,11 @@ class CPIOFileSystem(file_system.FileSystem):
     if len(location) == 1:
       return True
 
-    return self._cpio_archive_file.FileEntryExistsByPath(location[1:])
+    if self._cpio_archive_file.FileEntryExistsByPath(location[1:]):
+      return True
+
+    # Check if location could be a virtual directory.
+    return self._directory_index.HasPath(location[1:])
 
   def GetFileEntryByPathSpec(self, path_spec):
     """Retrieves a file entry for a path specification.
@@ -116,11 +236,24 @@ class CPIOFileSystem(file_system.FileSystem):
     cpio_archive_file_entry = self._cpio_archive_file.GetFileEntryByPath(
         location[1:])
     if cpio_archive_file_entry is None:
-      return
+      if not self._directory_index.IsVirtualDirectory(location[1:]):
+        return
+
+      return dfvfs.vfs.cpio_file_entry.CPIOFileEntry(
+          self._resolver_context, self, path_spec, is_virtual=True)
+
     return dfvfs.vfs.cpio_file_entry.CPIOFileEntry(
         self._resolver_context, self, path_spec,
         cpio_archive_file_entry=cpio_archive_file_entry)
 
+  def GetDirectoryIndex(self):
+    """Retrieves the directory index.
+
+    Returns:
+      DirectoryIndex: directory index.
+    """
+    return self._directory_index
+
   def GetRootFileEntry(self):
     """Retrieves the root file entry.
 
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""The directory index used by archive file systems."""
+
+
+class DirectoryIndex(object):
+  """Class that implements a directory index.
+
+  The directory index maps the path of a directory to the paths of its
+  children, so that a directory can be listed without iterating all
+  the paths stored in an archive, such as a ZIP or TAR file. Directories
+  that are implied by the stored paths, but not stored themselves, are
+  indexed as virtual directories.
+
+  Paths are relative to the root of the archive and are normalized to not
+  contain leading, trailing or successive path separators, where the root
+  is represented by an empty string.
+  """
+
+  def __init__(self, path_separator=u'/'):
+    """Initializes the directory index.
+
+    Args:
+      path_separator (Optional[str]): path separator.
+    """
+    super(DirectoryIndex, self).__init__()
+    self._children = {u'': []}
+    self._is_directory = {u'': True}
+    self._path_separator = path_separator
+    self._virtual_directories = set([u''])
+
+  def _NormalizePath(self, path):
+    """Normalizes a path.
+
+    Args:
+      path (str): path.
+
+    Returns:
+      str: normalized path.
+    """
+    path_segments = path.split(self._path_separator)
+    return self._path_separator.join(filter(None, path_segments))
+
+  def AddPath(self, path, is_directory=False):
+    """Adds a path to the index.
+
+    The parent directories of the path that are not in the index yet are
+    added as virtual directories. If the path was already added, only
+    a virtual directory is replaced by the path.
+
+    Args:
+      path (str): path.
+      is_directory (Optional[bool]): True if the path is a directory.
+    """
+    path = self._NormalizePath(path)
+    if not path:
+      return
+
+    if path in self._is_directory:
+      if path in self._virtual_directories:
+        self._virtual_directories.remove(path)
+        self._is_directory[path] = is_directory
+      return
+
+    self._is_directory[path] = is_directory
+
+    parent_path, _, _ = path.rpartition(self._path_separator)
+    while parent_path not in self._is_directory:
+      self._children[parent_path] = [path]
+      self._is_directory[parent_path] = True
+      self._virtual_directories.add(parent_path)
+
+      path = parent_path
+      parent_path, _, _ = path.rpartition(self._path_separator)
+
+    self._children.setdefault(parent_path, []).append(path)
+
+  def GetChildren(self, path):
+    """Retrieves the paths of the children of a directory.
+
+    Args:
+      path (str): path of the directory.
+
+    Returns:
+      list[str]: paths of the children in the order they were added.
+    """
+    path = self._NormalizePath(path)
+    return list(self._children.get(path, []))
+
+  def HasPath(self, path):
+    """Determines if a path is in the index.
+
+    Args:
+      path (str): path.
+
+    Returns:
+      bool: True if the path is in the index, which includes virtual
+          directories.
+    """
+    path = self._NormalizePath(path)
+    return path in self._is_directory
+
+  def IsDirectory(self, path):
+    """Determines if a path is a directory.
+
+    Args:
+      path (str): path.
+
+    Returns:
+      bool: True if the path is a directory, which includes virtual
+          directories.
+    """
+    path = self._NormalizePath(path)
+    return self._is_directory.get(path, False)
+
+  def IsVirtualDirectory(self, path):
+    """Determines if a path is a virtual directory.
+
+    Args:
+      path (str): path.
+
+    Returns:
+      bool: True if the path is a directory that is implied by other paths,
+          but that was not added itself.
+    """
+    path = self._NormalizePath(path)
+    return path in self._virtual_directories
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""The Virtual File System (VFS) extent."""
+
+from dfvfs.lib import definitions
+
+
+class Extent(object):
+  """Class that implements the VFS extent.
+
+  Attributes:
+    extent_type (str): type of the extent, for example EXTENT_TYPE_SPARSE.
+    offset (int): offset of the extent relative to the start of the file
+        system in bytes or None if not available, for example for resident
+        data.
+    size (int): size of the extent in bytes.
+  """
+
+  EXTENT_TYPE_COMPRESSED = definitions.EXTENT_TYPE_COMPRESSED
+  EXTENT_TYPE_DATA = definitions.EXTENT_TYPE_DATA
+  EXTENT_TYPE_RESIDENT = definitions.EXTENT_TYPE_RESIDENT
+  EXTENT_TYPE_SPARSE = definitions.EXTENT_TYPE_SPARSE
+
+  def __init__(self, extent_type=None, offset=None, size=None):
+    """Initializes the extent.
+
+    Args:
+      extent_type (Optional[str]): type of the extent, for example
+          EXTENT_TYPE_SPARSE.
+      offset (Optional[int]): offset of the extent relative to the start of
+          the file system in bytes.
+      size (Optional[int]): size of the extent in bytes.
+    """
+    super(Extent, self).__init__()
+    self.extent_type = extent_type
+    self.offset = offset
+    self.size = size
+
+  def IsResident(self):
+    """Determines if the extent is stored resident in the metadata.
+
+    Returns:
+      bool: True if the extent is resident.
+    """
+    return self.extent_type == definitions.EXTENT_TYPE_RESIDENT
+
+  def IsSparse(self):
+    """Determines if the extent is sparse.
+
+    Returns:
+      bool: True if the extent is sparse.
+    """
+    return self.extent_type == definitions.EXTENT_TYPE_SPARSE
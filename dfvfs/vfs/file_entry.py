@@ -7,6 +7,9 @@ a directory or file system metadata.
 
 import abc
 
+from dfdatetime import filetime as dfdatetime_filetime
+from dfdatetime import posix_time as dfdatetime_posix_time
+
 from dfvfs.lib import definitions
 from dfvfs.lib import py2to3
 from dfvfs.resolver import resolver
@@ -73,10 +76,199 @@ class Directory(object):
     """generator[PathSpec]: path specifications of the directory entries."""
     return self._EntriesGenerator()
 
+  def _ScanEntries(self):
+    """Scans the directory entries.
+
+    Yields:
+      DirectoryEntry: directory entry.
+    """
+    for path_spec in self._EntriesGenerator():
+      name = None
+      location = getattr(path_spec, u'location', None)
+      if location is not None:
+        name = self._file_system.BasenamePath(location)
+
+      yield DirectoryEntry(path_spec, name)
+
+  def ScanEntries(self):
+    """Scans the directory entries.
+
+    Scanning the directory entries does not create a file entry per
+    directory entry. Only the information that is available from
+    the directory listing is provided. If the file system caches directory
+    listings, a directory that was scanned before is not read again.
+
+    Yields:
+      DirectoryEntry: directory entry.
+    """
+    cache_identifier = None
+    if self._file_system.HasDirectoryListingCache():
+      cache_identifier = getattr(self.path_spec, u'comparable', None)
+
+    if not cache_identifier:
+      for directory_entry in self._ScanEntries():
+        yield directory_entry
+      return
+
+    directory_entries = self._file_system.GetCachedDirectoryListing(
+        cache_identifier)
+    if directory_entries is None:
+      directory_entries = []
+      for directory_entry in self._ScanEntries():
+        directory_entries.append(directory_entry)
+        yield directory_entry
+
+      # Note that the directory listing is only cached when the directory
+      # entries were scanned completely.
+      self._file_system.CacheDirectoryListing(
+          cache_identifier, directory_entries)
+
+    else:
+      for directory_entry in directory_entries:
+        yield directory_entry
+
+
+class DirectoryEntry(object):
+  """VFS directory entry.
+
+  A directory entry is a lightweight record of an entry in a directory, which
+  is used to enumerate a directory without creating a file entry per entry.
+
+  Attributes:
+    file_entry_type (int): file entry type, such as file or directory, or None
+        if not available from the directory listing.
+    inode (int): inode number, or equivalent such as the MFT entry number,
+        or None if not available from the directory listing.
+    is_allocated (bool): True if the directory entry is allocated or None
+        if not available from the directory listing.
+    name (str): name of the directory entry or None if not available.
+    path_spec (PathSpec): path specification of the directory entry.
+    size (int): size of the data of the directory entry or None if not
+        available from the directory listing.
+  """
+
+  __slots__ = (
+      u'file_entry_type', u'inode', u'is_allocated', u'name', u'path_spec',
+      u'size')
+
+  def __init__(
+      self, path_spec, name, file_entry_type=None, inode=None,
+      is_allocated=None, size=None):
+    """Initializes a directory entry.
+
+    Args:
+      path_spec (PathSpec): path specification of the directory entry.
+      name (str): name of the directory entry or None if not available.
+      file_entry_type (Optional[int]): file entry type, such as file or
+          directory.
+      inode (Optional[int]): inode number, or equivalent such as the MFT
+          entry number.
+      is_allocated (Optional[bool]): True if the directory entry is
+          allocated.
+      size (Optional[int]): size of the data of the directory entry.
+    """
+    super(DirectoryEntry, self).__init__()
+    self.file_entry_type = file_entry_type
+    self.inode = inode
+    self.is_allocated = is_allocated
+    self.name = name
+    self.path_spec = path_spec
+    self.size = size
+
+
+class Timestamps(object):
+  """VFS raw timestamps of a file entry.
+
+  The timestamps are integers in the format of the back-end, which avoids
+  creating a date and time values object per timestamp. The timestamp format
+  defines the epoch and precision of the timestamps, for example a FILETIME
+  timestamp contains the number of 100th nano seconds since January 1, 1601
+  00:00:00. Date and time values objects are only created on request.
+
+  Attributes:
+    access_time (int): access time or None if not available.
+    change_time (int): change time or None if not available.
+    creation_time (int): creation time or None if not available.
+    modification_time (int): modification time or None if not available.
+    timestamp_format (str): format of the timestamps, such as "filetime" or
+        "posix_time".
+  """
+
+  __slots__ = (
+      u'access_time', u'change_time', u'creation_time', u'modification_time',
+      u'timestamp_format')
+
+  _TIMESTAMP_NAMES = frozenset([
+      u'access_time', u'change_time', u'creation_time', u'modification_time'])
+
+  def __init__(
+      self, timestamp_format, access_time=None, change_time=None,
+      creation_time=None, modification_time=None):
+    """Initializes raw timestamps.
+
+    Args:
+      timestamp_format (str): format of the timestamps, such as "filetime"
+          or "posix_time".
+      access_time (Optional[int]): access time.
+      change_time (Optional[int]): change time.
+      creation_time (Optional[int]): creation time.
+      modification_time (Optional[int]): modification time.
+    """
+    super(Timestamps, self).__init__()
+    self.access_time = access_time
+    self.change_time = change_time
+    self.creation_time = creation_time
+    self.modification_time = modification_time
+    self.timestamp_format = timestamp_format
+
+  def GetDateTimeValues(self, timestamp_name):
+    """Retrieves the date and time values of a timestamp.
+
+    Note that a timestamp in nano seconds is represented with micro seconds
+    precision.
+
+    Args:
+      timestamp_name (str): name of the timestamp, such as "access_time".
+
+    Returns:
+      dfdatetime.DateTimeValues: date and time values or None if the
+          timestamp is not available.
+
+    Raises:
+      ValueError: if the timestamp name or format is not supported.
+    """
+    if timestamp_name not in self._TIMESTAMP_NAMES:
+      raise ValueError(u'Unsupported timestamp name: {0!s}'.format(
+          timestamp_name))
+
+    timestamp = getattr(self, timestamp_name)
+    if timestamp is None:
+      return
+
+    if self.timestamp_format == definitions.TIMESTAMP_FORMAT_FILETIME:
+      return dfdatetime_filetime.Filetime(timestamp=timestamp)
+
+    if self.timestamp_format == definitions.TIMESTAMP_FORMAT_POSIX_TIME:
+      return dfdatetime_posix_time.PosixTime(timestamp=timestamp)
+
+    if (self.timestamp_format ==
+        definitions.TIMESTAMP_FORMAT_POSIX_TIME_IN_NANOSECONDS):
+      return dfdatetime_posix_time.PosixTimeInMicroseconds(
+          timestamp=timestamp // 1000)
+
+    raise ValueError(u'Unsupported timestamp format: {0!s}'.format(
+        self.timestamp_format))
+
 
 class FileEntry(object):
   """VFS file entry interface."""
 
+  # True if the stat information is determined per facet, where the type and
+  # size information is determined separately from the timestamps and
+  # ownership information. Implementations that support this determine
+  # the stat information in the _Copy...ToStat methods instead of _GetStat.
+  _SUPPORTS_STAT_FACETS = False
+
   def __init__(
       self, resolver_context, file_system, path_spec, is_root=False,
       is_virtual=False):
@@ -102,6 +294,7 @@ class FileEntry(object):
     self._resolver_context = resolver_context
     self._stat_object = None
     self._type = None
+    self._type_and_size_stat_object = None
     self.path_spec = path_spec
 
     self._file_system.Open(path_spec)
@@ -112,6 +305,57 @@ class FileEntry(object):
       self._file_system.Close()
       self._file_system = None
 
+  def _CopyOwnershipToStat(self, stat_object):
+    """Copies the ownership and permissions information to a stat object.
+
+    Args:
+      stat_object (VFSStat): stat object.
+    """
+    return
+
+  def _CopyTimestampsToStat(self, stat_object):
+    """Copies the date and time information to a stat object.
+
+    Args:
+      stat_object (VFSStat): stat object.
+    """
+    access_time = self.access_time
+    if access_time:
+      stat_time, stat_time_nano = access_time.CopyToStatTimeTuple()
+      if stat_time is not None:
+        stat_object.atime = stat_time
+        stat_object.atime_nano = stat_time_nano
+
+    change_time = self.change_time
+    if change_time:
+      stat_time, stat_time_nano = change_time.CopyToStatTimeTuple()
+      if stat_time is not None:
+        stat_object.ctime = stat_time
+        stat_object.ctime_nano = stat_time_nano
+
+    creation_time = self.creation_time
+    if creation_time:
+      stat_time, stat_time_nano = creation_time.CopyToStatTimeTuple()
+      if stat_time is not None:
+        stat_object.crtime = stat_time
+        stat_object.crtime_nano = stat_time_nano
+
+    modification_time = self.modification_time
+    if modification_time:
+      stat_time, stat_time_nano = modification_time.CopyToStatTimeTuple()
+      if stat_time is not None:
+        stat_object.mtime = stat_time
+        stat_object.mtime_nano = stat_time_nano
+
+  def _CopyTypeAndSizeToStat(self, stat_object):
+    """Copies the type, size and allocation information to a stat object.
+
+    Args:
+      stat_object (VFSStat): stat object.
+    """
+    if self._type:
+      stat_object.type = self._type
+
   def _GetAttributes(self):
     """Retrieves the attributes.
 
@@ -168,40 +412,36 @@ class FileEntry(object):
     """
     stat_object = vfs_stat.VFSStat()
 
-    # Date and time stat information.
-    access_time = self.access_time
-    if access_time:
-      stat_time, stat_time_nano = access_time.CopyToStatTimeTuple()
-      if stat_time is not None:
-        stat_object.atime = stat_time
-        stat_object.atime_nano = stat_time_nano
+    self._CopyTypeAndSizeToStat(stat_object)
+    self._CopyTimestampsToStat(stat_object)
+    self._CopyOwnershipToStat(stat_object)
 
-    change_time = self.change_time
-    if change_time:
-      stat_time, stat_time_nano = change_time.CopyToStatTimeTuple()
-      if stat_time is not None:
-        stat_object.ctime = stat_time
-        stat_object.ctime_nano = stat_time_nano
+    return stat_object
 
-    creation_time = self.creation_time
-    if creation_time:
-      stat_time, stat_time_nano = creation_time.CopyToStatTimeTuple()
-      if stat_time is not None:
-        stat_object.crtime = stat_time
-        stat_object.crtime_nano = stat_time_nano
+  def _GetTypeAndSizeStat(self):
+    """Retrieves the type and size information about the file entry.
 
-    modification_time = self.modification_time
-    if modification_time:
-      stat_time, stat_time_nano = modification_time.CopyToStatTimeTuple()
-      if stat_time is not None:
-        stat_object.mtime = stat_time
-        stat_object.mtime_nano = stat_time_nano
+    If the file entry supports stat facets the date and time, and ownership
+    information is not determined, which is used by the type checks, such as
+    IsDirectory, to skip converting the timestamps.
 
-    # File entry type stat information.
-    if self._type:
-      stat_object.type = self._type
+    Returns:
+      VFSStat: a stat object, which contains at least the type, size and
+          allocation information, or None if not available.
+    """
+    if self._stat_object is not None:
+      return self._stat_object
 
-    return stat_object
+    if not self._SUPPORTS_STAT_FACETS:
+      self._stat_object = self._GetStat()
+      return self._stat_object
+
+    if self._type_and_size_stat_object is None:
+      stat_object = vfs_stat.VFSStat()
+      self._CopyTypeAndSizeToStat(stat_object)
+      self._type_and_size_stat_object = stat_object
+
+    return self._type_and_size_stat_object
 
   @property
   def access_time(self):
@@ -308,6 +548,19 @@ class FileEntry(object):
 
     return matching_data_stream
 
+  def GetExtents(self, data_stream_name=u''):
+    """Retrieves the extents of a data stream.
+
+    Args:
+      data_stream_name (Optional[str]): name of the data stream, where an empty
+          string represents the default data stream.
+
+    Returns:
+      list[Extent]: extents of the data stream or an empty list if not
+          available.
+    """
+    return []
+
   def GetFileObject(self, data_stream_name=u''):
     """Retrieves the file-like object.
 
@@ -356,6 +609,25 @@ class FileEntry(object):
     Returns:
       FileEntry: a file entry or None if not available.
     """
+    if self._directory is None:
+      self._directory = self._GetDirectory()
+
+    if not self._directory:
+      return
+
+    name_index = self._file_system.GetNameIndex(self._directory)
+    if name_index:
+      path_specs_per_name, path_specs_per_lower_case_name = name_index
+
+      path_spec = path_specs_per_name.get(name, None)
+      if path_spec is None and not case_sensitive:
+        path_spec = path_specs_per_lower_case_name.get(name.lower(), None)
+
+      if path_spec is None:
+        return
+
+      return self._file_system.GetFileEntryByPathSpec(path_spec)
+
     name_lower = name.lower()
     matching_sub_file_entry = None
 
@@ -376,9 +648,31 @@ class FileEntry(object):
       VFSStat: a stat object or None if not available.
     """
     if self._stat_object is None:
-      self._stat_object = self._GetStat()
+      if self._type_and_size_stat_object is not None:
+        # Complete the stat object that contains the type and size
+        # information with the remaining facets.
+        stat_object = self._type_and_size_stat_object
+        self._CopyTimestampsToStat(stat_object)
+        self._CopyOwnershipToStat(stat_object)
+        self._stat_object = stat_object
+
+      else:
+        self._stat_object = self._GetStat()
+
     return self._stat_object
 
+  def GetTimestamps(self):
+    """Retrieves the raw timestamps.
+
+    In contrast to the access_time, change_time, creation_time and
+    modification_time properties the timestamps are not converted into
+    date and time values objects.
+
+    Returns:
+      Timestamps: raw timestamps or None if not available.
+    """
+    return
+
   def HasDataStream(self, name, case_sensitive=True):
     """Determines if the file entry has specific data stream.
 
@@ -420,9 +714,8 @@ class FileEntry(object):
     Returns:
       bool: True if the file entry is allocated.
     """
-    if self._stat_object is None:
-      self._stat_object = self._GetStat()
-    return self._stat_object and self._stat_object.is_allocated
+    stat_object = self._GetTypeAndSizeStat()
+    return stat_object and stat_object.is_allocated
 
   def IsDevice(self):
     """Determines if the file entry is a device.
@@ -430,10 +723,9 @@ class FileEntry(object):
     Returns:
       bool: True if the file entry is a device.
     """
-    if self._stat_object is None:
-      self._stat_object = self._GetStat()
-    if self._stat_object is not None:
-      self._type = self._stat_object.type
+    stat_object = self._GetTypeAndSizeStat()
+    if stat_object is not None:
+      self._type = stat_object.type
     return self._type == definitions.FILE_ENTRY_TYPE_DEVICE
 
   def IsDirectory(self):
@@ -442,10 +734,9 @@ class FileEntry(object):
     Returns:
       bool: True if the file entry is a directory.
     """
-    if self._stat_object is None:
-      self._stat_object = self._GetStat()
-    if self._stat_object is not None:
-      self._type = self._stat_object.type
+    stat_object = self._GetTypeAndSizeStat()
+    if stat_object is not None:
+      self._type = stat_object.type
     return self._type == definitions.FILE_ENTRY_TYPE_DIRECTORY
 
   def IsFile(self):
@@ -454,10 +745,9 @@ class FileEntry(object):
     Returns:
       bool: True if the file entry is a file.
     """
-    if self._stat_object is None:
-      self._stat_object = self._GetStat()
-    if self._stat_object is not None:
-      self._type = self._stat_object.type
+    stat_object = self._GetTypeAndSizeStat()
+    if stat_object is not None:
+      self._type = stat_object.type
     return self._type == definitions.FILE_ENTRY_TYPE_FILE
 
   def IsLink(self):
@@ -466,10 +756,9 @@ class FileEntry(object):
     Returns:
       bool: True if the file entry is a link.
     """
-    if self._stat_object is None:
-      self._stat_object = self._GetStat()
-    if self._stat_object is not None:
-      self._type = self._stat_object.type
+    stat_object = self._GetTypeAndSizeStat()
+    if stat_object is not None:
+      self._type = stat_object.type
     return self._type == definitions.FILE_ENTRY_TYPE_LINK
 
   def IsPipe(self):
@@ -478,10 +767,9 @@ class FileEntry(object):
     Returns:
       bool: True if the file entry is a pipe.
     """
-    if self._stat_object is None:
-      self._stat_object = self._GetStat()
-    if self._stat_object is not None:
-      self._type = self._stat_object.type
+    stat_object = self._GetTypeAndSizeStat()
+    if stat_object is not None:
+      self._type = stat_object.type
     return self._type == definitions.FILE_ENTRY_TYPE_PIPE
 
   def IsRoot(self):
@@ -498,10 +786,9 @@ class FileEntry(object):
     Returns:
       bool: True if the file entry is a socket.
     """
-    if self._stat_object is None:
-      self._stat_object = self._GetStat()
-    if self._stat_object is not None:
-      self._type = self._stat_object.type
+    stat_object = self._GetTypeAndSizeStat()
+    if stat_object is not None:
+      self._type = stat_object.type
     return self._type == definitions.FILE_ENTRY_TYPE_SOCKET
 
   def IsVirtual(self):
@@ -511,3 +798,19 @@ class FileEntry(object):
       bool: True if the file entry is virtual.
     """
     return self._is_virtual
+
+  def ScanSubFileEntries(self):
+    """Scans the sub file entries without creating file entries.
+
+    Use the file system to retrieve the file entry of a directory entry,
+    for example: file_system.GetFileEntryByPathSpec(directory_entry.path_spec)
+
+    Yields:
+      DirectoryEntry: directory entry of a sub file entry.
+    """
+    if self._directory is None:
+      self._directory = self._GetDirectory()
+
+    if self._directory:
+      for directory_entry in self._directory.ScanEntries():
+        yield directory_entry
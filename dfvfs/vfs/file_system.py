@@ -2,6 +2,7 @@
 """The Virtual File System (VFS) file system interface."""
 
 import abc
+import collections
 
 
 class FileSystem(object):
@@ -10,6 +11,18 @@ class FileSystem(object):
   LOCATION_ROOT = u'/'
   PATH_SEPARATOR = u'/'
 
+  # The maximum number of directory name indexes cached, where 0 represents
+  # directory name indexes are not cached.
+  _MAXIMUM_NUMBER_OF_CACHED_NAME_INDEXES = 16
+
+  # The estimated size of a cached directory entry in bytes, excluding the
+  # size of its name.
+  _ESTIMATED_DIRECTORY_ENTRY_SIZE = 512
+
+  # The maximum estimated size of the cached directory listings in bytes,
+  # where 0 represents directory listings are not cached.
+  _MAXIMUM_SIZE_OF_CACHED_DIRECTORY_LISTINGS = 0
+
   def __init__(self, resolver_context):
     """Initializes a file system.
 
@@ -17,8 +30,11 @@ class FileSystem(object):
       resolver_context (Context): resolver context.
     """
     super(FileSystem, self).__init__()
+    self._directory_listings = collections.OrderedDict()
+    self._directory_listings_size = 0
     self._is_cached = False
     self._is_open = False
+    self._name_indexes = collections.OrderedDict()
     self._path_spec = None
     self._resolver_context = resolver_context
 
@@ -68,6 +84,45 @@ class FileSystem(object):
     _, _, basename = path.rpartition(self.PATH_SEPARATOR)
     return basename
 
+  def CacheDirectoryListing(self, cache_identifier, directory_entries):
+    """Caches a directory listing.
+
+    The size of a directory listing is estimated from the number of directory
+    entries and the size of their names. The least recently used directory
+    listings are discarded until the directory listing fits in the cache.
+    A directory listing that is larger than the cache is not cached.
+
+    Args:
+      cache_identifier (str): identifier of the directory in the cache.
+      directory_entries (list[DirectoryEntry]): directory entries.
+    """
+    if not self._MAXIMUM_SIZE_OF_CACHED_DIRECTORY_LISTINGS:
+      return
+
+    directory_listing_size = sum([
+        self._ESTIMATED_DIRECTORY_ENTRY_SIZE + len(directory_entry.name or u'')
+        for directory_entry in directory_entries])
+    if (directory_listing_size >
+        self._MAXIMUM_SIZE_OF_CACHED_DIRECTORY_LISTINGS):
+      return
+
+    self._directory_listings_size += directory_listing_size
+
+    cached_directory_listing = self._directory_listings.pop(
+        cache_identifier, None)
+    if cached_directory_listing is not None:
+      self._directory_listings_size -= cached_directory_listing[1]
+
+    while (self._directory_listings and
+           self._directory_listings_size >
+           self._MAXIMUM_SIZE_OF_CACHED_DIRECTORY_LISTINGS):
+      _, cached_directory_listing = self._directory_listings.popitem(
+          last=False)
+      self._directory_listings_size -= cached_directory_listing[1]
+
+    self._directory_listings[cache_identifier] = (
+        directory_entries, directory_listing_size)
+
   def Close(self):
     """Closes the file system.
 
@@ -87,7 +142,10 @@ class FileSystem(object):
 
     if close_file_system:
       self._Close()
+      self._directory_listings = collections.OrderedDict()
+      self._directory_listings_size = 0
       self._is_open = False
+      self._name_indexes = collections.OrderedDict()
       self._path_spec = None
 
   def DirnamePath(self, path):
@@ -119,6 +177,25 @@ class FileSystem(object):
       bool: True if the file entry exists.
     """
 
+  def GetCachedDirectoryListing(self, cache_identifier):
+    """Retrieves a cached directory listing.
+
+    Args:
+      cache_identifier (str): identifier of the directory in the cache.
+
+    Returns:
+      list[DirectoryEntry]: directory entries or None if the directory
+          listing is not cached.
+    """
+    cached_directory_listing = self._directory_listings.pop(
+        cache_identifier, None)
+    if cached_directory_listing is None:
+      return
+
+    # Move the directory listing to the end to mark it most recently used.
+    self._directory_listings[cache_identifier] = cached_directory_listing
+    return cached_directory_listing[0]
+
   def GetDataStreamByPathSpec(self, path_spec):
     """Retrieves a data stream for a path specification.
 
@@ -157,6 +234,58 @@ class FileSystem(object):
     if file_entry:
       return file_entry.GetFileObject()
 
+  def GetNameIndex(self, directory):
+    """Retrieves the name index of a directory.
+
+    The name index maps the names of the directory entries, both exact and
+    case-folded, onto their path specifications, which allows to look up
+    a directory entry without creating a file entry for every directory
+    entry. The name indexes are cached per file system, where the least
+    recently used name index is discarded first.
+
+    Args:
+      directory (Directory): directory.
+
+    Returns:
+      tuple[dict[str, PathSpec], dict[str, PathSpec]]: path specifications
+          per name and per lower case name, or None if a directory entry has
+          no location to determine its name.
+    """
+    cache_identifier = getattr(directory.path_spec, u'comparable', None)
+
+    if self._MAXIMUM_NUMBER_OF_CACHED_NAME_INDEXES and cache_identifier:
+      name_index = self._name_indexes.pop(cache_identifier, None)
+      if name_index:
+        self._name_indexes[cache_identifier] = name_index
+        return name_index
+
+    path_specs_per_name = {}
+    path_specs_per_lower_case_name = {}
+
+    for path_spec in directory.entries:
+      location = getattr(path_spec, u'location', None)
+      if location is None:
+        return
+
+      name = self.BasenamePath(location)
+      if name not in path_specs_per_name:
+        path_specs_per_name[name] = path_spec
+
+      name_lower = name.lower()
+      if name_lower not in path_specs_per_lower_case_name:
+        path_specs_per_lower_case_name[name_lower] = path_spec
+
+    name_index = (path_specs_per_name, path_specs_per_lower_case_name)
+
+    if self._MAXIMUM_NUMBER_OF_CACHED_NAME_INDEXES and cache_identifier:
+      if (len(self._name_indexes) >=
+          self._MAXIMUM_NUMBER_OF_CACHED_NAME_INDEXES):
+        self._name_indexes.popitem(last=False)
+
+      self._name_indexes[cache_identifier] = name_index
+
+    return name_index
+
   def GetPathSegmentAndSuffix(self, base_path, path):
     """Determines the path segment and suffix of the path.
 
@@ -191,6 +320,14 @@ class FileSystem(object):
       FileEntry: a file entry or None if not available.
     """
 
+  def HasDirectoryListingCache(self):
+    """Determines if the file system caches directory listings.
+
+    Returns:
+      bool: True if the file system caches directory listings.
+    """
+    return bool(self._MAXIMUM_SIZE_OF_CACHED_DIRECTORY_LISTINGS)
+
   def JoinPath(self, path_segments):
     """Joins the path segments into a path.
 
@@ -3,6 +3,7 @@
 
 from dfvfs.lib import definitions
 from dfvfs.lib import errors
+from dfvfs.vfs import file_entry
 from dfvfs.vfs import root_only_file_entry
 from dfvfs.vfs import vfs_stat
 
@@ -49,3 +50,27 @@ class GzipFileEntry(root_only_file_entry.RootOnlyFileEntry):
       gzip_file.close()
 
     return stat_object
+
+  def GetTimestamps(self):
+    """Retrieves the raw timestamps.
+
+    Returns:
+      Timestamps: raw timestamps, which are POSIX timestamps in seconds.
+
+    Raises:
+      BackEndError: when the gzip file is missing.
+    """
+    gzip_file = self.GetFileObject()
+    if not gzip_file:
+      raise errors.BackEndError(
+          u'Unable to open gzip file: {0:s}.'.format(self.path_spec.comparable))
+
+    try:
+      modification_time = gzip_file.modification_time
+
+    finally:
+      gzip_file.close()
+
+    return file_entry.Timestamps(
+        definitions.TIMESTAMP_FORMAT_POSIX_TIME,
+        modification_time=modification_time)
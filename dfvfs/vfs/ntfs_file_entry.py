@@ -12,6 +12,7 @@ from dfvfs.lib import definitions
 from dfvfs.lib import errors
 from dfvfs.path import ntfs_path_spec
 from dfvfs.resolver import resolver
+from dfvfs.vfs import extent
 from dfvfs.vfs import file_entry
 
 
@@ -184,14 +185,12 @@ class NTFSDataStream(file_entry.DataStream):
 class NTFSDirectory(file_entry.Directory):
   """File system directory that uses pyfsntfs."""
 
-  def _EntriesGenerator(self):
-    """Retrieves directory entries.
-
-    Since a directory can contain a vast number of entries using
-    a generator is more memory efficient.
+  def _DirectoryEntriesGenerator(self):
+    """Retrieves directory entries and their NTFS file entries.
 
     Yields:
-      NTFSPathSpec: NTFS path specification.
+      tuple[NTFSPathSpec, pyfsntfs.file_entry]: path specification and NTFS
+          file entry of the directory entry.
     """
     try:
       fsntfs_file_entry = self._file_system.GetNTFSFileEntryByPathSpec(
@@ -218,10 +217,47 @@ class NTFSDirectory(file_entry.Directory):
         directory_entry = self._file_system.JoinPath([
             location, directory_entry])
 
-      yield ntfs_path_spec.NTFSPathSpec(
+      path_spec = ntfs_path_spec.NTFSPathSpec(
           location=directory_entry,
           mft_attribute=fsntfs_sub_file_entry.name_attribute_index,
           mft_entry=directory_entry_mft_entry, parent=self.path_spec.parent)
+      yield path_spec, fsntfs_sub_file_entry
+
+  def _EntriesGenerator(self):
+    """Retrieves directory entries.
+
+    Since a directory can contain a vast number of entries using
+    a generator is more memory efficient.
+
+    Yields:
+      NTFSPathSpec: NTFS path specification.
+    """
+    for directory_entry in self.ScanEntries():
+      yield directory_entry.path_spec
+
+  def _ScanEntries(self):
+    """Scans the directory entries.
+
+    Yields:
+      DirectoryEntry: directory entry.
+    """
+    for path_spec, fsntfs_file_entry in self._DirectoryEntriesGenerator():
+      file_attribute_flags = fsntfs_file_entry.file_attribute_flags
+      if file_attribute_flags & pyfsntfs.file_attribute_flags.REPARSE_POINT:
+        file_entry_type = definitions.FILE_ENTRY_TYPE_LINK
+      elif fsntfs_file_entry.has_directory_entries_index():
+        file_entry_type = definitions.FILE_ENTRY_TYPE_DIRECTORY
+      else:
+        file_entry_type = definitions.FILE_ENTRY_TYPE_FILE
+
+      size = None
+      if fsntfs_file_entry.has_default_data_stream():
+        size = fsntfs_file_entry.get_size()
+
+      yield file_entry.DirectoryEntry(
+          path_spec, self._file_system.BasenamePath(path_spec.location),
+          file_entry_type=file_entry_type, inode=path_spec.mft_entry,
+          is_allocated=fsntfs_file_entry.is_allocated(), size=size)
 
 
 class NTFSFileEntry(file_entry.FileEntry):
@@ -236,6 +272,11 @@ class NTFSFileEntry(file_entry.FileEntry):
       0x00000050: SecurityDescriptorNTFSAttribute,
   }
 
+  _FSNTFS_EXTENT_FLAG_IS_SPARSE = 0x00000001
+  _FSNTFS_EXTENT_FLAG_IS_COMPRESSED = 0x00000002
+
+  _SUPPORTS_STAT_FACETS = True
+
   def __init__(
       self, resolver_context, file_system, path_spec, fsntfs_file_entry=None,
       is_root=False, is_virtual=False):
@@ -271,6 +312,31 @@ class NTFSFileEntry(file_entry.FileEntry):
     else:
       self._type = definitions.FILE_ENTRY_TYPE_FILE
 
+  def _CopyTypeAndSizeToStat(self, stat_object):
+    """Copies the type, size and allocation information to a stat object.
+
+    Args:
+      stat_object (VFSStat): stat object.
+    """
+    # File data stat information.
+    if self._fsntfs_file_entry.has_default_data_stream():
+      stat_object.size = self._fsntfs_file_entry.get_size()
+
+    # File entry type stat information.
+    if self._IsLink(self._fsntfs_file_entry.file_attribute_flags):
+      stat_object.type = stat_object.TYPE_LINK
+    elif self._fsntfs_file_entry.has_directory_entries_index():
+      stat_object.type = stat_object.TYPE_DIRECTORY
+    else:
+      stat_object.type = stat_object.TYPE_FILE
+
+    # Other stat information.
+    file_reference = self._fsntfs_file_entry.file_reference
+    stat_object.ino = file_reference & _FILE_REFERENCE_MFT_ENTRY_BITMASK
+    stat_object.fs_type = u'NTFS'
+
+    stat_object.is_allocated = self._fsntfs_file_entry.is_allocated()
+
   def _GetAttributes(self):
     """Retrieves the attributes.
 
@@ -332,40 +398,6 @@ class NTFSFileEntry(file_entry.FileEntry):
 
     return self._link
 
-  def _GetStat(self):
-    """Retrieves information about the file entry.
-
-    Returns:
-      VFSStat: a stat object.
-    """
-    stat_object = super(NTFSFileEntry, self)._GetStat()
-
-    # File data stat information.
-    if self._fsntfs_file_entry.has_default_data_stream():
-      stat_object.size = self._fsntfs_file_entry.get_size()
-
-    # Ownership and permissions stat information.
-    # TODO: stat_object.mode
-    # TODO: stat_object.uid
-    # TODO: stat_object.gid
-
-    # File entry type stat information.
-    if self._IsLink(self._fsntfs_file_entry.file_attribute_flags):
-      stat_object.type = stat_object.TYPE_LINK
-    elif self._fsntfs_file_entry.has_directory_entries_index():
-      stat_object.type = stat_object.TYPE_DIRECTORY
-    else:
-      stat_object.type = stat_object.TYPE_FILE
-
-    # Other stat information.
-    file_reference = self._fsntfs_file_entry.file_reference
-    stat_object.ino = file_reference & _FILE_REFERENCE_MFT_ENTRY_BITMASK
-    stat_object.fs_type = u'NTFS'
-
-    stat_object.is_allocated = self._fsntfs_file_entry.is_allocated()
-
-    return stat_object
-
   def _IsLink(self, file_attribute_flags):
     """Determines if a file entry is a link.
 
@@ -422,6 +454,76 @@ class NTFSFileEntry(file_entry.FileEntry):
         yield NTFSFileEntry(
             self._resolver_context, self._file_system, path_spec)
 
+  def GetExtents(self, data_stream_name=u''):
+    """Retrieves the extents of a data stream.
+
+    The extents are sorted by their offset within the data stream. The data
+    of a resident data stream is stored in the MFT entry and is represented
+    by a single extent without an offset.
+
+    Args:
+      data_stream_name (Optional[str]): data stream name, where an empty
+          string represents the default data stream.
+
+    Returns:
+      list[Extent]: extents of the data stream.
+    """
+    fsntfs_data_stream = None
+    if not data_stream_name:
+      if not self._fsntfs_file_entry.has_default_data_stream():
+        return []
+
+      # The pyfsntfs file entry provides access to the default data stream.
+      fsntfs_data_stream = self._fsntfs_file_entry
+
+    else:
+      for fsntfs_alternate_data_stream in (
+          self._fsntfs_file_entry.alternate_data_streams):
+        if fsntfs_alternate_data_stream.name == data_stream_name:
+          fsntfs_data_stream = fsntfs_alternate_data_stream
+          break
+
+      if not fsntfs_data_stream:
+        return []
+
+    data_stream_size = fsntfs_data_stream.get_size()
+    number_of_extents = fsntfs_data_stream.number_of_extents
+
+    if not number_of_extents:
+      if not data_stream_size:
+        return []
+
+      return [extent.Extent(
+          extent_type=definitions.EXTENT_TYPE_RESIDENT, size=data_stream_size)]
+
+    extents = []
+    data_stream_offset = 0
+    for extent_index in range(number_of_extents):
+      if data_stream_offset >= data_stream_size:
+        break
+
+      extent_offset, extent_size, extent_flags = (
+          fsntfs_data_stream.get_extent(extent_index))
+
+      extent_size = min(extent_size, data_stream_size - data_stream_offset)
+      data_stream_offset += extent_size
+
+      if extent_flags & self._FSNTFS_EXTENT_FLAG_IS_SPARSE:
+        extent_object = extent.Extent(
+            extent_type=definitions.EXTENT_TYPE_SPARSE, size=extent_size)
+      else:
+        if extent_flags & self._FSNTFS_EXTENT_FLAG_IS_COMPRESSED:
+          extent_type = definitions.EXTENT_TYPE_COMPRESSED
+        else:
+          extent_type = definitions.EXTENT_TYPE_DATA
+
+        extent_object = extent.Extent(
+            extent_type=extent_type, offset=extent_offset, size=extent_size)
+
+      extents.append(extent_object)
+
+    return extents
+
   def GetFileObject(self, data_stream_name=u''):
     """Retrieves the file-like object.
 
@@ -485,6 +587,7 @@ class NTFSFileEntry(file_entry.FileEntry):
     Returns:
       NTFSFileEntry: parent file entry or None.
     """
+    parent_location = None
     location = getattr(self.path_spec, u'location', None)
     if location is not None:
       parent_location = self._file_system.DirnamePath(location)
@@ -524,6 +627,57 @@ class NTFSFileEntry(file_entry.FileEntry):
     return NTFSFileEntry(
         self._resolver_context, self._file_system, path_spec, is_root=is_root)
 
+  def GetSubFileEntryByName(self, name, case_sensitive=True):
+    """Retrieves a sub file entry by name.
+
+    The sub file entry is looked up by path using pyfsntfs, which prevents
+    listing the directory. Note that the lookup by path is case insensitive.
+
+    Args:
+      name (str): name of the file entry.
+      case_sentitive (Optional[bool]): True if the name is case sensitive.
+
+    Returns:
+      NTFSFileEntry: a file entry or None if not available.
+
+    Raises:
+      BackEndError: if the sub file entry cannot be looked up.
+    """
+    location = getattr(self.path_spec, u'location', None)
+    if (location is None or not name or name in (u'.', u'..') or
+        self._file_system.PATH_SEPARATOR in name):
+      return super(NTFSFileEntry, self).GetSubFileEntryByName(
+          name, case_sensitive=case_sensitive)
+
+    sub_location = self._file_system.JoinPath([location, name])
+    path_spec = ntfs_path_spec.NTFSPathSpec(
+        location=sub_location, parent=self.path_spec.parent)
+
+    try:
+      fsntfs_file_entry = self._file_system.GetNTFSFileEntryByPathSpec(
+          path_spec)
+    except IOError as exception:
+      raise errors.BackEndError(exception)
+
+    if fsntfs_file_entry is None:
+      return
+
+    sub_file_entry_name = fsntfs_file_entry.name
+    if case_sensitive and sub_file_entry_name != name:
+      return super(NTFSFileEntry, self).GetSubFileEntryByName(
+          name, case_sensitive=case_sensitive)
+
+    file_reference = fsntfs_file_entry.file_reference
+    path_spec = ntfs_path_spec.NTFSPathSpec(
+        location=self._file_system.JoinPath([location, sub_file_entry_name]),
+        mft_attribute=fsntfs_file_entry.name_attribute_index,
+        mft_entry=file_reference & _FILE_REFERENCE_MFT_ENTRY_BITMASK,
+        parent=self.path_spec.parent)
+
+    return NTFSFileEntry(
+        self._resolver_context, self._file_system, path_spec,
+        fsntfs_file_entry=fsntfs_file_entry)
+
   def GetSecurityDescriptor(self):
     """Retrieves the security descriptor.
 
@@ -535,3 +689,18 @@ class NTFSFileEntry(file_entry.FileEntry):
         self._fsntfs_file_entry.security_descriptor_data)
 
     return fwnt_security_descriptor
+
+  def GetTimestamps(self):
+    """Retrieves the raw timestamps.
+
+    Returns:
+      Timestamps: raw timestamps, which are FILETIME timestamps.
+    """
+    return file_entry.Timestamps(
+        definitions.TIMESTAMP_FORMAT_FILETIME,
+        access_time=self._fsntfs_file_entry.get_access_time_as_integer(),
+        change_time=(
+            self._fsntfs_file_entry.get_entry_modification_time_as_integer()),
+        creation_time=self._fsntfs_file_entry.get_creation_time_as_integer(),
+        modification_time=(
+            self._fsntfs_file_entry.get_modification_time_as_integer()))
@@ -13,6 +13,9 @@ from dfvfs.resolver import resolver
 from dfvfs.vfs import file_system
 
 
+_FILE_REFERENCE_MFT_ENTRY_BITMASK = 0xffffffffffff
+
+
 class NTFSFileSystem(file_system.FileSystem):
   """File system that uses pyfsntfs."""
 
@@ -23,6 +26,12 @@ class NTFSFileSystem(file_system.FileSystem):
 
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_NTFS
 
+  _ATTRIBUTE_TYPE_FILE_NAME = 0x00000030
+
+  _FILE_NAME_NAMESPACE_DOS = 2
+
+  _MAXIMUM_SIZE_OF_CACHED_DIRECTORY_LISTINGS = 32 * 1024 * 1024
+
   def __init__(self, resolver_context):
     """Initializes a file system object.
 
@@ -73,6 +82,87 @@ class NTFSFileSystem(file_system.FileSystem):
     self._file_object = file_object
     self._fsntfs_volume = fsnfts_volume
 
+  def _GetFileNameValues(self, fsntfs_file_entry):
+    """Retrieves the values of the $FILE_NAME attribute of a file entry.
+
+    If a file entry has multiple $FILE_NAME attributes the long name is
+    preferred over the short (DOS) name.
+
+    Args:
+      fsntfs_file_entry (pyfsntfs.file_entry): NTFS file entry.
+
+    Returns:
+      tuple[int, str, int]: index of the $FILE_NAME attribute, name and
+          parent file reference or None if the file entry has no $FILE_NAME
+          attribute.
+    """
+    file_name_values = None
+    for attribute_index in range(fsntfs_file_entry.number_of_attributes):
+      fsntfs_attribute = fsntfs_file_entry.get_attribute(attribute_index)
+      if fsntfs_attribute.attribute_type != self._ATTRIBUTE_TYPE_FILE_NAME:
+        continue
+
+      file_name_values = (
+          attribute_index, fsntfs_attribute.name,
+          fsntfs_attribute.parent_file_reference)
+
+      if fsntfs_attribute.name_space != self._FILE_NAME_NAMESPACE_DOS:
+        break
+
+    return file_name_values
+
+  def _GetLocations(self, mft_entry_values):
+    """Rebuilds the locations of MFT entries from their parent references.
+
+    Args:
+      mft_entry_values (dict[int, tuple[int, bool, str, int]]): file
+          reference, allocation status, name and parent file reference
+          per MFT entry.
+
+    Returns:
+      dict[int, str]: location per MFT entry. MFT entries of which the
+          parent directory cannot be determined, such as deleted file
+          entries of which the parent MFT entry has been reused, are not
+          included.
+    """
+    locations = {self.MFT_ENTRY_ROOT_DIRECTORY: self.LOCATION_ROOT}
+    for mft_entry in mft_entry_values.keys():
+      # Determine the MFT entries up to the first parent directory of which
+      # the location is known.
+      mft_entries = []
+      while mft_entry not in locations and mft_entry not in mft_entries:
+        _, _, _, parent_file_reference = mft_entry_values[mft_entry]
+        parent_mft_entry = (
+            parent_file_reference & _FILE_REFERENCE_MFT_ENTRY_BITMASK)
+        parent_values = mft_entry_values.get(parent_mft_entry, None)
+        if parent_values is None:
+          break
+
+        # The sequence number of the parent file reference must match that
+        # of the parent MFT entry, otherwise the parent MFT entry has been
+        # reused. The sequence number of an MFT entry is incremented when
+        # it is deleted.
+        parent_sequence_number = parent_file_reference >> 48
+        sequence_number = parent_values[0] >> 48
+        is_allocated = parent_values[1]
+        if parent_sequence_number != sequence_number and (
+            is_allocated or parent_sequence_number + 1 != sequence_number):
+          break
+
+        mft_entries.append(mft_entry)
+        mft_entry = parent_mft_entry
+
+      location = locations.get(mft_entry, None)
+      if location is None:
+        continue
+
+      for mft_entry in reversed(mft_entries):
+        _, _, name, _ = mft_entry_values[mft_entry]
+        location = self.JoinPath([location, name])
+        locations[mft_entry] = location
+
+    return locations
+
   def FileEntryExistsByPathSpec(self, path_spec):
     """Determines if a file entry for a path specification exists.
 
@@ -184,3 +274,66 @@ class NTFSFileSystem(file_system.FileSystem):
         location=self.LOCATION_ROOT, mft_entry=self.MFT_ENTRY_ROOT_DIRECTORY,
         parent=self._path_spec.parent)
     return self.GetFileEntryByPathSpec(path_spec)
+
+  def IterateFileEntries(self, include_deleted=False):
+    """Iterates over the file entries of the file system in MFT entry order.
+
+    In contrast to a traversal of the directories the MFT is read
+    sequentially. The locations of the file entries are rebuilt from the
+    parent file references in their $FILE_NAME attributes. File entries
+    of which the location cannot be determined, such as orphaned deleted
+    file entries, have no location.
+
+    Args:
+      include_deleted (Optional[bool]): True if deleted file entries should
+          be included.
+
+    Yields:
+      NTFSFileEntry: file entry.
+    """
+    attribute_indexes = {}
+    mft_entry_values = {}
+    for mft_entry in range(self._fsntfs_volume.number_of_file_entries):
+      try:
+        fsntfs_file_entry = self._fsntfs_volume.get_file_entry(mft_entry)
+        file_name_values = self._GetFileNameValues(fsntfs_file_entry)
+        is_allocated = fsntfs_file_entry.is_allocated()
+        file_reference = fsntfs_file_entry.file_reference
+      except IOError:
+        continue
+
+      # Note that MFT entries without a $FILE_NAME attribute are unused
+      # or extensions of another MFT entry.
+      if file_name_values is None:
+        continue
+
+      attribute_index, name, parent_file_reference = file_name_values
+      attribute_indexes[mft_entry] = attribute_index
+      mft_entry_values[mft_entry] = (
+          file_reference, is_allocated, name, parent_file_reference)
+
+    locations = self._GetLocations(mft_entry_values)
+
+    for mft_entry in sorted(mft_entry_values.keys()):
+      _, is_allocated, _, _ = mft_entry_values[mft_entry]
+      if not is_allocated and not include_deleted:
+        continue
+
+      # Note that the path specification requires a location for MFT
+      # entry 0.
+      location = locations.get(mft_entry, None)
+      if location is None and not mft_entry:
+        continue
+
+      try:
+        fsntfs_file_entry = self._fsntfs_volume.get_file_entry(mft_entry)
+      except IOError:
+        continue
+
+      path_spec = ntfs_path_spec.NTFSPathSpec(
+          location=location, mft_attribute=attribute_indexes[mft_entry],
+          mft_entry=mft_entry, parent=self._path_spec.parent)
+      yield dfvfs.vfs.ntfs_file_entry.NTFSFileEntry(
+          self._resolver_context, self, path_spec,
+          fsntfs_file_entry=fsntfs_file_entry,
+          is_root=mft_entry == self.MFT_ENTRY_ROOT_DIRECTORY)
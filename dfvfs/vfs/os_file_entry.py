@@ -16,6 +16,10 @@ from dfvfs.vfs import file_entry
 from dfvfs.vfs import vfs_stat
 
 
+# os.scandir() was added in Python 3.5.
+_SCANDIR = getattr(os, u'scandir', None)
+
+
 class OSDirectory(file_entry.Directory):
   """Class that implements an operating system directory object."""
 
@@ -28,6 +32,64 @@ class OSDirectory(file_entry.Directory):
     Yields:
       A path specification (instance of path.OSPathSpec).
 
+    Raises:
+      AccessError: if the access to list the directory was denied.
+      BackEndError: if the directory could not be listed.
+    """
+    for path_spec, _ in self.IterateOSDirectoryEntries():
+      yield path_spec
+
+  def _ScanEntries(self):
+    """Scans the directory entries.
+
+    The size is not provided since it would require an additional system
+    call per directory entry on most platforms.
+
+    Yields:
+      DirectoryEntry: directory entry.
+
+    Raises:
+      AccessError: if the access to list the directory was denied.
+      BackEndError: if the directory could not be listed.
+    """
+    for path_spec, os_directory_entry in self.IterateOSDirectoryEntries():
+      name = self._file_system.BasenamePath(path_spec.location)
+      if os_directory_entry is None:
+        yield file_entry.DirectoryEntry(path_spec, name)
+        continue
+
+      try:
+        if os_directory_entry.is_symlink():
+          file_entry_type = definitions.FILE_ENTRY_TYPE_LINK
+        elif os_directory_entry.is_dir(follow_symlinks=False):
+          file_entry_type = definitions.FILE_ENTRY_TYPE_DIRECTORY
+        elif os_directory_entry.is_file(follow_symlinks=False):
+          file_entry_type = definitions.FILE_ENTRY_TYPE_FILE
+        else:
+          file_entry_type = None
+
+        inode = os_directory_entry.inode()
+
+      except OSError:
+        file_entry_type = None
+        inode = None
+
+      yield file_entry.DirectoryEntry(
+          path_spec, name, file_entry_type=file_entry_type, inode=inode,
+          is_allocated=True)
+
+  def IterateOSDirectoryEntries(self):
+    """Retrieves directory entries and their operating system information.
+
+    If supported os.scandir() is used to list the directory, which provides
+    the type and stat information of a directory entry without additional
+    system calls on most platforms.
+
+    Yields:
+      tuple[OSPathSpec, os.DirEntry]: path specification and operating system
+          directory entry, where the operating system directory entry is None
+          if os.scandir() is not supported.
+
     Raises:
       AccessError: if the access to list the directory was denied.
       BackEndError: if the directory could not be listed.
@@ -41,10 +103,27 @@ class OSDirectory(file_entry.Directory):
     # function cannot be used since it will return true even when os.listdir()
     # fails.
     try:
-      for directory_entry in os.listdir(location):
-        directory_entry_location = self._file_system.JoinPath([
-            location, directory_entry])
-        yield os_path_spec.OSPathSpec(location=directory_entry_location)
+      if _SCANDIR is None:
+        for directory_entry in os.listdir(location):
+          directory_entry_location = self._file_system.JoinPath([
+              location, directory_entry])
+          yield os_path_spec.OSPathSpec(location=directory_entry_location), None
+
+      else:
+        scandir_iterator = _SCANDIR(location)
+        try:
+          for os_directory_entry in scandir_iterator:
+            directory_entry_location = self._file_system.JoinPath([
+                location, os_directory_entry.name])
+            path_spec = os_path_spec.OSPathSpec(
+                location=directory_entry_location)
+            yield path_spec, os_directory_entry
+
+        finally:
+          # The iterator of os.scandir() holds an open directory handle until
+          # it is exhausted or closed, where close() was added in Python 3.6.
+          if hasattr(scandir_iterator, u'close'):
+            scandir_iterator.close()
 
     except OSError as exception:
       if exception.errno == errno.EACCES:
@@ -67,7 +146,9 @@ class OSFileEntry(file_entry.FileEntry):
 
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_OS
 
-  def __init__(self, resolver_context, file_system, path_spec, is_root=False):
+  def __init__(
+      self, resolver_context, file_system, path_spec, is_root=False,
+      os_directory_entry=None):
     """Initializes the file entry object.
 
     Args:
@@ -76,11 +157,15 @@ class OSFileEntry(file_entry.FileEntry):
       path_spec: the path specification object (instance of PathSpec).
       is_root: optional boolean value to indicate if the file entry is
                the root file entry of the corresponding file system.
+      os_directory_entry: optional operating system directory entry (instance
+                          of os.DirEntry), as returned by os.scandir(), that
+                          is used to retrieve the stat information.
     """
     super(OSFileEntry, self).__init__(
         resolver_context, file_system, path_spec, is_root=is_root,
         is_virtual=False)
     self._name = None
+    self._os_directory_entry = os_directory_entry
 
   def _GetDirectory(self):
     """Retrieves a directory.
@@ -132,8 +217,9 @@ class OSFileEntry(file_entry.FileEntry):
     stat_info = None
 
     # Windows does not support running os.stat on device files so we use
-    # libsmdev to do an initial check.
-    if platform.system() == u'Windows':
+    # libsmdev to do an initial check. Note that a directory entry is never
+    # a Windows device.
+    if not self._os_directory_entry and platform.system() == u'Windows':
       try:
         is_windows_device = pysmdev.check_device(location)
       except IOError:
@@ -147,7 +233,12 @@ class OSFileEntry(file_entry.FileEntry):
       # a WindowsError can be raised as well. We are not catching that since
       # that error does not exist on non-Windows platforms.
       try:
-        stat_info = os.stat(location)
+        if self._os_directory_entry:
+          # The directory entry caches the stat information, which on
+          # Windows is provided by the directory listing itself.
+          stat_info = self._os_directory_entry.stat()
+        else:
+          stat_info = os.stat(location)
       except OSError as exception:
         raise errors.BackEndError(
             u'Unable to retrieve stat object with error: {0:s}'.format(
@@ -169,8 +260,13 @@ class OSFileEntry(file_entry.FileEntry):
       # If location contains a trailing segment separator and points to
       # a symbolic link to a directory stat info will not indicate
       # the file entry as a symbolic link. The following check ensures
-      # that the LINK type is correctly detected.
-      is_link = os.path.islink(location)
+      # that the LINK type is correctly detected. The directory entry
+      # determines if it is a symbolic link without an additional system call
+      # on most platforms.
+      if self._os_directory_entry:
+        is_link = self._os_directory_entry.is_symlink()
+      else:
+        is_link = os.path.islink(location)
 
       # File entry type stat information.
 
@@ -194,6 +290,10 @@ class OSFileEntry(file_entry.FileEntry):
 
       # Other stat information.
       stat_object.ino = stat_info.st_ino
+      if not stat_object.ino and self._os_directory_entry:
+        # On Windows the stat information of the directory entry does not
+        # contain the inode number.
+        stat_object.ino = self._os_directory_entry.inode()
       # stat_info.st_dev
       # stat_info.st_nlink
 
@@ -232,8 +332,11 @@ class OSFileEntry(file_entry.FileEntry):
       self._directory = self._GetDirectory()
 
     if self._directory:
-      for path_spec in self._directory.entries:
-        yield OSFileEntry(self._resolver_context, self._file_system, path_spec)
+      for path_spec, os_directory_entry in (
+          self._directory.IterateOSDirectoryEntries()):
+        yield OSFileEntry(
+            self._resolver_context, self._file_system, path_spec,
+            os_directory_entry=os_directory_entry)
 
   def GetLinkedFileEntry(self):
     """Retrieves the linked file entry, e.g. for a symbolic link."""
@@ -263,3 +366,42 @@ class OSFileEntry(file_entry.FileEntry):
 
     path_spec = os_path_spec.OSPathSpec(location=parent_location)
     return OSFileEntry(self._resolver_context, self._file_system, path_spec)
+
+  def GetTimestamps(self):
+    """Retrieves the raw timestamps.
+
+    Returns:
+      Timestamps: raw timestamps, which are POSIX timestamps in nano seconds
+          if supported by the Python version, POSIX timestamps in seconds
+          otherwise, or None if no location is set.
+
+    Raises:
+      BackEndError: If an OSError comes up it is caught and an
+                    BackEndError error is raised instead.
+    """
+    location = getattr(self.path_spec, u'location', None)
+    if location is None:
+      return
+
+    try:
+      if self._os_directory_entry:
+        stat_info = self._os_directory_entry.stat()
+      else:
+        stat_info = os.stat(location)
+    except OSError as exception:
+      raise errors.BackEndError(
+          u'Unable to retrieve stat object with error: {0:s}'.format(
+              exception))
+
+    # The nano seconds stat information was added in Python 3.3.
+    if hasattr(stat_info, u'st_mtime_ns'):
+      return file_entry.Timestamps(
+          definitions.TIMESTAMP_FORMAT_POSIX_TIME_IN_NANOSECONDS,
+          access_time=stat_info.st_atime_ns, change_time=stat_info.st_ctime_ns,
+          modification_time=stat_info.st_mtime_ns)
+
+    return file_entry.Timestamps(
+        definitions.TIMESTAMP_FORMAT_POSIX_TIME,
+        access_time=int(stat_info.st_atime),
+        change_time=int(stat_info.st_ctime),
+        modification_time=int(stat_info.st_mtime))
@@ -24,6 +24,10 @@ class OSFileSystem(file_system.FileSystem):
 
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_OS
 
+  # The directory name indexes are not cached since the contents of
+  # an operating system directory can change.
+  _MAXIMUM_NUMBER_OF_CACHED_NAME_INDEXES = 0
+
   def _Close(self):
     """Closes the file system object.
 
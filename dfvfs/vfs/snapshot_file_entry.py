@@ -0,0 +1,285 @@
+# -*- coding: utf-8 -*-
+"""The snapshot file entry implementation."""
+
+from dfvfs.lib import definitions
+from dfvfs.lib import errors
+from dfvfs.vfs import file_entry
+
+
+class SnapshotDirectory(file_entry.Directory):
+  """File system directory that uses a file system snapshot."""
+
+  def __init__(self, file_system, path_spec, record):
+    """Initializes a directory.
+
+    Args:
+      file_system (SnapshotFileSystem): file system.
+      path_spec (PathSpec): path specification.
+      record (SnapshotRecord): snapshot record of the directory.
+    """
+    super(SnapshotDirectory, self).__init__(file_system, path_spec)
+    self._record = record
+
+  def _EntriesGenerator(self):
+    """Retrieves directory entries.
+
+    Since a directory can contain a vast number of entries using
+    a generator is more memory efficient.
+
+    Yields:
+      PathSpec: path specification.
+    """
+    for directory_entry in self.ScanEntries():
+      yield directory_entry.path_spec
+
+  def _ScanEntries(self):
+    """Scans the directory entries.
+
+    Yields:
+      DirectoryEntry: directory entry.
+    """
+    snapshot = self._file_system.GetSnapshot()
+    for record in snapshot.GetSubRecords(self._record.identifier):
+      path_spec = self._file_system.GetPathSpecByRecord(record)
+
+      yield file_entry.DirectoryEntry(
+          path_spec, record.name, file_entry_type=record.file_entry_type,
+          inode=record.inode, is_allocated=record.is_allocated,
+          size=record.size)
+
+
+class SnapshotFileEntry(file_entry.FileEntry):
+  """File system file entry that uses a file system snapshot.
+
+  The type, size, ownership and timestamps of the file entry are read from
+  the snapshot. The other information, such as the data streams, is read from
+  the file entry of the back-end file system.
+  """
+
+  _SUPPORTS_STAT_FACETS = True
+
+  def __init__(
+      self, resolver_context, file_system, path_spec, record, is_root=False):
+    """Initializes a file entry.
+
+    Args:
+      resolver_context (Context): resolver context.
+      file_system (SnapshotFileSystem): file system.
+      path_spec (PathSpec): path specification.
+      record (SnapshotRecord): snapshot record of the file entry.
+      is_root (Optional[bool]): True if the file entry is the root file entry
+          of the corresponding file system.
+    """
+    super(SnapshotFileEntry, self).__init__(
+        resolver_context, file_system, path_spec, is_root=is_root)
+    self._backend_file_entry = None
+    self._record = record
+    self._type = record.file_entry_type
+
+  def _CopyOwnershipToStat(self, stat_object):
+    """Copies the ownership and permissions information to a stat object.
+
+    Args:
+      stat_object (VFSStat): stat object.
+    """
+    stat_object.mode = self._record.mode
+    stat_object.uid = self._record.uid
+    stat_object.gid = self._record.gid
+
+  def _CopyTypeAndSizeToStat(self, stat_object):
+    """Copies the type, size and allocation information to a stat object.
+
+    Args:
+      stat_object (VFSStat): stat object.
+    """
+    stat_object.size = self._record.size
+    stat_object.type = self._record.file_entry_type
+    stat_object.ino = self._record.inode
+    stat_object.is_allocated = self._record.is_allocated
+
+  def _GetAttributes(self):
+    """Retrieves the attributes.
+
+    Returns:
+      list[Attribute]: attributes.
+    """
+    if self._attributes is None:
+      backend_file_entry = self.GetBackendFileEntry()
+      self._attributes = list(backend_file_entry.attributes)
+
+    return self._attributes
+
+  def _GetDataStreams(self):
+    """Retrieves the data streams.
+
+    Returns:
+      list[DataStream]: data streams.
+    """
+    if self._data_streams is None:
+      backend_file_entry = self.GetBackendFileEntry()
+      self._data_streams = list(backend_file_entry.data_streams)
+
+    return self._data_streams
+
+  def _GetDateTimeValues(self, timestamp_name):
+    """Retrieves the date and time values of a timestamp.
+
+    Args:
+      timestamp_name (str): name of the timestamp, such as "access_time".
+
+    Returns:
+      dfdatetime.DateTimeValues: date and time values or None if not
+          available.
+    """
+    timestamps = self.GetTimestamps()
+    if timestamps:
+      return timestamps.GetDateTimeValues(timestamp_name)
+
+  def _GetDirectory(self):
+    """Retrieves the directory.
+
+    Returns:
+      SnapshotDirectory: directory or None if not available.
+    """
+    if self._type == definitions.FILE_ENTRY_TYPE_DIRECTORY:
+      return SnapshotDirectory(self._file_system, self.path_spec, self._record)
+
+  def _GetLink(self):
+    """Retrieves the link.
+
+    Returns:
+      str: full path of the linked file entry.
+    """
+    if self._link is None:
+      self._link = u''
+      if self._type == definitions.FILE_ENTRY_TYPE_LINK:
+        backend_file_entry = self.GetBackendFileEntry()
+        self._link = backend_file_entry.link
+
+    return self._link
+
+  @property
+  def access_time(self):
+    """dfdatetime.DateTimeValues: access time or None if not available."""
+    return self._GetDateTimeValues(u'access_time')
+
+  @property
+  def change_time(self):
+    """dfdatetime.DateTimeValues: change time or None if not available."""
+    return self._GetDateTimeValues(u'change_time')
+
+  @property
+  def creation_time(self):
+    """dfdatetime.DateTimeValues: creation time or None if not available."""
+    return self._GetDateTimeValues(u'creation_time')
+
+  @property
+  def modification_time(self):
+    """dfdatetime.DateTimeValues: modification time or None if not available."""
+    return self._GetDateTimeValues(u'modification_time')
+
+  @property
+  def name(self):
+    """str: name of the file entry, without the full path."""
+    return self._record.name
+
+  @property
+  def sub_file_entries(self):
+    """generator[SnapshotFileEntry]: sub file entries."""
+    if self._type == definitions.FILE_ENTRY_TYPE_DIRECTORY:
+      snapshot = self._file_system.GetSnapshot()
+      for record in snapshot.GetSubRecords(self._record.identifier):
+        yield self._file_system.GetFileEntryByRecord(record)
+
+  @property
+  def type_indicator(self):
+    """str: type indicator of the back-end file system."""
+    return self.path_spec.type_indicator
+
+  def GetBackendFileEntry(self):
+    """Retrieves the file entry of the back-end file system.
+
+    Returns:
+      FileEntry: file entry of the back-end file system.
+
+    Raises:
+      BackEndError: if the file entry of the back-end file system
+          is missing.
+    """
+    if not self._backend_file_entry:
+      file_system = self._file_system.GetBackendFileSystem()
+      self._backend_file_entry = file_system.GetFileEntryByPathSpec(
+          self.path_spec)
+      if not self._backend_file_entry:
+        raise errors.BackEndError(
+            u'Missing file entry in back-end file system.')
+
+    return self._backend_file_entry
+
+  def GetExtents(self, data_stream_name=u''):
+    """Retrieves the extents of a data stream.
+
+    Args:
+      data_stream_name (Optional[str]): name of the data stream, where an empty
+          string represents the default data stream.
+
+    Returns:
+      list[Extent]: extents of the data stream or an empty list if not
+          available.
+    """
+    backend_file_entry = self.GetBackendFileEntry()
+    return backend_file_entry.GetExtents(data_stream_name=data_stream_name)
+
+  def GetFileObject(self, data_stream_name=u''):
+    """Retrieves the file-like object.
+
+    Args:
+      data_stream_name (Optional[str]): name of the data stream, where an empty
+          string represents the default data stream.
+
+    Returns:
+      FileIO: a file-like object or None if not available.
+    """
+    backend_file_entry = self.GetBackendFileEntry()
+    return backend_file_entry.GetFileObject(data_stream_name=data_stream_name)
+
+  def GetLinkedFileEntry(self):
+    """Retrieves the linked file entry, for example for a symbolic link.
+
+    Returns:
+      FileEntry: linked file entry of the back-end file system or None if
+          not available.
+    """
+    if self._type == definitions.FILE_ENTRY_TYPE_LINK:
+      backend_file_entry = self.GetBackendFileEntry()
+      return backend_file_entry.GetLinkedFileEntry()
+
+  def GetParentFileEntry(self):
+    """Retrieves the parent file entry.
+
+    Returns:
+      SnapshotFileEntry: parent file entry or None if not available.
+    """
+    if self._record.parent_identifier is None:
+      return
+
+    snapshot = self._file_system.GetSnapshot()
+    record = snapshot.GetRecordByIdentifier(self._record.parent_identifier)
+    if record:
+      return self._file_system.GetFileEntryByRecord(record)
+
+  def GetTimestamps(self):
+    """Retrieves the raw timestamps.
+
+    Returns:
+      Timestamps: raw timestamps or None if not available.
+    """
+    snapshot = self._file_system.GetSnapshot()
+    if not snapshot.timestamp_format:
+      return
+
+    return file_entry.Timestamps(
+        snapshot.timestamp_format, access_time=self._record.access_time,
+        change_time=self._record.change_time,
+        creation_time=self._record.creation_time,
+        modification_time=self._record.modification_time)
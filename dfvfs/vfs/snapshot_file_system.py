@@ -0,0 +1,293 @@
+# -*- coding: utf-8 -*-
+"""The snapshot file system implementation."""
+
+from dfvfs.lib import definitions
+from dfvfs.lib import errors
+from dfvfs.path import factory as path_spec_factory
+from dfvfs.resolver import resolver
+from dfvfs.vfs import file_system
+from dfvfs.vfs import snapshot_file_entry
+
+
+class SnapshotFileSystem(file_system.FileSystem):
+  """File system that uses a snapshot of the metadata of a file system.
+
+  The snapshot file system finds and lists the file entries of a back-end
+  file system, such as a TSK or NTFS file system, using its snapshot in
+  a snapshot index. The back-end file system is only opened when the content
+  of a file entry is needed, for example to read its data.
+
+  The path specifications are those of the back-end file system. Therefore
+  the snapshot file system is not cached in the resolver context, which would
+  otherwise resolve these path specifications to the snapshot file system.
+  """
+
+  # The names of the path specification attributes that contain the inode
+  # per type indicator.
+  _INODE_PATH_SPEC_ATTRIBUTES = {
+      definitions.TYPE_INDICATOR_NTFS: u'mft_entry',
+      definitions.TYPE_INDICATOR_TSK: u'inode'}
+
+  def __init__(self, resolver_context, index):
+    """Initializes a file system.
+
+    Args:
+      resolver_context (Context): resolver context.
+      index (SnapshotIndex): snapshot index that contains the snapshot of
+          the back-end file system.
+    """
+    super(SnapshotFileSystem, self).__init__(resolver_context)
+    self._backend_file_system = None
+    self._inode_path_spec_attribute = None
+    self._reference_count = 0
+    self._snapshot = None
+    self._snapshot_index = index
+
+  @property
+  def type_indicator(self):
+    """str: type indicator of the back-end file system."""
+    if not self._snapshot:
+      raise NotImplementedError(
+          u'Invalid file system missing type indicator.')
+    return self._snapshot.type_indicator
+
+  def _Close(self):
+    """Closes the file system object.
+
+    Raises:
+      IOError: if the close failed.
+    """
+    if self._backend_file_system:
+      self._backend_file_system.Close()
+      self._backend_file_system = None
+
+    self._snapshot.Close()
+    self._snapshot = None
+
+  def _GetRecordByPathSpec(self, path_spec):
+    """Retrieves the snapshot record for a path specification.
+
+    Args:
+      path_spec (PathSpec): path specification.
+
+    Returns:
+      SnapshotRecord: snapshot record or None if not available.
+    """
+    location = getattr(path_spec, u'location', None)
+    if location is not None:
+      record = self._snapshot.GetRecordByLocation(location)
+      if record:
+        return record
+
+    # Like the back-end file system the inode is used when the location
+    # is not available or not found, for example in case of a hard link
+    # that was not walked.
+    inode = None
+    if self._inode_path_spec_attribute:
+      inode = getattr(path_spec, self._inode_path_spec_attribute, None)
+
+    if inode is not None:
+      return self._snapshot.GetRecordByInode(inode)
+
+  def _Open(self, path_spec, mode='rb'):
+    """Opens the file system object defined by path specification.
+
+    Args:
+      path_spec (PathSpec): path specification of the back-end file system.
+      mode (Optional[str]): file access mode.
+
+    Raises:
+      AccessError: if the access to open the file was denied.
+      BackEndError: if the snapshot index does not contain a snapshot of
+          the back-end file system.
+      IOError: if the file system object could not be opened.
+      PathSpecError: if the path specification is incorrect.
+      ValueError: if the path specification is invalid.
+    """
+    if not path_spec.HasParent():
+      raise errors.PathSpecError(
+          u'Unsupported path specification without parent.')
+
+    file_object = resolver.Resolver.OpenFileObject(
+        path_spec.parent, resolver_context=self._resolver_context)
+    if not file_object:
+      raise IOError(u'Unable to open image of file system.')
+
+    try:
+      identifier = self._snapshot_index.GetIdentifier(
+          path_spec.type_indicator, path_spec.parent, file_object)
+    finally:
+      file_object.close()
+
+    snapshot = self._snapshot_index.OpenSnapshot(identifier)
+    if not snapshot:
+      raise errors.BackEndError(u'Missing snapshot of file system.')
+
+    if snapshot.type_indicator != path_spec.type_indicator:
+      snapshot.Close()
+      raise errors.BackEndError(u'Unsupported snapshot of file system.')
+
+    self._inode_path_spec_attribute = self._INODE_PATH_SPEC_ATTRIBUTES.get(
+        snapshot.type_indicator, None)
+    self._snapshot = snapshot
+
+    # The root location and path separator are those of the back-end
+    # file system.
+    self.LOCATION_ROOT = snapshot.path_separator
+    self.PATH_SEPARATOR = snapshot.path_separator
+
+  def Close(self):
+    """Closes the file system.
+
+    Raises:
+      IOError: if the file system object was not opened or the close failed.
+    """
+    if not self._is_open:
+      raise IOError(u'Not opened.')
+
+    self._reference_count -= 1
+    if self._reference_count > 0:
+      return
+
+    self._reference_count = 0
+
+    # Since the snapshot file system is not cached in the resolver context
+    # the base class closes the file system and resets its state.
+    super(SnapshotFileSystem, self).Close()
+
+  def FileEntryExistsByPathSpec(self, path_spec):
+    """Determines if a file entry for a path specification exists.
+
+    Args:
+      path_spec (PathSpec): path specification.
+
+    Returns:
+      bool: True if the file entry exists.
+    """
+    return self._GetRecordByPathSpec(path_spec) is not None
+
+  def GetBackendFileSystem(self):
+    """Retrieves the back-end file system.
+
+    The back-end file system is opened when first needed.
+
+    Returns:
+      FileSystem: back-end file system.
+
+    Raises:
+      BackEndError: if the back-end file system cannot be opened.
+    """
+    if not self._backend_file_system:
+      self._backend_file_system = resolver.Resolver.OpenFileSystem(
+          self._path_spec, resolver_context=self._resolver_context)
+      if not self._backend_file_system:
+        raise errors.BackEndError(u'Unable to open back-end file system.')
+
+    return self._backend_file_system
+
+  def GetFileEntryByPathSpec(self, path_spec):
+    """Retrieves a file entry for a path specification.
+
+    Args:
+      path_spec (PathSpec): path specification.
+
+    Returns:
+      SnapshotFileEntry: file entry or None if not available.
+    """
+    record = self._GetRecordByPathSpec(path_spec)
+    if not record:
+      return
+
+    return snapshot_file_entry.SnapshotFileEntry(
+        self._resolver_context, self, path_spec, record,
+        is_root=record.parent_identifier is None)
+
+  def GetFileEntryByRecord(self, record):
+    """Retrieves a file entry for a snapshot record.
+
+    Args:
+      record (SnapshotRecord): snapshot record.
+
+    Returns:
+      SnapshotFileEntry: file entry.
+    """
+    path_spec = self.GetPathSpecByRecord(record)
+    return snapshot_file_entry.SnapshotFileEntry(
+        self._resolver_context, self, path_spec, record,
+        is_root=record.parent_identifier is None)
+
+  def GetPathSpecByRecord(self, record):
+    """Retrieves the path specification for a snapshot record.
+
+    Args:
+      record (SnapshotRecord): snapshot record.
+
+    Returns:
+      PathSpec: path specification of the back-end file system.
+    """
+    # Note that we don't want to set the keyword arguments when not used
+    # because the path specification base class will check for unused
+    # keyword arguments and raise.
+    kwargs = {}
+
+    if record.location is not None:
+      kwargs[u'location'] = record.location
+    if self._inode_path_spec_attribute and record.inode is not None:
+      kwargs[self._inode_path_spec_attribute] = record.inode
+
+    kwargs[u'parent'] = self._path_spec.parent
+
+    return path_spec_factory.Factory.NewPathSpec(
+        self._snapshot.type_indicator, **kwargs)
+
+  def GetRootFileEntry(self):
+    """Retrieves the root file entry.
+
+    Returns:
+      SnapshotFileEntry: file entry or None if not available.
+    """
+    record = self._snapshot.GetRecordByLocation(self.LOCATION_ROOT)
+    if not record:
+      return
+
+    return self.GetFileEntryByRecord(record)
+
+  def GetSnapshot(self):
+    """Retrieves the snapshot of the back-end file system.
+
+    Returns:
+      Snapshot: snapshot.
+    """
+    return self._snapshot
+
+  def Open(self, path_spec, mode='rb'):
+    """Opens the file system object defined by path specification.
+
+    In contrast to other file systems the snapshot file system is not cached
+    in the resolver context, instead it keeps track of the number of times
+    it was opened itself.
+
+    Args:
+      path_spec (PathSpec): path specification of the back-end file system.
+      mode (Optional[str]): file access mode.
+
+    Raises:
+      AccessError: if the access to open the file was denied.
+      BackEndError: if the snapshot index does not contain a snapshot of
+          the back-end file system.
+      IOError: if the open failed.
+      PathSpecError: if the path specification is incorrect.
+      ValueError: if the path specification or mode is invalid.
+    """
+    if mode != 'rb':
+      raise ValueError(u'Unsupport mode: {0:s}.'.format(mode))
+
+    if not path_spec:
+      raise ValueError(u'Missing path specification.')
+
+    if not self._is_open:
+      self._Open(path_spec, mode=mode)
+      self._is_open = True
+      self._path_spec = path_spec
+
+    self._reference_count += 1
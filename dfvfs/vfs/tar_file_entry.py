@@ -27,48 +27,9 @@ class TARDirectory(file_entry.Directory):
         not location.startswith(self._file_system.PATH_SEPARATOR)):
       return
 
-    # The TAR info name does not have the leading path separator as
-    # the location string does.
-    tar_path = location[1:]
-
-    # Set of top level sub directories that have been yielded.
-    processed_directories = set()
-
-    tar_file = self._file_system.GetTARFile()
-    for tar_info in iter(tar_file.getmembers()):
-      path = tar_info.name
-
-      # Determine if the start of the TAR info name is similar to
-      # the location string. If not the file TAR info refers to is not in
-      # the same directory.
-      if not path or not path.startswith(tar_path):
-        continue
-
-      # Ignore the directory itself.
-      if path == tar_path:
-        continue
-
-      path_segment, suffix = self._file_system.GetPathSegmentAndSuffix(
-          tar_path, path)
-      if not path_segment:
-        continue
-
-      # Sometimes the TAR file lacks directories, therefore we will
-      # provide virtual ones.
-      if suffix:
-        path_spec_location = self._file_system.JoinPath([
-            location, path_segment])
-        is_directory = True
-
-      else:
-        path_spec_location = self._file_system.JoinPath([path])
-        is_directory = tar_info.isdir()
-
-      if is_directory:
-        if path_spec_location in processed_directories:
-          continue
-        processed_directories.add(path_spec_location)
-
+    index = self._file_system.GetDirectoryIndex()
+    for path in index.GetChildren(location[1:]):
+      path_spec_location = self._file_system.JoinPath([path])
       yield tar_path_spec.TARPathSpec(
           location=path_spec_location, parent=self.path_spec.parent)
 
@@ -199,21 +160,20 @@ class TARFileEntry(file_entry.FileEntry):
   @property
   def sub_file_entries(self):
     """generator(TARFileEntry): sub file entries."""
-    tar_file = self._file_system.GetTARFile()
-
     if self._directory is None:
       self._directory = self._GetDirectory()
 
-    if self._directory and tar_file:
+    if self._directory:
       for path_spec in self._directory.entries:
         location = getattr(path_spec, u'location', None)
         if location is None:
           continue
 
         kwargs = {}
-        try:
-          kwargs[u'tar_info'] = tar_file.getmember(location[1:])
-        except KeyError:
+        tar_info = self._file_system.GetTARInfoByPath(location[1:])
+        if tar_info:
+          kwargs[u'tar_info'] = tar_info
+        else:
           kwargs[u'is_virtual'] = True
 
         yield TARFileEntry(
@@ -260,10 +220,22 @@ class TARFileEntry(file_entry.FileEntry):
       if len(location) == 1:
         return
 
-      tar_file = self._file_system.GetTARFile()
-      try:
-        self._tar_info = tar_file.getmember(location[1:])
-      except KeyError:
-        pass
+      self._tar_info = self._file_system.GetTARInfoByPath(location[1:])
 
     return self._tar_info
+
+  def GetTimestamps(self):
+    """Retrieves the raw timestamps.
+
+    Returns:
+      Timestamps: raw timestamps, which are POSIX timestamps in seconds.
+    """
+    modification_time = getattr(self.GetTARInfo(), u'mtime', None)
+    if modification_time is not None:
+      # The modification time can be a floating-point value when stored
+      # in a PAX extended header.
+      modification_time = int(modification_time)
+
+    return file_entry.Timestamps(
+        definitions.TIMESTAMP_FORMAT_POSIX_TIME,
+        modification_time=modification_time)
@@ -8,8 +8,10 @@ import dfvfs.vfs.tar_file_entry
 
 from dfvfs.lib import definitions
 from dfvfs.lib import errors
+from dfvfs.lib import py2to3
 from dfvfs.path import tar_path_spec
 from dfvfs.resolver import resolver
+from dfvfs.vfs import directory_index
 from dfvfs.vfs import file_system
 
 
@@ -31,8 +33,10 @@ class TARFileSystem(file_system.FileSystem):
       encoding (Optional[str]): file entry name encoding.
     """
     super(TARFileSystem, self).__init__(resolver_context)
+    self._directory_index = None
     self._file_object = None
     self._tar_file = None
+    self._tar_infos = None
     self.encoding = encoding
 
   def _Close(self):
@@ -41,6 +45,9 @@ class TARFileSystem(file_system.FileSystem):
     Raises:
       IOError: if the close failed.
     """
+    self._directory_index = None
+    self._tar_infos = None
+
     self._tar_file.close()
     self._tar_file = None
 
@@ -71,12 +78,154 @@ class TARFileSystem(file_system.FileSystem):
       # Explicitly tell tarfile not to use compression. Compression should be
       # handled by the file-like object.
       tar_file = tarfile.open(mode='r:', fileobj=file_object)
+      self._ReadMembers(path_spec.parent, file_object, tar_file)
+      index, tar_infos = self._BuildDirectoryIndex(tar_file)
     except:
       file_object.close()
       raise
 
+    self._directory_index = index
     self._file_object = file_object
     self._tar_file = tar_file
+    self._tar_infos = tar_infos
+
+  def _BuildDirectoryIndex(self, tar_file):
+    """Builds the directory index and the TAR info per path.
+
+    Note that this reads all the members of the TAR file. The TAR info per
+    path is used instead of tarfile.getmember(), which iterates all
+    the members on every call. Like tarfile.getmember() the last member
+    with a specific path is used.
+
+    Args:
+      tar_file (tarfile.TarFile): TAR file.
+
+    Returns:
+      tuple[DirectoryIndex, dict[str, tarfile.TARInfo]]: directory index and
+          TAR info per path.
+    """
+    index = directory_index.DirectoryIndex(path_separator=self.PATH_SEPARATOR)
+    tar_infos = {}
+
+    for tar_info in tar_file.getmembers():
+      tar_infos[tar_info.name] = tar_info
+      if tar_info.name:
+        index.AddPath(tar_info.name, is_directory=tar_info.isdir())
+
+    return index, tar_infos
+
+  def _GetMemberValues(self, tar_info):
+    """Retrieves the values of a member to store in the member index.
+
+    Args:
+      tar_info (tarfile.TARInfo): TAR info.
+
+    Returns:
+      dict[str, object]: values of the member.
+    """
+    member_type = tar_info.type
+    if isinstance(member_type, py2to3.BYTES_TYPE):
+      member_type = member_type.decode(u'ascii')
+
+    sparse = tar_info.sparse
+    if sparse is not None:
+      sparse = [list(segment) for segment in sparse]
+
+    return {
+        u'data_offset': tar_info.offset_data,
+        u'devmajor': tar_info.devmajor,
+        u'devminor': tar_info.devminor,
+        u'gid': tar_info.gid,
+        u'gname': tar_info.gname,
+        u'linkname': tar_info.linkname,
+        u'mode': tar_info.mode,
+        u'mtime': tar_info.mtime,
+        u'offset': tar_info.offset,
+        u'path': tar_info.name,
+        u'size': tar_info.size,
+        u'sparse': sparse,
+        u'type': member_type,
+        u'uid': tar_info.uid,
+        u'uname': tar_info.uname}
+
+  def _GetTARInfo(self, member_values, tar_file):
+    """Retrieves the TAR info of a member stored in the member index.
+
+    Args:
+      member_values (dict[str, object]): values of the member.
+      tar_file (tarfile.TarFile): TAR file.
+
+    Returns:
+      tarfile.TARInfo: TAR info.
+
+    Raises:
+      KeyError: if a value is missing.
+    """
+    tar_info = tarfile.TarInfo(member_values[u'path'])
+    tar_info.devmajor = member_values[u'devmajor']
+    tar_info.devminor = member_values[u'devminor']
+    tar_info.gid = member_values[u'gid']
+    tar_info.gname = member_values[u'gname']
+    tar_info.linkname = member_values[u'linkname']
+    tar_info.mode = member_values[u'mode']
+    tar_info.mtime = member_values[u'mtime']
+    tar_info.offset = member_values[u'offset']
+    tar_info.offset_data = member_values[u'data_offset']
+    tar_info.size = member_values[u'size']
+    tar_info.tarfile = tar_file
+    tar_info.type = member_values[u'type'].encode(u'ascii')
+    tar_info.uid = member_values[u'uid']
+    tar_info.uname = member_values[u'uname']
+
+    sparse = member_values[u'sparse']
+    if sparse is not None:
+      tar_info.sparse = [tuple(segment) for segment in sparse]
+
+    return tar_info
+
+  def _ReadMembers(self, path_spec, file_object, tar_file):
+    """Reads the members of the TAR file using the member index.
+
+    If the member index of the resolver context contains the TAR file its
+    members are read from the index, which prevents reading all the member
+    headers of the TAR file. Otherwise the members are read from the TAR
+    file and written to the index. Without member index the members are
+    read from the TAR file when first needed.
+
+    Note that if the TAR file is stored in compressed data, such as a gzip
+    file, the compressed data has already been decompressed when it was
+    opened, which the member index does not prevent.
+
+    Args:
+      path_spec (PathSpec): path specification of the TAR file.
+      file_object (FileIO): file-like object of the TAR file.
+      tar_file (tarfile.TarFile): TAR file.
+    """
+    member_index = self._resolver_context.GetMemberIndex()
+    if not member_index:
+      return
+
+    identifier = member_index.GetIdentifier(
+        self.TYPE_INDICATOR, path_spec, file_object)
+
+    members = member_index.ReadMembers(identifier)
+    if members is not None:
+      try:
+        tar_infos = [
+            self._GetTARInfo(member_values, tar_file)
+            for member_values in members]
+      except (AttributeError, KeyError, TypeError, ValueError):
+        tar_infos = None
+
+      if tar_infos is not None:
+        # pylint: disable=protected-access
+        tar_file.members = tar_infos
+        tar_file._loaded = True
+        return
+
+    members = [
+        self._GetMemberValues(tar_info) for tar_info in tar_file.getmembers()]
+    member_index.WriteMembers(identifier, members)
 
   def FileEntryExistsByPathSpec(self, path_spec):
     """Determines if a file entry for a path specification exists.
@@ -96,20 +245,11 @@ class TARFileSystem(file_system.FileSystem):
     if len(location) == 1:
       return True
 
-    try:
-      self._tar_file.getmember(location[1:])
+    if self.GetTARInfoByPath(location[1:]):
       return True
-    except KeyError:
-      pass
 
     # Check if location could be a virtual directory.
-    for name in iter(self._tar_file.getnames()):
-      # The TAR info name does not have the leading path separator as
-      # the location string does.
-      if name.startswith(location[1:]):
-        return True
-
-    return False
+    return self._directory_index.HasPath(location[1:])
 
   def GetFileEntryByPathSpec(self, path_spec):
     """Retrieves a file entry for a path specification.
@@ -131,14 +271,23 @@ class TARFileSystem(file_system.FileSystem):
           is_virtual=True)
 
     kwargs = {}
-    try:
-      kwargs[u'tar_info'] = self._tar_file.getmember(location[1:])
-    except KeyError:
+    tar_info = self.GetTARInfoByPath(location[1:])
+    if tar_info:
+      kwargs[u'tar_info'] = tar_info
+    else:
       kwargs[u'is_virtual'] = True
 
     return dfvfs.vfs.tar_file_entry.TARFileEntry(
         self._resolver_context, self, path_spec, **kwargs)
 
+  def GetDirectoryIndex(self):
+    """Retrieves the directory index.
+
+    Returns:
+      DirectoryIndex: directory index.
+    """
+    return self._directory_index
+
   def GetRootFileEntry(self):
     """Retrieves the root file entry.
 
@@ -156,3 +305,22 @@ class TARFileSystem(file_system.FileSystem):
       tarfile.TARFile: TAR file.
     """
     return self._tar_file
+
+  def GetTARInfoByPath(self, path):
+    """Retrieves the TAR info for a path.
+
+    Args:
+      path (str): path of the member relative to the root of the TAR file.
+
+    Returns:
+      tarfile.TARInfo: TAR info or None if not available.
+    """
+    return self._tar_infos.get(path.rstrip(self.PATH_SEPARATOR), None)
+
+  def GetTARFileObject(self):
+    """Retrieves the file-like object that contains the TAR file.
+
+    Returns:
+      FileIO: file-like object.
+    """
+    return self._file_object
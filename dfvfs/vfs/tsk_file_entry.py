@@ -9,8 +9,8 @@ from dfvfs.lib import definitions
 from dfvfs.lib import errors
 from dfvfs.path import tsk_path_spec
 from dfvfs.resolver import resolver
+from dfvfs.vfs import extent
 from dfvfs.vfs import file_entry
-from dfvfs.vfs import vfs_stat
 
 
 class TSKAttribute(file_entry.Attribute):
@@ -63,14 +63,21 @@ class TSKDataStream(file_entry.DataStream):
 class TSKDirectory(file_entry.Directory):
   """File system directory that uses pytsk3."""
 
-  def _EntriesGenerator(self):
-    """Retrieves directory entries.
+  _FILE_ENTRY_TYPES = {
+      pytsk3.TSK_FS_META_TYPE_BLK: definitions.FILE_ENTRY_TYPE_DEVICE,
+      pytsk3.TSK_FS_META_TYPE_CHR: definitions.FILE_ENTRY_TYPE_DEVICE,
+      pytsk3.TSK_FS_META_TYPE_DIR: definitions.FILE_ENTRY_TYPE_DIRECTORY,
+      pytsk3.TSK_FS_META_TYPE_FIFO: definitions.FILE_ENTRY_TYPE_PIPE,
+      pytsk3.TSK_FS_META_TYPE_LNK: definitions.FILE_ENTRY_TYPE_LINK,
+      pytsk3.TSK_FS_META_TYPE_REG: definitions.FILE_ENTRY_TYPE_FILE,
+      pytsk3.TSK_FS_META_TYPE_SOCK: definitions.FILE_ENTRY_TYPE_SOCKET}
 
-    Since a directory can contain a vast number of entries using
-    a generator is more memory efficient.
+  def _DirectoryEntriesGenerator(self):
+    """Retrieves directory entries and their TSK information.
 
     Yields:
-      TSKPathSpec: a path specification.
+      tuple[TSKPathSpec, pytsk3.File]: path specification and TSK file of
+          the directory entry.
 
     Raises:
       BackEndError: if pytsk3 cannot open the directory.
@@ -163,9 +170,55 @@ class TSKDirectory(file_entry.Directory):
             directory_entry = self._file_system.JoinPath([
                 location, directory_entry])
 
-      yield tsk_path_spec.TSKPathSpec(
+      path_spec = tsk_path_spec.TSKPathSpec(
           inode=directory_entry_inode, location=directory_entry,
           parent=self.path_spec.parent)
+      yield path_spec, tsk_directory_entry
+
+  def _EntriesGenerator(self):
+    """Retrieves directory entries.
+
+    Since a directory can contain a vast number of entries using
+    a generator is more memory efficient.
+
+    Yields:
+      TSKPathSpec: a path specification.
+
+    Raises:
+      BackEndError: if pytsk3 cannot open the directory.
+    """
+    for directory_entry in self.ScanEntries():
+      yield directory_entry.path_spec
+
+  def _ScanEntries(self):
+    """Scans the directory entries.
+
+    Yields:
+      DirectoryEntry: directory entry.
+
+    Raises:
+      BackEndError: if pytsk3 cannot open the directory.
+    """
+    for path_spec, tsk_directory_entry in self._DirectoryEntriesGenerator():
+      name = None
+      if path_spec.location is not None:
+        name = self._file_system.BasenamePath(path_spec.location)
+
+      tsk_fs_meta = tsk_directory_entry.info.meta
+
+      # The type is an instance of pytsk3.TSK_FS_META_TYPE_ENUM.
+      tsk_fs_meta_type = getattr(
+          tsk_fs_meta, u'type', pytsk3.TSK_FS_META_TYPE_UNDEF)
+      file_entry_type = self._FILE_ENTRY_TYPES.get(tsk_fs_meta_type, None)
+
+      # The flags are an instance of pytsk3.TSK_FS_META_FLAG_ENUM.
+      flags = getattr(tsk_fs_meta, u'flags', 0)
+      is_allocated = bool(int(flags) & pytsk3.TSK_FS_META_FLAG_ALLOC)
+
+      yield file_entry.DirectoryEntry(
+          path_spec, name, file_entry_type=file_entry_type,
+          inode=path_spec.inode, is_allocated=is_allocated,
+          size=getattr(tsk_fs_meta, u'size', None))
 
 
 class TSKFileEntry(file_entry.FileEntry):
@@ -187,6 +240,12 @@ class TSKFileEntry(file_entry.FileEntry):
       pytsk3.TSK_FS_TYPE_EXT4, pytsk3.TSK_FS_TYPE_NTFS, pytsk3.TSK_FS_TYPE_HFS,
       pytsk3.TSK_FS_TYPE_FFS2, pytsk3.TSK_FS_TYPE_EXFAT]
 
+  _TSK_DATA_ATTRIBUTE_TYPES = [
+      pytsk3.TSK_FS_ATTR_TYPE_DEFAULT, pytsk3.TSK_FS_ATTR_TYPE_HFS_DEFAULT,
+      pytsk3.TSK_FS_ATTR_TYPE_HFS_DATA, pytsk3.TSK_FS_ATTR_TYPE_NTFS_DATA]
+
+  _SUPPORTS_STAT_FACETS = True
+
   def __init__(
       self, resolver_context, file_system, path_spec, is_root=False,
       is_virtual=False, parent_inode=None, tsk_file=None):
@@ -210,6 +269,130 @@ class TSKFileEntry(file_entry.FileEntry):
     self._parent_inode = parent_inode
     self._tsk_file = tsk_file
 
+  def _CopyOwnershipToStat(self, stat_object):
+    """Copies the ownership and permissions information to a stat object.
+
+    Args:
+      stat_object (VFSStat): stat object.
+
+    Raises:
+      BackEndError: if the TSK File .info or .info.meta attribute is missing.
+    """
+    tsk_file = self.GetTSKFile()
+    if not tsk_file or not tsk_file.info or not tsk_file.info.meta:
+      raise errors.BackEndError(u'Missing TSK File .info or .info.meta.')
+
+    mode = getattr(tsk_file.info.meta, u'mode', None)
+    if mode is not None:
+      # We need to cast mode to an int since it is of type
+      # pytsk3.TSK_FS_META_MODE_ENUM.
+      stat_object.mode = int(mode)
+
+    stat_object.uid = getattr(tsk_file.info.meta, u'uid', None)
+    stat_object.gid = getattr(tsk_file.info.meta, u'gid', None)
+
+  def _CopyTimestampsToStat(self, stat_object):
+    """Copies the date and time information to a stat object.
+
+    Args:
+      stat_object (VFSStat): stat object.
+
+    Raises:
+      BackEndError: if the TSK File .info, .info.meta or info.fs_info
+        attribute is missing.
+    """
+    tsk_file = self.GetTSKFile()
+
+    stat_time, stat_time_nano = self._TSKFileTimeCopyToStatTimeTuple(
+        tsk_file, u'atime')
+    if stat_time is not None:
+      stat_object.atime = stat_time
+      stat_object.atime_nano = stat_time_nano
+
+    stat_time, stat_time_nano = self._TSKFileTimeCopyToStatTimeTuple(
+        tsk_file, u'bkup')
+    if stat_time is not None:
+      stat_object.bkup = stat_time
+      stat_object.bkup_nano = stat_time_nano
+
+    stat_time, stat_time_nano = self._TSKFileTimeCopyToStatTimeTuple(
+        tsk_file, u'ctime')
+    if stat_time is not None:
+      stat_object.ctime = stat_time
+      stat_object.ctime_nano = stat_time_nano
+
+    stat_time, stat_time_nano = self._TSKFileTimeCopyToStatTimeTuple(
+        tsk_file, u'crtime')
+    if stat_time is not None:
+      stat_object.crtime = stat_time
+      stat_object.crtime_nano = stat_time_nano
+
+    stat_time, stat_time_nano = self._TSKFileTimeCopyToStatTimeTuple(
+        tsk_file, u'dtime')
+    if stat_time is not None:
+      stat_object.dtime = stat_time
+      stat_object.dtime_nano = stat_time_nano
+
+    stat_time, stat_time_nano = self._TSKFileTimeCopyToStatTimeTuple(
+        tsk_file, u'mtime')
+    if stat_time is not None:
+      stat_object.mtime = stat_time
+      stat_object.mtime_nano = stat_time_nano
+
+  def _CopyTypeAndSizeToStat(self, stat_object):
+    """Copies the type, size and allocation information to a stat object.
+
+    Args:
+      stat_object (VFSStat): stat object.
+
+    Raises:
+      BackEndError: if the TSK File .info or .info.meta attribute is missing.
+    """
+    tsk_file = self.GetTSKFile()
+    if not tsk_file or not tsk_file.info or not tsk_file.info.meta:
+      raise errors.BackEndError(u'Missing TSK File .info or .info.meta.')
+
+    # File data stat information.
+    stat_object.size = getattr(tsk_file.info.meta, u'size', None)
+
+    # File entry type stat information.
+    # The type is an instance of pytsk3.TSK_FS_META_TYPE_ENUM.
+    tsk_fs_meta_type = getattr(
+        tsk_file.info.meta, u'type', pytsk3.TSK_FS_META_TYPE_UNDEF)
+
+    if tsk_fs_meta_type == pytsk3.TSK_FS_META_TYPE_REG:
+      stat_object.type = stat_object.TYPE_FILE
+    elif tsk_fs_meta_type == pytsk3.TSK_FS_META_TYPE_DIR:
+      stat_object.type = stat_object.TYPE_DIRECTORY
+    elif tsk_fs_meta_type == pytsk3.TSK_FS_META_TYPE_LNK:
+      stat_object.type = stat_object.TYPE_LINK
+    elif (tsk_fs_meta_type == pytsk3.TSK_FS_META_TYPE_CHR or
+          tsk_fs_meta_type == pytsk3.TSK_FS_META_TYPE_BLK):
+      stat_object.type = stat_object.TYPE_DEVICE
+    elif tsk_fs_meta_type == pytsk3.TSK_FS_META_TYPE_FIFO:
+      stat_object.type = stat_object.TYPE_PIPE
+    elif tsk_fs_meta_type == pytsk3.TSK_FS_META_TYPE_SOCK:
+      stat_object.type = stat_object.TYPE_SOCKET
+    # TODO: implement support for:
+    # pytsk3.TSK_FS_META_TYPE_UNDEF
+    # pytsk3.TSK_FS_META_TYPE_SHAD
+    # pytsk3.TSK_FS_META_TYPE_WHT
+    # pytsk3.TSK_FS_META_TYPE_VIRT
+
+    # Other stat information.
+    stat_object.ino = getattr(tsk_file.info.meta, u'addr', None)
+    # stat_object.dev = stat_info.st_dev
+    # stat_object.nlink = getattr(tsk_file.info.meta, u'nlink', None)
+    # stat_object.fs_type = u'Unknown'
+
+    flags = getattr(tsk_file.info.meta, u'flags', 0)
+
+    # The flags are an instance of pytsk3.TSK_FS_META_FLAG_ENUM.
+    if int(flags) & pytsk3.TSK_FS_META_FLAG_ALLOC:
+      stat_object.is_allocated = True
+    else:
+      stat_object.is_allocated = False
+
   def _GetAttributes(self):
     """Retrieves the attributes.
 
@@ -287,11 +470,8 @@ class TSKFileEntry(file_entry.FileEntry):
     Returns:
       TSKDirectory: directory or None.
     """
-    if self._stat_object is None:
-      self._stat_object = self._GetStat()
-
-    if (self._stat_object and
-        self._stat_object.type == self._stat_object.TYPE_DIRECTORY):
+    stat_object = self._GetTypeAndSizeStat()
+    if stat_object and stat_object.type == stat_object.TYPE_DIRECTORY:
       return TSKDirectory(self._file_system, self.path_spec)
     return
 
@@ -340,110 +520,39 @@ class TSKFileEntry(file_entry.FileEntry):
 
     return self._link
 
-  def _GetStat(self):
-    """Retrieves the stat object.
+  def _GetTSKDataAttribute(self, tsk_file, data_stream_name):
+    """Retrieves the TSK attribute that contains a data stream.
 
-    Returns:
-      VFSStat: stat object.
+    Args:
+      tsk_file (pytsk3.File): TSK file.
+      data_stream_name (str): data stream name, where an empty string
+          represents the default data stream.
 
-    Raises:
-      BackEndError: if the TSK File .info or .info.meta attribute is missing.
+    Returns:
+      pytsk3.Attribute: TSK attribute or None if not available.
     """
-    tsk_file = self.GetTSKFile()
-    if not tsk_file or not tsk_file.info or not tsk_file.info.meta:
-      raise errors.BackEndError(u'Missing TSK File .info or .info.meta.')
-
-    stat_object = vfs_stat.VFSStat()
-
-    # File data stat information.
-    stat_object.size = getattr(tsk_file.info.meta, u'size', None)
-
-    # Date and time stat information.
-    stat_time, stat_time_nano = self._TSKFileTimeCopyToStatTimeTuple(
-        tsk_file, u'atime')
-    if stat_time is not None:
-      stat_object.atime = stat_time
-      stat_object.atime_nano = stat_time_nano
-
-    stat_time, stat_time_nano = self._TSKFileTimeCopyToStatTimeTuple(
-        tsk_file, u'bkup')
-    if stat_time is not None:
-      stat_object.bkup = stat_time
-      stat_object.bkup_nano = stat_time_nano
-
-    stat_time, stat_time_nano = self._TSKFileTimeCopyToStatTimeTuple(
-        tsk_file, u'ctime')
-    if stat_time is not None:
-      stat_object.ctime = stat_time
-      stat_object.ctime_nano = stat_time_nano
-
-    stat_time, stat_time_nano = self._TSKFileTimeCopyToStatTimeTuple(
-        tsk_file, u'crtime')
-    if stat_time is not None:
-      stat_object.crtime = stat_time
-      stat_object.crtime_nano = stat_time_nano
-
-    stat_time, stat_time_nano = self._TSKFileTimeCopyToStatTimeTuple(
-        tsk_file, u'dtime')
-    if stat_time is not None:
-      stat_object.dtime = stat_time
-      stat_object.dtime_nano = stat_time_nano
-
-    stat_time, stat_time_nano = self._TSKFileTimeCopyToStatTimeTuple(
-        tsk_file, u'mtime')
-    if stat_time is not None:
-      stat_object.mtime = stat_time
-      stat_object.mtime_nano = stat_time_nano
-
-    # Ownership and permissions stat information.
-    mode = getattr(tsk_file.info.meta, u'mode', None)
-    if mode is not None:
-      # We need to cast mode to an int since it is of type
-      # pytsk3.TSK_FS_META_MODE_ENUM.
-      stat_object.mode = int(mode)
-
-    stat_object.uid = getattr(tsk_file.info.meta, u'uid', None)
-    stat_object.gid = getattr(tsk_file.info.meta, u'gid', None)
-
-    # File entry type stat information.
-    # The type is an instance of pytsk3.TSK_FS_META_TYPE_ENUM.
-    tsk_fs_meta_type = getattr(
-        tsk_file.info.meta, u'type', pytsk3.TSK_FS_META_TYPE_UNDEF)
-
-    if tsk_fs_meta_type == pytsk3.TSK_FS_META_TYPE_REG:
-      stat_object.type = stat_object.TYPE_FILE
-    elif tsk_fs_meta_type == pytsk3.TSK_FS_META_TYPE_DIR:
-      stat_object.type = stat_object.TYPE_DIRECTORY
-    elif tsk_fs_meta_type == pytsk3.TSK_FS_META_TYPE_LNK:
-      stat_object.type = stat_object.TYPE_LINK
-    elif (tsk_fs_meta_type == pytsk3.TSK_FS_META_TYPE_CHR or
-          tsk_fs_meta_type == pytsk3.TSK_FS_META_TYPE_BLK):
-      stat_object.type = stat_object.TYPE_DEVICE
-    elif tsk_fs_meta_type == pytsk3.TSK_FS_META_TYPE_FIFO:
-      stat_object.type = stat_object.TYPE_PIPE
-    elif tsk_fs_meta_type == pytsk3.TSK_FS_META_TYPE_SOCK:
-      stat_object.type = stat_object.TYPE_SOCKET
-    # TODO: implement support for:
-    # pytsk3.TSK_FS_META_TYPE_UNDEF
-    # pytsk3.TSK_FS_META_TYPE_SHAD
-    # pytsk3.TSK_FS_META_TYPE_WHT
-    # pytsk3.TSK_FS_META_TYPE_VIRT
-
-    # Other stat information.
-    stat_object.ino = getattr(tsk_file.info.meta, u'addr', None)
-    # stat_object.dev = stat_info.st_dev
-    # stat_object.nlink = getattr(tsk_file.info.meta, u'nlink', None)
-    # stat_object.fs_type = u'Unknown'
+    for tsk_attribute in tsk_file:
+      if getattr(tsk_attribute, u'info', None) is None:
+        continue
 
-    flags = getattr(tsk_file.info.meta, u'flags', 0)
+      # The value of the attribute name will be None for the default
+      # data stream.
+      attribute_name = getattr(tsk_attribute.info, u'name', None)
+      if attribute_name is None:
+        attribute_name = u''
 
-    # The flags are an instance of pytsk3.TSK_FS_META_FLAG_ENUM.
-    if int(flags) & pytsk3.TSK_FS_META_FLAG_ALLOC:
-      stat_object.is_allocated = True
-    else:
-      stat_object.is_allocated = False
+      else:
+        try:
+          # pytsk3 returns an UTF-8 encoded byte string.
+          attribute_name = attribute_name.decode(u'utf8')
+        except UnicodeError:
+          # Continue here since we cannot represent the attribute name.
+          continue
 
-    return stat_object
+      attribute_type = getattr(tsk_attribute.info, u'type', None)
+      if (attribute_name == data_stream_name and
+          attribute_type in self._TSK_DATA_ATTRIBUTE_TYPES):
+        return tsk_attribute
 
   def _TSKFileTimeCopyToStatTimeTuple(self, tsk_file, time_value):
     """Copies a SleuthKit file object time value to a stat timestamp tuple.
@@ -500,6 +609,54 @@ class TSKFileEntry(file_entry.FileEntry):
 
     return stat_time, stat_time_nano
 
+  def _TSKFileTimeCopyToTimestamp(self, tsk_file, time_value):
+    """Copies a SleuthKit file object time value to a raw timestamp.
+
+    Args:
+      tsk_file (pytsk3.File): TSK file.
+      time_value (str): name of the time value.
+
+    Returns:
+      int: POSIX timestamp in nano seconds if the file system supports
+          sub-second precision, POSIX timestamp in seconds otherwise. None
+          if the file system does not include the requested timestamp.
+    """
+    file_system_type = tsk_file.info.fs_info.ftype
+    # pytsk3.TSK_FS_TYPE_ENUM is unhashable, preventing a dictionary lookup
+    # approach.
+    if (time_value == u'atime' and
+        file_system_type in self._TSK_NO_ATIME_FS_TYPES):
+      return
+
+    if (time_value == u'ctime' and
+        file_system_type in self._TSK_NO_CTIME_FS_TYPES):
+      return
+
+    if (time_value == u'crtime' and
+        file_system_type in self._TSK_NO_CRTIME_FS_TYPES):
+      return
+
+    if (time_value == u'mtime' and
+        file_system_type in self._TSK_NO_MTIME_FS_TYPES):
+      return
+
+    timestamp = getattr(tsk_file.info.meta, time_value, None)
+    if timestamp is None:
+      return
+
+    if file_system_type not in self._TSK_HAS_NANO_FS_TYPES:
+      return timestamp
+
+    time_value_nano = u'{0:s}_nano'.format(time_value)
+    timestamp_nano = getattr(tsk_file.info.meta, time_value_nano, None) or 0
+
+    # Sleuthkit 4.2.0 switched from 100 nano seconds precision to
+    # 1 nano seconds precision.
+    if pytsk3.TSK_VERSION_NUM < 0x040200ff:
+      timestamp_nano *= 100
+
+    return (timestamp * 1000000000) + timestamp_nano
+
   @property
   def name(self):
     """str: name of the file entry, which does not include the full path.
@@ -546,6 +703,81 @@ class TSKFileEntry(file_entry.FileEntry):
       for path_spec in self._directory.entries:
         yield TSKFileEntry(self._resolver_context, self._file_system, path_spec)
 
+  def GetExtents(self, data_stream_name=u''):
+    """Retrieves the extents of a data stream.
+
+    The extents are derived from the runs of the TSK attribute that contains
+    the data stream and are sorted by their offset within the data stream.
+
+    Args:
+      data_stream_name (Optional[str]): data stream name, where an empty
+          string represents the default data stream.
+
+    Returns:
+      list[Extent]: extents of the data stream.
+
+    Raises:
+      BackEndError: if the TSK File .info, .info.meta or .info.fs_info
+          attribute is missing.
+    """
+    tsk_file = self.GetTSKFile()
+    if (not tsk_file or not tsk_file.info or not tsk_file.info.meta or
+        not tsk_file.info.fs_info):
+      raise errors.BackEndError(
+          u'Missing TSK File .info, .info.meta or .info.fs_info.')
+
+    if not data_stream_name:
+      tsk_fs_meta_type = getattr(
+          tsk_file.info.meta, u'type', pytsk3.TSK_FS_META_TYPE_UNDEF)
+      if tsk_fs_meta_type != pytsk3.TSK_FS_META_TYPE_REG:
+        return []
+
+    tsk_attribute = self._GetTSKDataAttribute(tsk_file, data_stream_name)
+    if not tsk_attribute:
+      return []
+
+    attribute_size = getattr(tsk_attribute.info, u'size', 0)
+
+    # The flags are an instance of pytsk3.TSK_FS_ATTR_FLAG_ENUM.
+    attribute_flags = int(getattr(tsk_attribute.info, u'flags', 0))
+    if attribute_flags & pytsk3.TSK_FS_ATTR_RES:
+      return [extent.Extent(
+          extent_type=definitions.EXTENT_TYPE_RESIDENT, size=attribute_size)]
+
+    if attribute_flags & pytsk3.TSK_FS_ATTR_COMP:
+      data_extent_type = definitions.EXTENT_TYPE_COMPRESSED
+    else:
+      data_extent_type = definitions.EXTENT_TYPE_DATA
+
+    block_size = tsk_file.info.fs_info.block_size
+
+    extents = []
+    for tsk_attribute_run in tsk_attribute:
+      # The run offset is the number of blocks relative to the start of
+      # the data stream.
+      run_offset = tsk_attribute_run.offset * block_size
+      if run_offset >= attribute_size:
+        break
+
+      run_size = min(
+          tsk_attribute_run.len * block_size, attribute_size - run_offset)
+
+      # The flags are an instance of pytsk3.TSK_FS_ATTR_RUN_FLAG_ENUM.
+      run_flags = int(tsk_attribute_run.flags)
+      if run_flags & (
+          pytsk3.TSK_FS_ATTR_RUN_FLAG_FILLER |
+          pytsk3.TSK_FS_ATTR_RUN_FLAG_SPARSE):
+        extent_object = extent.Extent(
+            extent_type=definitions.EXTENT_TYPE_SPARSE, size=run_size)
+      else:
+        extent_object = extent.Extent(
+            extent_type=data_extent_type,
+            offset=tsk_attribute_run.addr * block_size, size=run_size)
+
+      extents.append(extent_object)
+
+    return extents
+
   def GetFileObject(self, data_stream_name=u''):
     """Retrieves the file-like object.
 
@@ -626,9 +858,76 @@ class TSKFileEntry(file_entry.FileEntry):
     return TSKFileEntry(
         self._resolver_context, self._file_system, path_spec, is_root=is_root)
 
+  def GetSubFileEntryByName(self, name, case_sensitive=True):
+    """Retrieves a sub file entry by name.
+
+    The sub file entry is looked up by path using pytsk3, which prevents
+    listing the directory. Note that the lookup by path is case insensitive
+    on file systems such as NTFS and FAT.
+
+    Args:
+      name (str): name of the file entry.
+      case_sentitive (Optional[bool]): True if the name is case sensitive.
+
+    Returns:
+      TSKFileEntry: a file entry or None if not available.
+    """
+    location = getattr(self.path_spec, u'location', None)
+    if (location is None or not name or name in (u'.', u'..') or
+        self._file_system.PATH_SEPARATOR in name):
+      return super(TSKFileEntry, self).GetSubFileEntryByName(
+          name, case_sensitive=case_sensitive)
+
+    fs_info = self._file_system.GetFsInfo()
+    sub_location = self._file_system.JoinPath([location, name])
+
+    try:
+      tsk_file = fs_info.open(sub_location)
+    except IOError:
+      tsk_file = None
+
+    tsk_name = getattr(getattr(tsk_file, u'info', None), u'name', None)
+    tsk_meta = getattr(getattr(tsk_file, u'info', None), u'meta', None)
+
+    sub_file_entry_name = None
+    if tsk_name is not None and tsk_meta is not None:
+      flags = getattr(tsk_name, u'flags', 0)
+      if not int(flags) & pytsk3.TSK_FS_NAME_FLAG_UNALLOC:
+        try:
+          # pytsk3 returns an UTF-8 encoded byte string.
+          sub_file_entry_name = getattr(tsk_name, u'name', b'').decode(u'utf8')
+        except UnicodeError:
+          pass
+
+    if not sub_file_entry_name:
+      if case_sensitive:
+        return
+
+      # The lookup by path is case sensitive on file systems such as ext.
+      return super(TSKFileEntry, self).GetSubFileEntryByName(
+          name, case_sensitive=case_sensitive)
+
+    if case_sensitive and sub_file_entry_name != name:
+      return super(TSKFileEntry, self).GetSubFileEntryByName(
+          name, case_sensitive=case_sensitive)
+
+    path_spec = tsk_path_spec.TSKPathSpec(
+        inode=tsk_meta.addr,
+        location=self._file_system.JoinPath([location, sub_file_entry_name]),
+        parent=self.path_spec.parent)
+
+    return TSKFileEntry(
+        self._resolver_context, self._file_system, path_spec,
+        parent_inode=getattr(self.path_spec, u'inode', None),
+        tsk_file=tsk_file)
+
   def GetTSKFile(self):
     """Retrieves the SleuthKit file object.
 
+    Note that a TSK file opened by inode is shared with other file entries
+    of the same inode and that its attributes must not be iterated
+    concurrently.
+
     Returns:
       pytsk3.File: TSK file.
 
@@ -641,13 +940,43 @@ class TSKFileEntry(file_entry.FileEntry):
       inode = getattr(self.path_spec, u'inode', None)
       location = getattr(self.path_spec, u'location', None)
 
-      fs_info = self._file_system.GetFsInfo()
       if inode is not None:
-        self._tsk_file = fs_info.open_meta(inode=inode)
+        self._tsk_file = self._file_system.GetTSKFileByInode(inode)
       elif location is not None:
+        fs_info = self._file_system.GetFsInfo()
         self._tsk_file = fs_info.open(location)
       else:
         raise errors.PathSpecError(
             u'Path specification missing inode and location.')
 
     return self._tsk_file
+
+  def GetTimestamps(self):
+    """Retrieves the raw timestamps.
+
+    Returns:
+      Timestamps: raw timestamps, which are POSIX timestamps in nano seconds
+          if the file system supports sub-second precision, POSIX timestamps
+          in seconds otherwise.
+
+    Raises:
+      BackEndError: if the TSK File .info, .info.meta or info.fs_info
+        attribute is missing.
+    """
+    tsk_file = self.GetTSKFile()
+    if (not tsk_file or not tsk_file.info or not tsk_file.info.meta or
+        not tsk_file.info.fs_info):
+      raise errors.BackEndError(
+          u'Missing TSK File .info, .info.meta. or .info.fs_info')
+
+    if tsk_file.info.fs_info.ftype in self._TSK_HAS_NANO_FS_TYPES:
+      timestamp_format = definitions.TIMESTAMP_FORMAT_POSIX_TIME_IN_NANOSECONDS
+    else:
+      timestamp_format = definitions.TIMESTAMP_FORMAT_POSIX_TIME
+
+    return file_entry.Timestamps(
+        timestamp_format,
+        access_time=self._TSKFileTimeCopyToTimestamp(tsk_file, u'atime'),
+        change_time=self._TSKFileTimeCopyToTimestamp(tsk_file, u'ctime'),
+        creation_time=self._TSKFileTimeCopyToTimestamp(tsk_file, u'crtime'),
+        modification_time=self._TSKFileTimeCopyToTimestamp(tsk_file, u'mtime'))
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 """The SleuthKit (TSK) file system implementation."""
 
+import collections
+
 import pytsk3
 
 # This is necessary to prevent a circular import.
@@ -21,6 +23,11 @@ class TSKFileSystem(file_system.FileSystem):
 
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_TSK
 
+  _MAXIMUM_SIZE_OF_CACHED_DIRECTORY_LISTINGS = 32 * 1024 * 1024
+
+  # The maximum number of TSK files, opened by inode, that are cached.
+  _MAXIMUM_NUMBER_OF_CACHED_TSK_FILES = 256
+
   def __init__(self, resolver_context):
     """Initializes a file system object.
 
@@ -30,6 +37,7 @@ class TSKFileSystem(file_system.FileSystem):
     super(TSKFileSystem, self).__init__(resolver_context)
     self._file_object = None
     self._tsk_file_system = None
+    self._tsk_files = collections.OrderedDict()
     self._tsk_fs_type = None
 
   def _Close(self):
@@ -39,6 +47,7 @@ class TSKFileSystem(file_system.FileSystem):
       IOError: if the close failed.
     """
     self._tsk_file_system = None
+    self._tsk_files = collections.OrderedDict()
 
     self._file_object.close()
     self._file_object = None
@@ -73,6 +82,127 @@ class TSKFileSystem(file_system.FileSystem):
     self._file_object = file_object
     self._tsk_file_system = tsk_file_system
 
+  def _GetDirectoryEntryNames(self, inode):
+    """Retrieves the names of the entries of a directory.
+
+    Args:
+      inode: the inode of the directory.
+
+    Yields:
+      A tuple of the inode and name of the directory entry.
+    """
+    try:
+      tsk_directory = self._tsk_file_system.open_dir(inode=inode)
+    except IOError:
+      return
+
+    is_ntfs = self.IsNTFS()
+    for tsk_directory_entry in tsk_directory:
+      # Note that because pytsk3.Directory and pytsk3.TSK_FS_FILE do not
+      # explicitly define info, meta and name we need to check if
+      # the attributes exist and have a value other than None.
+      tsk_fs_file = getattr(tsk_directory_entry, u'info', None)
+      if tsk_fs_file is None:
+        continue
+
+      tsk_fs_meta = getattr(tsk_fs_file, u'meta', None)
+      tsk_fs_name = getattr(tsk_fs_file, u'name', None)
+      if tsk_fs_meta is None or tsk_fs_name is None:
+        continue
+
+      directory_entry_inode = getattr(tsk_fs_meta, u'addr', None)
+      if directory_entry_inode is None or directory_entry_inode == inode:
+        continue
+
+      # On non-NTFS file systems ignore inode 0.
+      if directory_entry_inode == 0 and not is_ntfs:
+        continue
+
+      # Ignore file entries marked as "unallocated".
+      flags = getattr(tsk_fs_name, u'flags', 0)
+      if int(flags) & pytsk3.TSK_FS_NAME_FLAG_UNALLOC:
+        continue
+
+      name = getattr(tsk_fs_name, u'name', b'')
+      try:
+        # pytsk3 returns an UTF-8 encoded byte string.
+        name = name.decode(u'utf8')
+      except UnicodeError:
+        continue
+
+      if name and name not in [u'.', u'..']:
+        yield directory_entry_inode, name
+
+  def _GetLocationsByInode(self):
+    """Retrieves the locations of the file entries by inode.
+
+    The metadata is read in inode order, where the entries of every
+    allocated directory are read to build a map of the parent inode and
+    name per inode. The locations are rebuilt from this map.
+
+    Returns:
+      A dictionary containing the location per inode. File entries that
+      cannot be reached from the root directory, such as unallocated
+      file entries, are not included.
+    """
+    root_inode = self.GetRootInode()
+    tsk_fs_info = getattr(self._tsk_file_system, u'info', None)
+    if root_inode is None or tsk_fs_info is None:
+      return {}
+
+    first_inode = getattr(tsk_fs_info, u'first_inum', root_inode)
+    last_inode = getattr(tsk_fs_info, u'last_inum', root_inode)
+
+    parent_inodes = {}
+    for inode in range(first_inode, last_inode + 1):
+      try:
+        tsk_file = self._tsk_file_system.open_meta(inode=inode)
+      except IOError:
+        continue
+
+      tsk_fs_meta = getattr(tsk_file.info, u'meta', None)
+      if tsk_fs_meta is None:
+        continue
+
+      tsk_fs_meta_type = getattr(
+          tsk_fs_meta, u'type', pytsk3.TSK_FS_META_TYPE_UNDEF)
+      if tsk_fs_meta_type not in [
+          pytsk3.TSK_FS_META_TYPE_DIR, pytsk3.TSK_FS_META_TYPE_VIRT_DIR]:
+        continue
+
+      flags = getattr(tsk_fs_meta, u'flags', 0)
+      if not int(flags) & pytsk3.TSK_FS_META_FLAG_ALLOC:
+        continue
+
+      for directory_entry_inode, name in self._GetDirectoryEntryNames(inode):
+        # Only the first name of a file entry with multiple names, such as
+        # a hard link, is used.
+        if directory_entry_inode not in parent_inodes:
+          parent_inodes[directory_entry_inode] = (inode, name)
+
+    locations = {root_inode: self.LOCATION_ROOT}
+    for inode in parent_inodes.keys():
+      # Determine the inodes up to the first parent directory of which
+      # the location is known.
+      inodes = []
+      while inode not in locations and inode not in inodes:
+        if inode not in parent_inodes:
+          break
+
+        inodes.append(inode)
+        inode, _ = parent_inodes[inode]
+
+      location = locations.get(inode, None)
+      if location is None:
+        continue
+
+      for inode in reversed(inodes):
+        _, name = parent_inodes[inode]
+        location = self.JoinPath([location, name])
+        locations[inode] = location
+
+    return locations
+
   def GetRootInode(self):
     """Retrieves the root inode or None."""
     # Note that because pytsk3.FS_Info does not explicitly define info
@@ -102,7 +232,7 @@ class TSKFileSystem(file_system.FileSystem):
 
     try:
       if inode is not None:
-        tsk_file = self._tsk_file_system.open_meta(inode=inode)
+        tsk_file = self.GetTSKFileByInode(inode)
       elif location is not None:
         tsk_file = self._tsk_file_system.open(location)
 
@@ -128,14 +258,17 @@ class TSKFileSystem(file_system.FileSystem):
     root_inode = self.GetRootInode()
     if (location == self.LOCATION_ROOT or
         (inode is not None and root_inode is not None and inode == root_inode)):
-      tsk_file = self._tsk_file_system.open(self.LOCATION_ROOT)
+      if root_inode is not None:
+        tsk_file = self.GetTSKFileByInode(root_inode)
+      else:
+        tsk_file = self._tsk_file_system.open(self.LOCATION_ROOT)
       return dfvfs.vfs.tsk_file_entry.TSKFileEntry(
           self._resolver_context, self, path_spec, tsk_file=tsk_file,
           is_root=True)
 
     try:
       if inode is not None:
-        tsk_file = self._tsk_file_system.open_meta(inode=inode)
+        tsk_file = self.GetTSKFileByInode(inode)
       elif location is not None:
         tsk_file = self._tsk_file_system.open(location)
 
@@ -174,6 +307,42 @@ class TSKFileSystem(file_system.FileSystem):
 
     return self._tsk_fs_type
 
+  def GetTSKFileByInode(self, inode):
+    """Retrieves the SleuthKit file object of an inode.
+
+    The file objects are cached per file system, where the least recently
+    used file object is discarded first, so that the metadata of an inode
+    that is revisited, for example to read its data after it was found by
+    the file system searcher, is not parsed again. Note that only files
+    opened by inode are cached since a file opened by location contains
+    the name used to open it.
+
+    A cached file object is shared by the file entries and file-like objects
+    of the same inode. Iterating the attributes of a pytsk3.File is not
+    reentrant, since iter() returns the file object itself and restarts
+    the iteration. Hence the attributes of a cached file object must not be
+    iterated concurrently, for example by multiple threads or by a generator
+    that yields while iterating.
+
+    Args:
+      inode: the inode.
+
+    Returns:
+      The SleuthKit file object (instance of pytsk3.File).
+
+    Raises:
+      IOError: if the file object cannot be opened.
+    """
+    tsk_file = self._tsk_files.pop(inode, None)
+    if tsk_file is None:
+      tsk_file = self._tsk_file_system.open_meta(inode=inode)
+
+      if len(self._tsk_files) >= self._MAXIMUM_NUMBER_OF_CACHED_TSK_FILES:
+        self._tsk_files.popitem(last=False)
+
+    self._tsk_files[inode] = tsk_file
+    return tsk_file
+
   def GetRootFileEntry(self):
     """Retrieves the root file entry.
 
@@ -192,6 +361,31 @@ class TSKFileSystem(file_system.FileSystem):
     path_spec = tsk_path_spec.TSKPathSpec(**kwargs)
     return self.GetFileEntryByPathSpec(path_spec)
 
+  def IterateFileEntries(self):
+    """Iterates over all the file entries of the file system in inode order.
+
+    In contrast to a recursive traversal of the directories, which opens
+    the metadata in directory order, the metadata is read sequentially.
+
+    Yields:
+      A file entry (instance of vfs.TSKFileEntry).
+    """
+    root_inode = self.GetRootInode()
+    locations = self._GetLocationsByInode()
+
+    for inode in sorted(locations.keys()):
+      try:
+        tsk_file = self.GetTSKFileByInode(inode)
+      except IOError:
+        continue
+
+      path_spec = tsk_path_spec.TSKPathSpec(
+          inode=inode, location=locations[inode],
+          parent=self._path_spec.parent)
+      yield dfvfs.vfs.tsk_file_entry.TSKFileEntry(
+          self._resolver_context, self, path_spec, tsk_file=tsk_file,
+          is_root=inode == root_inode)
+
   def IsHFS(self):
     """Determines if the file system is HFS, HFS+ or HFSX.
 
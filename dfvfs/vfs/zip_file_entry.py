@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 """The zip file entry implementation."""
 
+import calendar
+
 from dfdatetime import time_elements as dfdatetime_time_elements
 
 from dfvfs.lib import definitions
@@ -28,48 +30,10 @@ class ZipDirectory(file_entry.Directory):
         not location.startswith(self._file_system.PATH_SEPARATOR)):
       return
 
-    # The zip_info filename does not have the leading path separator
-    # as the location string does.
-    zip_path = location[1:]
-
-    # Set of top level sub directories that have been yielded.
-    processed_directories = set()
-
-    zip_file = self._file_system.GetZipFile()
-    for zip_info in zip_file.infolist():
-      path = getattr(zip_info, u'filename', None)
-      if path is not None and not isinstance(path, py2to3.UNICODE_TYPE):
-        try:
-          path = path.decode(self._file_system.encoding)
-        except UnicodeDecodeError:
-          path = None
-
-      if not path or not path.startswith(zip_path):
-        continue
-
-      # Ignore the directory itself.
-      if path == zip_path:
-        continue
-
-      path_segment, suffix = self._file_system.GetPathSegmentAndSuffix(
-          zip_path, path)
-      if not path_segment:
-        continue
-
-      # Some times the ZIP file lacks directories, therefore we will
-      # provide virtual ones.
-      if suffix:
-        path_spec_location = self._file_system.JoinPath([
-            location, path_segment])
-        is_directory = True
-      else:
-        path_spec_location = self._file_system.JoinPath([path])
-        is_directory = path.endswith(u'/')
-
-      if is_directory:
-        if path_spec_location in processed_directories:
-          continue
-        processed_directories.add(path_spec_location)
+    index = self._file_system.GetDirectoryIndex()
+    for path in index.GetChildren(location[1:]):
+      path_spec_location = self._file_system.JoinPath([path])
+      if index.IsDirectory(path):
         # Restore / at end path to indicate a directory.
         path_spec_location += self._file_system.PATH_SEPARATOR
 
@@ -238,6 +202,27 @@ class ZipFileEntry(file_entry.FileEntry):
         self._resolver_context, self._file_system, path_spec, is_root=is_root,
         is_virtual=is_virtual)
 
+  def GetTimestamps(self):
+    """Retrieves the raw timestamps.
+
+    Returns:
+      Timestamps: raw timestamps, which are POSIX timestamps in seconds.
+    """
+    modification_time = None
+    if self._zip_info is not None:
+      time_elements = getattr(self._zip_info, u'date_time', None)
+      if time_elements:
+        try:
+          modification_time = calendar.timegm(time_elements)
+        except (OverflowError, ValueError):
+          # For example a DOS date of 0 that zipfile reports as
+          # (1980, 0, 0, 0, 0, 0).
+          pass
+
+    return file_entry.Timestamps(
+        definitions.TIMESTAMP_FORMAT_POSIX_TIME,
+        modification_time=modification_time)
+
   def GetZipInfo(self):
     """Retrieves the ZIP info object.
 
@@ -8,8 +8,10 @@ import dfvfs.vfs.zip_file_entry
 
 from dfvfs.lib import definitions
 from dfvfs.lib import errors
+from dfvfs.lib import py2to3
 from dfvfs.path import zip_path_spec
 from dfvfs.resolver import resolver
+from dfvfs.vfs import directory_index
 from dfvfs.vfs import file_system
 
 
@@ -31,6 +33,7 @@ class ZipFileSystem(file_system.FileSystem):
       encoding (Optional[str]): encoding of the file entry name.
     """
     super(ZipFileSystem, self).__init__(resolver_context)
+    self._directory_index = None
     self._file_object = None
     self._zip_file = None
     self.encoding = encoding
@@ -41,6 +44,8 @@ class ZipFileSystem(file_system.FileSystem):
     Raises:
       IOError: if the close failed.
     """
+    self._directory_index = None
+
     self._zip_file.close()
     self._zip_file = None
 
@@ -73,9 +78,34 @@ class ZipFileSystem(file_system.FileSystem):
       file_object.close()
       raise
 
+    self._directory_index = self._BuildDirectoryIndex(zip_file)
     self._file_object = file_object
     self._zip_file = zip_file
 
+  def _BuildDirectoryIndex(self, zip_file):
+    """Builds the directory index.
+
+    Args:
+      zip_file (zipfile.ZipFile): ZIP file.
+
+    Returns:
+      DirectoryIndex: directory index.
+    """
+    index = directory_index.DirectoryIndex(path_separator=self.PATH_SEPARATOR)
+
+    for zip_info in zip_file.infolist():
+      path = getattr(zip_info, u'filename', None)
+      if path is not None and not isinstance(path, py2to3.UNICODE_TYPE):
+        try:
+          path = path.decode(self.encoding)
+        except UnicodeDecodeError:
+          path = None
+
+      if path:
+        index.AddPath(path, is_directory=path.endswith(self.PATH_SEPARATOR))
+
+    return index
+
   def FileEntryExistsByPathSpec(self, path_spec):
     """Determines if a file entry for a path specification exists.
 
@@ -101,13 +131,7 @@ class ZipFileSystem(file_system.FileSystem):
       pass
 
     # Check if location could be a virtual directory.
-    for name in iter(self._zip_file.namelist()):
-      # The ZIP info name does not have the leading path separator as
-      # the location string does.
-      if name.startswith(location[1:]):
-        return True
-
-    return False
+    return self._directory_index.HasPath(location[1:])
 
   def GetFileEntryByPathSpec(self, path_spec):
     """Retrieves a file entry for a path specification.
@@ -137,6 +161,14 @@ class ZipFileSystem(file_system.FileSystem):
     return dfvfs.vfs.zip_file_entry.ZipFileEntry(
         self._resolver_context, self, path_spec, **kwargs)
 
+  def GetDirectoryIndex(self):
+    """Retrieves the directory index.
+
+    Returns:
+      DirectoryIndex: directory index.
+    """
+    return self._directory_index
+
   def GetRootFileEntry(self):
     """Retrieves the root file entry.
 
@@ -0,0 +1,115 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Tests for the BZIP2 compressed block index object."""
+
+import bz2
+import unittest
+
+from dfvfs.compression import bzip2_block_index
+from dfvfs.file_io import fake_file_io
+from dfvfs.lib import errors
+from dfvfs.path import fake_path_spec
+from dfvfs.resolver import context
+
+from tests import test_lib as shared_test_lib
+
+
+class BZIP2BlockIndexTest(shared_test_lib.BaseTestCase):
+  """Tests for the BZIP2 compressed block index object."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._resolver_context = context.Context()
+    self._path_spec = fake_path_spec.FakePathSpec(location=u'/test.bz2')
+
+    self._uncompressed_data = b''.join([
+        u'{0:d} {1:d}\n'.format(value, value * value).encode(u'ascii')
+        for value in range(0, 25000)])
+
+    # A compression level of 1 results in blocks of 100 kB. Concatenate
+    # 2 streams, such as produced by parallel BZIP2 compression tools.
+    self._compressed_data = b''.join([
+        bz2.compress(self._uncompressed_data[:200000], 1),
+        bz2.compress(self._uncompressed_data[200000:], 1)])
+
+  def _OpenFileObject(self, file_data):
+    """Opens a fake file-like object.
+
+    Args:
+      file_data (bytes): file data.
+
+    Returns:
+      FakeFile: fake file-like object.
+    """
+    file_object = fake_file_io.FakeFile(self._resolver_context, file_data)
+    file_object.open(path_spec=self._path_spec)
+    return file_object
+
+  def testBuild(self):
+    """Tests the Build function."""
+    file_object = self._OpenFileObject(self._compressed_data)
+
+    block_index = bzip2_block_index.BZIP2BlockIndex()
+    block_index.Build(file_object)
+
+    self.assertEqual(len(block_index.blocks), 5)
+    self.assertIsNone(block_index.uncompressed_data_size)
+
+    block = block_index.blocks[0]
+    self.assertEqual(block.compressed_data_offset, 4)
+    self.assertEqual(block.bit_offset, 0)
+
+    file_object.close()
+
+    file_object = self._OpenFileObject(b'This is a test.')
+
+    block_index = bzip2_block_index.BZIP2BlockIndex()
+    with self.assertRaises(errors.BackEndError):
+      block_index.Build(file_object)
+
+    file_object.close()
+
+  def testDecompressBlock(self):
+    """Tests the DecompressBlock function."""
+    file_object = self._OpenFileObject(self._compressed_data)
+
+    block_index = bzip2_block_index.BZIP2BlockIndex()
+    block_index.Build(file_object)
+
+    uncompressed_data = []
+    for block in block_index.blocks:
+      compressed_data = self._compressed_data[
+          block.compressed_data_offset:
+          block.compressed_data_offset + block.compressed_data_size]
+
+      block_data = block_index.DecompressBlock(block, compressed_data)
+      block.uncompressed_data_size = len(block_data)
+      uncompressed_data.append(block_data)
+
+    self.assertEqual(b''.join(uncompressed_data), self._uncompressed_data)
+
+    block_index.UpdateOffsets()
+    self.assertEqual(
+        block_index.uncompressed_data_size, len(self._uncompressed_data))
+
+    # The second stream starts with uncompressed data offset 200000.
+    block_number = block_index.GetBlockNumberByOffset(200000)
+    block = block_index.blocks[block_number]
+    self.assertEqual(block.uncompressed_data_offset, 200000)
+
+    block = block_index.blocks[block_number - 1]
+    self.assertEqual(
+        block.uncompressed_data_offset + block.uncompressed_data_size, 200000)
+
+    block_number = block_index.GetBlockNumberByOffset(
+        len(self._uncompressed_data))
+    self.assertIsNone(block_number)
+
+    with self.assertRaises(errors.BackEndError):
+      block_index.DecompressBlock(block_index.blocks[0], b'\x00' * 32)
+
+    file_object.close()
+
+
+if __name__ == '__main__':
+  unittest.main()
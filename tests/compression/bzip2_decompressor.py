@@ -2,6 +2,8 @@
 # -*- coding: utf-8 -*-
 """Tests for the bzip2 decompressor object."""
 
+import bz2
+import sys
 import unittest
 
 from dfvfs.compression import bzip2_decompressor
@@ -35,6 +37,28 @@ class BZIP2DecompressorTestCase(test_lib.DecompressorTestCase):
     with self.assertRaises(errors.BackEndError):
       _, _ = decompressor.Decompress(b'This is a test.')
 
+  @unittest.skipIf(
+      sys.version_info[0] < 3, 'requires bz2 with maximum size support')
+  def testDecompressWithMaximumSize(self):
+    """Tests the Decompress method with a maximum size."""
+    decompressor = bzip2_decompressor.BZIP2Decompressor()
+
+    compressed_data = bz2.compress(b'\x00' * 4096)
+
+    uncompressed_data, compressed_data = decompressor.Decompress(
+        compressed_data, maximum_size=1000)
+    self.assertEqual(uncompressed_data, b'\x00' * 1000)
+
+    uncompressed_data_parts = [uncompressed_data]
+    while len(uncompressed_data) == 1000:
+      uncompressed_data, compressed_data = decompressor.Decompress(
+          compressed_data, maximum_size=1000)
+      self.assertLessEqual(len(uncompressed_data), 1000)
+      uncompressed_data_parts.append(uncompressed_data)
+
+    self.assertEqual(b''.join(uncompressed_data_parts), b'\x00' * 4096)
+    self.assertEqual(compressed_data, b'')
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -4,6 +4,8 @@
 
 import unittest
 
+from dfvfs.compression import block_index
+from dfvfs.compression import bzip2_block_index
 from dfvfs.compression import decompressor
 from dfvfs.compression import manager
 from dfvfs.compression import zlib_decompressor
@@ -30,9 +32,57 @@ class TestDecompressor(decompressor.Decompressor):
     return b'', b''
 
 
+class TestBlockIndex(block_index.BlockIndex):
+  """Class that implements a test block index."""
+
+  COMPRESSION_METHOD = u'test'
+
+  def Build(self, unused_file_object):
+    """Builds the block index.
+
+    Args:
+      file_object (FileIO): file-like object containing the compressed
+          stream.
+    """
+    return
+
+  def DecompressBlock(self, unused_block, unused_compressed_data):
+    """Decompresses a block.
+
+    Args:
+      block (CompressedBlock): block.
+      compressed_data (bytes): compressed data of the block.
+
+    Returns:
+      bytes: uncompressed data.
+    """
+    return b''
+
+
 class CompressionManagerTest(shared_test_lib.BaseTestCase):
   """Class to test the compression manager."""
 
+  def testBlockIndexRegistration(self):
+    """Tests the RegisterBlockIndex and DeregisterBlockIndex functions."""
+    # pylint: disable=protected-access
+    number_of_block_indexes = len(manager.CompressionManager._block_indexes)
+
+    manager.CompressionManager.RegisterBlockIndex(TestBlockIndex)
+    self.assertEqual(
+        len(manager.CompressionManager._block_indexes),
+        number_of_block_indexes + 1)
+
+    with self.assertRaises(KeyError):
+      manager.CompressionManager.RegisterBlockIndex(TestBlockIndex)
+
+    manager.CompressionManager.DeregisterBlockIndex(TestBlockIndex)
+    self.assertEqual(
+        len(manager.CompressionManager._block_indexes),
+        number_of_block_indexes)
+
+    with self.assertRaises(KeyError):
+      manager.CompressionManager.DeregisterBlockIndex(TestBlockIndex)
+
   def testDecompressorRegistration(self):
     """Tests the DeregisterDecompressor and DeregisterDecompressor functions."""
     # pylint: disable=protected-access
@@ -60,6 +110,17 @@ class CompressionManagerTest(shared_test_lib.BaseTestCase):
     decompressor_object = manager.CompressionManager.GetDecompressor(u'bogus')
     self.assertIsNone(decompressor_object)
 
+  def testGetBlockIndex(self):
+    """Function to test the GetBlockIndex function."""
+    block_index_object = manager.CompressionManager.GetBlockIndex(
+        definitions.COMPRESSION_METHOD_BZIP2)
+    self.assertIsInstance(
+        block_index_object, bzip2_block_index.BZIP2BlockIndex)
+
+    block_index_object = manager.CompressionManager.GetBlockIndex(
+        definitions.COMPRESSION_METHOD_ZLIB)
+    self.assertIsNone(block_index_object)
+
 
 if __name__ == '__main__':
   unittest.main()
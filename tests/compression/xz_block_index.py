@@ -0,0 +1,90 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Tests for the XZ compressed block index object."""
+
+import unittest
+
+try:
+  from dfvfs.compression import xz_block_index
+except ImportError:
+  xz_block_index = None
+
+from dfvfs.file_io import fake_file_io
+from dfvfs.file_io import os_file_io
+from dfvfs.lib import errors
+from dfvfs.path import fake_path_spec
+from dfvfs.path import os_path_spec
+from dfvfs.resolver import context
+
+from tests import test_lib as shared_test_lib
+
+
+@unittest.skipIf(xz_block_index is None, 'requires LZMA compression support')
+@shared_test_lib.skipUnlessHasTestFile([u'syslog.multi.xz'])
+class XZBlockIndexTest(shared_test_lib.BaseTestCase):
+  """Tests for the XZ compressed block index object."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._resolver_context = context.Context()
+    test_file = self._GetTestFilePath([u'syslog.multi.xz'])
+    path_spec = os_path_spec.OSPathSpec(location=test_file)
+    self._file_object = os_file_io.OSFile(self._resolver_context)
+    self._file_object.open(path_spec=path_spec)
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    self._file_object.close()
+
+  def testBuild(self):
+    """Tests the Build function."""
+    block_index = xz_block_index.XZBlockIndex()
+    block_index.Build(self._file_object)
+
+    # xz --list -vv syslog.multi.xz
+    self.assertEqual(len(block_index.blocks), 3)
+    self.assertEqual(block_index.uncompressed_data_size, 1247)
+
+    block = block_index.blocks[1]
+    self.assertEqual(block.compressed_data_offset, 264)
+    self.assertEqual(block.compressed_data_size, 300)
+    self.assertEqual(block.uncompressed_data_offset, 512)
+    self.assertEqual(block.uncompressed_data_size, 512)
+
+    self.assertEqual(block_index.GetBlockNumberByOffset(1100), 2)
+
+    file_object = fake_file_io.FakeFile(
+        self._resolver_context, b'This is a test.')
+    file_object.open(path_spec=fake_path_spec.FakePathSpec(location=u'/test'))
+
+    block_index = xz_block_index.XZBlockIndex()
+    with self.assertRaises(errors.BackEndError):
+      block_index.Build(file_object)
+
+    file_object.close()
+
+  def testDecompressBlock(self):
+    """Tests the DecompressBlock function."""
+    block_index = xz_block_index.XZBlockIndex()
+    block_index.Build(self._file_object)
+
+    block = block_index.blocks[1]
+    self._file_object.seek(block.compressed_data_offset)
+    compressed_data = self._file_object.read(block.compressed_data_size)
+
+    uncompressed_data = block_index.DecompressBlock(block, compressed_data)
+    self.assertEqual(len(uncompressed_data), 512)
+
+    test_file = self._GetTestFilePath([u'syslog'])
+    with open(test_file, 'rb') as file_object:
+      file_object.seek(512)
+      expected_uncompressed_data = file_object.read(512)
+
+    self.assertEqual(uncompressed_data, expected_uncompressed_data)
+
+    with self.assertRaises(errors.BackEndError):
+      block_index.DecompressBlock(block, b'\x00' * 300)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 """Tests for the xz decompressor object."""
 
+import sys
 import unittest
 
 try:
@@ -68,6 +69,32 @@ class XZDecompressorTestCase(test_lib.DecompressorTestCase):
     with self.assertRaises(errors.BackEndError):
       _, _ = decompressor.Decompress(b'This is a test.')
 
+  @unittest.skipIf(
+      sys.version_info[0] < 3, 'requires lzma with maximum size support')
+  def testDecompressWithMaximumSize(self):
+    """Tests the Decompress method with a maximum size."""
+    decompressor = xz_decompressor.XZDecompressor()
+
+    compressed_data = (
+        b'\xfd7zXZ\x00\x00\x04\xe6\xd6\xb4F\x02\x00!\x01\x16\x00\x00\x00t/'
+        b'\xe5\xa3\xe0\x0f\xff\x00\x19]\x00\x00o\xfd\xff\xff\xa3\xb7\xffG>'
+        b'H\x15r9aQ\xb8\x92(\xe6\xa3\x84\x9e)F\x00\x00\x00\x00\xa5\xf0\xea'
+        b'%\x94\xd3\xd3&\x00\x015\x80 \x00\x00\x00o]6\x86\xb1\xc4g\xfb\x02'
+        b'\x00\x00\x00\x00\x04YZ')
+
+    uncompressed_data, compressed_data = decompressor.Decompress(
+        compressed_data, maximum_size=1000)
+    self.assertEqual(uncompressed_data, b'\x00' * 1000)
+
+    uncompressed_data_parts = [uncompressed_data]
+    while len(uncompressed_data) == 1000:
+      uncompressed_data, compressed_data = decompressor.Decompress(
+          compressed_data, maximum_size=1000)
+      self.assertLessEqual(len(uncompressed_data), 1000)
+      uncompressed_data_parts.append(uncompressed_data)
+
+    self.assertEqual(b''.join(uncompressed_data_parts), b'\x00' * 4096)
+
 
 if __name__ == '__main__':
   unittest.main()
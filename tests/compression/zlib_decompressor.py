@@ -3,6 +3,7 @@
 """Tests for the zlib decompressor object."""
 
 import unittest
+import zlib
 
 from dfvfs.compression import zlib_decompressor
 from dfvfs.lib import errors
@@ -30,6 +31,28 @@ class ZlibDecompressorTestCase(test_lib.DecompressorTestCase):
       _, _ = decompressor.Decompress(b'This is a test.')
 
 
+  def testDecompressWithMaximumSize(self):
+    """Tests the Decompress method with a maximum size."""
+    decompressor = zlib_decompressor.ZlibDecompressor()
+
+    compressed_data = zlib.compress(b'\x00' * 4096)
+
+    uncompressed_data, compressed_data = decompressor.Decompress(
+        compressed_data, maximum_size=1000)
+    self.assertEqual(uncompressed_data, b'\x00' * 1000)
+    self.assertNotEqual(compressed_data, b'')
+
+    uncompressed_data_parts = [uncompressed_data]
+    while len(uncompressed_data) == 1000:
+      uncompressed_data, compressed_data = decompressor.Decompress(
+          compressed_data, maximum_size=1000)
+      self.assertLessEqual(len(uncompressed_data), 1000)
+      uncompressed_data_parts.append(uncompressed_data)
+
+    self.assertEqual(b''.join(uncompressed_data_parts), b'\x00' * 4096)
+    self.assertEqual(compressed_data, b'')
+
+
 class DeflateDecompressorTestCase(test_lib.DecompressorTestCase):
   """Tests for the zlib decompressor object."""
 
@@ -7,13 +7,17 @@ try:
 except ImportError:
   lzma = None
 
+import bz2
 import os
 import unittest
+import zlib
 
 from dfvfs.file_io import compressed_stream_io
+from dfvfs.file_io import fake_file_io
 from dfvfs.file_io import os_file_io
 from dfvfs.lib import definitions
 from dfvfs.path import compressed_stream_path_spec
+from dfvfs.path import fake_path_spec
 from dfvfs.path import os_path_spec
 from dfvfs.resolver import context
 
@@ -89,6 +93,211 @@ class BZIP2CompressedStreamTest(test_lib.SylogTestCase):
     file_object.close()
 
 
+class FailingDecompressor(object):
+  """Decompressor that fails with an unexpected exception."""
+
+  # pylint: disable=unused-argument
+  def Decompress(self, compressed_data, maximum_size=None):
+    """Decompresses the compressed data.
+
+    Args:
+      compressed_data (bytes): compressed data.
+      maximum_size (Optional[int]): maximum size of the uncompressed data.
+
+    Raises:
+      ValueError: always.
+    """
+    raise ValueError(u'Unable to decompress data.')
+
+
+class DecompressionPipelineTest(shared_test_lib.BaseTestCase):
+  """The unit test for the decompression pipeline."""
+
+  def testGetUncompressedDataWithFailingDecompressor(self):
+    """Test the GetUncompressedData function with a failing decompressor."""
+    pipeline = compressed_stream_io.DecompressionPipeline(
+        FailingDecompressor(), 1024, 4)
+
+    pipeline.AddCompressedData(b'data')
+
+    with self.assertRaises(ValueError):
+      pipeline.GetUncompressedData()
+
+    self.assertEqual(pipeline.number_of_pending_chunks, 0)
+
+    pipeline.Stop()
+
+
+class TestCompressedStream(compressed_stream_io.CompressedStream):
+  """Compressed stream file-like object with small data buffers."""
+
+  _COMPRESSED_DATA_BUFFER_SIZE = 256
+
+  _UNCOMPRESSED_DATA_BUFFER_SIZE = 1024
+
+
+class ZlibSequentialReadCompressedStreamTest(shared_test_lib.BaseTestCase):
+  """The unit test for sequential reads of a compressed stream."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._resolver_context = context.Context()
+    self._uncompressed_data = b''.join([
+        u'{0:d} {1:d}\n'.format(value, value * value).encode(u'ascii')
+        for value in range(0, 2000)])
+
+    self._fake_file_object = fake_file_io.FakeFile(
+        self._resolver_context, zlib.compress(self._uncompressed_data))
+    self._fake_file_object.open(
+        path_spec=fake_path_spec.FakePathSpec(location=u'/test.zlib'))
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    self._fake_file_object.close()
+
+  def _TestSequentialRead(self, number_of_threads):
+    """Tests sequential reads that span multiple compressed data buffers.
+
+    Args:
+      number_of_threads (int): number of threads used to decompress data.
+    """
+    file_object = TestCompressedStream(
+        self._resolver_context,
+        compression_method=definitions.COMPRESSION_METHOD_ZLIB,
+        file_object=self._fake_file_object,
+        number_of_threads=number_of_threads)
+    file_object.open()
+
+    self.assertEqual(file_object.get_size(), len(self._uncompressed_data))
+
+    uncompressed_data = []
+    read_buffer = file_object.read(100)
+    while read_buffer:
+      uncompressed_data.append(read_buffer)
+      read_buffer = file_object.read(100)
+
+    self.assertEqual(b''.join(uncompressed_data), self._uncompressed_data)
+
+    file_object.seek(10000, os.SEEK_SET)
+    self.assertEqual(
+        file_object.read(100), self._uncompressed_data[10000:10100])
+
+    file_object.close()
+
+  def testSequentialRead(self):
+    """Test sequential reads."""
+    self._TestSequentialRead(1)
+
+  def testSequentialReadWithThreads(self):
+    """Test sequential reads with decompression on a worker thread."""
+    self._TestSequentialRead(2)
+
+  def _TestHighCompressionRatioRead(self, number_of_threads):
+    """Tests reads of data with a high compression ratio.
+
+    Args:
+      number_of_threads (int): number of threads used to decompress data.
+    """
+    uncompressed_data = b''.join([b'\x00' * 65536, self._uncompressed_data])
+
+    fake_file_object = fake_file_io.FakeFile(
+        self._resolver_context, zlib.compress(uncompressed_data))
+    fake_file_object.open(
+        path_spec=fake_path_spec.FakePathSpec(location=u'/zeros.zlib'))
+
+    file_object = TestCompressedStream(
+        self._resolver_context,
+        compression_method=definitions.COMPRESSION_METHOD_ZLIB,
+        file_object=fake_file_object,
+        number_of_threads=number_of_threads)
+    file_object.open()
+
+    self.assertEqual(file_object.get_size(), len(uncompressed_data))
+
+    file_object.seek(65000, os.SEEK_SET)
+    self.assertEqual(file_object.read(1000), uncompressed_data[65000:66000])
+
+    # The uncompressed data is decompressed in parts of a bounded size.
+    # pylint: disable=protected-access
+    self.assertLessEqual(file_object._uncompressed_data_size, 1024)
+
+    file_object.seek(0, os.SEEK_SET)
+    self.assertEqual(file_object.read(), uncompressed_data)
+
+    file_object.close()
+    fake_file_object.close()
+
+  def testHighCompressionRatioRead(self):
+    """Test reads of data with a high compression ratio."""
+    self._TestHighCompressionRatioRead(1)
+
+  def testHighCompressionRatioReadWithThreads(self):
+    """Test reads of data with a high compression ratio on a worker thread."""
+    self._TestHighCompressionRatioRead(2)
+
+
+class BZIP2MultipleBlocksCompressedStreamTest(shared_test_lib.BaseTestCase):
+  """The unit test for a BZIP2 compressed stream with multiple blocks."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._resolver_context = context.Context()
+    self._uncompressed_data = b''.join([
+        u'{0:d} {1:d}\n'.format(value, value * value).encode(u'ascii')
+        for value in range(0, 25000)])
+
+    # A compression level of 1 results in blocks of 100 kB. Concatenate
+    # 2 streams, such as produced by parallel BZIP2 compression tools.
+    compressed_data = b''.join([
+        bz2.compress(self._uncompressed_data[:200000], 1),
+        bz2.compress(self._uncompressed_data[200000:], 1)])
+
+    self._fake_file_object = fake_file_io.FakeFile(
+        self._resolver_context, compressed_data)
+    self._fake_file_object.open(
+        path_spec=fake_path_spec.FakePathSpec(location=u'/test.bz2'))
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    self._fake_file_object.close()
+
+  def _TestReadAndSeek(self, number_of_threads):
+    """Tests the read and seek functionality.
+
+    Args:
+      number_of_threads (int): number of threads used to decompress blocks.
+    """
+    file_object = compressed_stream_io.CompressedStream(
+        self._resolver_context,
+        compression_method=definitions.COMPRESSION_METHOD_BZIP2,
+        file_object=self._fake_file_object,
+        number_of_threads=number_of_threads)
+    file_object.open()
+
+    self.assertEqual(file_object.get_size(), len(self._uncompressed_data))
+
+    file_object.seek(399990, os.SEEK_SET)
+    self.assertEqual(
+        file_object.read(4096), self._uncompressed_data[399990:404086])
+
+    file_object.seek(199990, os.SEEK_SET)
+    self.assertEqual(
+        file_object.read(20), self._uncompressed_data[199990:200010])
+
+    file_object.seek(0, os.SEEK_SET)
+    self.assertEqual(file_object.read(), self._uncompressed_data)
+
+    file_object.close()
+
+  def testReadAndSeek(self):
+    """Test the read and seek functionality."""
+    self._TestReadAndSeek(1)
+
+  def testReadAndSeekWithThreads(self):
+    """Test the read and seek functionality with multiple threads."""
+    self._TestReadAndSeek(3)
+
+
 @unittest.skipIf(lzma is None, 'requires LZMA compression support')
 @shared_test_lib.skipUnlessHasTestFile([u'syslog.lzma'])
 class LZMACompressedStreamTest(test_lib.SylogTestCase):
@@ -227,6 +436,52 @@ class XZCompressedStreamTest(test_lib.SylogTestCase):
     file_object.close()
 
 
+@unittest.skipIf(lzma is None, 'requires LZMA compression support')
+@shared_test_lib.skipUnlessHasTestFile([u'syslog.multi.xz'])
+class XZMultipleBlocksCompressedStreamTest(test_lib.SylogTestCase):
+  """The unit test for a XZ compressed stream with multiple blocks."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._resolver_context = context.Context()
+    test_file = self._GetTestFilePath([u'syslog.multi.xz'])
+    self._os_path_spec = os_path_spec.OSPathSpec(location=test_file)
+
+  def _TestReadAndSeek(self, number_of_threads):
+    """Tests the read and seek functionality.
+
+    Args:
+      number_of_threads (int): number of threads used to decompress blocks.
+    """
+    os_file_object = os_file_io.OSFile(self._resolver_context)
+    os_file_object.open(path_spec=self._os_path_spec)
+    file_object = compressed_stream_io.CompressedStream(
+        self._resolver_context,
+        compression_method=definitions.COMPRESSION_METHOD_XZ,
+        file_object=os_file_object, number_of_threads=number_of_threads)
+    file_object.open()
+
+    self._TestGetSizeFileObject(file_object)
+    self._TestSeekFileObject(file_object)
+    self._TestReadFileObject(file_object)
+
+    # The read spans the first and second block.
+    file_object.seek(480, os.SEEK_SET)
+    self.assertEqual(file_object.read(38), (
+        b' Job `cron.daily\' terminated\nMMM 22 07'))
+
+    file_object.close()
+    os_file_object.close()
+
+  def testReadAndSeek(self):
+    """Test the read and seek functionality."""
+    self._TestReadAndSeek(1)
+
+  def testReadAndSeekWithThreads(self):
+    """Test the read and seek functionality with multiple threads."""
+    self._TestReadAndSeek(2)
+
+
 @shared_test_lib.skipUnlessHasTestFile([u'syslog.zlib'])
 class ZlibCompressedStreamTest(test_lib.SylogTestCase):
   """The unit test for a zlib compressed stream file-like object."""
@@ -64,6 +64,49 @@ class DataRangeTest(test_lib.SylogTestCase):
 
     file_object.close()
 
+  def testGetFlattenedDataRange(self):
+    """Test the get flattened data range functionality."""
+    file_object = data_range_io.DataRange(self._resolver_context)
+    file_object.open(path_spec=self._data_range_path_spec)
+
+    flattened_file_object, range_offset, range_size = (
+        file_object.GetFlattenedDataRange())
+    self.assertIsInstance(flattened_file_object, os_file_io.OSFile)
+    self.assertEqual(range_offset, 167)
+    self.assertEqual(range_size, 1080)
+
+    file_object.close()
+
+    path_spec = data_range_path_spec.DataRangePathSpec(
+        range_offset=100, range_size=200, parent=self._data_range_path_spec)
+    file_object = data_range_io.DataRange(self._resolver_context)
+    file_object.open(path_spec=path_spec)
+
+    flattened_file_object, range_offset, range_size = (
+        file_object.GetFlattenedDataRange())
+    self.assertIsInstance(flattened_file_object, os_file_io.OSFile)
+    self.assertEqual(range_offset, 267)
+    self.assertEqual(range_size, 200)
+
+    file_object.close()
+
+    # Test a data range that exceeds the parent data range.
+    path_spec = data_range_path_spec.DataRangePathSpec(
+        range_offset=1000, range_size=200, parent=self._data_range_path_spec)
+    file_object = data_range_io.DataRange(self._resolver_context)
+    file_object.open(path_spec=path_spec)
+
+    self.assertEqual(file_object.get_size(), 200)
+
+    _, range_offset, range_size = file_object.GetFlattenedDataRange()
+    self.assertEqual(range_offset, 1167)
+    self.assertEqual(range_size, 80)
+
+    data = file_object.read()
+    self.assertEqual(len(data), 80)
+
+    file_object.close()
+
   def testSeek(self):
     """Test the seek functionality."""
     file_object = data_range_io.DataRange(self._resolver_context)
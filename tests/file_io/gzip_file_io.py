@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 """Tests for the gzip file-like object."""
 
+import os
 import unittest
 
 from dfvfs.file_io import gzip_file_io
@@ -57,5 +58,62 @@ class GzipFileTest(test_lib.SylogTestCase):
     file_object.close()
 
 
+@shared_test_lib.skipUnlessHasTestFile([u'syslog.multi.gz'])
+class MultiMemberGzipFileTest(test_lib.SylogTestCase):
+  """The unit test for a gzip file-like object with multiple members."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._resolver_context = context.Context()
+    test_file = self._GetTestFilePath([u'syslog.multi.gz'])
+    path_spec = os_path_spec.OSPathSpec(location=test_file)
+    self._gzip_path_spec = gzip_path_spec.GzipPathSpec(parent=path_spec)
+
+  def testOpenClosePathSpec(self):
+    """Test the open and close functionality using a path specification."""
+    file_object = gzip_file_io.GzipFile(self._resolver_context)
+    file_object.open(path_spec=self._gzip_path_spec)
+
+    self._TestGetSizeFileObject(file_object)
+
+    self.assertEqual(file_object.GetNumberOfMembers(), 3)
+    self.assertEqual(file_object.modification_time, 0x501416d7)
+    self.assertEqual(file_object.operating_system, 0xff)
+    self.assertEqual(file_object.original_filename, u'syslog.1')
+    self.assertIsNone(file_object.comment)
+
+    file_object.close()
+
+  def testSeek(self):
+    """Test the seek functionality."""
+    file_object = gzip_file_io.GzipFile(self._resolver_context)
+    file_object.open(path_spec=self._gzip_path_spec)
+
+    self._TestSeekFileObject(file_object)
+
+    file_object.close()
+
+  def testRead(self):
+    """Test the read functionality."""
+    file_object = gzip_file_io.GzipFile(self._resolver_context)
+    file_object.open(path_spec=self._gzip_path_spec)
+
+    # The first member contains the first 200 bytes of the uncompressed
+    # data, hence the read spans the first and second member.
+    self._TestReadFileObject(file_object)
+
+    file_object.seek(0, os.SEEK_SET)
+    read_buffer = file_object.read()
+    self.assertEqual(len(read_buffer), 1247)
+
+    test_file = self._GetTestFilePath([u'syslog'])
+    with open(test_file, 'rb') as file_object_syslog:
+      expected_buffer = file_object_syslog.read()
+
+    self.assertEqual(read_buffer, expected_buffer)
+
+    file_object.close()
+
+
 if __name__ == '__main__':
   unittest.main()
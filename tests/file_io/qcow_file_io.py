@@ -4,6 +4,7 @@
 
 import unittest
 
+from dfvfs.file_io import qcow_file_io
 from dfvfs.lib import errors
 from dfvfs.path import os_path_spec
 from dfvfs.path import qcow_path_spec
@@ -43,6 +44,16 @@ class QCOWFileTest(test_lib.ImageFileTestCase):
     """Test the seek functionality."""
     self._TestSeek(self._qcow_path_spec)
 
+  def testGetAllocatedExtents(self):
+    """Test the get allocated extents functionality."""
+    file_object = qcow_file_io.QCOWFile(self._resolver_context)
+    file_object.open(path_spec=self._qcow_path_spec)
+
+    allocated_extents = file_object.GetAllocatedExtents()
+    self.assertEqual(allocated_extents, [(0, 65536)])
+
+    file_object.close()
+
   def testRead(self):
     """Test the read functionality."""
     self._TestRead(self._qcow_path_spec)
@@ -4,6 +4,8 @@
 
 import unittest
 
+from dfvfs.file_io import os_file_io
+from dfvfs.file_io import raw_file_io
 from dfvfs.lib import errors
 from dfvfs.path import raw_path_spec
 from dfvfs.path import os_path_spec
@@ -38,6 +40,19 @@ class RawFileTest(test_lib.ImageFileTestCase):
     with self.assertRaises(errors.PathSpecError):
       self._TestOpenCloseLocation(path_spec)
 
+  def testGetFlattenedDataRange(self):
+    """Test the get flattened data range functionality."""
+    file_object = raw_file_io.RawFile(self._resolver_context)
+    file_object.open(path_spec=self._raw_path_spec)
+
+    flattened_file_object, range_offset, range_size = (
+        file_object.GetFlattenedDataRange())
+    self.assertIsInstance(flattened_file_object, os_file_io.OSFile)
+    self.assertEqual(range_offset, 0)
+    self.assertEqual(range_size, file_object.get_size())
+
+    file_object.close()
+
   def testSeek(self):
     """Test the seek functionality."""
     self._TestSeek(self._raw_path_spec)
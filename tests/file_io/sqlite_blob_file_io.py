@@ -2,8 +2,16 @@
 # -*- coding: utf-8 -*-
 """Tests for the SQLite blob file-like object."""
 
+import os
+import shutil
+import tempfile
 import unittest
 
+try:
+  from pysqlite2 import dbapi2 as sqlite3
+except ImportError:
+  import sqlite3
+
 from dfvfs.file_io import sqlite_blob_file_io
 from dfvfs.path import sqlite_blob_path_spec
 from dfvfs.path import os_path_spec
@@ -53,6 +61,24 @@ class SQLiteBlobFileWithConditionTest(test_lib.SylogTestCase):
 
     file_object.close()
 
+  def testIncrementalBlobIO(self):
+    """Test that the blob is read incrementally if supported."""
+    file_object = sqlite_blob_file_io.SQLiteBlobFile(self._resolver_context)
+    file_object.open(path_spec=self._sqlite_blob_path_spec)
+
+    database_object = self._resolver_context.GetDatabase(
+        self._sqlite_blob_path_spec.parent)
+
+    # pylint: disable=protected-access
+    if database_object.SupportsIncrementalBlobIO():
+      self.assertIsNone(file_object._blob)
+      self.assertIsNotNone(file_object._blob_handle)
+    else:
+      self.assertIsNotNone(file_object._blob)
+      self.assertIsNone(file_object._blob_handle)
+
+    file_object.close()
+
 
 @shared_test_lib.skipUnlessHasTestFile([u'syslog.db'])
 class SQLiteBlobFileWithIndexTest(test_lib.SylogTestCase):
@@ -93,6 +119,96 @@ class SQLiteBlobFileWithIndexTest(test_lib.SylogTestCase):
 
     file_object.close()
 
+  def testSharedDatabase(self):
+    """Test that file-like objects of the same database share the database."""
+    parent_path_spec = self._sqlite_blob_path_spec.parent
+
+    file_object1 = sqlite_blob_file_io.SQLiteBlobFile(self._resolver_context)
+    file_object1.open(path_spec=self._sqlite_blob_path_spec)
+
+    file_object2 = sqlite_blob_file_io.SQLiteBlobFile(self._resolver_context)
+    file_object2.open(path_spec=self._sqlite_blob_path_spec)
+
+    database_object = self._resolver_context.GetDatabase(parent_path_spec)
+    self.assertIsNotNone(database_object)
+    self.assertEqual(
+        self._resolver_context.GetDatabaseReferenceCount(parent_path_spec), 2)
+
+    # pylint: disable=protected-access
+    temp_file_path = database_object._temp_file_path
+    self.assertTrue(os.path.exists(temp_file_path))
+
+    self.assertEqual(file_object1.read(), file_object2.read())
+
+    file_object1.close()
+    self.assertEqual(
+        self._resolver_context.GetDatabaseReferenceCount(parent_path_spec), 1)
+
+    file_object2.close()
+    self.assertIsNone(self._resolver_context.GetDatabase(parent_path_spec))
+    self.assertFalse(os.path.exists(temp_file_path))
+
+
+class SQLiteBlobFileWithIndexedTableTest(shared_test_lib.BaseTestCase):
+  """The unit test for a SQLite blob file-like object on an indexed table."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._resolver_context = context.Context()
+    self._temp_directory = tempfile.mkdtemp()
+
+    test_file = os.path.join(self._temp_directory, u'indexed.db')
+    connection = sqlite3.connect(test_file)
+    connection.execute(u'CREATE TABLE blobs (name TEXT, blob BLOB)')
+    connection.execute(u'CREATE INDEX blobs_name ON blobs (name)')
+
+    # Note that the rows are inserted in reverse name order, so that the order
+    # of the rows differs from the order of the index.
+    connection.execute(
+        u'INSERT INTO blobs VALUES (?, ?)', (u'b', sqlite3.Binary(b'aaa')))
+    connection.execute(
+        u'INSERT INTO blobs VALUES (?, ?)', (u'a', sqlite3.Binary(b'ccc')))
+    connection.commit()
+    connection.close()
+
+    self._os_path_spec = os_path_spec.OSPathSpec(location=test_file)
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    self._resolver_context.Empty()
+    shutil.rmtree(self._temp_directory, True)
+
+  def testReadWithRowIndex(self):
+    """Test the read functionality using a row index."""
+    path_spec = sqlite_blob_path_spec.SQLiteBlobPathSpec(
+        table_name=u'blobs', column_name=u'blob', row_index=0,
+        parent=self._os_path_spec)
+
+    file_object = sqlite_blob_file_io.SQLiteBlobFile(self._resolver_context)
+    file_object.open(path_spec=path_spec)
+    self.assertEqual(file_object.read(), b'aaa')
+    file_object.close()
+
+    path_spec = sqlite_blob_path_spec.SQLiteBlobPathSpec(
+        table_name=u'blobs', column_name=u'blob', row_index=1,
+        parent=self._os_path_spec)
+
+    file_object = sqlite_blob_file_io.SQLiteBlobFile(self._resolver_context)
+    file_object.open(path_spec=path_spec)
+    self.assertEqual(file_object.read(), b'ccc')
+    file_object.close()
+
+  def testReadWithRowCondition(self):
+    """Test the read functionality using a row condition."""
+    path_spec = sqlite_blob_path_spec.SQLiteBlobPathSpec(
+        table_name=u'blobs', column_name=u'blob',
+        row_condition=(u'name', u'==', u'a'), parent=self._os_path_spec)
+
+    file_object = sqlite_blob_file_io.SQLiteBlobFile(self._resolver_context)
+    file_object.open(path_spec=path_spec)
+    self.assertEqual(file_object.read(), b'ccc')
+    file_object.close()
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -2,6 +2,8 @@
 # -*- coding: utf-8 -*-
 """Tests for the TAR extracted file-like object."""
 
+import os
+import tarfile
 import unittest
 
 from dfvfs.file_io import tar_file_io
@@ -53,6 +55,63 @@ class TARFileTest(test_lib.SylogTestCase):
 
     file_object.close()
 
+  def testGetFlattenedDataRange(self):
+    """Test the get flattened data range functionality."""
+    file_object = tar_file_io.TARFile(self._resolver_context)
+    file_object.open(path_spec=self._tar_path_spec)
+
+    flattened_file_object, range_offset, range_size = (
+        file_object.GetFlattenedDataRange())
+    self.assertNotEqual(flattened_file_object, file_object)
+    self.assertEqual(range_size, file_object.get_size())
+
+    flattened_file_object.seek(range_offset, os.SEEK_SET)
+    self.assertEqual(flattened_file_object.read(range_size), file_object.read())
+
+    file_object.close()
+
+
+@shared_test_lib.skipUnlessHasTestFile([u'sparse.tar'])
+class SparseTARFileTest(shared_test_lib.BaseTestCase):
+  """The unit test for a sparse TAR extracted file-like object."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._resolver_context = context.Context()
+    test_file = self._GetTestFilePath([u'sparse.tar'])
+    path_spec = os_path_spec.OSPathSpec(location=test_file)
+    self._tar_path_spec = tar_path_spec.TARPathSpec(
+        location=u'/sparse', parent=path_spec)
+
+    tar_file = tarfile.open(test_file, mode='r:')
+    self._expected_data = tar_file.extractfile(u'sparse').read()
+    tar_file.close()
+
+  def testRead(self):
+    """Test the read functionality."""
+    file_object = tar_file_io.TARFile(self._resolver_context)
+    file_object.open(path_spec=self._tar_path_spec)
+
+    self.assertEqual(file_object.get_size(), 131072)
+    self.assertEqual(file_object.read(), self._expected_data)
+
+    # Read data that spans a data segment and a hole.
+    file_object.seek(8000, os.SEEK_SET)
+    self.assertEqual(file_object.read(400), self._expected_data[8000:8400])
+
+    # Read data that spans a hole and a data segment.
+    file_object.seek(65500, os.SEEK_SET)
+    self.assertEqual(file_object.read(100), self._expected_data[65500:65600])
+
+    # Read data from the hole at the end.
+    file_object.seek(131000, os.SEEK_SET)
+    self.assertEqual(file_object.read(), b'\x00' * 72)
+
+    flattened_file_object, _, _ = file_object.GetFlattenedDataRange()
+    self.assertEqual(flattened_file_object, file_object)
+
+    file_object.close()
+
 
 if __name__ == '__main__':
   unittest.main()
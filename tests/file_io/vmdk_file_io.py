@@ -4,6 +4,7 @@
 
 import unittest
 
+from dfvfs.file_io import vmdk_file_io
 from dfvfs.lib import errors
 from dfvfs.path import os_path_spec
 from dfvfs.path import vmdk_path_spec
@@ -43,6 +44,16 @@ class VMDKFileTest(test_lib.ImageFileTestCase):
     """Test the seek functionality."""
     self._TestSeek(self._vmdk_path_spec)
 
+  def testGetAllocatedExtents(self):
+    """Test the get allocated extents functionality."""
+    file_object = vmdk_file_io.VMDKFile(self._resolver_context)
+    file_object.open(path_spec=self._vmdk_path_spec)
+
+    allocated_extents = file_object.GetAllocatedExtents()
+    self.assertEqual(allocated_extents, [(0, 65536)])
+
+    file_object.close()
+
   def testRead(self):
     """Test the read functionality."""
     self._TestRead(self._vmdk_path_spec)
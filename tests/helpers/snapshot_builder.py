@@ -0,0 +1,159 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Tests for the builder of snapshots of file system metadata."""
+
+import shutil
+import tempfile
+import unittest
+
+from dfvfs.helpers import snapshot_builder
+from dfvfs.lib import definitions
+from dfvfs.lib import errors
+from dfvfs.lib import snapshot_index
+from dfvfs.path import os_path_spec
+from dfvfs.path import tsk_path_spec
+from dfvfs.resolver import context
+from dfvfs.vfs import tsk_file_entry
+
+from tests import test_lib as shared_test_lib
+
+
+@shared_test_lib.skipUnlessHasTestFile([u'ímynd.dd'])
+class SnapshotBuilderTest(shared_test_lib.BaseTestCase):
+  """Tests for the snapshot builder."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._resolver_context = context.Context()
+    self._temp_directory = tempfile.mkdtemp()
+
+    test_file = self._GetTestFilePath([u'ímynd.dd'])
+    self._os_path_spec = os_path_spec.OSPathSpec(location=test_file)
+    self._tsk_path_spec = tsk_path_spec.TSKPathSpec(
+        location=u'/', parent=self._os_path_spec)
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    shutil.rmtree(self._temp_directory, True)
+
+  def testBuild(self):
+    """Tests the Build function."""
+    index = snapshot_index.SnapshotIndex(self._temp_directory)
+    builder = snapshot_builder.SnapshotBuilder(
+        index, resolver_context=self._resolver_context)
+
+    identifier = builder.Build(self._tsk_path_spec)
+    self.assertTrue(index.HasSnapshot(identifier))
+
+    snapshot = index.OpenSnapshot(identifier)
+    self.assertIsNotNone(snapshot)
+
+    try:
+      self.assertEqual(snapshot.path_separator, u'/')
+      self.assertEqual(
+          snapshot.timestamp_format, definitions.TIMESTAMP_FORMAT_POSIX_TIME)
+      self.assertEqual(snapshot.type_indicator, definitions.TYPE_INDICATOR_TSK)
+
+      root_record = snapshot.GetRecordByLocation(u'/')
+      self.assertIsNotNone(root_record)
+      self.assertEqual(root_record.inode, 2)
+      self.assertEqual(
+          root_record.file_entry_type, definitions.FILE_ENTRY_TYPE_DIRECTORY)
+
+      records = snapshot.GetSubRecords(root_record.identifier)
+      self.assertEqual(sorted([record.name for record in records]), [
+          u'$OrphanFiles', u'a_directory', u'a_link', u'lost+found',
+          u'passwords.txt'])
+
+      record = snapshot.GetRecordByLocation(u'/a_directory/another_file')
+      self.assertIsNotNone(record)
+      self.assertEqual(record.file_entry_type, definitions.FILE_ENTRY_TYPE_FILE)
+      self.assertEqual(record.inode, 16)
+      self.assertTrue(record.is_allocated)
+      self.assertEqual(record.mode, 384)
+      self.assertEqual(record.size, 22)
+      self.assertEqual(record.uid, 151107)
+      self.assertEqual(record.gid, 5000)
+      self.assertEqual(record.access_time, 1337961563)
+      self.assertIsNone(record.creation_time)
+      self.assertEqual(record.modification_time, 1337961563)
+
+      parent_record = snapshot.GetRecordByIdentifier(record.parent_identifier)
+      self.assertIsNotNone(parent_record)
+      self.assertEqual(parent_record.location, u'/a_directory')
+
+    finally:
+      snapshot.Close()
+
+  def testBuildWithFailingFileEntries(self):
+    """Tests the Build function with file entries that cannot be read."""
+    original_get_stat = tsk_file_entry.TSKFileEntry.GetStat
+    original_get_timestamps = tsk_file_entry.TSKFileEntry.GetTimestamps
+
+    def _GetStat(file_entry):
+      """Fails to retrieve the stat object of a specific file entry."""
+      if file_entry.name == u'a_directory':
+        raise errors.BackEndError(u'Missing TSK File .info or .info.meta.')
+      return original_get_stat(file_entry)
+
+    def _GetTimestamps(file_entry):
+      """Fails to retrieve the timestamps of a specific file entry."""
+      if file_entry.name == u'passwords.txt':
+        raise IOError(u'Unable to read timestamps.')
+      return original_get_timestamps(file_entry)
+
+    index = snapshot_index.SnapshotIndex(self._temp_directory)
+    builder = snapshot_builder.SnapshotBuilder(
+        index, resolver_context=self._resolver_context)
+
+    try:
+      tsk_file_entry.TSKFileEntry.GetStat = _GetStat
+      tsk_file_entry.TSKFileEntry.GetTimestamps = _GetTimestamps
+
+      identifier = builder.Build(self._tsk_path_spec)
+
+    finally:
+      tsk_file_entry.TSKFileEntry.GetStat = original_get_stat
+      tsk_file_entry.TSKFileEntry.GetTimestamps = original_get_timestamps
+
+    self.assertTrue(index.HasSnapshot(identifier))
+
+    snapshot = index.OpenSnapshot(identifier)
+    self.assertIsNotNone(snapshot)
+
+    try:
+      root_record = snapshot.GetRecordByLocation(u'/')
+      self.assertIsNotNone(root_record)
+
+      # The file entries that cannot be read are left out of the snapshot
+      # together with their sub file entries.
+      records = snapshot.GetSubRecords(root_record.identifier)
+      self.assertEqual(sorted([record.name for record in records]), [
+          u'$OrphanFiles', u'a_link', u'lost+found'])
+
+      record = snapshot.GetRecordByLocation(u'/a_directory/another_file')
+      self.assertIsNone(record)
+
+    finally:
+      snapshot.Close()
+
+  def testGetIdentifier(self):
+    """Tests the GetIdentifier function."""
+    index = snapshot_index.SnapshotIndex(self._temp_directory)
+    builder = snapshot_builder.SnapshotBuilder(
+        index, resolver_context=self._resolver_context)
+
+    identifier = builder.GetIdentifier(self._tsk_path_spec)
+    self.assertEqual(len(identifier), 64)
+
+    path_spec = tsk_path_spec.TSKPathSpec(
+        inode=16, location=u'/a_directory/another_file',
+        parent=self._os_path_spec)
+    self.assertEqual(builder.GetIdentifier(path_spec), identifier)
+
+    with self.assertRaises(errors.PathSpecError):
+      builder.GetIdentifier(self._os_path_spec)
+
+
+if __name__ == '__main__':
+  unittest.main()
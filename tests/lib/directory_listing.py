@@ -0,0 +1,88 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Tests for the directory listing helper."""
+
+import unittest
+
+from dfvfs.lib import directory_listing
+from dfvfs.path import fake_path_spec
+from dfvfs.resolver import context
+from dfvfs.vfs import fake_file_system
+
+from tests import test_lib as shared_test_lib
+
+
+class DirectoryListingCacheTest(shared_test_lib.BaseTestCase):
+  """The unit test for the directory listing cache."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    resolver_context = context.Context()
+    self._file_system = fake_file_system.FakeFileSystem(resolver_context)
+    self._file_system.AddFileEntry(u'/image.E01')
+    self._file_system.AddFileEntry(u'/image.E02')
+    self._path_spec = fake_path_spec.FakePathSpec(location=u'/image.E01')
+
+  def testFindPathSpecByLocation(self):
+    """Tests the FindPathSpecByLocation function."""
+    directory_listing_cache = directory_listing.DirectoryListingCache(
+        self._file_system, self._path_spec)
+
+    path_spec = directory_listing_cache.FindPathSpecByLocation(u'/image.E02')
+    self.assertIsNotNone(path_spec)
+    self.assertEqual(path_spec.location, u'/image.E02')
+
+    path_spec = directory_listing_cache.FindPathSpecByLocation(u'/image.E03')
+    self.assertIsNone(path_spec)
+
+    # A file entry that was added after the directory was listed is found
+    # by checking if the file entry exists.
+    self._file_system.AddFileEntry(u'/image.E03')
+
+    path_spec = directory_listing_cache.FindPathSpecByLocation(u'/image.E03')
+    self.assertIsNotNone(path_spec)
+    self.assertEqual(path_spec.location, u'/image.E03')
+
+  def testFindPathSpecByLocationWithCachedListing(self):
+    """Tests the FindPathSpecByLocation function with a cached listing."""
+    directory_listing_cache = directory_listing.DirectoryListingCache(
+        self._file_system, self._path_spec)
+
+    path_spec = directory_listing_cache.FindPathSpecByLocation(u'/image.E01')
+    self.assertIsNotNone(path_spec)
+
+    number_of_checks = []
+    file_entry_exists_by_path_spec = self._file_system.FileEntryExistsByPathSpec
+
+    def _FileEntryExistsByPathSpec(path_spec):
+      """Counts the number of times a file entry is checked for existence."""
+      number_of_checks.append(path_spec)
+      return file_entry_exists_by_path_spec(path_spec)
+
+    self._file_system.FileEntryExistsByPathSpec = _FileEntryExistsByPathSpec
+
+    path_spec = directory_listing_cache.FindPathSpecByLocation(u'/image.E02')
+    self.assertIsNotNone(path_spec)
+    self.assertEqual(number_of_checks, [])
+
+    # The directory listings are not shared between caches.
+    listed_locations = []
+    get_file_entry_by_path_spec = self._file_system.GetFileEntryByPathSpec
+
+    def _GetFileEntryByPathSpec(path_spec):
+      """Tracks the locations of the file entries that are retrieved."""
+      listed_locations.append(path_spec.location)
+      return get_file_entry_by_path_spec(path_spec)
+
+    self._file_system.GetFileEntryByPathSpec = _GetFileEntryByPathSpec
+
+    directory_listing_cache = directory_listing.DirectoryListingCache(
+        self._file_system, self._path_spec)
+
+    path_spec = directory_listing_cache.FindPathSpecByLocation(u'/image.E02')
+    self.assertIsNotNone(path_spec)
+    self.assertEqual(listed_locations, [u'/'])
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,75 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Tests for the gzip file support helper functions."""
+
+import unittest
+
+from dfvfs.lib import gzipfile
+from dfvfs.path import os_path_spec
+from dfvfs.resolver import context
+from dfvfs.resolver import resolver
+
+from tests import test_lib as shared_test_lib
+
+
+class TestGzipMember(gzipfile.GzipMember):
+  """Class that contains a gzip member that decompresses in small parts."""
+
+  _UNCOMPRESSED_DATA_BUFFER_SIZE = 64
+
+
+@shared_test_lib.skipUnlessHasTestFile([u'syslog.gz'])
+class GzipMemberTest(shared_test_lib.BaseTestCase):
+  """The unit test for the gzip member."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._resolver_context = context.Context()
+    test_file = self._GetTestFilePath([u'syslog.gz'])
+    path_spec = os_path_spec.OSPathSpec(location=test_file)
+    self._file_object = resolver.Resolver.OpenFileObject(
+        path_spec, resolver_context=self._resolver_context)
+
+    test_file = self._GetTestFilePath([u'syslog'])
+    with open(test_file, 'rb') as file_object:
+      self._expected_data = file_object.read()
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    self._file_object.close()
+
+  def testReadMember(self):
+    """Test the read member functionality."""
+    member = gzipfile.GzipMember(self._file_object, 0, 0)
+
+    self.assertEqual(member.member_start_offset, 0)
+    self.assertEqual(member.member_end_offset, self._file_object.get_size())
+    self.assertEqual(member.uncompressed_data_offset, 0)
+    self.assertEqual(member.uncompressed_data_size, 1247)
+    self.assertEqual(member.original_filename, u'syslog.1')
+    self.assertEqual(member.GetNumberOfAccessPoints(), 1)
+
+  def testReadAtOffset(self):
+    """Test the read at offset functionality."""
+    member = TestGzipMember(self._file_object, 0, 0, access_point_span=100)
+
+    self.assertEqual(member.uncompressed_data_size, 1247)
+    self.assertEqual(member.GetNumberOfAccessPoints(), 10)
+
+    # Read backwards to force reads to start from an access point.
+    for offset in range(1200, -1, -100):
+      data = member.ReadAtOffset(offset, 150)
+      self.assertEqual(data, self._expected_data[offset:offset + 150])
+
+    # Read sequentially to continue from the state of the previous read.
+    member.FlushCache()
+    data = b''.join([
+        member.ReadAtOffset(offset, 10) for offset in range(0, 1247, 10)])
+    self.assertEqual(data, self._expected_data)
+
+    self.assertEqual(member.ReadAtOffset(1247, 10), b'')
+    self.assertEqual(member.ReadAtOffset(0, 0), b'')
+
+
+if __name__ == '__main__':
+  unittest.main()
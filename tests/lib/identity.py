@@ -0,0 +1,50 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Tests for the identity helper functions."""
+
+import unittest
+
+from dfvfs.lib import definitions
+from dfvfs.lib import identity
+from dfvfs.path import os_path_spec
+from dfvfs.resolver import context
+from dfvfs.resolver import resolver
+
+from tests import test_lib as shared_test_lib
+
+
+@shared_test_lib.skipUnlessHasTestFile([u'syslog.tar'])
+class GetIdentifierTest(shared_test_lib.BaseTestCase):
+  """The unit test for the get identifier function."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._resolver_context = context.Context()
+
+    test_file = self._GetTestFilePath([u'syslog.tar'])
+    self._os_path_spec = os_path_spec.OSPathSpec(location=test_file)
+    self._file_object = resolver.Resolver.OpenFileObject(
+        self._os_path_spec, resolver_context=self._resolver_context)
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    self._file_object.close()
+
+  def testGetIdentifier(self):
+    """Tests the GetIdentifier function."""
+    identifier = identity.GetIdentifier(
+        definitions.TYPE_INDICATOR_TAR, self._os_path_spec, self._file_object)
+    self.assertEqual(len(identifier), 64)
+
+    other_identifier = identity.GetIdentifier(
+        definitions.TYPE_INDICATOR_TAR, self._os_path_spec, self._file_object)
+    self.assertEqual(identifier, other_identifier)
+
+    other_identifier = identity.GetIdentifier(
+        definitions.TYPE_INDICATOR_CPIO, self._os_path_spec,
+        self._file_object)
+    self.assertNotEqual(identifier, other_identifier)
+
+
+if __name__ == '__main__':
+  unittest.main()
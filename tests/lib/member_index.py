@@ -0,0 +1,85 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Tests for the on-disk member index of archive files."""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from dfvfs.lib import definitions
+from dfvfs.lib import member_index
+from dfvfs.path import os_path_spec
+from dfvfs.resolver import context
+from dfvfs.resolver import resolver
+
+from tests import test_lib as shared_test_lib
+
+
+@shared_test_lib.skipUnlessHasTestFile([u'syslog.tar'])
+class MemberIndexTest(shared_test_lib.BaseTestCase):
+  """The unit test for the member index object."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._resolver_context = context.Context()
+    self._temp_directory = tempfile.mkdtemp()
+
+    test_file = self._GetTestFilePath([u'syslog.tar'])
+    self._os_path_spec = os_path_spec.OSPathSpec(location=test_file)
+    self._file_object = resolver.Resolver.OpenFileObject(
+        self._os_path_spec, resolver_context=self._resolver_context)
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    self._file_object.close()
+    shutil.rmtree(self._temp_directory, True)
+
+  def testGetIdentifier(self):
+    """Tests the GetIdentifier function."""
+    index = member_index.MemberIndex(self._temp_directory)
+
+    identifier = index.GetIdentifier(
+        definitions.TYPE_INDICATOR_TAR, self._os_path_spec, self._file_object)
+    self.assertEqual(len(identifier), 64)
+
+    other_identifier = index.GetIdentifier(
+        definitions.TYPE_INDICATOR_TAR, self._os_path_spec, self._file_object)
+    self.assertEqual(identifier, other_identifier)
+
+    other_identifier = index.GetIdentifier(
+        definitions.TYPE_INDICATOR_CPIO, self._os_path_spec,
+        self._file_object)
+    self.assertNotEqual(identifier, other_identifier)
+
+  def testReadAndWriteMembers(self):
+    """Tests the ReadMembers and WriteMembers functions."""
+    index_path = os.path.join(self._temp_directory, u'index')
+    index = member_index.MemberIndex(index_path)
+
+    identifier = index.GetIdentifier(
+        definitions.TYPE_INDICATOR_TAR, self._os_path_spec, self._file_object)
+
+    members = index.ReadMembers(identifier)
+    self.assertIsNone(members)
+
+    expected_members = [{u'offset': 512, u'path': u'syslog', u'size': 1247}]
+    index.WriteMembers(identifier, expected_members)
+
+    members = index.ReadMembers(identifier)
+    self.assertEqual(members, expected_members)
+
+    self.assertEqual(os.listdir(index_path), [
+        u'{0:s}.json'.format(identifier)])
+
+    index_file_path = os.path.join(
+        index_path, u'{0:s}.json'.format(identifier))
+    with open(index_file_path, 'wb') as file_object:
+      file_object.write(b'{"version": 1, "members": [')
+
+    members = index.ReadMembers(identifier)
+    self.assertIsNone(members)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,177 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Tests for the on-disk snapshot index of file system metadata."""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from dfvfs.lib import definitions
+from dfvfs.lib import snapshot_index
+from dfvfs.path import os_path_spec
+from dfvfs.resolver import context
+from dfvfs.resolver import resolver
+
+from tests import test_lib as shared_test_lib
+
+
+class SnapshotRecordTest(shared_test_lib.BaseTestCase):
+  """The unit test for the snapshot record object."""
+
+  def testGetRowAndFromRow(self):
+    """Tests the GetRow and FromRow functions."""
+    record = snapshot_index.SnapshotRecord(
+        u'/a_directory/a_file', u'a_file', file_entry_type=3, identifier=5,
+        inode=14, is_allocated=False, modification_time=1337961563,
+        parent_identifier=3, size=53)
+
+    row = record.GetRow()
+    self.assertEqual(len(row), 15)
+
+    record = snapshot_index.SnapshotRecord.FromRow(row)
+    self.assertEqual(record.identifier, 5)
+    self.assertEqual(record.location, u'/a_directory/a_file')
+    self.assertEqual(record.name, u'a_file')
+    self.assertEqual(record.inode, 14)
+    self.assertFalse(record.is_allocated)
+    self.assertEqual(record.modification_time, 1337961563)
+    self.assertEqual(record.parent_identifier, 3)
+    self.assertEqual(record.size, 53)
+    self.assertIsNone(record.access_time)
+
+
+@shared_test_lib.skipUnlessHasTestFile([u'ímynd.dd'])
+class SnapshotIndexTest(shared_test_lib.BaseTestCase):
+  """The unit test for the snapshot index object."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._resolver_context = context.Context()
+    self._temp_directory = tempfile.mkdtemp()
+
+    test_file = self._GetTestFilePath([u'ímynd.dd'])
+    self._os_path_spec = os_path_spec.OSPathSpec(location=test_file)
+    self._file_object = resolver.Resolver.OpenFileObject(
+        self._os_path_spec, resolver_context=self._resolver_context)
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    self._file_object.close()
+    shutil.rmtree(self._temp_directory, True)
+
+  def _WriteSnapshot(self, index, identifier):
+    """Writes a test snapshot.
+
+    Args:
+      index (SnapshotIndex): snapshot index.
+      identifier (str): identifier of the file system.
+    """
+    snapshot_writer = index.CreateSnapshot(
+        identifier, definitions.TYPE_INDICATOR_TSK, u'/')
+
+    root_record = snapshot_index.SnapshotRecord(
+        u'/', u'', file_entry_type=definitions.FILE_ENTRY_TYPE_DIRECTORY,
+        inode=2)
+    snapshot_writer.WriteRecord(
+        root_record, timestamp_format=definitions.TIMESTAMP_FORMAT_POSIX_TIME)
+
+    record = snapshot_index.SnapshotRecord(
+        u'/a_file', u'a_file', file_entry_type=definitions.FILE_ENTRY_TYPE_FILE,
+        inode=14, modification_time=1337961563,
+        parent_identifier=root_record.identifier, size=53)
+    snapshot_writer.WriteRecord(
+        record, timestamp_format=definitions.TIMESTAMP_FORMAT_POSIX_TIME)
+
+    record = snapshot_index.SnapshotRecord(
+        u'/a_link', u'a_link', file_entry_type=definitions.FILE_ENTRY_TYPE_LINK,
+        inode=13, modification_time=130305261095023783,
+        parent_identifier=root_record.identifier)
+    snapshot_writer.WriteRecord(
+        record, timestamp_format=definitions.TIMESTAMP_FORMAT_FILETIME)
+
+    snapshot_writer.Close()
+
+  def testGetIdentifier(self):
+    """Tests the GetIdentifier function."""
+    index = snapshot_index.SnapshotIndex(self._temp_directory)
+
+    identifier = index.GetIdentifier(
+        definitions.TYPE_INDICATOR_TSK, self._os_path_spec, self._file_object)
+    self.assertEqual(len(identifier), 64)
+
+    other_identifier = index.GetIdentifier(
+        definitions.TYPE_INDICATOR_TSK, self._os_path_spec, self._file_object)
+    self.assertEqual(identifier, other_identifier)
+
+    other_identifier = index.GetIdentifier(
+        definitions.TYPE_INDICATOR_NTFS, self._os_path_spec,
+        self._file_object)
+    self.assertNotEqual(identifier, other_identifier)
+
+  def testCreateAndOpenSnapshot(self):
+    """Tests the CreateSnapshot and OpenSnapshot functions."""
+    index_path = os.path.join(self._temp_directory, u'index')
+    index = snapshot_index.SnapshotIndex(index_path)
+
+    identifier = index.GetIdentifier(
+        definitions.TYPE_INDICATOR_TSK, self._os_path_spec, self._file_object)
+
+    self.assertFalse(index.HasSnapshot(identifier))
+    self.assertIsNone(index.OpenSnapshot(identifier))
+
+    self._WriteSnapshot(index, identifier)
+
+    self.assertTrue(index.HasSnapshot(identifier))
+    self.assertEqual(os.listdir(index_path), [
+        u'{0:s}.sqlite'.format(identifier)])
+
+    snapshot = index.OpenSnapshot(identifier)
+    self.assertIsNotNone(snapshot)
+
+    try:
+      self.assertEqual(snapshot.path_separator, u'/')
+      self.assertEqual(
+          snapshot.timestamp_format, definitions.TIMESTAMP_FORMAT_POSIX_TIME)
+      self.assertEqual(snapshot.type_indicator, definitions.TYPE_INDICATOR_TSK)
+
+      root_record = snapshot.GetRecordByLocation(u'/')
+      self.assertIsNotNone(root_record)
+      self.assertIsNone(root_record.parent_identifier)
+
+      record = snapshot.GetRecordByInode(14)
+      self.assertIsNotNone(record)
+      self.assertEqual(record.location, u'/a_file')
+      self.assertEqual(record.modification_time, 1337961563)
+      self.assertEqual(record.parent_identifier, root_record.identifier)
+      self.assertEqual(record.size, 53)
+
+      record = snapshot.GetRecordByIdentifier(record.identifier)
+      self.assertIsNotNone(record)
+      self.assertEqual(record.name, u'a_file')
+
+      # The timestamps of a record in another format are not stored.
+      record = snapshot.GetRecordByLocation(u'/a_link')
+      self.assertIsNotNone(record)
+      self.assertIsNone(record.modification_time)
+
+      records = snapshot.GetSubRecords(root_record.identifier)
+      self.assertEqual(
+          [record.name for record in records], [u'a_file', u'a_link'])
+
+      self.assertIsNone(snapshot.GetRecordByLocation(u'/bogus'))
+      self.assertIsNone(snapshot.GetRecordByInode(99))
+
+    finally:
+      snapshot.Close()
+
+    snapshot_path = os.path.join(
+        index_path, u'{0:s}.sqlite'.format(identifier))
+    with open(snapshot_path, 'wb') as file_object:
+      file_object.write(b'SQLite format 3\x00')
+
+    self.assertIsNone(index.OpenSnapshot(identifier))
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,96 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Tests for the SQLite database support helper functions."""
+
+import os
+import unittest
+
+from dfvfs.lib import sqlite_database
+from dfvfs.path import os_path_spec
+from dfvfs.resolver import context
+from dfvfs.resolver import resolver
+
+from tests import test_lib as shared_test_lib
+
+
+@shared_test_lib.skipUnlessHasTestFile([u'syslog.db'])
+class SQLiteDatabaseFileTest(shared_test_lib.BaseTestCase):
+  """The unit test for the SQLite database file object."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._resolver_context = context.Context()
+    test_file = self._GetTestFilePath([u'syslog.db'])
+    path_spec = os_path_spec.OSPathSpec(location=test_file)
+    self._file_object = resolver.Resolver.OpenFileObject(
+        path_spec, resolver_context=self._resolver_context)
+
+    self._database_object = sqlite_database.SQLiteDatabaseFile()
+    self._database_object.Open(self._file_object)
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    self._database_object.Close()
+    self._file_object.close()
+
+  def testClose(self):
+    """Test the close functionality."""
+    database_object = sqlite_database.SQLiteDatabaseFile()
+    database_object.Open(self._file_object)
+
+    # pylint: disable=protected-access
+    temp_file_path = database_object._temp_file_path
+    self.assertTrue(os.path.exists(temp_file_path))
+
+    database_object.Close()
+    self.assertFalse(os.path.exists(temp_file_path))
+
+    with self.assertRaises(IOError):
+      database_object.HasTable(u'blobs')
+
+  def testHasColumn(self):
+    """Test the has column functionality."""
+    self.assertTrue(self._database_object.HasColumn(u'blobs', u'blob'))
+    self.assertFalse(self._database_object.HasColumn(u'blobs', u'bogus'))
+
+  def testHasRowIdentifier(self):
+    """Test the has row identifier functionality."""
+    self.assertTrue(self._database_object.HasRowIdentifier(u'blobs'))
+    self.assertFalse(self._database_object.HasRowIdentifier(u'bogus'))
+
+  def testHasTable(self):
+    """Test the has table functionality."""
+    self.assertTrue(self._database_object.HasTable(u'blobs'))
+    self.assertFalse(self._database_object.HasTable(u'bogus'))
+
+  def testOpenBlob(self):
+    """Test the open blob functionality."""
+    if not self._database_object.SupportsIncrementalBlobIO():
+      blob = self._database_object.OpenBlob(u'blobs', u'blob', 1)
+      self.assertIsNone(blob)
+      return
+
+    rows = self._database_object.Query(
+        u'SELECT _ROWID_, blob FROM blobs WHERE identifier = ?',
+        parameters=(u'myblob', ))
+    row_identifier, expected_data = rows[0]
+
+    blob = self._database_object.OpenBlob(u'blobs', u'blob', row_identifier)
+    self.assertIsNotNone(blob)
+    self.assertEqual(len(blob), len(expected_data))
+
+    blob.seek(100)
+    self.assertEqual(blob.read(50), expected_data[100:150])
+    blob.close()
+
+    blob = self._database_object.OpenBlob(u'blobs', u'bogus', row_identifier)
+    self.assertIsNone(blob)
+
+  def testQuery(self):
+    """Test the query functionality."""
+    rows = self._database_object.Query(u'SELECT identifier FROM blobs')
+    self.assertEqual(len(rows), self._database_object.GetNumberOfRows(u'blobs'))
+
+
+if __name__ == '__main__':
+  unittest.main()
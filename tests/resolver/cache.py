@@ -118,6 +118,18 @@ class ObjectsCacheTest(unittest.TestCase):
     cached_object = cache_object.GetObject(self._path_spec.comparable)
     self.assertEqual(cached_object, self._vfs_object)
 
+  def testGetObjects(self):
+    """Tests the GetObjects method."""
+    cache_object = cache.ObjectsCache(1)
+    self.assertIsNotNone(cache_object)
+
+    self.assertEqual(cache_object.GetObjects(), [])
+
+    cache_object.CacheObject(self._path_spec.comparable, self._vfs_object)
+
+    cached_objects = cache_object.GetObjects()
+    self.assertEqual(cached_objects, [self._vfs_object])
+
   def testGetCacheValueByObjectGetCacheValueByObject(self):
     """Tests the GetCacheValueByObject method."""
     cache_object = cache.ObjectsCache(1)
@@ -5,6 +5,7 @@
 import unittest
 
 from dfvfs.resolver import compressed_stream_resolver_helper
+from dfvfs.resolver import context
 
 from tests.resolver import test_lib
 
@@ -18,6 +19,16 @@ class CompressedStreamResolverHelperTest(test_lib.ResolverHelperTestCase):
         compressed_stream_resolver_helper.CompressedStreamResolverHelper())
     self._TestNewFileObject(resolver_helper_object)
 
+  def testNewFileObjectWithNumberOfThreads(self):
+    """Tests the NewFileObject function with a number of threads."""
+    resolver_context = context.Context(compressed_stream_number_of_threads=4)
+    resolver_helper_object = (
+        compressed_stream_resolver_helper.CompressedStreamResolverHelper())
+    file_object = resolver_helper_object.NewFileObject(resolver_context)
+
+    # pylint: disable=protected-access
+    self.assertEqual(file_object._number_of_threads, 4)
+
   def testNewFileSystem(self):
     """Tests the NewFileSystem function."""
     resolver_helper_object = (
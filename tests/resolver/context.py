@@ -5,14 +5,47 @@
 import unittest
 
 from dfvfs.file_io import fake_file_io
+from dfvfs.lib import sqlite_database
 from dfvfs.path import fake_path_spec
+from dfvfs.path import os_path_spec
 from dfvfs.resolver import context
+from dfvfs.resolver import resolver
 from dfvfs.vfs import fake_file_system
 
+from tests import test_lib as shared_test_lib
+
 
 class ContextTest(unittest.TestCase):
   """Tests for the resolver context object."""
 
+  def testCacheDatabase(self):
+    """Tests the cache database object functionality."""
+    resolver_context = context.Context()
+
+    # pylint: disable=protected-access
+    self.assertEqual(len(resolver_context._database_cache._values), 0)
+
+    path_spec = fake_path_spec.FakePathSpec(location=u'/database.db')
+    database_object = sqlite_database.SQLiteDatabaseFile()
+
+    resolver_context.CacheDatabase(path_spec, database_object)
+    self.assertEqual(len(resolver_context._database_cache._values), 1)
+
+    cached_object = resolver_context.GetDatabase(path_spec)
+    self.assertEqual(cached_object, database_object)
+
+    resolver_context.GrabDatabase(path_spec)
+    resolver_context.GrabDatabase(path_spec)
+    self.assertEqual(resolver_context.GetDatabaseReferenceCount(path_spec), 2)
+
+    result = resolver_context.ReleaseDatabase(database_object)
+    self.assertFalse(result)
+    self.assertEqual(len(resolver_context._database_cache._values), 1)
+
+    result = resolver_context.ReleaseDatabase(database_object)
+    self.assertTrue(result)
+    self.assertEqual(len(resolver_context._database_cache._values), 0)
+
   def testCacheFileObject(self):
     """Tests the cache file-like object functionality."""
     resolver_context = context.Context()
@@ -70,5 +103,36 @@ class ContextTest(unittest.TestCase):
     self.assertEqual(len(resolver_context._file_system_cache._values), 0)
 
 
+@shared_test_lib.skipUnlessHasTestFile([u'syslog.db'])
+class ContextWithDatabaseTest(shared_test_lib.BaseTestCase):
+  """Tests for the resolver context object with a cached database."""
+
+  def testEmpty(self):
+    """Tests the Empty function."""
+    resolver_context = context.Context()
+
+    test_file = self._GetTestFilePath([u'syslog.db'])
+    path_spec = os_path_spec.OSPathSpec(location=test_file)
+    file_object = resolver.Resolver.OpenFileObject(
+        path_spec, resolver_context=resolver_context)
+
+    database_object = sqlite_database.SQLiteDatabaseFile()
+    try:
+      database_object.Open(file_object)
+    finally:
+      file_object.close()
+
+    resolver_context.CacheDatabase(path_spec, database_object)
+    resolver_context.GrabDatabase(path_spec)
+
+    # pylint: disable=protected-access
+    self.assertIsNotNone(database_object._connection)
+
+    resolver_context.Empty()
+
+    self.assertEqual(len(resolver_context._database_cache._values), 0)
+    self.assertIsNone(database_object._connection)
+
+
 if __name__ == '__main__':
   unittest.main()
@@ -2,8 +2,12 @@
 # -*- coding: utf-8 -*-
 """Tests for the file system implementation using the CPIOArchiveFile."""
 
+import os
+import shutil
+import tempfile
 import unittest
 
+from dfvfs.lib import member_index
 from dfvfs.path import cpio_path_spec
 from dfvfs.path import os_path_spec
 from dfvfs.resolver import context
@@ -33,6 +37,60 @@ class CPIOFileSystemTest(shared_test_lib.BaseTestCase):
 
     file_system.Close()
 
+  def testOpenWithMemberIndex(self):
+    """Test the open functionality with a member index."""
+    temp_directory = tempfile.mkdtemp()
+    try:
+      resolver_context = context.Context(member_index_path=temp_directory)
+
+      file_system = cpio_file_system.CPIOFileSystem(resolver_context)
+      file_system.Open(self._cpio_path_spec)
+      file_system.Close()
+
+      index_file_names = os.listdir(temp_directory)
+      self.assertEqual(len(index_file_names), 1)
+
+      # Rename the member in the member index, which shows that the members
+      # are read from the member index instead of the CPIO archive file.
+      index = member_index.MemberIndex(temp_directory)
+      identifier, _, _ = index_file_names[0].rpartition(u'.')
+
+      members = index.ReadMembers(identifier)
+      self.assertIsNotNone(members)
+
+      for member_values in members:
+        if member_values[u'path'] == u'syslog':
+          member_values[u'path'] = u'indexed_syslog'
+
+      index.WriteMembers(identifier, members)
+
+      # Open the file system a second time to read the members from
+      # the member index.
+      file_system = cpio_file_system.CPIOFileSystem(resolver_context)
+      file_system.Open(self._cpio_path_spec)
+
+      path_spec = cpio_path_spec.CPIOPathSpec(
+          location=u'/syslog', parent=self._os_path_spec)
+      self.assertFalse(file_system.FileEntryExistsByPathSpec(path_spec))
+
+      path_spec = cpio_path_spec.CPIOPathSpec(
+          location=u'/indexed_syslog', parent=self._os_path_spec)
+      file_entry = file_system.GetFileEntryByPathSpec(path_spec)
+      self.assertIsNotNone(file_entry)
+
+      stat_object = file_entry.GetStat()
+      self.assertEqual(stat_object.size, 1247)
+
+      file_object = file_entry.GetFileObject()
+      self.assertEqual(file_object.get_size(), 1247)
+      self.assertEqual(file_object.read(5), b'Jan 2')
+      file_object.close()
+
+      file_system.Close()
+
+    finally:
+      shutil.rmtree(temp_directory, True)
+
   def testFileEntryExistsByPathSpec(self):
     """Test the file entry exists by path specification functionality."""
     file_system = cpio_file_system.CPIOFileSystem(self._resolver_context)
@@ -50,6 +108,41 @@ class CPIOFileSystemTest(shared_test_lib.BaseTestCase):
 
     file_system.Close()
 
+  @shared_test_lib.skipUnlessHasTestFile([u'missing_directory_entries.cpio'])
+  def testFileEntryExistsByPathSpecWithMissingDirectoryEntries(self):
+    """Test the file entry exists functionality with missing directories."""
+    test_file = self._GetTestFilePath([u'missing_directory_entries.cpio'])
+    test_file_path_spec = os_path_spec.OSPathSpec(location=test_file)
+    path_spec = cpio_path_spec.CPIOPathSpec(
+        location=u'/', parent=test_file_path_spec)
+
+    file_system = cpio_file_system.CPIOFileSystem(self._resolver_context)
+    self.assertIsNotNone(file_system)
+    file_system.Open(path_spec)
+
+    path_spec = cpio_path_spec.CPIOPathSpec(
+        location=u'/folder', parent=test_file_path_spec)
+    self.assertTrue(file_system.FileEntryExistsByPathSpec(path_spec))
+
+    path_spec = cpio_path_spec.CPIOPathSpec(
+        location=u'/folder/subfolder', parent=test_file_path_spec)
+    self.assertTrue(file_system.FileEntryExistsByPathSpec(path_spec))
+
+    path_spec = cpio_path_spec.CPIOPathSpec(
+        location=u'/folder/test_file.txt', parent=test_file_path_spec)
+    self.assertTrue(file_system.FileEntryExistsByPathSpec(path_spec))
+
+    # A prefix of the path of a member is not a virtual directory.
+    path_spec = cpio_path_spec.CPIOPathSpec(
+        location=u'/fold', parent=test_file_path_spec)
+    self.assertFalse(file_system.FileEntryExistsByPathSpec(path_spec))
+
+    path_spec = cpio_path_spec.CPIOPathSpec(
+        location=u'/folder/sub', parent=test_file_path_spec)
+    self.assertFalse(file_system.FileEntryExistsByPathSpec(path_spec))
+
+    file_system.Close()
+
   def testGetFileEntryByPathSpec(self):
     """Tests the GetFileEntryByPathSpec function."""
     file_system = cpio_file_system.CPIOFileSystem(self._resolver_context)
@@ -72,6 +165,49 @@ class CPIOFileSystemTest(shared_test_lib.BaseTestCase):
 
     file_system.Close()
 
+  @shared_test_lib.skipUnlessHasTestFile([u'missing_directory_entries.cpio'])
+  def testGetFileEntryByPathSpecWithMissingDirectoryEntries(self):
+    """Tests the GetFileEntryByPathSpec function with missing directories."""
+    test_file = self._GetTestFilePath([u'missing_directory_entries.cpio'])
+    test_file_path_spec = os_path_spec.OSPathSpec(location=test_file)
+    path_spec = cpio_path_spec.CPIOPathSpec(
+        location=u'/', parent=test_file_path_spec)
+
+    file_system = cpio_file_system.CPIOFileSystem(self._resolver_context)
+    self.assertIsNotNone(file_system)
+    file_system.Open(path_spec)
+
+    path_spec = cpio_path_spec.CPIOPathSpec(
+        location=u'/folder', parent=test_file_path_spec)
+    file_entry = file_system.GetFileEntryByPathSpec(path_spec)
+    self.assertIsNotNone(file_entry)
+    self.assertTrue(file_entry.IsVirtual())
+    self.assertTrue(file_entry.IsDirectory())
+    self.assertEqual(file_entry.name, u'folder')
+
+    sub_file_entry_names = sorted([
+        sub_file_entry.name for sub_file_entry in file_entry.sub_file_entries])
+    self.assertEqual(sub_file_entry_names, [u'subfolder', u'test_file.txt'])
+
+    path_spec = cpio_path_spec.CPIOPathSpec(
+        location=u'/folder/subfolder/another_file.txt',
+        parent=test_file_path_spec)
+    file_entry = file_system.GetFileEntryByPathSpec(path_spec)
+    self.assertIsNotNone(file_entry)
+    self.assertFalse(file_entry.IsVirtual())
+    self.assertEqual(file_entry.name, u'another_file.txt')
+
+    parent_file_entry = file_entry.GetParentFileEntry()
+    self.assertIsNotNone(parent_file_entry)
+    self.assertEqual(parent_file_entry.name, u'subfolder')
+
+    path_spec = cpio_path_spec.CPIOPathSpec(
+        location=u'/fold', parent=test_file_path_spec)
+    file_entry = file_system.GetFileEntryByPathSpec(path_spec)
+    self.assertIsNone(file_entry)
+
+    file_system.Close()
+
   def testGetRootFileEntry(self):
     """Test the get root file entry functionality."""
     file_system = cpio_file_system.CPIOFileSystem(self._resolver_context)
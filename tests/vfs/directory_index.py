@@ -0,0 +1,80 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Tests for the directory index."""
+
+import unittest
+
+from dfvfs.vfs import directory_index
+
+from tests import test_lib as shared_test_lib
+
+
+class DirectoryIndexTest(shared_test_lib.BaseTestCase):
+  """Tests for the directory index."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._directory_index = directory_index.DirectoryIndex()
+    self._directory_index.AddPath(u'a_directory/a_file')
+    self._directory_index.AddPath(u'a_directory/another_file')
+    self._directory_index.AddPath(u'a_directory/', is_directory=True)
+    self._directory_index.AddPath(u'other_directory/sub_directory/a_file')
+    self._directory_index.AddPath(u'syslog')
+
+  def testAddPath(self):
+    """Tests the AddPath function."""
+    self._directory_index.AddPath(u'syslog')
+    self._directory_index.AddPath(u'/a_directory//a_file')
+
+    children = self._directory_index.GetChildren(u'')
+    self.assertEqual(
+        children, [u'a_directory', u'other_directory', u'syslog'])
+
+    children = self._directory_index.GetChildren(u'a_directory')
+    self.assertEqual(
+        children, [u'a_directory/a_file', u'a_directory/another_file'])
+
+  def testGetChildren(self):
+    """Tests the GetChildren function."""
+    children = self._directory_index.GetChildren(u'/')
+    self.assertEqual(
+        children, [u'a_directory', u'other_directory', u'syslog'])
+
+    children = self._directory_index.GetChildren(u'other_directory/')
+    self.assertEqual(children, [u'other_directory/sub_directory'])
+
+    children = self._directory_index.GetChildren(u'syslog')
+    self.assertEqual(children, [])
+
+    children = self._directory_index.GetChildren(u'bogus')
+    self.assertEqual(children, [])
+
+  def testHasPath(self):
+    """Tests the HasPath function."""
+    self.assertTrue(self._directory_index.HasPath(u''))
+    self.assertTrue(self._directory_index.HasPath(u'a_directory/a_file'))
+    self.assertTrue(self._directory_index.HasPath(u'other_directory'))
+    self.assertFalse(self._directory_index.HasPath(u'a_dir'))
+    self.assertFalse(self._directory_index.HasPath(u'bogus'))
+
+  def testIsDirectory(self):
+    """Tests the IsDirectory function."""
+    self.assertTrue(self._directory_index.IsDirectory(u''))
+    self.assertTrue(self._directory_index.IsDirectory(u'a_directory'))
+    self.assertTrue(self._directory_index.IsDirectory(u'other_directory'))
+    self.assertFalse(self._directory_index.IsDirectory(u'syslog'))
+    self.assertFalse(self._directory_index.IsDirectory(u'bogus'))
+
+  def testIsVirtualDirectory(self):
+    """Tests the IsVirtualDirectory function."""
+    self.assertTrue(self._directory_index.IsVirtualDirectory(u''))
+    self.assertFalse(self._directory_index.IsVirtualDirectory(u'a_directory'))
+    self.assertTrue(
+        self._directory_index.IsVirtualDirectory(u'other_directory'))
+    self.assertTrue(self._directory_index.IsVirtualDirectory(
+        u'other_directory/sub_directory'))
+    self.assertFalse(self._directory_index.IsVirtualDirectory(u'syslog'))
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -4,6 +4,7 @@
 
 import unittest
 
+from dfvfs.lib import definitions
 from dfvfs.path import fake_path_spec
 from dfvfs.resolver import context
 from dfvfs.vfs import fake_file_system
@@ -53,6 +54,46 @@ class DirectoryTest(shared_test_lib.BaseTestCase):
     file_system.Close()
 
 
+class TimestampsTest(shared_test_lib.BaseTestCase):
+  """Tests the VFS raw timestamps."""
+
+  def testGetDateTimeValues(self):
+    """Test the GetDateTimeValues function."""
+    timestamps = file_entry.Timestamps(
+        definitions.TIMESTAMP_FORMAT_FILETIME,
+        modification_time=0x01cb3a623d0a17ce)
+
+    date_time_values = timestamps.GetDateTimeValues(u'modification_time')
+    self.assertIsNotNone(date_time_values)
+    self.assertEqual(date_time_values.timestamp, 0x01cb3a623d0a17ce)
+
+    date_time_values = timestamps.GetDateTimeValues(u'access_time')
+    self.assertIsNone(date_time_values)
+
+    timestamps = file_entry.Timestamps(
+        definitions.TIMESTAMP_FORMAT_POSIX_TIME, access_time=1337961563)
+
+    date_time_values = timestamps.GetDateTimeValues(u'access_time')
+    self.assertIsNotNone(date_time_values)
+    self.assertEqual(date_time_values.timestamp, 1337961563)
+
+    timestamps = file_entry.Timestamps(
+        definitions.TIMESTAMP_FORMAT_POSIX_TIME_IN_NANOSECONDS,
+        change_time=1386052509517978300)
+
+    date_time_values = timestamps.GetDateTimeValues(u'change_time')
+    self.assertIsNotNone(date_time_values)
+    self.assertEqual(date_time_values.timestamp, 1386052509517978)
+
+    with self.assertRaises(ValueError):
+      timestamps.GetDateTimeValues(u'bogus')
+
+    timestamps = file_entry.Timestamps(u'bogus', creation_time=1)
+
+    with self.assertRaises(ValueError):
+      timestamps.GetDateTimeValues(u'creation_time')
+
+
 class FileEntryTest(shared_test_lib.BaseTestCase):
   """Tests the VFS file entry interface."""
 
@@ -123,6 +164,13 @@ class FileEntryTest(shared_test_lib.BaseTestCase):
   # TODO: add tests for GetParentFileEntry function.
   # TODO: add tests for GetSubFileEntryByName function.
   # TODO: add tests for GetStat function.
+
+  def testGetTimestamps(self):
+    """Test the GetTimestamps function."""
+    test_file_entry = file_entry.FileEntry(
+        self._resolver_context, self._file_system, self._path_spec)
+    self.assertIsNone(test_file_entry.GetTimestamps())
+
   # TODO: add tests for HasDataStream function.
   # TODO: add tests for HasExternalData function.
   # TODO: add tests for IsAllocated function.
@@ -4,7 +4,11 @@
 
 import unittest
 
+from dfvfs.lib import definitions
+from dfvfs.path import fake_path_spec
 from dfvfs.resolver import context
+from dfvfs.vfs import fake_file_system
+from dfvfs.vfs import file_entry
 from dfvfs.vfs import file_system
 
 from tests import test_lib as shared_test_lib
@@ -23,6 +27,48 @@ class FileSystemTest(shared_test_lib.BaseTestCase):
 
     self.assertIsNotNone(test_file_system)
 
+  def testCacheDirectoryListing(self):
+    """Tests the CacheDirectoryListing and GetCachedDirectoryListing functions.
+    """
+    test_file_system = file_system.FileSystem(self._resolver_context)
+    self.assertFalse(test_file_system.HasDirectoryListingCache())
+
+    # pylint: disable=protected-access
+    test_file_system._ESTIMATED_DIRECTORY_ENTRY_SIZE = 10
+    test_file_system._MAXIMUM_SIZE_OF_CACHED_DIRECTORY_LISTINGS = 50
+    self.assertTrue(test_file_system.HasDirectoryListingCache())
+
+    path_spec = fake_path_spec.FakePathSpec(location=u'/a')
+    directory_entries = [
+        file_entry.DirectoryEntry(path_spec, u'a'),
+        file_entry.DirectoryEntry(path_spec, u'b')]
+
+    test_file_system.CacheDirectoryListing(u'/1', directory_entries)
+    test_file_system.CacheDirectoryListing(u'/2', directory_entries)
+
+    directory_listing = test_file_system.GetCachedDirectoryListing(u'/1')
+    self.assertEqual(directory_listing, directory_entries)
+
+    # Caching a third directory listing discards the least recently used one.
+    test_file_system.CacheDirectoryListing(u'/3', directory_entries)
+
+    directory_listing = test_file_system.GetCachedDirectoryListing(u'/2')
+    self.assertIsNone(directory_listing)
+
+    directory_listing = test_file_system.GetCachedDirectoryListing(u'/1')
+    self.assertIsNotNone(directory_listing)
+
+    # A directory listing larger than the cache is not cached.
+    directory_entries = [
+        file_entry.DirectoryEntry(path_spec, name) for name in u'abcde']
+    test_file_system.CacheDirectoryListing(u'/4', directory_entries)
+
+    directory_listing = test_file_system.GetCachedDirectoryListing(u'/4')
+    self.assertIsNone(directory_listing)
+
+    directory_listing = test_file_system.GetCachedDirectoryListing(u'/3')
+    self.assertIsNotNone(directory_listing)
+
   # TODO: add tests for type_indicator property.
   # TODO: add tests for _Close function.
   # TODO: add tests for _Open function.
@@ -33,6 +79,46 @@ class FileSystemTest(shared_test_lib.BaseTestCase):
   # TODO: add tests for GetFileObjectByPathSpec function.
   # TODO: add tests for GetPathSegmentAndSuffix function.
 
+  def testGetNameIndex(self):
+    """Tests the GetNameIndex function."""
+    test_file_system = fake_file_system.FakeFileSystem(self._resolver_context)
+    test_file_system.AddFileEntry(
+        u'/Windows', file_entry_type=definitions.FILE_ENTRY_TYPE_DIRECTORY)
+    test_file_system.AddFileEntry(
+        u'/Windows/System32',
+        file_entry_type=definitions.FILE_ENTRY_TYPE_DIRECTORY)
+    test_file_system.AddFileEntry(u'/Windows/system.ini')
+
+    path_spec = fake_path_spec.FakePathSpec(location=u'/Windows')
+    file_entry = test_file_system.GetFileEntryByPathSpec(path_spec)
+    self.assertIsNotNone(file_entry)
+
+    directory = file_entry._GetDirectory()  # pylint: disable=protected-access
+    name_index = test_file_system.GetNameIndex(directory)
+    self.assertIsNotNone(name_index)
+
+    path_specs_per_name, path_specs_per_lower_case_name = name_index
+    self.assertEqual(
+        sorted(path_specs_per_name.keys()), [u'System32', u'system.ini'])
+    self.assertEqual(
+        sorted(path_specs_per_lower_case_name.keys()),
+        [u'system.ini', u'system32'])
+    self.assertEqual(
+        path_specs_per_lower_case_name[u'system32'].location,
+        u'/Windows/System32')
+
+    # Test if the name index is cached.
+    cached_name_index = test_file_system.GetNameIndex(directory)
+    self.assertIs(cached_name_index, name_index)
+
+    sub_file_entry = file_entry.GetSubFileEntryByName(u'system32')
+    self.assertIsNone(sub_file_entry)
+
+    sub_file_entry = file_entry.GetSubFileEntryByName(
+        u'system32', case_sensitive=False)
+    self.assertIsNotNone(sub_file_entry)
+    self.assertEqual(sub_file_entry.name, u'System32')
+
   def testJoinPath(self):
     """Test the join path functionality."""
     test_file_system = file_system.FileSystem(self._resolver_context)
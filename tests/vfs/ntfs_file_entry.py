@@ -100,6 +100,36 @@ class NTFSFileEntryTest(shared_test_lib.BaseTestCase):
     self.assertIsNotNone(file_entry)
     self.assertIsNotNone(file_entry.modification_time)
 
+  def testGetExtents(self):
+    """Tests the GetExtents function."""
+    path_spec = ntfs_path_spec.NTFSPathSpec(
+        location=u'\\$MFT', mft_entry=0, parent=self._qcow_path_spec)
+    file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+    self.assertIsNotNone(file_entry)
+
+    extents = file_entry.GetExtents()
+    self.assertEqual(len(extents), 1)
+
+    self.assertEqual(extents[0].extent_type, definitions.EXTENT_TYPE_DATA)
+    self.assertEqual(extents[0].offset, 357912576)
+    self.assertEqual(extents[0].size, 262144)
+
+    test_location = u'\\$Extend\\$RmMetadata\\$Repair'
+    path_spec = ntfs_path_spec.NTFSPathSpec(
+        location=test_location, mft_entry=28, parent=self._qcow_path_spec)
+    file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+    self.assertIsNotNone(file_entry)
+
+    extents = file_entry.GetExtents(data_stream_name=u'$Config')
+    self.assertEqual(len(extents), 1)
+
+    self.assertEqual(extents[0].extent_type, definitions.EXTENT_TYPE_RESIDENT)
+    self.assertIsNone(extents[0].offset)
+    self.assertEqual(extents[0].size, 8)
+
+    extents = file_entry.GetExtents(data_stream_name=u'bogus')
+    self.assertEqual(len(extents), 0)
+
   def testGetFileEntryByPathSpec(self):
     """Tests the GetFileEntryByPathSpec function."""
     path_spec = ntfs_path_spec.NTFSPathSpec(
@@ -128,6 +158,35 @@ class NTFSFileEntryTest(shared_test_lib.BaseTestCase):
 
     self.assertEqual(parent_file_entry.name, u'System Volume Information')
 
+  def testGetSubFileEntryByName(self):
+    """Tests the GetSubFileEntryByName function."""
+    path_spec = ntfs_path_spec.NTFSPathSpec(
+        location=u'\\', parent=self._qcow_path_spec)
+    file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+    self.assertIsNotNone(file_entry)
+
+    sub_file_entry = file_entry.GetSubFileEntryByName(
+        u'System Volume Information')
+    self.assertIsNotNone(sub_file_entry)
+    self.assertEqual(sub_file_entry.name, u'System Volume Information')
+    self.assertEqual(sub_file_entry.path_spec.mft_attribute, 2)
+    self.assertEqual(sub_file_entry.path_spec.mft_entry, 36)
+
+    sub_file_entry = file_entry.GetSubFileEntryByName(
+        u'system volume information')
+    self.assertIsNone(sub_file_entry)
+
+    sub_file_entry = file_entry.GetSubFileEntryByName(
+        u'system volume information', case_sensitive=False)
+    self.assertIsNotNone(sub_file_entry)
+    self.assertEqual(sub_file_entry.name, u'System Volume Information')
+    self.assertEqual(
+        sub_file_entry.path_spec.location, u'\\System Volume Information')
+
+    sub_file_entry = file_entry.GetSubFileEntryByName(
+        u'bogus', case_sensitive=False)
+    self.assertIsNone(sub_file_entry)
+
   def testGetStat(self):
     """Tests the GetStat function."""
     test_location = (
@@ -153,6 +212,25 @@ class NTFSFileEntryTest(shared_test_lib.BaseTestCase):
     self.assertEqual(stat_object.mtime, 1386052509)
     self.assertEqual(stat_object.mtime_nano, 5179783)
 
+  def testGetTimestamps(self):
+    """Tests the GetTimestamps function."""
+    test_location = (
+        u'\\System Volume Information\\{3808876b-c176-4e48-b7ae-04046e6cc752}')
+    path_spec = ntfs_path_spec.NTFSPathSpec(
+        location=test_location, mft_entry=38, parent=self._qcow_path_spec)
+    file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+    self.assertIsNotNone(file_entry)
+
+    timestamps = file_entry.GetTimestamps()
+
+    self.assertIsNotNone(timestamps)
+    self.assertEqual(
+        timestamps.timestamp_format, definitions.TIMESTAMP_FORMAT_FILETIME)
+    self.assertEqual(timestamps.access_time, 130305261095023783)
+    self.assertEqual(timestamps.change_time, 130305261095179783)
+    self.assertEqual(timestamps.creation_time, 130305261095023783)
+    self.assertEqual(timestamps.modification_time, 130305261095179783)
+
   def testIsAllocated(self):
     """Test the IsAllocated function."""
     test_location = (
@@ -422,6 +500,31 @@ class NTFSFileEntryTest(shared_test_lib.BaseTestCase):
     self.assertEqual(
         sorted(sub_file_entry_names), sorted(expected_sub_file_entry_names))
 
+  def testScanSubFileEntries(self):
+    """Tests the ScanSubFileEntries function."""
+    file_entry = self._file_system.GetFileEntryByPathSpec(self._ntfs_path_spec)
+    self.assertIsNotNone(file_entry)
+
+    directory_entries = {
+        directory_entry.name: directory_entry
+        for directory_entry in file_entry.ScanSubFileEntries()}
+
+    self.assertEqual(len(directory_entries), 15)
+
+    directory_entry = directory_entries[u'System Volume Information']
+    self.assertEqual(
+        directory_entry.file_entry_type, definitions.FILE_ENTRY_TYPE_DIRECTORY)
+    self.assertEqual(directory_entry.inode, 36)
+    self.assertTrue(directory_entry.is_allocated)
+
+    directory_entry = directory_entries[u'password.txt']
+    self.assertEqual(
+        directory_entry.file_entry_type, definitions.FILE_ENTRY_TYPE_FILE)
+    self.assertEqual(directory_entry.inode, 41)
+    self.assertTrue(directory_entry.is_allocated)
+    self.assertEqual(directory_entry.size, 116)
+    self.assertEqual(directory_entry.path_spec.location, u'\\password.txt')
+
   def testAttributes(self):
     """Test the attributes properties."""
     test_location = (
@@ -13,6 +13,102 @@ from dfvfs.vfs import ntfs_file_system
 from tests import test_lib as shared_test_lib
 
 
+class TestNTFSAttribute(object):
+  """Class that defines a test $FILE_NAME attribute of a NTFS file entry."""
+
+  def __init__(self, name, parent_file_reference):
+    """Initializes the attribute.
+
+    Args:
+      name (str): name.
+      parent_file_reference (int): parent file reference.
+    """
+    super(TestNTFSAttribute, self).__init__()
+    self.attribute_type = 0x00000030
+    self.name = name
+    self.name_space = 1
+    self.parent_file_reference = parent_file_reference
+
+
+class TestNTFSFileEntry(object):
+  """Class that defines a test NTFS file entry."""
+
+  def __init__(self, file_reference, is_allocated, name, parent_file_reference):
+    """Initializes the file entry.
+
+    Args:
+      file_reference (int): file reference.
+      is_allocated (bool): True if the file entry is allocated.
+      name (str): name.
+      parent_file_reference (int): parent file reference.
+    """
+    super(TestNTFSFileEntry, self).__init__()
+    self._attribute = TestNTFSAttribute(name, parent_file_reference)
+    self._is_allocated = is_allocated
+    self.file_attribute_flags = 0
+    self.file_reference = file_reference
+    self.number_of_attributes = 1
+
+  def get_attribute(self, unused_attribute_index):
+    """Retrieves an attribute.
+
+    Args:
+      attribute_index (int): index of the attribute.
+
+    Returns:
+      TestNTFSAttribute: attribute.
+    """
+    return self._attribute
+
+  def has_directory_entries_index(self):
+    """Determines if the file entry has a directory entries index.
+
+    Returns:
+      bool: False since the test file entries are not directories.
+    """
+    return False
+
+  def is_allocated(self):
+    """Determines if the file entry is allocated.
+
+    Returns:
+      bool: True if the file entry is allocated.
+    """
+    return self._is_allocated
+
+
+class TestNTFSVolume(object):
+  """Class that defines a test NTFS volume."""
+
+  def __init__(self, file_entries):
+    """Initializes the volume.
+
+    Args:
+      file_entries (dict[int, TestNTFSFileEntry]): file entries per MFT entry.
+    """
+    super(TestNTFSVolume, self).__init__()
+    self._file_entries = file_entries
+    self.number_of_file_entries = max(file_entries.keys()) + 1
+
+  def get_file_entry(self, mft_entry):
+    """Retrieves a file entry.
+
+    Args:
+      mft_entry (int): MFT entry.
+
+    Returns:
+      TestNTFSFileEntry: file entry.
+
+    Raises:
+      IOError: if the file entry is not available.
+    """
+    file_entry = self._file_entries.get(mft_entry, None)
+    if not file_entry:
+      raise IOError(u'Missing file entry: {0:d}.'.format(mft_entry))
+
+    return file_entry
+
+
 @shared_test_lib.skipUnlessHasTestFile([u'vsstest.qcow2'])
 class NTFSFileSystemTest(shared_test_lib.BaseTestCase):
   """The unit test for the NTFS file system object."""
@@ -26,6 +122,32 @@ class NTFSFileSystemTest(shared_test_lib.BaseTestCase):
     self._ntfs_path_spec = ntfs_path_spec.NTFSPathSpec(
         location=u'\\', parent=self._qcow_path_spec)
 
+  def testGetLocations(self):
+    """Test the _GetLocations function."""
+    file_system = ntfs_file_system.NTFSFileSystem(self._resolver_context)
+
+    # pylint: disable=protected-access
+
+    mft_entry_values = {
+        5: (0x0005000000000005, True, u'.', 0x0005000000000005),
+        64: (0x0001000000000040, True, u'directory', 0x0005000000000005),
+        65: (0x0001000000000041, True, u'file', 0x0001000000000040),
+        # Deleted directory, of which the sequence number was incremented.
+        66: (0x0003000000000042, False, u'deleted', 0x0005000000000005),
+        67: (0x0002000000000043, False, u'file', 0x0002000000000042),
+        # Deleted file of which the parent MFT entry was reused.
+        68: (0x0002000000000044, False, u'orphan', 0x0004000000000041)}
+
+    locations = file_system._GetLocations(mft_entry_values)
+
+    expected_locations = {
+        5: u'\\',
+        64: u'\\directory',
+        65: u'\\directory\\file',
+        66: u'\\deleted',
+        67: u'\\deleted\\file'}
+    self.assertEqual(locations, expected_locations)
+
   def testOpenAndClose(self):
     """Test the open and close functionality."""
     file_system = ntfs_file_system.NTFSFileSystem(self._resolver_context)
@@ -100,6 +222,93 @@ class NTFSFileSystemTest(shared_test_lib.BaseTestCase):
 
     file_system.Close()
 
+  def testIterateFileEntries(self):
+    """Test the iterate file entries functionality."""
+    file_system = ntfs_file_system.NTFSFileSystem(self._resolver_context)
+    self.assertIsNotNone(file_system)
+
+    file_system.Open(self._ntfs_path_spec)
+
+    file_entries = list(file_system.IterateFileEntries())
+    self.assertEqual(len(file_entries), 30)
+
+    mft_entries = [
+        file_entry.path_spec.mft_entry for file_entry in file_entries]
+    self.assertEqual(mft_entries, sorted(mft_entries))
+
+    file_entry = file_entries[5]
+    self.assertTrue(file_entry.IsRoot())
+    self.assertEqual(file_entry.path_spec.location, u'\\')
+
+    file_entry = file_entries[-1]
+    self.assertEqual(file_entry.name, u'password.txt')
+    self.assertEqual(file_entry.path_spec.location, u'\\password.txt')
+    self.assertEqual(file_entry.path_spec.mft_entry, 41)
+
+    file_entry = file_entries[22]
+    self.assertEqual(
+        file_entry.path_spec.location,
+        u'\\$Extend\\$RmMetadata\\$TxfLog\\'
+        u'$TxfLogContainer00000000000000000002')
+    self.assertEqual(file_entry.path_spec.mft_attribute, 2)
+
+    file_entries = list(file_system.IterateFileEntries(include_deleted=True))
+    self.assertEqual(len(file_entries), 30)
+
+    file_system.Close()
+
+  def testIterateFileEntriesWithDeletedFileEntries(self):
+    """Test the iterate file entries functionality with deleted entries."""
+    file_system = ntfs_file_system.NTFSFileSystem(self._resolver_context)
+    self.assertIsNotNone(file_system)
+
+    file_system.Open(self._ntfs_path_spec)
+
+    test_volume = TestNTFSVolume({
+        5: TestNTFSFileEntry(
+            0x0005000000000005, True, u'.', 0x0005000000000005),
+        64: TestNTFSFileEntry(
+            0x0001000000000040, True, u'directory', 0x0005000000000005),
+        # Deleted directory, of which the sequence number was incremented.
+        66: TestNTFSFileEntry(
+            0x0003000000000042, False, u'deleted', 0x0005000000000005),
+        67: TestNTFSFileEntry(
+            0x0002000000000043, False, u'file', 0x0002000000000042),
+        # Deleted file of which the parent MFT entry was reused.
+        68: TestNTFSFileEntry(
+            0x0002000000000044, False, u'orphan', 0x0004000000000040)})
+
+    # pylint: disable=protected-access
+    fsntfs_volume = file_system._fsntfs_volume
+    file_system._fsntfs_volume = test_volume
+
+    try:
+      path_specs = [
+          file_entry.path_spec
+          for file_entry in file_system.IterateFileEntries()]
+
+      mft_entries = [path_spec.mft_entry for path_spec in path_specs]
+      self.assertEqual(mft_entries, [5, 64])
+
+      path_specs = [
+          file_entry.path_spec
+          for file_entry in file_system.IterateFileEntries(
+              include_deleted=True)]
+
+      mft_entries = [path_spec.mft_entry for path_spec in path_specs]
+      self.assertEqual(mft_entries, [5, 64, 66, 67, 68])
+
+      locations = [
+          getattr(path_spec, u'location', None) for path_spec in path_specs]
+      expected_locations = [
+          u'\\', u'\\directory', u'\\deleted', u'\\deleted\\file', None]
+      self.assertEqual(locations, expected_locations)
+
+    finally:
+      file_system._fsntfs_volume = fsntfs_volume
+
+    file_system.Close()
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -2,8 +2,10 @@
 # -*- coding: utf-8 -*-
 """Tests for the operating system file entry implementation."""
 
+import os
 import unittest
 
+from dfvfs.lib import definitions
 from dfvfs.path import os_path_spec
 from dfvfs.resolver import context
 from dfvfs.vfs import os_file_entry
@@ -12,6 +14,71 @@ from dfvfs.vfs import os_file_system
 from tests import test_lib as shared_test_lib
 
 
+@shared_test_lib.skipUnlessHasTestFile([u'testdir_os', u'file1.txt'])
+class OSDirectoryTest(shared_test_lib.BaseTestCase):
+  """The unit test for the operating system directory object."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._resolver_context = context.Context()
+    test_file = self._GetTestFilePath([u'testdir_os'])
+    self._os_path_spec = os_path_spec.OSPathSpec(location=test_file)
+
+    self._file_system = os_file_system.OSFileSystem(self._resolver_context)
+    self._file_system.Open(self._os_path_spec)
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    self._file_system.Close()
+
+  def testIterateOSDirectoryEntries(self):
+    """Tests the IterateOSDirectoryEntries function."""
+    directory = os_file_entry.OSDirectory(
+        self._file_system, self._os_path_spec)
+
+    names = [
+        self._file_system.BasenamePath(path_spec.location)
+        for path_spec, _ in directory.IterateOSDirectoryEntries()]
+
+    expected_names = [
+        u'file1.txt', u'file2.txt', u'file3.txt', u'file4.txt', u'file5.txt',
+        u'subdir1']
+    self.assertEqual(sorted(names), expected_names)
+
+  @unittest.skipIf(
+      not hasattr(os, u'scandir'), u'os.scandir() is not supported')
+  def testIterateOSDirectoryEntriesClosesScandirIterator(self):
+    """Tests that an abandoned iteration closes the os.scandir() iterator."""
+    scandir_iterators = []
+
+    def _Scandir(path):
+      """Tracks the iterators returned by os.scandir()."""
+      scandir_iterator = os.scandir(path)
+      scandir_iterators.append(scandir_iterator)
+      return scandir_iterator
+
+    directory = os_file_entry.OSDirectory(
+        self._file_system, self._os_path_spec)
+
+    # pylint: disable=protected-access
+    scandir = os_file_entry._SCANDIR
+    os_file_entry._SCANDIR = _Scandir
+
+    try:
+      generator = directory.IterateOSDirectoryEntries()
+      self.assertIsNotNone(next(generator))
+      generator.close()
+
+    finally:
+      os_file_entry._SCANDIR = scandir
+
+    self.assertEqual(len(scandir_iterators), 1)
+
+    # A closed os.scandir() iterator is exhausted.
+    with self.assertRaises(StopIteration):
+      next(scandir_iterators[0])
+
+
 @shared_test_lib.skipUnlessHasTestFile([u'testdir_os', u'file1.txt'])
 class OSFileEntryTest(shared_test_lib.BaseTestCase):
   """The unit test for the operating system file entry object."""
@@ -128,6 +195,52 @@ class OSFileEntryTest(shared_test_lib.BaseTestCase):
     self.assertEqual(
         sorted(sub_file_entry_names), expected_sub_file_entry_names)
 
+  def testSubFileEntriesGetStat(self):
+    """Tests the GetStat function of sub file entries."""
+    file_entry = self._file_system.GetFileEntryByPathSpec(self._os_path_spec)
+    self.assertIsNotNone(file_entry)
+
+    for sub_file_entry in file_entry.sub_file_entries:
+      test_file = self._GetTestFilePath([u'testdir_os', sub_file_entry.name])
+      path_spec = os_path_spec.OSPathSpec(location=test_file)
+      expected_file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+
+      stat_object = sub_file_entry.GetStat()
+      expected_stat_object = expected_file_entry.GetStat()
+
+      self.assertEqual(stat_object.ino, expected_stat_object.ino)
+      self.assertEqual(stat_object.mode, expected_stat_object.mode)
+      self.assertEqual(stat_object.mtime, expected_stat_object.mtime)
+      self.assertEqual(stat_object.size, expected_stat_object.size)
+      self.assertEqual(stat_object.type, expected_stat_object.type)
+
+  def testScanSubFileEntries(self):
+    """Tests the ScanSubFileEntries function."""
+    file_entry = self._file_system.GetFileEntryByPathSpec(self._os_path_spec)
+    self.assertIsNotNone(file_entry)
+
+    directory_entries = {
+        directory_entry.name: directory_entry
+        for directory_entry in file_entry.ScanSubFileEntries()}
+
+    expected_names = [
+        u'file1.txt', u'file2.txt', u'file3.txt', u'file4.txt', u'file5.txt',
+        u'subdir1']
+    self.assertEqual(sorted(directory_entries.keys()), expected_names)
+
+    directory_entry = directory_entries[u'file1.txt']
+    self.assertEqual(
+        directory_entry.file_entry_type, definitions.FILE_ENTRY_TYPE_FILE)
+
+    directory_entry = directory_entries[u'subdir1']
+    self.assertEqual(
+        directory_entry.file_entry_type, definitions.FILE_ENTRY_TYPE_DIRECTORY)
+
+    sub_file_entry = self._file_system.GetFileEntryByPathSpec(
+        directory_entry.path_spec)
+    self.assertIsNotNone(sub_file_entry)
+    self.assertEqual(directory_entry.inode, sub_file_entry.GetStat().ino)
+
   def testDataStreams(self):
     """Test the data streams functionality."""
     test_file = self._GetTestFilePath([u'testdir_os', u'file1.txt'])
@@ -0,0 +1,175 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Tests for the file entry implementation using a file system snapshot."""
+
+import shutil
+import tempfile
+import unittest
+
+from dfvfs.helpers import snapshot_builder
+from dfvfs.lib import definitions
+from dfvfs.lib import snapshot_index
+from dfvfs.path import os_path_spec
+from dfvfs.path import tsk_path_spec
+from dfvfs.resolver import context
+from dfvfs.vfs import snapshot_file_system
+
+from tests import test_lib as shared_test_lib
+
+
+@shared_test_lib.skipUnlessHasTestFile([u'ímynd.dd'])
+class SnapshotFileEntryTest(shared_test_lib.BaseTestCase):
+  """The unit test for the snapshot file entry object."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._resolver_context = context.Context()
+    self._temp_directory = tempfile.mkdtemp()
+
+    test_file = self._GetTestFilePath([u'ímynd.dd'])
+    self._os_path_spec = os_path_spec.OSPathSpec(location=test_file)
+    self._tsk_path_spec = tsk_path_spec.TSKPathSpec(
+        location=u'/', parent=self._os_path_spec)
+
+    index = snapshot_index.SnapshotIndex(self._temp_directory)
+    builder = snapshot_builder.SnapshotBuilder(
+        index, resolver_context=self._resolver_context)
+    builder.Build(self._tsk_path_spec)
+
+    self._file_system = snapshot_file_system.SnapshotFileSystem(
+        self._resolver_context, index)
+    self._file_system.Open(self._tsk_path_spec)
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    self._file_system.Close()
+    shutil.rmtree(self._temp_directory, True)
+
+  def testGetFileObject(self):
+    """Tests the GetFileObject function."""
+    path_spec = tsk_path_spec.TSKPathSpec(
+        location=u'/a_directory/another_file', parent=self._os_path_spec)
+    file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+    self.assertIsNotNone(file_entry)
+
+    file_object = file_entry.GetFileObject()
+    self.assertIsNotNone(file_object)
+
+    try:
+      self.assertEqual(file_object.get_size(), 22)
+      self.assertEqual(file_object.read(), b'This is another file.\n')
+    finally:
+      file_object.close()
+
+  def testGetParentFileEntry(self):
+    """Tests the GetParentFileEntry function."""
+    path_spec = tsk_path_spec.TSKPathSpec(
+        location=u'/a_directory/another_file', parent=self._os_path_spec)
+    file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+    self.assertIsNotNone(file_entry)
+
+    parent_file_entry = file_entry.GetParentFileEntry()
+    self.assertIsNotNone(parent_file_entry)
+    self.assertEqual(parent_file_entry.name, u'a_directory')
+
+    root_file_entry = parent_file_entry.GetParentFileEntry()
+    self.assertIsNotNone(root_file_entry)
+    self.assertTrue(root_file_entry.IsRoot())
+    self.assertIsNone(root_file_entry.GetParentFileEntry())
+
+  def testGetStat(self):
+    """Tests the GetStat function."""
+    path_spec = tsk_path_spec.TSKPathSpec(
+        location=u'/a_directory/another_file', parent=self._os_path_spec)
+    file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+    self.assertIsNotNone(file_entry)
+
+    self.assertTrue(file_entry.IsAllocated())
+    self.assertTrue(file_entry.IsFile())
+
+    stat_object = file_entry.GetStat()
+
+    self.assertIsNotNone(stat_object)
+    self.assertEqual(stat_object.type, stat_object.TYPE_FILE)
+    self.assertEqual(stat_object.size, 22)
+    self.assertEqual(stat_object.ino, 16)
+
+    self.assertEqual(stat_object.mode, 384)
+    self.assertEqual(stat_object.uid, 151107)
+    self.assertEqual(stat_object.gid, 5000)
+
+    self.assertEqual(stat_object.atime, 1337961563)
+    self.assertEqual(stat_object.ctime, 1337961563)
+    self.assertEqual(stat_object.mtime, 1337961563)
+
+  def testGetTimestamps(self):
+    """Tests the GetTimestamps function."""
+    path_spec = tsk_path_spec.TSKPathSpec(
+        location=u'/a_directory/another_file', parent=self._os_path_spec)
+    file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+    self.assertIsNotNone(file_entry)
+
+    timestamps = file_entry.GetTimestamps()
+
+    self.assertIsNotNone(timestamps)
+    self.assertEqual(
+        timestamps.timestamp_format, definitions.TIMESTAMP_FORMAT_POSIX_TIME)
+    self.assertEqual(timestamps.access_time, 1337961563)
+    self.assertIsNone(timestamps.creation_time)
+    self.assertEqual(timestamps.modification_time, 1337961563)
+
+    self.assertIsNotNone(file_entry.modification_time)
+    self.assertIsNone(file_entry.creation_time)
+
+  def testScanSubFileEntries(self):
+    """Tests the ScanSubFileEntries function."""
+    file_entry = self._file_system.GetRootFileEntry()
+    self.assertIsNotNone(file_entry)
+
+    directory_entries = {
+        directory_entry.name: directory_entry
+        for directory_entry in file_entry.ScanSubFileEntries()}
+
+    self.assertEqual(sorted(directory_entries.keys()), [
+        u'$OrphanFiles', u'a_directory', u'a_link', u'lost+found',
+        u'passwords.txt'])
+
+    directory_entry = directory_entries[u'passwords.txt']
+    self.assertEqual(
+        directory_entry.file_entry_type, definitions.FILE_ENTRY_TYPE_FILE)
+    self.assertEqual(directory_entry.inode, 15)
+    self.assertTrue(directory_entry.is_allocated)
+    self.assertEqual(directory_entry.path_spec.location, u'/passwords.txt')
+    self.assertEqual(directory_entry.size, 116)
+
+    # The back-end file system is not opened to list directories.
+    self.assertIsNone(self._resolver_context.GetFileSystem(self._tsk_path_spec))
+
+  def testSubFileEntries(self):
+    """Test the sub_file_entries property."""
+    path_spec = tsk_path_spec.TSKPathSpec(
+        location=u'/a_directory', parent=self._os_path_spec)
+    file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+    self.assertIsNotNone(file_entry)
+
+    self._assertSubFileEntries(file_entry, [u'a_file', u'another_file'])
+
+    sub_file_entry = file_entry.GetSubFileEntryByName(u'A_FILE', False)
+    self.assertIsNotNone(sub_file_entry)
+    self.assertEqual(sub_file_entry.name, u'a_file')
+    self.assertEqual(
+        sub_file_entry.type_indicator, definitions.TYPE_INDICATOR_TSK)
+
+  def testLink(self):
+    """Test the link property."""
+    path_spec = tsk_path_spec.TSKPathSpec(
+        location=u'/a_link', parent=self._os_path_spec)
+    file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+    self.assertIsNotNone(file_entry)
+
+    self.assertTrue(file_entry.IsLink())
+    self.assertEqual(file_entry.link, u'/a_directory/another_file')
+
+
+if __name__ == '__main__':
+  unittest.main()
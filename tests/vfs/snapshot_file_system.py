@@ -0,0 +1,162 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Tests for the file system implementation using a file system snapshot."""
+
+import shutil
+import tempfile
+import unittest
+
+from dfvfs.helpers import snapshot_builder
+from dfvfs.lib import definitions
+from dfvfs.lib import errors
+from dfvfs.lib import snapshot_index
+from dfvfs.path import os_path_spec
+from dfvfs.path import tsk_path_spec
+from dfvfs.resolver import context
+from dfvfs.vfs import snapshot_file_system
+
+from tests import test_lib as shared_test_lib
+
+
+@shared_test_lib.skipUnlessHasTestFile([u'ímynd.dd'])
+class SnapshotFileSystemTest(shared_test_lib.BaseTestCase):
+  """The unit test for the snapshot file system object."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._resolver_context = context.Context()
+    self._temp_directory = tempfile.mkdtemp()
+
+    test_file = self._GetTestFilePath([u'ímynd.dd'])
+    self._os_path_spec = os_path_spec.OSPathSpec(location=test_file)
+    self._tsk_path_spec = tsk_path_spec.TSKPathSpec(
+        location=u'/', parent=self._os_path_spec)
+
+    self._snapshot_index = snapshot_index.SnapshotIndex(self._temp_directory)
+    builder = snapshot_builder.SnapshotBuilder(
+        self._snapshot_index, resolver_context=self._resolver_context)
+    builder.Build(self._tsk_path_spec)
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    shutil.rmtree(self._temp_directory, True)
+
+  def testOpenAndClose(self):
+    """Test the open and close functionality."""
+    file_system = snapshot_file_system.SnapshotFileSystem(
+        self._resolver_context, self._snapshot_index)
+    self.assertIsNotNone(file_system)
+
+    file_system.Open(self._tsk_path_spec)
+
+    self.assertEqual(file_system.type_indicator, definitions.TYPE_INDICATOR_TSK)
+    self.assertIsNone(self._resolver_context.GetFileSystem(self._tsk_path_spec))
+
+    file_system.Close()
+
+    file_system = snapshot_file_system.SnapshotFileSystem(
+        self._resolver_context, snapshot_index.SnapshotIndex(
+            self._temp_directory + u'-bogus'))
+
+    with self.assertRaises(errors.BackEndError):
+      file_system.Open(self._tsk_path_spec)
+
+  def testOpenAndCloseMultipleTimes(self):
+    """Test the open and close functionality when opened multiple times."""
+    file_system = snapshot_file_system.SnapshotFileSystem(
+        self._resolver_context, self._snapshot_index)
+
+    file_system.Open(self._tsk_path_spec)
+    file_system.Open(self._tsk_path_spec)
+
+    root_file_entry = file_system.GetRootFileEntry()
+    self.assertIsNotNone(root_file_entry)
+
+    file_entry = root_file_entry.GetSubFileEntryByName(u'passwords.txt')
+    self.assertIsNotNone(file_entry)
+
+    # pylint: disable=protected-access
+    self.assertEqual(len(file_system._name_indexes), 1)
+
+    # A file entry keeps the file system open until it is discarded.
+    del file_entry
+    del root_file_entry
+
+    file_system.Close()
+    self.assertIsNotNone(file_system.GetRootFileEntry())
+    self.assertEqual(len(file_system._name_indexes), 1)
+
+    file_system.Close()
+    self.assertEqual(len(file_system._name_indexes), 0)
+
+    with self.assertRaises(IOError):
+      file_system.Close()
+
+  def testFileEntryExistsByPathSpec(self):
+    """Test the file entry exists by path specification functionality."""
+    file_system = snapshot_file_system.SnapshotFileSystem(
+        self._resolver_context, self._snapshot_index)
+    file_system.Open(self._tsk_path_spec)
+
+    path_spec = tsk_path_spec.TSKPathSpec(
+        location=u'/passwords.txt', parent=self._os_path_spec)
+    self.assertTrue(file_system.FileEntryExistsByPathSpec(path_spec))
+
+    path_spec = tsk_path_spec.TSKPathSpec(
+        inode=15, location=u'/password.txt', parent=self._os_path_spec)
+    self.assertTrue(file_system.FileEntryExistsByPathSpec(path_spec))
+
+    path_spec = tsk_path_spec.TSKPathSpec(
+        inode=19, location=u'/bogus.txt', parent=self._os_path_spec)
+    self.assertFalse(file_system.FileEntryExistsByPathSpec(path_spec))
+
+    file_system.Close()
+
+  def testGetFileEntryByPathSpec(self):
+    """Tests the GetFileEntryByPathSpec function."""
+    file_system = snapshot_file_system.SnapshotFileSystem(
+        self._resolver_context, self._snapshot_index)
+    file_system.Open(self._tsk_path_spec)
+
+    path_spec = tsk_path_spec.TSKPathSpec(inode=15, parent=self._os_path_spec)
+    file_entry = file_system.GetFileEntryByPathSpec(path_spec)
+
+    self.assertIsNotNone(file_entry)
+    self.assertEqual(file_entry.name, u'passwords.txt')
+
+    path_spec = tsk_path_spec.TSKPathSpec(
+        location=u'/passwords.txt', parent=self._os_path_spec)
+    file_entry = file_system.GetFileEntryByPathSpec(path_spec)
+
+    self.assertIsNotNone(file_entry)
+    self.assertEqual(file_entry.name, u'passwords.txt')
+
+    path_spec = tsk_path_spec.TSKPathSpec(
+        location=u'/bogus.txt', parent=self._os_path_spec)
+    file_entry = file_system.GetFileEntryByPathSpec(path_spec)
+
+    self.assertIsNone(file_entry)
+
+    # The back-end file system is not opened to find file entries.
+    self.assertIsNone(self._resolver_context.GetFileSystem(self._tsk_path_spec))
+
+    file_system.Close()
+
+  def testGetRootFileEntry(self):
+    """Test the get root file entry functionality."""
+    file_system = snapshot_file_system.SnapshotFileSystem(
+        self._resolver_context, self._snapshot_index)
+    file_system.Open(self._tsk_path_spec)
+
+    file_entry = file_system.GetRootFileEntry()
+
+    self.assertIsNotNone(file_entry)
+    self.assertTrue(file_entry.IsRoot())
+    self.assertEqual(file_entry.path_spec.inode, 2)
+    self.assertEqual(file_entry.path_spec.location, u'/')
+
+    file_system.Close()
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -2,8 +2,16 @@
 # -*- coding: utf-8 -*-
 """Tests for the file system implementation using the tarfile."""
 
+import io
+import os
+import shutil
+import tarfile
+import tempfile
 import unittest
 
+from dfvfs.lib import gzipfile
+from dfvfs.lib import member_index
+from dfvfs.path import gzip_path_spec
 from dfvfs.path import os_path_spec
 from dfvfs.path import tar_path_spec
 from dfvfs.resolver import context
@@ -33,6 +41,122 @@ class TARFileSystemTest(shared_test_lib.BaseTestCase):
 
     file_system.Close()
 
+  def testOpenWithMemberIndex(self):
+    """Test the open functionality with a member index."""
+    temp_directory = tempfile.mkdtemp()
+    try:
+      resolver_context = context.Context(member_index_path=temp_directory)
+
+      file_system = tar_file_system.TARFileSystem(resolver_context)
+      file_system.Open(self._tar_path_spec)
+      file_system.Close()
+
+      index_file_names = os.listdir(temp_directory)
+      self.assertEqual(len(index_file_names), 1)
+
+      # Rename the member in the member index, which shows that the members
+      # are read from the member index instead of the TAR file.
+      index = member_index.MemberIndex(temp_directory)
+      identifier, _, _ = index_file_names[0].rpartition(u'.')
+
+      members = index.ReadMembers(identifier)
+      self.assertIsNotNone(members)
+
+      for member_values in members:
+        if member_values[u'path'] == u'syslog':
+          member_values[u'path'] = u'indexed_syslog'
+
+      index.WriteMembers(identifier, members)
+
+      # Open the file system a second time to read the members from
+      # the member index.
+      file_system = tar_file_system.TARFileSystem(resolver_context)
+      file_system.Open(self._tar_path_spec)
+
+      path_spec = tar_path_spec.TARPathSpec(
+          location=u'/syslog', parent=self._os_path_spec)
+      self.assertFalse(file_system.FileEntryExistsByPathSpec(path_spec))
+
+      path_spec = tar_path_spec.TARPathSpec(
+          location=u'/indexed_syslog', parent=self._os_path_spec)
+      file_entry = file_system.GetFileEntryByPathSpec(path_spec)
+      self.assertIsNotNone(file_entry)
+
+      stat_object = file_entry.GetStat()
+      self.assertEqual(stat_object.size, 1247)
+
+      # Check that the TAR info read from the member index can be used to read
+      # the file entry data.
+      file_object = file_entry.GetFileObject()
+      self.assertEqual(file_object.get_size(), 1247)
+      self.assertEqual(file_object.read(5), b'Jan 2')
+      file_object.close()
+
+      file_system.Close()
+
+    finally:
+      shutil.rmtree(temp_directory, True)
+
+  @shared_test_lib.skipUnlessHasTestFile([u'syslog.tgz'])
+  def testOpenWithMemberIndexOnGzipFile(self):
+    """Test the open functionality with a member index on a gzip file."""
+    test_file = self._GetTestFilePath([u'syslog.tgz'])
+    path_spec = os_path_spec.OSPathSpec(location=test_file)
+    path_spec = gzip_path_spec.GzipPathSpec(parent=path_spec)
+    path_spec = tar_path_spec.TARPathSpec(location=u'/', parent=path_spec)
+
+    calls = {u'decompress': 0, u'read_header': 0}
+
+    original_read_compressed_data = gzipfile.GzipMember._ReadCompressedData
+    original_next = tarfile.TarFile.next
+
+    def _ReadCompressedData(gzip_member):
+      """Counts the decompression of a gzip member."""
+      calls[u'decompress'] += 1
+      return original_read_compressed_data(gzip_member)
+
+    def _Next(tar_file):
+      """Counts the reading of a TAR member header."""
+      calls[u'read_header'] += 1
+      return original_next(tar_file)
+
+    temp_directory = tempfile.mkdtemp()
+    try:
+      gzipfile.GzipMember._ReadCompressedData = _ReadCompressedData
+      tarfile.TarFile.next = _Next
+
+      resolver_context = context.Context(member_index_path=temp_directory)
+      file_system = tar_file_system.TARFileSystem(resolver_context)
+      file_system.Open(path_spec)
+      file_system.Close()
+
+      self.assertEqual(calls[u'decompress'], 1)
+      self.assertGreater(calls[u'read_header'], 1)
+
+      calls = {u'decompress': 0, u'read_header': 0}
+
+      # Reopen the file system with a new resolver context, so that the gzip
+      # file is not cached. The member index prevents reading the TAR member
+      # headers but not the decompression of the gzip file. Note that
+      # tarfile.open() always reads the first member header.
+      resolver_context = context.Context(member_index_path=temp_directory)
+      file_system = tar_file_system.TARFileSystem(resolver_context)
+      file_system.Open(path_spec)
+
+      self.assertEqual(calls[u'decompress'], 1)
+      self.assertEqual(calls[u'read_header'], 1)
+
+      syslog_path_spec = tar_path_spec.TARPathSpec(
+          location=u'/syslog', parent=path_spec.parent)
+      self.assertTrue(file_system.FileEntryExistsByPathSpec(syslog_path_spec))
+
+      file_system.Close()
+
+    finally:
+      gzipfile.GzipMember._ReadCompressedData = original_read_compressed_data
+      tarfile.TarFile.next = original_next
+      shutil.rmtree(temp_directory, True)
+
   @shared_test_lib.skipUnlessHasTestFile([u'missing_directory_entries.tar'])
   def testFileEntryExistsByPathSpec(self):
     """Test the file entry exists by path specification functionality."""
@@ -69,6 +193,15 @@ class TARFileSystemTest(shared_test_lib.BaseTestCase):
         location=u'/File System/Recordings', parent=test_file_path_spec)
     self.assertTrue(file_system.FileEntryExistsByPathSpec(path_spec))
 
+    # A prefix of the path of a member is not a virtual directory.
+    path_spec = tar_path_spec.TARPathSpec(
+        location=u'/File Sys', parent=test_file_path_spec)
+    self.assertFalse(file_system.FileEntryExistsByPathSpec(path_spec))
+
+    path_spec = tar_path_spec.TARPathSpec(
+        location=u'/File System/Record', parent=test_file_path_spec)
+    self.assertFalse(file_system.FileEntryExistsByPathSpec(path_spec))
+
     file_system.Close()
 
   @shared_test_lib.skipUnlessHasTestFile([u'missing_directory_entries.tar'])
@@ -116,6 +249,93 @@ class TARFileSystemTest(shared_test_lib.BaseTestCase):
     self.assertIsNotNone(file_entry)
     self.assertEqual(file_entry.name, u'Recordings')
 
+    path_spec = tar_path_spec.TARPathSpec(
+        location=u'/File Sys', parent=test_file_path_spec)
+    file_entry = file_system.GetFileEntryByPathSpec(path_spec)
+    self.assertIsNone(file_entry)
+
+    file_system.Close()
+
+  def testGetTARInfoByPath(self):
+    """Tests the GetTARInfoByPath function."""
+    temp_directory = tempfile.mkdtemp()
+    try:
+      # Create a TAR file that contains the same path twice.
+      test_file = os.path.join(temp_directory, u'duplicate_members.tar')
+      with tarfile.open(test_file, mode='w') as tar_file:
+        for data in (b'first', b'second version'):
+          tar_info = tarfile.TarInfo(u'file')
+          tar_info.size = len(data)
+          tar_file.addfile(tar_info, io.BytesIO(data))
+
+      test_file_path_spec = os_path_spec.OSPathSpec(location=test_file)
+      path_spec = tar_path_spec.TARPathSpec(
+          location=u'/', parent=test_file_path_spec)
+
+      file_system = tar_file_system.TARFileSystem(self._resolver_context)
+      file_system.Open(path_spec)
+
+      # Like tarfile.getmember() the last member with the path is used.
+      tar_info = file_system.GetTARInfoByPath(u'file')
+      self.assertIsNotNone(tar_info)
+      self.assertEqual(tar_info.size, 14)
+
+      tar_info = file_system.GetTARInfoByPath(u'file/')
+      self.assertIsNotNone(tar_info)
+      self.assertEqual(tar_info.size, 14)
+
+      tar_info = file_system.GetTARInfoByPath(u'bogus')
+      self.assertIsNone(tar_info)
+
+      file_system.Close()
+
+    finally:
+      shutil.rmtree(temp_directory, True)
+
+  @shared_test_lib.skipUnlessHasTestFile([u'missing_directory_entries.tar'])
+  def testLookupWithoutGetMember(self):
+    """Tests that members are looked up without tarfile.getmember()."""
+    test_file = self._GetTestFilePath([u'missing_directory_entries.tar'])
+    test_file_path_spec = os_path_spec.OSPathSpec(location=test_file)
+    path_spec = tar_path_spec.TARPathSpec(
+        location=u'/', parent=test_file_path_spec)
+
+    file_system = tar_file_system.TARFileSystem(self._resolver_context)
+    file_system.Open(path_spec)
+
+    def _GetMember(unused_name):
+      """Fails since tarfile.getmember() iterates all the members."""
+      raise AssertionError(u'Unexpected call to tarfile.getmember().')
+
+    tar_file = file_system.GetTARFile()
+    tar_file.getmember = _GetMember
+
+    path_spec = tar_path_spec.TARPathSpec(
+        location=u'/Non Missing Directory Entry/test_file.txt',
+        parent=test_file_path_spec)
+    self.assertTrue(file_system.FileEntryExistsByPathSpec(path_spec))
+
+    file_entry = file_system.GetFileEntryByPathSpec(path_spec)
+    self.assertIsNotNone(file_entry)
+    self.assertIsNotNone(file_entry.GetTARInfo())
+
+    locations = []
+    file_entries = [file_system.GetRootFileEntry()]
+    while file_entries:
+      file_entry = file_entries.pop()
+      for sub_file_entry in file_entry.sub_file_entries:
+        locations.append(sub_file_entry.path_spec.location)
+        if not sub_file_entry.IsVirtual():
+          self.assertIsNotNone(sub_file_entry.GetTARInfo())
+        file_entries.append(sub_file_entry)
+
+    self.assertEqual(sorted(locations), [
+        u'/File System',
+        u'/File System/Recordings',
+        u'/File System/Recordings/AssetManifest.plist',
+        u'/Non Missing Directory Entry',
+        u'/Non Missing Directory Entry/test_file.txt'])
+
     file_system.Close()
 
   def testGetRootFileEntry(self):
@@ -4,6 +4,7 @@
 
 import unittest
 
+from dfvfs.lib import definitions
 from dfvfs.path import os_path_spec
 from dfvfs.path import qcow_path_spec
 from dfvfs.path import tsk_path_spec
@@ -40,6 +41,30 @@ class TSKFileEntryTestExt2(shared_test_lib.BaseTestCase):
 
     self.assertIsNotNone(file_entry)
 
+  def testGetExtents(self):
+    """Tests the GetExtents function."""
+    test_location = u'/a_directory/another_file'
+    path_spec = tsk_path_spec.TSKPathSpec(
+        inode=16, location=test_location, parent=self._os_path_spec)
+    file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+    self.assertIsNotNone(file_entry)
+
+    extents = file_entry.GetExtents()
+    self.assertEqual(len(extents), 1)
+
+    self.assertEqual(extents[0].extent_type, definitions.EXTENT_TYPE_DATA)
+    self.assertEqual(extents[0].offset, 31744)
+    self.assertEqual(extents[0].size, 22)
+
+    test_location = u'/a_directory'
+    path_spec = tsk_path_spec.TSKPathSpec(
+        inode=12, location=test_location, parent=self._os_path_spec)
+    file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+    self.assertIsNotNone(file_entry)
+
+    extents = file_entry.GetExtents()
+    self.assertEqual(len(extents), 0)
+
   def testGetFileEntryByPathSpec(self):
     """Tests the GetFileEntryByPathSpec function."""
     path_spec = tsk_path_spec.TSKPathSpec(inode=15, parent=self._os_path_spec)
@@ -75,6 +100,36 @@ class TSKFileEntryTestExt2(shared_test_lib.BaseTestCase):
 
     self.assertEqual(parent_file_entry.name, u'a_directory')
 
+  def testGetSubFileEntryByName(self):
+    """Tests the GetSubFileEntryByName function."""
+    path_spec = tsk_path_spec.TSKPathSpec(
+        location=u'/', parent=self._os_path_spec)
+    file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+    self.assertIsNotNone(file_entry)
+
+    sub_file_entry = file_entry.GetSubFileEntryByName(u'a_directory')
+    self.assertIsNotNone(sub_file_entry)
+    self.assertEqual(sub_file_entry.name, u'a_directory')
+    self.assertEqual(sub_file_entry.path_spec.inode, 12)
+    self.assertEqual(sub_file_entry.path_spec.location, u'/a_directory')
+
+    sub_file_entry = sub_file_entry.GetSubFileEntryByName(u'another_file')
+    self.assertIsNotNone(sub_file_entry)
+    self.assertEqual(sub_file_entry.name, u'another_file')
+
+    # Note that the lookup by path is case sensitive on ext2.
+    sub_file_entry = file_entry.GetSubFileEntryByName(u'A_DIRECTORY')
+    self.assertIsNone(sub_file_entry)
+
+    sub_file_entry = file_entry.GetSubFileEntryByName(
+        u'A_DIRECTORY', case_sensitive=False)
+    self.assertIsNotNone(sub_file_entry)
+    self.assertEqual(sub_file_entry.name, u'a_directory')
+
+    sub_file_entry = file_entry.GetSubFileEntryByName(
+        u'bogus', case_sensitive=False)
+    self.assertIsNone(sub_file_entry)
+
   def testGetStat(self):
     """Tests the GetStat function."""
     test_location = u'/a_directory/another_file'
@@ -105,6 +160,54 @@ class TSKFileEntryTestExt2(shared_test_lib.BaseTestCase):
     self.assertEqual(stat_object.mtime, 1337961563)
     self.assertEqual(stat_object.mtime_nano, None)
 
+  def testGetTimestamps(self):
+    """Tests the GetTimestamps function."""
+    test_location = u'/a_directory/another_file'
+    path_spec = tsk_path_spec.TSKPathSpec(
+        inode=16, location=test_location, parent=self._os_path_spec)
+    file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+    self.assertIsNotNone(file_entry)
+
+    timestamps = file_entry.GetTimestamps()
+
+    self.assertIsNotNone(timestamps)
+    self.assertEqual(
+        timestamps.timestamp_format, definitions.TIMESTAMP_FORMAT_POSIX_TIME)
+    self.assertEqual(timestamps.access_time, 1337961563)
+    self.assertEqual(timestamps.change_time, 1337961563)
+    # EXT2 has no crtime timestamp.
+    self.assertIsNone(timestamps.creation_time)
+    self.assertEqual(timestamps.modification_time, 1337961563)
+
+  def testGetStatAfterIsFunctions(self):
+    """Tests the GetStat function after the type was determined."""
+    test_location = u'/a_directory/another_file'
+    path_spec = tsk_path_spec.TSKPathSpec(
+        inode=16, location=test_location, parent=self._os_path_spec)
+    file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+    self.assertIsNotNone(file_entry)
+
+    self.assertTrue(file_entry.IsFile())
+    self.assertTrue(file_entry.IsAllocated())
+
+    # The type checks do not determine the timestamps.
+    # pylint: disable=protected-access
+    self.assertIsNone(file_entry._stat_object)
+    stat_object = file_entry._type_and_size_stat_object
+    self.assertIsNotNone(stat_object)
+    self.assertEqual(stat_object.size, 22)
+    self.assertIsNone(stat_object.atime)
+    self.assertIsNone(stat_object.mode)
+
+    stat_object = file_entry.GetStat()
+
+    self.assertIsNotNone(stat_object)
+    self.assertEqual(stat_object.type, stat_object.TYPE_FILE)
+    self.assertEqual(stat_object.size, 22)
+    self.assertEqual(stat_object.mode, 384)
+    self.assertEqual(stat_object.atime, 1337961563)
+    self.assertEqual(stat_object.mtime, 1337961563)
+
   def testIsFunctions(self):
     """Test the Is? functions."""
     test_location = u'/a_directory/another_file'
@@ -184,6 +287,69 @@ class TSKFileEntryTestExt2(shared_test_lib.BaseTestCase):
     self.assertEqual(
         sorted(sub_file_entry_names), sorted(expected_sub_file_entry_names))
 
+  def testScanSubFileEntries(self):
+    """Tests the ScanSubFileEntries function."""
+    file_entry = self._file_system.GetFileEntryByPathSpec(self._tsk_path_spec)
+    self.assertIsNotNone(file_entry)
+
+    directory_entries = {
+        directory_entry.name: directory_entry
+        for directory_entry in file_entry.ScanSubFileEntries()}
+
+    expected_names = [
+        u'$OrphanFiles', u'a_directory', u'a_link', u'lost+found',
+        u'passwords.txt']
+    self.assertEqual(sorted(directory_entries.keys()), expected_names)
+
+    directory_entry = directory_entries[u'a_directory']
+    self.assertEqual(
+        directory_entry.file_entry_type, definitions.FILE_ENTRY_TYPE_DIRECTORY)
+    self.assertEqual(directory_entry.inode, 12)
+    self.assertTrue(directory_entry.is_allocated)
+    self.assertEqual(directory_entry.path_spec.location, u'/a_directory')
+
+    directory_entry = directory_entries[u'a_link']
+    self.assertEqual(
+        directory_entry.file_entry_type, definitions.FILE_ENTRY_TYPE_LINK)
+
+    directory_entry = directory_entries[u'passwords.txt']
+    self.assertEqual(
+        directory_entry.file_entry_type, definitions.FILE_ENTRY_TYPE_FILE)
+    self.assertEqual(directory_entry.inode, 15)
+    self.assertEqual(directory_entry.size, 116)
+
+    sub_file_entry = self._file_system.GetFileEntryByPathSpec(
+        directory_entry.path_spec)
+    self.assertIsNotNone(sub_file_entry)
+    self.assertEqual(sub_file_entry.name, u'passwords.txt')
+
+  def testScanSubFileEntriesCached(self):
+    """Tests the ScanSubFileEntries function with a cached directory listing."""
+    file_entry = self._file_system.GetFileEntryByPathSpec(self._tsk_path_spec)
+    self.assertIsNotNone(file_entry)
+
+    cache_identifier = self._tsk_path_spec.comparable
+    directory_listing = self._file_system.GetCachedDirectoryListing(
+        cache_identifier)
+    self.assertIsNone(directory_listing)
+
+    directory_entries = list(file_entry.ScanSubFileEntries())
+    self.assertEqual(len(directory_entries), 5)
+
+    directory_listing = self._file_system.GetCachedDirectoryListing(
+        cache_identifier)
+    self.assertEqual(directory_listing, directory_entries)
+
+    file_entry = self._file_system.GetFileEntryByPathSpec(self._tsk_path_spec)
+    cached_directory_entries = list(file_entry.ScanSubFileEntries())
+    self.assertEqual(cached_directory_entries, directory_entries)
+
+    sub_file_entry_names = [
+        sub_file_entry.name for sub_file_entry in file_entry.sub_file_entries]
+    self.assertEqual(
+        sub_file_entry_names,
+        [directory_entry.name for directory_entry in directory_entries])
+
   def testDataStreams(self):
     """Test the data streams functionality."""
     test_location = u'/a_directory/another_file'
@@ -214,6 +380,41 @@ class TSKFileEntryTestExt2(shared_test_lib.BaseTestCase):
 
     self.assertEqual(data_stream_names, [])
 
+  def testFileEntriesWithSameInode(self):
+    """Test file entries that share the TSK file of the same inode."""
+    path_spec = tsk_path_spec.TSKPathSpec(
+        inode=16, location=u'/a_directory/another_file',
+        parent=self._os_path_spec)
+    file_entry1 = self._file_system.GetFileEntryByPathSpec(path_spec)
+    self.assertIsNotNone(file_entry1)
+
+    file_entry2 = self._file_system.GetFileEntryByPathSpec(path_spec)
+    self.assertIsNotNone(file_entry2)
+
+    self.assertIs(file_entry1.GetTSKFile(), file_entry2.GetTSKFile())
+
+    file_object = file_entry1.GetFileObject()
+    self.assertIsNotNone(file_object)
+
+    expected_data = b'This is another file.\n'
+
+    try:
+      self.assertEqual(file_object.read(8), expected_data[:8])
+
+      # Iterating the attributes of the shared TSK file does not affect
+      # the file-like object.
+      self.assertEqual(file_entry2.number_of_attributes, 1)
+      self.assertEqual(file_entry2.number_of_data_streams, 1)
+      self.assertIsNotNone(file_entry2.GetDataStream(u''))
+      self.assertEqual(file_entry2.GetExtents()[0].size, 22)
+
+      self.assertEqual(file_object.read(), expected_data[8:])
+
+    finally:
+      file_object.close()
+
+    self.assertEqual(file_entry1.number_of_data_streams, 1)
+
   def testGetDataStream(self):
     """Tests the GetDataStream function."""
     test_location = u'/a_directory/another_file'
@@ -281,6 +482,56 @@ class TSKFileEntryTestNTFS(shared_test_lib.BaseTestCase):
     self.assertEqual(stat_object.mtime, 1386052509)
     self.assertEqual(stat_object.mtime_nano, 5179783)
 
+  def testGetTimestamps(self):
+    """Tests the GetTimestamps function."""
+    test_location = (
+        u'\\System Volume Information\\{3808876b-c176-4e48-b7ae-04046e6cc752}')
+    path_spec = tsk_path_spec.TSKPathSpec(
+        inode=38, location=test_location, parent=self._qcow_path_spec)
+    file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+    self.assertIsNotNone(file_entry)
+
+    timestamps = file_entry.GetTimestamps()
+
+    self.assertIsNotNone(timestamps)
+    self.assertEqual(
+        timestamps.timestamp_format,
+        definitions.TIMESTAMP_FORMAT_POSIX_TIME_IN_NANOSECONDS)
+    self.assertEqual(timestamps.access_time, 1386052509502378300)
+    self.assertEqual(timestamps.change_time, 1386052509517978300)
+    self.assertEqual(timestamps.creation_time, 1386052509502378300)
+    self.assertEqual(timestamps.modification_time, 1386052509517978300)
+
+  def testGetExtents(self):
+    """Tests the GetExtents function."""
+    path_spec = tsk_path_spec.TSKPathSpec(
+        inode=0, location=u'\\$MFT', parent=self._qcow_path_spec)
+    file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+    self.assertIsNotNone(file_entry)
+
+    extents = file_entry.GetExtents()
+    self.assertEqual(len(extents), 1)
+
+    self.assertEqual(extents[0].extent_type, definitions.EXTENT_TYPE_DATA)
+    self.assertEqual(extents[0].offset, 357912576)
+    self.assertEqual(extents[0].size, 262144)
+
+    test_location = u'\\$Extend\\$RmMetadata\\$Repair'
+    path_spec = tsk_path_spec.TSKPathSpec(
+        inode=28, location=test_location, parent=self._qcow_path_spec)
+    file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+    self.assertIsNotNone(file_entry)
+
+    extents = file_entry.GetExtents(data_stream_name=u'$Config')
+    self.assertEqual(len(extents), 1)
+
+    self.assertEqual(extents[0].extent_type, definitions.EXTENT_TYPE_RESIDENT)
+    self.assertIsNone(extents[0].offset)
+    self.assertEqual(extents[0].size, 8)
+
+    extents = file_entry.GetExtents(data_stream_name=u'bogus')
+    self.assertEqual(len(extents), 0)
+
   def testAttributes(self):
     """Test the attributes functionality."""
     test_location = (
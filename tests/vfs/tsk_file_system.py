@@ -94,6 +94,59 @@ class TSKFileSystemTest(shared_test_lib.BaseTestCase):
 
     file_system.Close()
 
+  def testGetTSKFileByInode(self):
+    """Test the get TSK file by inode functionality."""
+    file_system = tsk_file_system.TSKFileSystem(self._resolver_context)
+    self.assertIsNotNone(file_system)
+
+    file_system.Open(self._tsk_path_spec)
+
+    tsk_file = file_system.GetTSKFileByInode(15)
+    self.assertIsNotNone(tsk_file)
+    self.assertEqual(tsk_file.info.meta.addr, 15)
+
+    cached_tsk_file = file_system.GetTSKFileByInode(15)
+    self.assertIs(cached_tsk_file, tsk_file)
+
+    path_spec = tsk_path_spec.TSKPathSpec(
+        inode=15, location=u'/passwords.txt', parent=self._os_path_spec)
+    file_entry = file_system.GetFileEntryByPathSpec(path_spec)
+    self.assertIsNotNone(file_entry)
+    self.assertIs(file_entry.GetTSKFile(), tsk_file)
+
+    with self.assertRaises(IOError):
+      file_system.GetTSKFileByInode(9999)
+
+    file_system.Close()
+
+  def testIterateFileEntries(self):
+    """Test the iterate file entries functionality."""
+    file_system = tsk_file_system.TSKFileSystem(self._resolver_context)
+    self.assertIsNotNone(file_system)
+
+    file_system.Open(self._tsk_path_spec)
+
+    file_entries = list(file_system.IterateFileEntries())
+
+    inodes = [file_entry.path_spec.inode for file_entry in file_entries]
+    self.assertEqual(inodes, sorted(inodes))
+
+    expected_locations = [
+        u'/', u'/lost+found', u'/a_directory', u'/a_link',
+        u'/a_directory/a_file', u'/passwords.txt',
+        u'/a_directory/another_file', u'/$OrphanFiles']
+    locations = [file_entry.path_spec.location for file_entry in file_entries]
+    self.assertEqual(locations, expected_locations)
+
+    self.assertTrue(file_entries[0].IsRoot())
+
+    file_entry = file_entries[6]
+    self.assertEqual(file_entry.name, u'another_file')
+    self.assertEqual(file_entry.path_spec.inode, 16)
+    self.assertEqual(file_entry.GetStat().size, 22)
+
+    file_system.Close()
+
 
 if __name__ == '__main__':
   unittest.main()
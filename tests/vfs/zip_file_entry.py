@@ -2,8 +2,13 @@
 # -*- coding: utf-8 -*-
 """Tests for the file entry implementation using the zipfile."""
 
+import os
+import shutil
+import tempfile
 import unittest
+import zipfile
 
+from dfvfs.lib import definitions
 from dfvfs.path import os_path_spec
 from dfvfs.path import zip_path_spec
 from dfvfs.resolver import context
@@ -66,6 +71,58 @@ class ZIPFileEntryTest(shared_test_lib.BaseTestCase):
     # TODO: re-enable when dfdatetime updates are committed
     # self.assertEqual(stat_object.mtime_nano, None)
 
+  def testGetTimestamps(self):
+    """Tests the GetTimestamps function."""
+    path_spec = zip_path_spec.ZipPathSpec(
+        location=u'/syslog', parent=self._os_path_spec)
+    file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+    self.assertIsNotNone(file_entry)
+
+    timestamps = file_entry.GetTimestamps()
+
+    self.assertIsNotNone(timestamps)
+    self.assertEqual(
+        timestamps.timestamp_format, definitions.TIMESTAMP_FORMAT_POSIX_TIME)
+    self.assertIsNone(timestamps.access_time)
+    self.assertEqual(timestamps.modification_time, 1343141124)
+
+  def testGetTimestampsWithZeroDate(self):
+    """Tests the GetTimestamps function with a member with a zero date."""
+    temp_directory = tempfile.mkdtemp()
+    try:
+      # Create a ZIP file with a member of which the DOS date and time
+      # are 0, which zipfile reports as (1980, 0, 0, 0, 0, 0).
+      test_file = os.path.join(temp_directory, u'zero_date.zip')
+      with zipfile.ZipFile(test_file, mode='w') as zip_file:
+        zip_info = zipfile.ZipInfo(
+            filename=u'file', date_time=(1980, 0, 0, 0, 0, 0))
+        zip_file.writestr(zip_info, b'data')
+
+      test_file_path_spec = os_path_spec.OSPathSpec(location=test_file)
+      path_spec = zip_path_spec.ZipPathSpec(
+          location=u'/', parent=test_file_path_spec)
+
+      file_system = zip_file_system.ZipFileSystem(self._resolver_context)
+      file_system.Open(path_spec)
+
+      path_spec = zip_path_spec.ZipPathSpec(
+          location=u'/file', parent=test_file_path_spec)
+      file_entry = file_system.GetFileEntryByPathSpec(path_spec)
+      self.assertIsNotNone(file_entry)
+
+      timestamps = file_entry.GetTimestamps()
+
+      self.assertIsNotNone(timestamps)
+      self.assertEqual(
+          timestamps.timestamp_format, definitions.TIMESTAMP_FORMAT_POSIX_TIME)
+      self.assertIsNone(timestamps.modification_time)
+
+      del file_entry
+      file_system.Close()
+
+    finally:
+      shutil.rmtree(temp_directory, True)
+
   def testAccessTime(self):
     """Test the access_time property."""
     path_spec = zip_path_spec.ZipPathSpec(
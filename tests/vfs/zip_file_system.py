@@ -69,6 +69,15 @@ class ZIPFileSystemTest(shared_test_lib.BaseTestCase):
         location=u'/folder/syslog', parent=test_file_path_spec)
     self.assertTrue(file_system.FileEntryExistsByPathSpec(path_spec))
 
+    # A prefix of the path of a member is not a virtual directory.
+    path_spec = zip_path_spec.ZipPathSpec(
+        location=u'/fold', parent=test_file_path_spec)
+    self.assertFalse(file_system.FileEntryExistsByPathSpec(path_spec))
+
+    path_spec = zip_path_spec.ZipPathSpec(
+        location=u'/folder/sys', parent=test_file_path_spec)
+    self.assertFalse(file_system.FileEntryExistsByPathSpec(path_spec))
+
     file_system.Close()
 
   @shared_test_lib.skipUnlessHasTestFile([u'missing_directory_entries.zip'])
@@ -117,6 +126,11 @@ class ZIPFileSystemTest(shared_test_lib.BaseTestCase):
     self.assertIsNotNone(file_entry)
     self.assertEqual(file_entry.name, u'syslog')
 
+    path_spec = zip_path_spec.ZipPathSpec(
+        location=u'/fold', parent=test_file_path_spec)
+    file_entry = file_system.GetFileEntryByPathSpec(path_spec)
+    self.assertIsNone(file_entry)
+
     file_system.Close()
 
   def testGetRootFileEntry(self):